@@ -19,7 +19,7 @@ from datetime import datetime
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
-from app.chat.enhanced_agent import chat, EnhancedConversationalAgent
+from app.chat.enhanced_agent import chat, get_enhanced_agent
 from app.core.database import DatabaseConfig
 
 
@@ -385,7 +385,7 @@ async def create_new_session(
         New session ID and metadata
     """
     try:
-        agent = EnhancedConversationalAgent()
+        agent = get_enhanced_agent()
         session_id = agent._create_session(user_id)
 
         # Update title if provided
@@ -33,6 +33,8 @@ from app.schemas.skg.cost_models import (
 )
 from app.schemas.skg.rule_models import (
     ConstructabilityRule,
+    RuleBatchEvaluationRequest,
+    RuleBatchEvaluationResponse,
     RuleCategory,
     RuleCategoryCreate,
     RuleCreate,
@@ -61,10 +63,14 @@ from app.schemas.skg.lesson_models import (
     LessonUpdate,
 )
 from app.schemas.skg.relationship_models import (
+    GraphPathRequest,
+    GraphPathResponse,
     GraphStatistics,
     KnowledgeEntityType,
     KnowledgeRelationship,
     KnowledgeRelationshipCreate,
+    NeighborhoodRequest,
+    NeighborhoodResponse,
     RelatedEntitiesResponse,
     RelatedEntityRequest,
     RelationshipType,
@@ -343,6 +349,16 @@ async def evaluate_rules(
     return service.evaluate_rules(request, x_user_id)
 
 
+@router.post("/rules/evaluate/batch", response_model=RuleBatchEvaluationResponse)
+async def evaluate_rules_batch(
+    request: RuleBatchEvaluationRequest,
+    x_user_id: str = Header(..., alias="X-User-ID")
+):
+    """Evaluate applicable rules against many input records in one call."""
+    service = get_rule_service()
+    return service.evaluate_rules_batch(request, x_user_id)
+
+
 @router.post("/rules/search", response_model=List[RuleSearchResult])
 async def search_rules(
     request: RuleSearchRequest,
@@ -528,6 +544,20 @@ async def get_related_entities(request: RelatedEntityRequest):
     return service.get_related_entities(request)
 
 
+@router.post("/relationships/paths", response_model=GraphPathResponse)
+async def find_graph_paths(request: GraphPathRequest):
+    """Find paths between two knowledge entities."""
+    service = get_relationship_service()
+    return service.find_paths(request)
+
+
+@router.post("/relationships/neighborhood", response_model=NeighborhoodResponse)
+async def get_entity_neighborhood(request: NeighborhoodRequest):
+    """Get every entity within k hops of a knowledge entity."""
+    service = get_relationship_service()
+    return service.get_neighborhood(request)
+
+
 # =============================================================================
 # GRAPH STATISTICS ENDPOINT
 # =============================================================================
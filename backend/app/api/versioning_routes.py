@@ -463,6 +463,22 @@ async def compare_versions(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@performance_router.post("/rollups/backfill")
+async def backfill_performance_rollups(
+    schema_id: Optional[UUID] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None
+):
+    """
+    Rebuild execution performance rollups from the executions table.
+
+    Rollups are maintained as executions are written; run this after
+    importing executions or applying init_performance_rollups.sql.
+    """
+    analyzer = PerformanceAnalyzer()
+    return {"rollup_rows": analyzer.backfill_rollups(schema_id, start, end)}
+
+
 @performance_router.get("/dashboard/summary")
 async def get_dashboard_summary():
     """
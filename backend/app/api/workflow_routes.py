@@ -11,20 +11,27 @@ Endpoints:
 - PUT /api/v1/workflows/{deliverable_type} - Update a workflow schema
 - DELETE /api/v1/workflows/{deliverable_type} - Delete a workflow schema
 - POST /api/v1/workflows/{deliverable_type}/execute - Execute a workflow
+- POST /api/v1/workflows/{deliverable_type}/submit - Submit a workflow, return execution_id immediately
+- GET /api/v1/workflows/jobs/{execution_id} - Status of a submitted execution
+- POST /api/v1/workflows/executions/{execution_id}/rerun - Re-run an execution, recomputing only affected steps
 - GET /api/v1/workflows/{deliverable_type}/versions - Get version history
 - GET /api/v1/workflows/{deliverable_type}/graph - Get dependency graph (Sprint 3)
 - WS /api/v1/workflows/stream/{execution_id} - Stream execution updates (Sprint 3)
+- GET /api/v1/workflows/stream/{execution_id}/events - Stream execution updates as Server-Sent Events
 """
 
-from typing import Optional, List
-from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+from typing import AsyncIterator, Optional, List
+from fastapi import APIRouter, Header, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
+import asyncio
+import contextlib
 import json
 import uuid
 import logging
 
 from app.services.schema_service import SchemaService
-from app.services.workflow_orchestrator import execute_workflow
+from app.services.workflow_runner import get_workflow_runner, ExecutionCapacityError
 from app.schemas.workflow.schema_models import (
     DeliverableSchemaCreate,
     DeliverableSchemaUpdate,
@@ -37,6 +44,7 @@ from app.execution import (
     get_streaming_manager,
     StreamEvent,
 )
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +96,36 @@ class WorkflowExecuteResponse(BaseModel):
     error_message: Optional[str] = None
 
 
+class WorkflowRerunRequest(BaseModel):
+    """Request model for re-running an execution with changed inputs."""
+    input_changes: dict = Field(..., description="Input fields to change; others keep their previous value")
+    user_id: str = Field(..., description="User ID executing the workflow")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "input_changes": {"safe_bearing_capacity": 250.0},
+                "user_id": "engineer123"
+            }
+        }
+
+
+class WorkflowRerunResponse(WorkflowExecuteResponse):
+    """Response model for a re-run: the execution plus which steps were reused."""
+    source_execution_id: str
+    reused_steps: List[int] = Field(default_factory=list)
+    recomputed_steps: List[int] = Field(default_factory=list)
+
+
+class WorkflowSubmitResponse(BaseModel):
+    """Response model for asynchronous workflow submission."""
+    execution_id: str
+    deliverable_type: str
+    status: str
+    stream_url: str
+    status_url: str
+
+
 # =============================================================================
 # API ROUTER
 # =============================================================================
@@ -265,6 +303,9 @@ async def execute_workflow_endpoint(deliverable_type: str, request: WorkflowExec
     """
     Execute a workflow with the provided input data.
 
+    The execution runs on the bounded workflow worker pool so the event loop
+    stays free for other requests while it is in progress.
+
     Args:
         deliverable_type: The workflow type to execute
         request: Execution request with input data and user ID
@@ -281,8 +322,8 @@ async def execute_workflow_endpoint(deliverable_type: str, request: WorkflowExec
         print("INPUT DATA:")
         pprint(request.input_data)
         print("="*80 + "\n")
-        
-        result = execute_workflow(
+
+        result = await get_workflow_runner().run(
             deliverable_type=deliverable_type,
             input_data=request.input_data,
             user_id=request.user_id
@@ -308,12 +349,68 @@ async def execute_workflow_endpoint(deliverable_type: str, request: WorkflowExec
             error_message=result.error_message
         )
 
+    except ExecutionCapacityError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error executing workflow: {str(e)}")
 
 
+@router.post("/{deliverable_type}/submit", response_model=WorkflowSubmitResponse, status_code=202)
+async def submit_workflow_endpoint(deliverable_type: str, request: WorkflowExecuteRequest):
+    """
+    Submit a workflow for execution and return its execution_id immediately.
+
+    Follow progress via the WebSocket at /api/v1/workflows/stream/{execution_id}
+    (or Server-Sent Events at /api/v1/workflows/stream/{execution_id}/events);
+    the final record is available at /api/v1/workflows/executions/{execution_id}.
+
+    Args:
+        deliverable_type: The workflow type to execute
+        request: Execution request with input data and user ID
+
+    Returns:
+        Execution ID and URLs to follow the execution
+    """
+    try:
+        execution_id = get_workflow_runner().submit(
+            deliverable_type=deliverable_type,
+            input_data=request.input_data,
+            user_id=request.user_id
+        )
+
+        return WorkflowSubmitResponse(
+            execution_id=str(execution_id),
+            deliverable_type=deliverable_type,
+            status="queued",
+            stream_url=f"/api/v1/workflows/stream/{execution_id}",
+            status_url=f"/api/v1/workflows/jobs/{execution_id}"
+        )
+
+    except ExecutionCapacityError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error submitting workflow: {str(e)}")
+
+
+@router.get("/jobs/{execution_id}")
+async def get_submitted_job(execution_id: str):
+    """
+    Get the status of a submitted workflow execution.
+
+    Args:
+        execution_id: Execution ID returned by the submit endpoint
+
+    Returns:
+        Job status (queued, running, completed, awaiting_approval, failed)
+    """
+    job = get_workflow_runner().get_job(execution_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job '{execution_id}' not found")
+    return job
+
+
 @router.get("/{deliverable_type}/versions")
 async def get_workflow_versions(deliverable_type: str):
     """
@@ -430,7 +527,11 @@ async def get_dependency_graph(deliverable_type: str):
 
 
 @router.websocket("/stream/{execution_id}")
-async def stream_workflow_execution(websocket: WebSocket, execution_id: str):
+async def stream_workflow_execution(
+    websocket: WebSocket,
+    execution_id: str,
+    last_event_id: Optional[int] = None
+):
     """
     WebSocket endpoint for real-time workflow execution updates (Sprint 3).
 
@@ -443,31 +544,27 @@ async def stream_workflow_execution(websocket: WebSocket, execution_id: str):
     - execution_completed
     - execution_failed
 
+    Each event carries a ``sequence`` number; reconnect with
+    ``?last_event_id=<sequence>`` to resume without replaying earlier events.
+
     Args:
         websocket: WebSocket connection
         execution_id: Execution ID to stream
+        last_event_id: Last sequence number the client already received
     """
     await websocket.accept()
     logger.info(f"WebSocket connected for execution {execution_id}")
 
     streaming_manager = get_streaming_manager()
 
-    try:
-        # Send historical events first
-        history = streaming_manager.get_event_history(execution_id)
-        for event in history:
+    async def send_events():
+        """Send history, then live events, in sequence order"""
+        async for event in streaming_manager.stream_events(execution_id, last_event_id=last_event_id):
             await websocket.send_text(event.to_json())
 
-        # Subscribe to new events
-        async def send_to_websocket(event: StreamEvent):
-            """Callback to send events to WebSocket"""
-            try:
-                await websocket.send_text(event.to_json())
-            except Exception as e:
-                logger.error(f"Failed to send event to WebSocket: {e}")
-
-        streaming_manager.subscribe(execution_id, send_to_websocket)
+    sender = asyncio.create_task(send_events())
 
+    try:
         # Keep connection alive
         while True:
             try:
@@ -486,11 +583,77 @@ async def stream_workflow_execution(websocket: WebSocket, execution_id: str):
         logger.error(f"WebSocket error for execution {execution_id}: {e}")
 
     finally:
-        # Unsubscribe on disconnect
-        streaming_manager.unsubscribe(execution_id, send_to_websocket)
+        # Stop streaming on disconnect (unsubscribes the event iterator)
+        sender.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await sender
         logger.info(f"WebSocket closed for execution {execution_id}")
 
 
+def format_sse(event: StreamEvent) -> str:
+    """Format one stream event as a Server-Sent Events message."""
+    return f"id: {event.sequence}\nevent: {event.event_type.value}\ndata: {event.to_json()}\n\n"
+
+
+async def _sse_messages(execution_id: str, last_event_id: Optional[int]) -> AsyncIterator[str]:
+    """SSE messages for an execution, with keepalive comments while idle."""
+    events = get_streaming_manager().stream_events(execution_id, last_event_id=last_event_id)
+    pending = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(events.__anext__())
+            done, _ = await asyncio.wait({pending}, timeout=settings.STREAM_SSE_KEEPALIVE_SECONDS)
+            if not done:
+                yield ": keepalive\n\n"
+                continue
+            try:
+                event = pending.result()
+            except StopAsyncIteration:
+                pending = None
+                break
+            pending = None
+            yield format_sse(event)
+    finally:
+        if pending is not None:
+            pending.cancel()
+            with contextlib.suppress(asyncio.CancelledError, StopAsyncIteration):
+                await pending
+        await events.aclose()
+
+
+@router.get("/stream/{execution_id}/events")
+async def stream_workflow_execution_sse(
+    execution_id: str,
+    last_event_id: Optional[int] = Query(None, description="Resume after this event sequence number"),
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID")
+):
+    """
+    Server-Sent Events endpoint for workflow execution updates.
+
+    Streams the same events as the WebSocket endpoint, each with
+    ``id: <sequence>``. Browsers' EventSource reconnects with a
+    Last-Event-ID header and resumes after that event; the stream ends
+    after execution_completed / execution_failed.
+
+    Args:
+        execution_id: Execution ID to stream
+        last_event_id: Resume point (query parameter)
+        last_event_id_header: Resume point (Last-Event-ID header, takes precedence)
+    """
+    if last_event_id_header:
+        try:
+            last_event_id = int(last_event_id_header)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Last-Event-ID must be an event sequence number")
+
+    return StreamingResponse(
+        _sse_messages(execution_id, last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/{deliverable_type}/stats")
 async def get_workflow_stats(deliverable_type: str):
     """
@@ -688,6 +851,56 @@ async def get_execution(execution_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/executions/{execution_id}/rerun", response_model=WorkflowRerunResponse)
+async def rerun_execution(execution_id: str, request: WorkflowRerunRequest):
+    """
+    Re-run an execution with changed inputs.
+
+    Steps unaffected by the changes reuse their stored results instead of
+    invoking their engines again; the response lists reused and recomputed steps.
+
+    Args:
+        execution_id: The execution to start from
+        request: Input changes and user ID
+
+    Returns:
+        Result of the new execution
+    """
+    try:
+        source_execution_id = uuid.UUID(execution_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid execution ID: {execution_id}")
+
+    try:
+        result = await get_workflow_runner().rerun(
+            source_execution_id=source_execution_id,
+            input_changes=request.input_changes,
+            user_id=request.user_id
+        )
+        rerun_stats = (result.execution_stats or {}).get("rerun", {})
+
+        return WorkflowRerunResponse(
+            execution_id=str(result.id),
+            deliverable_type=result.deliverable_type,
+            execution_status=result.execution_status,
+            risk_score=result.risk_score,
+            requires_approval=result.requires_approval,
+            output_data=result.output_data,
+            error_message=result.error_message,
+            source_execution_id=execution_id,
+            reused_steps=rerun_stats.get("reused_steps", []),
+            recomputed_steps=rerun_stats.get("recomputed_steps", [])
+        )
+
+    except ExecutionCapacityError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except ValueError as e:
+        status_code = 404 if "not found" in str(e) else 400
+        raise HTTPException(status_code=status_code, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error re-running execution: {str(e)}")
+
+
 @router.get("/executions/stats/summary")
 async def get_execution_stats(days: int = 30):
     """
@@ -753,6 +966,7 @@ async def workflow_health():
         return {
             "status": "healthy",
             "total_workflows": len(all_schemas),
+            "runner": get_workflow_runner().get_stats(),
             "sprint": "Phase 2 Sprint 2 & 3: Configuration Layer + Dynamic Executor",
             "features": [
                 "workflow_schema_management",
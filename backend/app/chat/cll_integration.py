@@ -10,9 +10,11 @@ Author: AI Assistant
 Created: 2025-12-22
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Awaitable, Dict, Any, Optional, List, TypeVar
 from uuid import UUID
+import asyncio
 import logging
+import threading
 
 from app.services.learning.preference_extractor import PreferenceExtractor
 from app.services.learning.preference_manager import PreferenceManager
@@ -21,6 +23,47 @@ from app.schemas.learning.models import PreferenceScope
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+# =============================================================================
+# CLL EVENT LOOP
+# =============================================================================
+
+# The chat agent's graph nodes are synchronous. They hand CLL coroutines to one
+# long-lived loop (on a daemon thread) instead of creating a loop per message,
+# so the async database pool opened on that loop is reused across messages.
+_cll_loop: Optional[asyncio.AbstractEventLoop] = None
+_cll_loop_lock = threading.Lock()
+
+
+def get_cll_loop() -> asyncio.AbstractEventLoop:
+    """Get (or start) the background event loop that runs CLL coroutines."""
+    global _cll_loop
+
+    if _cll_loop is None:
+        with _cll_loop_lock:
+            if _cll_loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="cll-event-loop", daemon=True
+                )
+                thread.start()
+                _cll_loop = loop
+
+    return _cll_loop
+
+
+def run_cll(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """
+    Run a CLL coroutine from synchronous code and wait for its result.
+
+    Args:
+        coro: Coroutine to run on the CLL event loop
+        timeout: Seconds to wait before raising TimeoutError (None waits forever)
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_cll_loop()).result(timeout)
+
 
 class CLLChatIntegration:
     """
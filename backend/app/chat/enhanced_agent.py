@@ -15,6 +15,7 @@ Key Features:
 - Intent detection and entity extraction
 - Smart tool calling (workflows and calculation engines)
 - Context-aware responses
+- Long-lived runtime: one agent (graph compiled once) shared by all requests
 """
 
 from typing import List, Dict, Optional, Tuple, Any
@@ -22,6 +23,7 @@ from datetime import datetime
 from uuid import UUID, uuid4
 import json
 import re
+import threading
 
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, ToolMessage
 from langgraph.graph import StateGraph, END
@@ -38,7 +40,7 @@ from app.core.database import DatabaseConfig
 from app.nodes.retrieval import search_knowledge_base
 from app.services.workflow_orchestrator import WorkflowOrchestrator
 from app.engines.registry import engine_registry
-from app.chat.cll_integration import CLLChatIntegration
+from app.chat.cll_integration import CLLChatIntegration, run_cll
 
 
 # =============================================================================
@@ -106,15 +108,15 @@ Classify the intent as ONE of the following:
 Also extract any technical parameters mentioned (loads, dimensions, materials, locations, etc.)
 
 Respond in JSON format:
-{
+{{
     "intent": "ask_knowledge" | "execute_workflow" | "calculate" | "provide_parameters" | "chat",
     "task_type": "foundation_design" | "schedule_optimization" | null,
-    "entities": {
+    "entities": {{
         "parameter_name": value,
         ...
-    },
+    }},
     "confidence": 0.0-1.0
-}"""
+}}"""
 
 ENTITY_EXTRACTION_PROMPT = """Extract technical parameters from the user's message.
 
@@ -128,12 +130,12 @@ Extract parameters such as:
 - Location/environment (coastal, seismic zone)
 
 Return JSON:
-{
-    "entities": {
+{{
+    "entities": {{
         "parameter_name": value,
         ...
-    }
-}"""
+    }}
+}}"""
 
 TOOL_DECISION_PROMPT = """You are helping a user with engineering tasks.
 
@@ -154,13 +156,13 @@ Decide if you should:
 3. Provide a text response using knowledge base
 
 Respond in JSON:
-{
+{{
     "action": "execute_tool" | "ask_parameters" | "respond_with_knowledge",
     "tool_name": "workflow_name" if executing,
     "tool_function": "function_name" if executing,
     "missing_parameters": ["param1", "param2"] if asking,
     "reasoning": "why you chose this action"
-}"""
+}}"""
 
 RESPONSE_GENERATION_PROMPT = """You are a helpful AI assistant for civil, structural, and architectural engineering.
 
@@ -191,6 +193,10 @@ class EnhancedConversationalAgent:
     - Intent detection
     - Tool/workflow execution
     - Context tracking
+
+    An instance is long-lived and shared across requests (see
+    get_enhanced_agent()): it holds only shared clients and the compiled
+    graph, and all per-request data travels in EnhancedAgentState.
     """
 
     def __init__(self, enable_cll: bool = True):
@@ -539,11 +545,7 @@ class EnhancedConversationalAgent:
         session_id = state["session_id"]
 
         try:
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            result = loop.run_until_complete(
+            result = run_cll(
                 self.cll.process_user_message(
                     user_id=user_id,
                     message=user_message,
@@ -552,8 +554,6 @@ class EnhancedConversationalAgent:
                 )
             )
 
-            loop.close()
-
             if result["preferences_extracted"]:
                 print(f"[CLL] Extracted {result['preference_count']} preference(s) from user message")
 
@@ -587,11 +587,7 @@ class EnhancedConversationalAgent:
         task_type = state.get("task_type")
 
         try:
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            result = loop.run_until_complete(
+            result = run_cll(
                 self.cll.apply_preferences_to_response(
                     user_id=user_id,
                     response=response,
@@ -601,8 +597,6 @@ class EnhancedConversationalAgent:
                 )
             )
 
-            loop.close()
-
             modified_response = result["modified_response"]
             had_changes = result["had_changes"]
 
@@ -826,6 +820,35 @@ class EnhancedConversationalAgent:
             return {}
 
 
+# =============================================================================
+# SHARED AGENT RUNTIME
+# =============================================================================
+
+_global_agents: Dict[bool, EnhancedConversationalAgent] = {}
+_global_agents_lock = threading.Lock()
+
+
+def get_enhanced_agent(enable_cll: bool = True) -> EnhancedConversationalAgent:
+    """
+    Get the process-wide enhanced agent (built and compiled on first use).
+
+    Args:
+        enable_cll: Whether the agent runs the CLL preference nodes
+
+    Returns:
+        Shared EnhancedConversationalAgent instance
+    """
+    agent = _global_agents.get(enable_cll)
+    if agent is not None:
+        return agent
+
+    with _global_agents_lock:
+        agent = _global_agents.get(enable_cll)
+        if agent is None:
+            agent = _global_agents[enable_cll] = EnhancedConversationalAgent(enable_cll=enable_cll)
+    return agent
+
+
 # =============================================================================
 # CONVENIENCE FUNCTIONS
 # =============================================================================
@@ -846,7 +869,7 @@ def chat(
     Returns:
         Dictionary with response and metadata
     """
-    agent = EnhancedConversationalAgent()
+    agent = get_enhanced_agent()
     response, metadata = agent.chat(message, session_id, user_id)
 
     return {
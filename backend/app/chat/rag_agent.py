@@ -15,6 +15,7 @@ Key Features:
 
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
+import threading
 import uuid
 
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
@@ -104,6 +105,9 @@ class ConversationalRAGAgent:
     - Sprint 1: Ambiguity detection
     - Sprint 2: Knowledge retrieval
     - Sprint 3: Conversational interface with citations
+
+    Instances hold no per-conversation state and are shared across
+    requests (see get_rag_agent()).
     """
 
     def __init__(self, model: Optional[str] = None):
@@ -266,6 +270,35 @@ def clear_conversation(conversation_id: str):
         del _conversation_store[conversation_id]
 
 
+# =============================================================================
+# SHARED AGENT RUNTIME
+# =============================================================================
+
+_global_rag_agents: Dict[Optional[str], ConversationalRAGAgent] = {}
+_global_rag_agents_lock = threading.Lock()
+
+
+def get_rag_agent(model: Optional[str] = None) -> ConversationalRAGAgent:
+    """
+    Get the process-wide RAG agent for a model (created on first use).
+
+    Args:
+        model: Optional LLM model override
+
+    Returns:
+        Shared ConversationalRAGAgent instance
+    """
+    agent = _global_rag_agents.get(model)
+    if agent is not None:
+        return agent
+
+    with _global_rag_agents_lock:
+        agent = _global_rag_agents.get(model)
+        if agent is None:
+            agent = _global_rag_agents[model] = ConversationalRAGAgent(model=model)
+    return agent
+
+
 # =============================================================================
 # CONVENIENCE FUNCTIONS
 # =============================================================================
@@ -289,8 +322,8 @@ def chat(
     # Get or create conversation
     conv_id, memory = get_or_create_conversation(conversation_id)
 
-    # Initialize agent
-    agent = ConversationalRAGAgent()
+    # Shared agent (no per-message client construction)
+    agent = get_rag_agent()
 
     # Get response
     response, metadata = agent.chat(message, memory, discipline)
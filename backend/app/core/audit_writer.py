@@ -0,0 +1,576 @@
+"""
+CSA AIaaS Platform - Buffered Audit Writer
+Performance: Batched, asynchronous audit persistence
+
+Audit rows (audit_log, csa.risk_rules_audit, csa.safety_routing_log) used to
+be written with one database round trip per row, inline on the request or
+workflow execution path. The writer takes them off that path: callers append
+a row to a local write-ahead log and a bounded queue, and a background
+flusher writes the queued rows with multi-row INSERTs.
+
+Features:
+- Bounded in-memory queue; callers never wait on the database
+- Background flusher: one multi-row INSERT per audit table per batch,
+  triggered by batch size or flush interval
+- Write-ahead log: a row is on local disk before submit() returns and its
+  WAL segment is deleted only after the row is committed; rows carry a
+  client-generated id and are inserted ON CONFLICT (id) DO NOTHING, so a
+  replayed row is never written twice
+- Database outages: batches are retried with backoff; rows that do not fit
+  in the queue are replayed from the WAL; segments left by a crashed
+  process are replayed on startup
+- Rows the database rejects are isolated from their batch and kept in a
+  dead-letter file instead of blocking the queue
+- flush() for read-your-writes and shutdown (main.py lifespan)
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+import psycopg2
+from psycopg2.extras import execute_values
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# AUDIT TABLES
+# ============================================================================
+
+class AuditTable(NamedTuple):
+    """An audit table the writer can insert into (first column is the row id)."""
+    name: str
+    sql: str  # INSERT ... VALUES %s ON CONFLICT (id) DO NOTHING
+    template: str  # execute_values row template
+
+
+_audit_tables: Dict[str, AuditTable] = {}
+
+
+def register_audit_table(table: AuditTable) -> AuditTable:
+    """Register an audit table so queued and WAL rows can be written to it."""
+    _audit_tables[table.name] = table
+    return table
+
+
+AUDIT_LOG_TABLE = register_audit_table(AuditTable(
+    name="audit_log",
+    sql="""
+    INSERT INTO audit_log (id, user_id, action, entity_type, entity_id, details, timestamp)
+    VALUES %s
+    ON CONFLICT (id) DO NOTHING
+    """,
+    template="(%s::uuid, %s, %s, %s, %s::uuid, %s::jsonb, %s::timestamptz)",
+))
+
+
+# ============================================================================
+# SINK
+# ============================================================================
+
+class AuditSinkUnavailable(Exception):
+    """The audit database cannot be reached; the batch should be retried later."""
+    pass
+
+
+class PostgresAuditSink:
+    """Writes audit batches through the shared psycopg2 pool."""
+
+    def __init__(self, db: Any):
+        self.db = db
+
+    def write(self, table: AuditTable, rows: Sequence[Sequence[Any]]) -> None:
+        """
+        Insert rows with multi-row INSERTs in one transaction.
+
+        Raises:
+            AuditSinkUnavailable: On connection-level failures
+            Exception: Any other error means the database rejected the rows
+        """
+        try:
+            with self.db.connection() as conn:
+                with conn.cursor() as cursor:
+                    execute_values(cursor, table.sql, rows, template=table.template, page_size=len(rows))
+                conn.commit()
+        except (psycopg2.OperationalError, psycopg2.InterfaceError, ConnectionError, OSError) as e:
+            raise AuditSinkUnavailable(str(e)) from e
+
+
+# ============================================================================
+# WRITE-AHEAD LOG
+# ============================================================================
+
+WAL_SUFFIX = ".wal"
+DEAD_LETTER_FILE = "dead_letter.jsonl"
+
+
+@dataclass(eq=False)
+class _Segment:
+    """One WAL file; deleted when closed and every row in it is committed."""
+    path: Optional[Path]
+    records: int = 0
+    pending: int = 0
+    closed: bool = False
+    spilled: Set[int] = field(default_factory=set)  # rows only on disk, not queued
+
+
+@dataclass(eq=False)
+class _Entry:
+    table: str
+    row: Tuple[Any, ...]
+    segment: _Segment
+    line: int
+
+
+def _owner_alive(path: Path) -> bool:
+    """Whether the process that wrote a WAL segment is still running."""
+    try:
+        pid = int(path.name.split("-")[1])
+    except (IndexError, ValueError):
+        return False
+    if pid == os.getpid():
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+# ============================================================================
+# AUDIT WRITER
+# ============================================================================
+
+class AuditWriter:
+    """
+    Buffered audit writer with a background flusher.
+
+    Args:
+        sink: Object with ``write(table, rows)``; see PostgresAuditSink
+        wal_dir: Write-ahead log directory (None disables the WAL)
+        batch_size: Rows per flush; reaching it wakes the flusher early
+        flush_interval: Seconds between flushes of a partial batch
+        queue_size: Maximum queued rows
+        max_backoff: Upper bound for the retry delay during an outage
+        fsync: fsync the WAL on every row (survives power loss, not only crashes)
+        enqueue_timeout: Without a WAL, how long submit() waits for queue space
+    """
+
+    def __init__(
+        self,
+        sink: Any,
+        wal_dir: Optional[str] = None,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        queue_size: int = 10000,
+        max_backoff: float = 60.0,
+        fsync: bool = False,
+        enqueue_timeout: float = 5.0
+    ):
+        self.sink = sink
+        self.wal_dir = Path(wal_dir) if wal_dir else None
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_backoff = max_backoff
+        self.fsync = fsync
+        self.enqueue_timeout = enqueue_timeout
+
+        self._queue: "queue.Queue[_Entry]" = queue.Queue(maxsize=queue_size)
+        self._retry: List[_Entry] = []
+        self._segments: List[_Segment] = []
+        self._current: Optional[_Segment] = None
+        self._file: Optional[Any] = None
+        self._segment_counter = 0
+        self._pending = 0
+        self._backoff = 0.0
+
+        self._lock = threading.Lock()  # WAL and segment bookkeeping
+        self._flush_lock = threading.RLock()  # one flush at a time
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.stats = {
+            "submitted": 0,
+            "written": 0,
+            "batches": 0,
+            "spilled": 0,
+            "replayed": 0,
+            "dead_lettered": 0,
+            "dropped": 0,
+            "failures": 0,
+        }
+
+        if self.wal_dir is not None:
+            self.wal_dir.mkdir(parents=True, exist_ok=True)
+            self._recover()
+
+    # ------------------------------------------------------------------------
+    # Producers
+    # ------------------------------------------------------------------------
+
+    def submit(self, table: str, row: Sequence[Any]) -> None:
+        """
+        Queue one audit row for ``table``.
+
+        Values must be JSON serializable (they are written to the WAL as-is).
+
+        Raises:
+            ValueError: If ``table`` has not been registered
+        """
+        if table not in _audit_tables:
+            raise ValueError(f"Unknown audit table: {table}")
+        row = tuple(row)
+        with self._lock:
+            segment, line = self._append_wal(table, row)
+            self._pending += 1
+            self.stats["submitted"] += 1
+        entry = _Entry(table, row, segment, line)
+
+        try:
+            if self.wal_dir is None:
+                self._queue.put(entry, timeout=self.enqueue_timeout)
+            else:
+                self._queue.put_nowait(entry)
+        except queue.Full:
+            with self._lock:
+                if self.wal_dir is None:
+                    segment.pending -= 1
+                    self._pending -= 1
+                    self.stats["dropped"] += 1
+                    logger.error(f"Audit queue full, dropped {table} row: {row}")
+                    return
+                # Already durable in the WAL; replayed once the queue drains
+                segment.spilled.add(line)
+                self.stats["spilled"] += 1
+
+        if self._queue.qsize() >= self.batch_size:
+            self._wake.set()
+
+    def _append_wal(self, table: str, row: Tuple[Any, ...]) -> Tuple[_Segment, int]:
+        if self.wal_dir is None:
+            if self._current is None:
+                self._current = _Segment(path=None)
+            segment = self._current
+        else:
+            if self._current is None:
+                self._segment_counter += 1
+                path = self.wal_dir / f"audit-{os.getpid()}-{time.time_ns()}-{self._segment_counter}{WAL_SUFFIX}"
+                self._current = _Segment(path=path)
+                self._segments.append(self._current)
+                self._file = open(path, "a", encoding="utf-8")
+            segment = self._current
+            self._file.write(json.dumps({"table": table, "row": row}, default=str) + "\n")
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+
+        line = segment.records
+        segment.records += 1
+        segment.pending += 1
+        return segment, line
+
+    # ------------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the background flusher thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self._backoff or self.flush_interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self._flush_batch()
+            except Exception as e:  # never let the flusher die
+                logger.error(f"Audit writer flush failed: {e}")
+
+    def flush(self) -> bool:
+        """
+        Write everything queued, retried and spilled so far.
+
+        Returns:
+            True if nothing is left to write (False during a database outage)
+        """
+        with self._flush_lock:
+            while True:
+                written = self._flush_batch()
+                if written is None:
+                    return False
+                if written == 0:
+                    return True
+
+    def _flush_batch(self) -> Optional[int]:
+        """
+        Write one batch.
+
+        Returns:
+            Rows handled (0 when idle), or None if the database is unavailable
+        """
+        with self._flush_lock:
+            batch = self._retry
+            self._retry = []
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if len(batch) < self.batch_size:
+                batch.extend(self._load_spilled(self.batch_size - len(batch)))
+            if not batch:
+                return 0
+
+            by_table: Dict[str, List[_Entry]] = {}
+            for entry in batch:
+                by_table.setdefault(entry.table, []).append(entry)
+
+            retry: List[_Entry] = []
+            for table_name, entries in by_table.items():
+                if retry:
+                    # Database unavailable: keep the remaining tables for the retry
+                    retry.extend(entries)
+                    continue
+                retry.extend(self._write(_audit_tables[table_name], entries))
+
+            self._retry = retry
+            if retry:
+                self.stats["failures"] += 1
+                self._backoff = min(self.max_backoff, max(self.flush_interval, self._backoff * 2))
+                if len(retry) == len(batch):
+                    return None
+            else:
+                self._backoff = 0.0
+            return len(batch) - len(retry)
+
+    def _write(self, table: AuditTable, entries: List[_Entry]) -> List[_Entry]:
+        """
+        Write one table's rows.
+
+        Returns:
+            The rows to retry (the database is unavailable), else an empty list
+        """
+        try:
+            self.sink.write(table, [entry.row for entry in entries])
+        except AuditSinkUnavailable as e:
+            logger.warning(f"Audit database unavailable, {len(entries)} {table.name} rows kept for retry: {e}")
+            return entries
+        except Exception as e:
+            if len(entries) == 1:
+                self._dead_letter(entries[0], e)
+                self._ack(entries)
+                return []
+            # Find the rejected rows; the rest of the batch is still written
+            logger.warning(f"Audit batch for {table.name} rejected, writing rows individually: {e}")
+            for position, entry in enumerate(entries):
+                if self._write(table, [entry]):
+                    return entries[position:]
+            return []
+
+        self._ack(entries)
+        self.stats["written"] += len(entries)
+        self.stats["batches"] += 1
+        return []
+
+    def _ack(self, entries: List[_Entry]) -> None:
+        """Mark rows committed and delete WAL segments with nothing pending."""
+        with self._lock:
+            self._pending -= len(entries)
+            for entry in entries:
+                entry.segment.pending -= 1
+            if self._current is not None and self._current.pending == 0:
+                self._close_current()
+            for segment in [s for s in self._segments if s.closed and s.pending == 0]:
+                self._segments.remove(segment)
+                if segment.path is not None:
+                    try:
+                        segment.path.unlink()
+                    except FileNotFoundError:
+                        pass
+
+    def _close_current(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._current is not None:
+            self._current.closed = True
+            self._current = None
+
+    def _load_spilled(self, limit: int) -> List[_Entry]:
+        """
+        Read rows that are only in the WAL (queue overflow or crash recovery).
+
+        Rows for tables this process has not registered stay in the WAL for
+        a process that has.
+        """
+        with self._lock:
+            segments = [(segment, set(segment.spilled)) for segment in self._segments if segment.spilled]
+
+        entries: List[_Entry] = []
+        for segment, lines in segments:
+            if len(entries) >= limit:
+                break
+            taken: Set[int] = set()
+            unreadable: List[_Entry] = []
+            with open(segment.path, encoding="utf-8") as f:
+                for line_no, text in enumerate(f):
+                    if len(entries) >= limit:
+                        break
+                    if line_no not in lines:
+                        continue
+                    try:
+                        record = json.loads(text)
+                        table, row = record["table"], tuple(record["row"])
+                    except (ValueError, KeyError, TypeError):
+                        # A partial line from a crash mid-write
+                        logger.error(f"Skipping unreadable audit WAL line {segment.path}:{line_no}")
+                        unreadable.append(_Entry("", (), segment, line_no))
+                        taken.add(line_no)
+                        continue
+                    if table in _audit_tables:
+                        entries.append(_Entry(table, row, segment, line_no))
+                        taken.add(line_no)
+            with self._lock:
+                segment.spilled -= taken
+                self.stats["replayed"] += len(taken) - len(unreadable)
+            if unreadable:
+                self._ack(unreadable)
+        return entries
+
+    def _dead_letter(self, entry: _Entry, error: Exception) -> None:
+        """Keep a row the database rejected so it is not silently lost."""
+        self.stats["dead_lettered"] += 1
+        logger.error(f"Audit row rejected by {entry.table}: {error}")
+        if self.wal_dir is None:
+            logger.error(f"Rejected audit row: {entry.row}")
+            return
+        record = {"table": entry.table, "row": entry.row, "error": str(error), "rejected_at": time.time()}
+        with self._lock, open(self.wal_dir / DEAD_LETTER_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, default=str) + "\n")
+
+    def _recover(self) -> None:
+        """Adopt WAL segments left behind by processes that are no longer running."""
+        for path in sorted(self.wal_dir.glob(f"*{WAL_SUFFIX}")):
+            if _owner_alive(path):
+                continue
+            with open(path, encoding="utf-8") as f:
+                records = sum(1 for _ in f)
+            if records == 0:
+                path.unlink()
+                continue
+            self._segments.append(_Segment(
+                path=path, records=records, pending=records, closed=True, spilled=set(range(records))
+            ))
+            self._pending += records
+            logger.warning(f"Recovered {records} unwritten audit rows from {path}")
+
+    # ------------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------------
+
+    def close(self, timeout: float = 10.0) -> bool:
+        """
+        Stop the flusher and write everything still pending.
+
+        Rows that cannot be written stay in the WAL for the next start.
+
+        Returns:
+            True if every row was written
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+        flushed = self.flush()
+        with self._lock:
+            self._close_current()
+        if not flushed:
+            logger.error(f"Audit writer closed with {self.pending()} rows kept in the write-ahead log")
+        return flushed
+
+    def pending(self) -> int:
+        """Rows submitted but not yet committed."""
+        with self._lock:
+            return self._pending
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                "pending": self._pending,
+                "queued": self._queue.qsize(),
+                "retrying": len(self._retry),
+                "wal_segments": len(self._segments),
+            }
+
+
+# ============================================================================
+# GLOBAL INSTANCE
+# ============================================================================
+
+_global_audit_writer: Optional[AuditWriter] = None
+_global_lock = threading.Lock()
+
+
+def get_audit_writer() -> Optional[AuditWriter]:
+    """
+    Get the process-wide audit writer, starting its flusher on first use.
+
+    Returns:
+        The writer, or None when buffering is disabled or DATABASE_URL is not
+        configured (callers then write synchronously as before)
+    """
+    global _global_audit_writer
+    if not settings.AUDIT_BUFFER_ENABLED or not settings.DATABASE_URL:
+        return None
+    with _global_lock:
+        if _global_audit_writer is None:
+            from app.core.database import DatabaseConfig
+
+            _global_audit_writer = AuditWriter(
+                sink=PostgresAuditSink(DatabaseConfig()),
+                wal_dir=settings.AUDIT_WAL_DIR or None,
+                batch_size=settings.AUDIT_BATCH_SIZE,
+                flush_interval=settings.AUDIT_FLUSH_INTERVAL_SECONDS,
+                queue_size=settings.AUDIT_QUEUE_SIZE,
+                max_backoff=settings.AUDIT_MAX_BACKOFF_SECONDS,
+                fsync=settings.AUDIT_WAL_FSYNC,
+            )
+            _global_audit_writer.start()
+    return _global_audit_writer
+
+
+def flush_audit_writer() -> bool:
+    """Flush the audit writer if one is running (read-your-writes for audit queries)."""
+    writer = _global_audit_writer
+    return writer.flush() if writer is not None else True
+
+
+def shutdown_audit_writer() -> None:
+    """Flush and stop the audit writer (called on application shutdown)."""
+    global _global_audit_writer
+    with _global_lock:
+        writer = _global_audit_writer
+        _global_audit_writer = None
+    if writer is not None:
+        writer.close()
@@ -25,6 +25,26 @@ class Settings:
     SUPABASE_ANON_KEY: str = os.getenv("SUPABASE_ANON_KEY", "")
     DATABASE_URL: Optional[str] = os.getenv("DATABASE_URL")  # PostgreSQL connection string for raw SQL
 
+    # PostgreSQL Connection Pool
+    DB_POOL_MIN_SIZE: int = int(os.getenv("DB_POOL_MIN_SIZE", "1"))
+    DB_POOL_MAX_SIZE: int = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+    DB_POOL_CHECKOUT_TIMEOUT: float = float(os.getenv("DB_POOL_CHECKOUT_TIMEOUT", "30"))
+    DB_POOL_HEALTH_CHECK_INTERVAL: float = float(os.getenv("DB_POOL_HEALTH_CHECK_INTERVAL", "30"))
+    DB_STATEMENT_TIMEOUT_MS: int = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "60000"))  # 0 disables
+
+    # Async PostgreSQL Pool (learning, feedback, CLL chat) - one per event loop
+    ASYNC_DB_POOL_MIN_SIZE: int = int(os.getenv("ASYNC_DB_POOL_MIN_SIZE", "1"))
+    ASYNC_DB_POOL_MAX_SIZE: int = int(os.getenv("ASYNC_DB_POOL_MAX_SIZE", "5"))
+
+    # Buffered Audit Writer (audit_log, risk rule audit, safety routing log)
+    AUDIT_BUFFER_ENABLED: bool = os.getenv("AUDIT_BUFFER_ENABLED", "True").lower() == "true"
+    AUDIT_BATCH_SIZE: int = int(os.getenv("AUDIT_BATCH_SIZE", "500"))
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = float(os.getenv("AUDIT_FLUSH_INTERVAL_SECONDS", "1.0"))
+    AUDIT_QUEUE_SIZE: int = int(os.getenv("AUDIT_QUEUE_SIZE", "10000"))
+    AUDIT_MAX_BACKOFF_SECONDS: float = float(os.getenv("AUDIT_MAX_BACKOFF_SECONDS", "60"))
+    AUDIT_WAL_DIR: str = os.getenv("AUDIT_WAL_DIR", ".cache/audit_wal")  # empty disables the write-ahead log
+    AUDIT_WAL_FSYNC: bool = os.getenv("AUDIT_WAL_FSYNC", "False").lower() == "true"
+
     # LLM Configuration (OpenRouter)
     OPENROUTER_API_KEY: Optional[str] = os.getenv("OPENROUTER_API_KEY")
     OPENROUTER_MODEL: str = os.getenv("OPENROUTER_MODEL", "nvidia/nemotron-3-nano-30b-a3b:free")
@@ -34,6 +54,77 @@ class Settings:
     APP_VERSION: str = "0.1.0"
     DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
 
+    # Workflow Execution (bounded worker pool for the FastAPI routes)
+    WORKFLOW_EXECUTION_MAX_WORKERS: int = int(os.getenv("WORKFLOW_EXECUTION_MAX_WORKERS", "4"))
+    WORKFLOW_EXECUTION_MAX_QUEUE: int = int(os.getenv("WORKFLOW_EXECUTION_MAX_QUEUE", "16"))
+
+    # Step Execution Policies (per-step retry/timeout come from each step's error_handling)
+    WORKFLOW_DEADLINE_SECONDS: float = float(os.getenv("WORKFLOW_DEADLINE_SECONDS", "1800"))  # whole execution, 0 disables
+    WORKFLOW_STEP_THREADS: int = int(os.getenv("WORKFLOW_STEP_THREADS", "32"))  # step attempts running at once
+    WORKFLOW_STEP_MAX_ABANDONED: int = int(os.getenv("WORKFLOW_STEP_MAX_ABANDONED", "8"))  # timed-out attempts still running
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = int(os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5"))  # consecutive failures
+    CIRCUIT_BREAKER_RECOVERY_SECONDS: float = float(os.getenv("CIRCUIT_BREAKER_RECOVERY_SECONDS", "30"))
+
+    # Execution Event Streaming (WebSocket / SSE fan-out)
+    STREAM_BROKER: str = os.getenv("STREAM_BROKER", "memory")  # memory | postgres (multi-worker)
+    STREAM_HISTORY_SIZE: int = int(os.getenv("STREAM_HISTORY_SIZE", "1000"))  # events kept per execution
+    STREAM_SSE_KEEPALIVE_SECONDS: float = float(os.getenv("STREAM_SSE_KEEPALIVE_SECONDS", "15"))
+    STREAM_CLEANUP_AFTER_SECONDS: int = int(os.getenv("STREAM_CLEANUP_AFTER_SECONDS", "3600"))  # history kept after an execution ends
+    STREAM_CLEANUP_INTERVAL_SECONDS: float = float(os.getenv("STREAM_CLEANUP_INTERVAL_SECONDS", "60"))
+
+    # Deliverable Schema Cache (in-process, TTL/LRU)
+    SCHEMA_CACHE_TTL_SECONDS: float = float(os.getenv("SCHEMA_CACHE_TTL_SECONDS", "60"))  # 0 disables
+    SCHEMA_CACHE_MAX_ENTRIES: int = int(os.getenv("SCHEMA_CACHE_MAX_ENTRIES", "256"))
+    SCHEMA_CACHE_NOTIFY: bool = os.getenv("SCHEMA_CACHE_NOTIFY", "False").lower() == "true"  # LISTEN/NOTIFY invalidation
+
+    # Embedding Cache (content-hash, shared by all EmbeddingService instances)
+    EMBEDDING_CACHE_ENABLED: bool = os.getenv("EMBEDDING_CACHE_ENABLED", "True").lower() == "true"
+    EMBEDDING_CACHE_BACKEND: str = os.getenv("EMBEDDING_CACHE_BACKEND", "disk")  # disk | postgres | memory
+    EMBEDDING_CACHE_PATH: str = os.getenv("EMBEDDING_CACHE_PATH", ".cache/embedding_cache.sqlite3")
+    EMBEDDING_CACHE_MAX_ENTRIES: int = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "10000"))
+
+    # Engine Result Memoization (EngineRegistry.invoke, engines registered pure=True)
+    ENGINE_MEMO_ENABLED: bool = os.getenv("ENGINE_MEMO_ENABLED", "True").lower() == "true"
+    ENGINE_MEMO_BACKEND: str = os.getenv("ENGINE_MEMO_BACKEND", "memory")  # memory | disk
+    ENGINE_MEMO_PATH: str = os.getenv("ENGINE_MEMO_PATH", ".cache/engine_results.sqlite3")
+    ENGINE_MEMO_MAX_ENTRIES: int = int(os.getenv("ENGINE_MEMO_MAX_ENTRIES", "1024"))
+
+    # Engine Process Pool (engines registered execution="process")
+    ENGINE_PROCESS_POOL_ENABLED: bool = os.getenv("ENGINE_PROCESS_POOL_ENABLED", "True").lower() == "true"  # False runs them inline
+    ENGINE_PROCESS_POOL_WORKERS: int = int(os.getenv("ENGINE_PROCESS_POOL_WORKERS", "0"))  # 0 = one per CPU core
+    ENGINE_PROCESS_POOL_MAX_PENDING: int = int(os.getenv("ENGINE_PROCESS_POOL_MAX_PENDING", "0"))  # 0 = 2 x workers
+    ENGINE_PROCESS_POOL_START_METHOD: str = os.getenv("ENGINE_PROCESS_POOL_START_METHOD", "spawn")  # spawn | forkserver
+    ENGINE_PROCESS_POOL_SLOT_TIMEOUT_SECONDS: float = float(os.getenv("ENGINE_PROCESS_POOL_SLOT_TIMEOUT_SECONDS", "60"))  # capped by the step deadline
+
+    # Engine Sandbox (engines registered execution="sandbox": killable workers with hard limits)
+    ENGINE_SANDBOX_ENABLED: bool = os.getenv("ENGINE_SANDBOX_ENABLED", "True").lower() == "true"  # False runs them inline
+    ENGINE_SANDBOX_WORKERS: int = int(os.getenv("ENGINE_SANDBOX_WORKERS", "2"))
+    ENGINE_SANDBOX_TIMEOUT_SECONDS: float = float(os.getenv("ENGINE_SANDBOX_TIMEOUT_SECONDS", "30"))  # capped by the step deadline
+    ENGINE_SANDBOX_MEMORY_MB: int = int(os.getenv("ENGINE_SANDBOX_MEMORY_MB", "1024"))  # per worker address space, 0 = unlimited
+    ENGINE_SANDBOX_MAX_TASKS: int = int(os.getenv("ENGINE_SANDBOX_MAX_TASKS", "500"))  # calls before a worker is replaced
+
+    # Historical Risk Statistics (running baselines for anomaly / baseline risk)
+    RISK_STATS_ENABLED: bool = os.getenv("RISK_STATS_ENABLED", "True").lower() == "true"
+    RISK_STATS_BUCKET_SECONDS: float = float(os.getenv("RISK_STATS_BUCKET_SECONDS", "86400"))
+    RISK_STATS_RETENTION_DAYS: int = int(os.getenv("RISK_STATS_RETENTION_DAYS", "365"))  # 0 keeps all history
+    RISK_STATS_REFRESH_SECONDS: float = float(os.getenv("RISK_STATS_REFRESH_SECONDS", "900"))  # reload from DB, 0 = load once
+    RISK_STATS_WINDOW_DAYS: int = int(os.getenv("RISK_STATS_WINDOW_DAYS", "0"))  # 0 compares with all history
+
+    # SKG Rate Index (in-memory cost table for BOQ rate resolution)
+    RATE_INDEX_TTL_SECONDS: float = float(os.getenv("RATE_INDEX_TTL_SECONDS", "300"))
+
+    # SKG Graph Index (in-memory adjacency for knowledge graph traversal)
+    SKG_GRAPH_INDEX_TTL_SECONDS: float = float(os.getenv("SKG_GRAPH_INDEX_TTL_SECONDS", "300"))
+
+    # Compiled Constructability Rule Set (in-memory rule engine cache)
+    RULE_SET_TTL_SECONDS: float = float(os.getenv("RULE_SET_TTL_SECONDS", "300"))
+
+    # Pipelined Document Ingestion (ETLPipeline.ingest_directory(pipelined=True))
+    ETL_EXTRACT_WORKERS: int = int(os.getenv("ETL_EXTRACT_WORKERS", "4"))  # 0 extracts inline
+    ETL_DOCUMENT_WORKERS: int = int(os.getenv("ETL_DOCUMENT_WORKERS", "2"))
+    ETL_EMBED_CONCURRENCY: int = int(os.getenv("ETL_EMBED_CONCURRENCY", "4"))
+    ETL_QUEUE_SIZE: int = int(os.getenv("ETL_QUEUE_SIZE", "4"))
+
     # LangGraph Configuration
     MAX_ITERATIONS: int = int(os.getenv("MAX_ITERATIONS", "10"))
 
@@ -0,0 +1,348 @@
+"""
+CSA AIaaS Platform - PostgreSQL Connection Pool
+Performance: Pooled, thread-safe database access
+
+A bounded, thread-safe pool of psycopg2 connections shared by every
+DatabaseConfig instance in the process.
+
+Features:
+- Configurable min/max pool size
+- Blocking checkout with timeout (backpressure instead of unbounded connects)
+- Health check on checkout for connections that have been idle
+- Server-side statement timeout applied to every pooled connection
+- Metrics: wait time, in-use connections, checkouts/sec
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import psycopg2
+from psycopg2.extensions import QueryCanceledError
+
+logger = logging.getLogger(__name__)
+
+# SQLSTATE of a statement cancelled by statement_timeout (or pg_cancel_backend)
+QUERY_CANCELED_PGCODE = "57014"
+
+
+def is_query_canceled(error: BaseException) -> bool:
+    """
+    Whether an error is a cancelled statement (e.g. statement_timeout).
+
+    psycopg2 raises it as an OperationalError, but the connection is healthy
+    and re-running the query would only add load to a busy server.
+    """
+    return isinstance(error, QueryCanceledError) or getattr(error, "pgcode", None) == QUERY_CANCELED_PGCODE
+
+
+class PoolTimeoutError(ConnectionError):
+    """Raised when no pooled connection becomes available in time."""
+    pass
+
+
+class ConnectionPool:
+    """
+    Thread-safe PostgreSQL connection pool.
+
+    Connections are created lazily up to ``max_size``. Callers that find the
+    pool exhausted block (up to ``checkout_timeout`` seconds) until another
+    caller returns a connection.
+
+    Usage:
+        pool = ConnectionPool(connect=lambda: psycopg2.connect(**params))
+        with pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+    """
+
+    # Window used to compute checkouts/sec
+    RATE_WINDOW_SECONDS = 60.0
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        min_size: int = 1,
+        max_size: int = 10,
+        checkout_timeout: float = 30.0,
+        health_check_interval: float = 30.0,
+        max_idle_seconds: float = 300.0,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            connect: Zero-argument factory returning a new DB-API connection
+            min_size: Connections kept open when idle (opened lazily)
+            max_size: Hard upper bound on open connections
+            checkout_timeout: Seconds to wait for a free connection
+            health_check_interval: Idle seconds after which a connection is
+                                   pinged with ``SELECT 1`` before reuse
+            max_idle_seconds: Idle connections above ``min_size`` are closed
+                              after this many seconds
+        """
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(
+                f"Invalid pool size: min_size={min_size}, max_size={max_size}"
+            )
+
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.checkout_timeout = checkout_timeout
+        self.health_check_interval = health_check_interval
+        self.max_idle_seconds = max_idle_seconds
+
+        self._lock = threading.Condition(threading.Lock())
+        self._idle: List[tuple] = []  # (connection, last_used_monotonic)
+        self._in_use: set = set()
+        self._closed = False
+
+        # Metrics
+        self._created_at = time.monotonic()
+        self._total_checkouts = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._timeouts = 0
+        self._connections_created = 0
+        self._connections_discarded = 0
+        self._health_check_failures = 0
+        self._recent_checkouts: deque = deque()
+
+    # =========================================================================
+    # CHECKOUT / RETURN
+    # =========================================================================
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """
+        Check out a connection for the duration of the ``with`` block.
+
+        The connection is returned to the pool on exit (rolled back). If the
+        block raises a connection-level error (OperationalError/InterfaceError)
+        the connection is discarded instead of being reused; a cancelled
+        statement (statement timeout) leaves it usable and it is kept.
+        """
+        conn = self.getconn()
+        discard = False
+        try:
+            yield conn
+        except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+            discard = not is_query_canceled(e)
+            raise
+        finally:
+            self.putconn(conn, discard=discard)
+
+    def getconn(self) -> Any:
+        """
+        Check out a connection, blocking until one is available.
+
+        Raises:
+            PoolTimeoutError: If no connection is available within
+                              ``checkout_timeout`` seconds
+        """
+        start = time.monotonic()
+        deadline = start + self.checkout_timeout
+
+        while True:
+            conn = None
+            create = False
+
+            with self._lock:
+                if self._closed:
+                    raise ConnectionError("Connection pool is closed")
+
+                while not self._idle and len(self._in_use) >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolTimeoutError(
+                            f"Timed out after {self.checkout_timeout}s waiting for a "
+                            f"database connection (pool max_size={self.max_size})"
+                        )
+                    self._lock.wait(remaining)
+
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                    # Checked out while its health is checked outside the lock,
+                    # so a concurrent checkout cannot create one past max_size
+                    self._in_use.add(conn)
+                else:
+                    last_used = None
+                    create = True
+                    # Reserve the slot before connecting outside the lock
+                    reservation = object()
+                    self._in_use.add(reservation)
+
+            if create:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._lock:
+                        self._in_use.discard(reservation)
+                        self._lock.notify()
+                    raise
+                with self._lock:
+                    self._in_use.discard(reservation)
+                    self._in_use.add(conn)
+                    self._connections_created += 1
+            else:
+                if not self._is_healthy(conn, last_used):
+                    self._close_quietly(conn)
+                    with self._lock:
+                        self._in_use.discard(conn)
+                        self._connections_discarded += 1
+                        self._health_check_failures += 1
+                        self._lock.notify()
+                    continue
+
+            self._record_checkout(time.monotonic() - start)
+            return conn
+
+    def putconn(self, conn: Any, discard: bool = False) -> None:
+        """
+        Return a connection to the pool.
+
+        Args:
+            conn: Connection previously obtained from ``getconn``
+            discard: Close the connection instead of reusing it
+        """
+        if not discard and not getattr(conn, "closed", False):
+            try:
+                # Never hand out a connection with an open transaction
+                conn.rollback()
+            except Exception:
+                discard = True
+
+        with self._lock:
+            self._in_use.discard(conn)
+            keep = (
+                not discard
+                and not self._closed
+                and not getattr(conn, "closed", False)
+            )
+            if keep:
+                self._idle.append((conn, time.monotonic()))
+            expired = self._pop_expired_idle()
+            self._lock.notify()
+
+        if not keep:
+            expired.append(conn)
+        for stale in expired:
+            self._close_quietly(stale)
+        if expired:
+            with self._lock:
+                self._connections_discarded += len(expired)
+
+    def close(self) -> None:
+        """Close every idle connection and refuse further checkouts."""
+        with self._lock:
+            self._closed = True
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+            self._lock.notify_all()
+
+        for conn in idle:
+            self._close_quietly(conn)
+
+    # =========================================================================
+    # METRICS
+    # =========================================================================
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of pool metrics.
+
+        Returns:
+            Dictionary with size, utilisation, wait-time and throughput figures
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._trim_recent(now)
+            window = min(self.RATE_WINDOW_SECONDS, max(now - self._created_at, 1e-9))
+            in_use = len(self._in_use)
+            idle = len(self._idle)
+            checkouts = self._total_checkouts
+
+            return {
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "size": in_use + idle,
+                "in_use": in_use,
+                "idle": idle,
+                "total_checkouts": checkouts,
+                "checkouts_per_sec": round(len(self._recent_checkouts) / window, 3),
+                "avg_wait_ms": round(
+                    (self._total_wait_seconds / checkouts) * 1000, 3
+                ) if checkouts else 0.0,
+                "max_wait_ms": round(self._max_wait_seconds * 1000, 3),
+                "timeouts": self._timeouts,
+                "connections_created": self._connections_created,
+                "connections_discarded": self._connections_discarded,
+                "health_check_failures": self._health_check_failures,
+                "closed": self._closed,
+            }
+
+    # =========================================================================
+    # INTERNALS
+    # =========================================================================
+
+    def _pop_expired_idle(self) -> List[Any]:
+        """Remove idle connections beyond ``min_size`` that sat unused too long (lock held)."""
+        expired = []
+        cutoff = time.monotonic() - self.max_idle_seconds
+        # Oldest idle connections are at the front of the list
+        while (
+            self._idle
+            and len(self._idle) + len(self._in_use) > self.min_size
+            and self._idle[0][1] < cutoff
+        ):
+            expired.append(self._idle.pop(0)[0])
+        return expired
+
+    def _record_checkout(self, wait_seconds: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._total_checkouts += 1
+            self._total_wait_seconds += wait_seconds
+            self._max_wait_seconds = max(self._max_wait_seconds, wait_seconds)
+            self._recent_checkouts.append(now)
+            self._trim_recent(now)
+
+    def _trim_recent(self, now: float) -> None:
+        cutoff = now - self.RATE_WINDOW_SECONDS
+        while self._recent_checkouts and self._recent_checkouts[0] < cutoff:
+            self._recent_checkouts.popleft()
+
+    def _is_healthy(self, conn: Any, last_used: Optional[float]) -> bool:
+        """Check a connection before handing it out."""
+        if getattr(conn, "closed", False):
+            return False
+
+        if last_used is not None and time.monotonic() - last_used < self.health_check_interval:
+            return True
+
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+            finally:
+                cursor.close()
+            conn.rollback()
+            return True
+        except Exception as e:
+            logger.warning(f"Discarding unhealthy pooled connection: {e}")
+            return False
+
+    @staticmethod
+    def _close_quietly(conn: Any) -> None:
+        try:
+            if not getattr(conn, "closed", False):
+                conn.close()
+        except Exception:
+            pass
+
@@ -5,7 +5,7 @@ Phase 4 Sprint 3: The "What-If" Cost Engine
 
 Generates detailed BOQ from structural design outputs with:
 - Parametric linkage to design variables
-- Integration with SKG cost database
+- Integration with SKG cost database (all rates of a BOQ resolved in one batch)
 - Complexity-adjusted rates from Sprint 4.2
 """
 
@@ -109,6 +109,8 @@ class BOQGenerator:
         self.cost_service = cost_service
         self.region_code = region_code
         self._item_counter = 0
+        # (category, sub_category, grade) -> SKG base rate, or None if unmatched
+        self._rates: Dict[Tuple[str, str, Optional[str]], Optional[Decimal]] = {}
 
     def generate_boq(
         self,
@@ -131,6 +133,8 @@ class BOQGenerator:
         """
         self._item_counter = 0
         complexity_factors = complexity_factors or {}
+        self._rates = {}
+        self._prefetch_rates(self._rate_keys(scenario_type, design_variables))
 
         if scenario_type == "beam":
             boq_items = self._generate_beam_boq(
@@ -156,6 +160,48 @@ class BOQGenerator:
         self._item_counter += 1
         return self._item_counter
 
+    def _rate_keys(
+        self,
+        scenario_type: str,
+        design_variables: Dict[str, Any]
+    ) -> List[Tuple[str, str, Optional[str]]]:
+        """Every (category, sub_category, grade) rate a BOQ of this type looks up."""
+        concrete_grade = design_variables.get("concrete_grade", "M25")
+        steel_grade = design_variables.get("steel_grade", "Fe500")
+        keys = [
+            ("concrete", "rcc", concrete_grade),
+            ("steel", "tmt", steel_grade),
+        ]
+
+        if scenario_type == "beam":
+            keys += [("formwork", "beam_sides", None), ("formwork", "beam_bottom", None)]
+        elif scenario_type == "foundation":
+            keys += [
+                ("excavation", "medium_soil", None),
+                ("misc", "pcc_per_cum", None),
+                ("formwork", "foundation", None),
+            ]
+        else:
+            keys.append(("formwork", "beam_sides", None))
+        return keys
+
+    def _prefetch_rates(self, keys: List[Tuple[str, str, Optional[str]]]) -> None:
+        """Resolve all rates of a BOQ from the SKG in one batch."""
+        if not self.cost_service:
+            return
+
+        resolved = {}
+        try:
+            resolved = self.cost_service.resolve_rates(
+                [(category, sub_category, grade, self.region_code) for category, sub_category, grade in keys]
+            )
+        except Exception as e:
+            logger.warning(f"Failed to resolve rates from SKG: {e}")
+
+        for key in keys:
+            rate = resolved.get((*key, self.region_code))
+            self._rates[key] = rate.base_cost if rate is not None else None
+
     def _get_rate(
         self,
         category: str,
@@ -169,26 +215,15 @@ class BOQGenerator:
         Returns:
             Tuple of (base_rate, adjusted_rate)
         """
-        # Try to get from SKG cost database
-        if self.cost_service:
-            try:
-                # Search for matching cost item
-                search_query = f"{category} {sub_category}"
-                if grade:
-                    search_query += f" {grade}"
-
-                results = self.cost_service.search_costs(
-                    {"query": search_query, "category": category, "limit": 1},
-                    "system"
-                )
-
-                if results:
-                    base_rate = results[0].base_cost
-                    adjusted_rate = base_rate * Decimal(str(complexity_multiplier))
-                    return base_rate, adjusted_rate
-
-            except Exception as e:
-                logger.warning(f"Failed to get rate from SKG: {e}")
+        key = (category, sub_category, grade)
+        if key not in self._rates:
+            # Not prefetched by generate_boq(); resolve it on its own
+            self._prefetch_rates([key])
+
+        base_rate = self._rates.get(key)
+        if base_rate is not None:
+            adjusted_rate = base_rate * Decimal(str(complexity_multiplier))
+            return base_rate, adjusted_rate
 
         # Fall back to default rates
         base_rate = Decimal("0")
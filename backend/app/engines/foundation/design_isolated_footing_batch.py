@@ -0,0 +1,481 @@
+"""
+Foundation Design - Batched Isolated Footing Designer
+
+Vectorized counterpart of design_isolated_footing() for whole-project
+foundation schedules. Instead of validating and designing one column per
+call, the batch entry point takes columnar arrays of column loads and
+geometries and runs every design step (sizing, bearing pressure, one-way
+and punching shear, moments, reinforcement, bar selection, development
+length) with NumPy across all rows at once.
+
+Every step replicates the scalar engine operation-for-operation, so each
+row of the batch result is identical to what design_isolated_footing()
+returns for the same column.
+
+Workflow:
+    columnar input → design_isolated_footings_batch() → columnar initial design data
+    batch_result_to_records() → per-column initial_design_data dicts
+"""
+
+from typing import Dict, Any, List
+from datetime import datetime
+
+import numpy as np
+
+from app.engines.foundation.design_isolated_footing import (
+    CONCRETE_PROPERTIES,
+    STEEL_PROPERTIES,
+    LOAD_FACTOR,
+    CONCRETE_DENSITY,
+    COVER,
+    BAR_DIAMETERS,
+    _get_shear_strength_concrete,
+)
+
+
+# ============================================================================
+# INPUT SPECIFICATION
+# ============================================================================
+
+# Numeric columns: name -> (default, must be > 0). None means required.
+NUMERIC_FIELDS = {
+    "axial_load_dead": (None, True),
+    "axial_load_live": (None, True),
+    "moment_x": (0.0, False),
+    "moment_y": (0.0, False),
+    "column_width": (None, True),
+    "column_depth": (None, True),
+    "safe_bearing_capacity": (None, True),
+    "depth_of_foundation": (1.5, True),
+    "soil_unit_weight": (18.0, True),
+    "aspect_ratio": (1.5, False),
+}
+
+# Categorical columns: name -> (default, allowed values)
+CATEGORICAL_FIELDS = {
+    "column_shape": ("rectangular", ("rectangular", "circular")),
+    "concrete_grade": ("M25", tuple(CONCRETE_PROPERTIES)),
+    "steel_grade": ("Fe415", tuple(STEEL_PROPERTIES)),
+    "footing_type": ("square", ("square", "rectangular")),
+    "design_code": ("IS456:2000", ("IS456:2000", "ACI318")),
+}
+
+# Same search order as _select_bars() in the scalar engine
+BAR_SEARCH_ORDER = [bar for bar in [12, 16, 20, 25, 10, 32, 8] if bar in BAR_DIAMETERS]
+FALLBACK_BAR = 25
+
+FLOAT_OUTPUTS = [
+    "footing_length", "footing_width", "footing_depth", "effective_depth",
+    "total_load", "factored_load", "base_pressure_service", "base_pressure_ultimate",
+    "one_way_shear_vu_x", "one_way_shear_vu_y", "punching_shear_vu", "shear_capacity_vc",
+    "moment_ux", "moment_uy", "steel_required_x", "steel_required_y",
+    "steel_provided_x", "steel_provided_y", "development_length",
+]
+INT_OUTPUTS = ["bar_dia_x", "bar_dia_y", "num_bars_x", "num_bars_y"]
+BOOL_OUTPUTS = ["shear_ok", "development_ok", "design_ok"]
+
+
+# ============================================================================
+# CORE DESIGN FUNCTION
+# ============================================================================
+
+def design_isolated_footings_batch(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Design many isolated RCC footings at once following IS 456:2000.
+
+    Args:
+        input_data: Columnar dictionary. Each FoundationInput field is either
+            a list (one value per column) or a scalar broadcast to every
+            column; optional fields fall back to the FoundationInput
+            defaults. An optional "column_ids" list is echoed back.
+
+    Returns:
+        Columnar dictionary with one list per InitialDesignData field
+        (except input_data), plus "count", "warnings" (list per column),
+        "design_code_used" and "calculation_timestamp".
+
+    Raises:
+        ValueError: If a column is missing, lengths differ, or any row
+            fails the FoundationInput constraints
+
+    Example:
+        >>> result = design_isolated_footings_batch({
+        ...     "axial_load_dead": [600.0, 900.0],
+        ...     "axial_load_live": [400.0, 450.0],
+        ...     "column_width": 0.4,
+        ...     "column_depth": 0.4,
+        ...     "safe_bearing_capacity": 200.0,
+        ... })
+        >>> result["count"]
+        2
+    """
+    inputs, count = _prepare_inputs(input_data)
+
+    fck = np.array([CONCRETE_PROPERTIES[g]["fck"] for g in CONCRETE_PROPERTIES], dtype=float)
+    fy = np.array([STEEL_PROPERTIES[g]["fy"] for g in STEEL_PROPERTIES], dtype=float)
+    tau_c_by_grade = np.array(
+        [_get_shear_strength_concrete(CONCRETE_PROPERTIES[g]["fck"], 0.15) for g in CONCRETE_PROPERTIES]
+    )
+    concrete_index = inputs["concrete_grade_index"]
+    fck = fck[concrete_index]
+    fy = fy[inputs["steel_grade_index"]]
+
+    column_width = inputs["column_width"]
+    column_depth = inputs["column_depth"]
+    sbc = inputs["safe_bearing_capacity"]
+    square = inputs["footing_type"] == "square"
+
+    # ========================================================================
+    # STEP 1-3: Loads, base area and plan dimensions
+    # ========================================================================
+
+    P_total = inputs["axial_load_dead"] + inputs["axial_load_live"]
+    A_required = (P_total * 1.10) / sbc
+
+    aspect_ratio = np.where(square, 1.0, inputs["aspect_ratio"])
+    B = np.where(square, np.sqrt(A_required), np.sqrt(A_required / aspect_ratio))
+    L = np.where(square, B, B * aspect_ratio)
+
+    B = _ceil_to_increment(B)
+    L = _ceil_to_increment(L)
+    A_actual = L * B
+
+    # ========================================================================
+    # STEP 4: Footing depth
+    # ========================================================================
+
+    max_cantilever = np.maximum((L - column_width) / 2, (B - column_depth) / 2)
+    D = np.maximum(_ceil_to_increment(max_cantilever / 1.5), 0.30)
+    d = D - COVER - 0.020
+
+    # ========================================================================
+    # STEP 5: Base pressures (grow undersized footings)
+    # ========================================================================
+
+    P_total_actual, P_u_actual, q_service, q_ultimate = _base_pressures(P_total, L, B, D, A_actual)
+
+    resized = q_service > sbc
+    if resized.any():
+        factor = np.sqrt(q_service[resized] / sbc[resized])
+        B[resized] = _ceil_to_increment(B[resized] * factor)
+        L[resized] = _ceil_to_increment(L[resized] * factor)
+        A_actual = L * B
+        P_total_actual, P_u_actual, q_service, q_ultimate = _base_pressures(P_total, L, B, D, A_actual)
+
+    # ========================================================================
+    # STEP 6: One-way shear
+    # ========================================================================
+
+    x_shear_plane = (L - column_width) / 2 - d
+    y_shear_plane = (B - column_depth) / 2 - d
+    no_shear_x = ~(x_shear_plane > 0)
+    no_shear_y = ~(y_shear_plane > 0)
+    V_ux = np.where(no_shear_x, 0.0, q_ultimate * B * x_shear_plane)
+    V_uy = np.where(no_shear_y, 0.0, q_ultimate * L * y_shear_plane)
+
+    tau_v_x = np.where(V_ux > 0, (V_ux * 1000) / (B * 1000 * d * 1000), 0.0)
+    tau_v_y = np.where(V_uy > 0, (V_uy * 1000) / (L * 1000 * d * 1000), 0.0)
+    tau_c = tau_c_by_grade[concrete_index]
+
+    one_way_shear_ok = (tau_v_x <= tau_c) & (tau_v_y <= tau_c)
+
+    # ========================================================================
+    # STEP 7: Punching shear
+    # ========================================================================
+
+    perimeter_length = 2 * (column_width + column_depth + 2 * d)
+    punching_area = (column_width + d) * (column_depth + d)
+    V_punching = q_ultimate * (A_actual - punching_area)
+    tau_v_punching = (V_punching * 1000) / (perimeter_length * 1000 * d * 1000)
+
+    k_s = np.minimum(0.5 + column_width / column_depth, 1.0)
+    tau_c_punching = 0.25 * np.sqrt(fck) * k_s
+
+    deepened = ~(one_way_shear_ok & (tau_v_punching <= tau_c_punching))
+    if deepened.any():
+        d_increased = d[deepened] * 1.2
+        D[deepened] = _ceil_to_increment(d_increased + COVER + 0.020)
+        d[deepened] = D[deepened] - COVER + 0.020
+    # After increasing depth, shear is taken as satisfied (as in the scalar engine)
+    shear_ok = np.ones(count, dtype=bool)
+
+    V_c = tau_c * (B * 1000) * (d * 1000) / 1000
+
+    # ========================================================================
+    # STEP 8-9: Moments and flexural reinforcement
+    # ========================================================================
+
+    cantilever_x = (L - column_width) / 2
+    cantilever_y = (B - column_depth) / 2
+    M_ux = q_ultimate * B * cantilever_x * (cantilever_x / 2)
+    M_uy = q_ultimate * L * cantilever_y * (cantilever_y / 2)
+
+    Ast_min = 0.0012 * B * 1000 * D * 1000
+    Ast_x = np.maximum(_required_steel(M_ux, d, fy), Ast_min)
+    Ast_y = np.maximum(_required_steel(M_uy, d, fy), Ast_min)
+
+    # ========================================================================
+    # STEP 10: Bar selection
+    # ========================================================================
+
+    bar_dia_x, num_bars_x, Ast_provided_x = _select_bars(Ast_x, B)
+    bar_dia_y, num_bars_y, Ast_provided_y = _select_bars(Ast_y, L)
+
+    # ========================================================================
+    # STEP 11-12: Development length and overall status
+    # ========================================================================
+
+    bar_dia = np.maximum(bar_dia_x, bar_dia_y)
+    Ld = ((bar_dia * (0.87 * fy)) / (4 * (1.6 * np.sqrt(fck)))) / 1000
+
+    L_available = np.minimum(cantilever_x - COVER, cantilever_y - COVER)
+    development_ok = L_available >= Ld
+
+    design_ok = shear_ok & development_ok & (q_service <= sbc)
+
+    # ========================================================================
+    # STEP 13: Prepare columnar output
+    # ========================================================================
+
+    columns = {
+        "footing_length": L,
+        "footing_width": B,
+        "footing_depth": D,
+        "effective_depth": d,
+        "total_load": P_total_actual,
+        "factored_load": P_u_actual,
+        "base_pressure_service": q_service,
+        "base_pressure_ultimate": q_ultimate,
+        "one_way_shear_vu_x": V_ux,
+        "one_way_shear_vu_y": V_uy,
+        "punching_shear_vu": V_punching,
+        "shear_capacity_vc": V_c,
+        "shear_ok": shear_ok,
+        "moment_ux": M_ux,
+        "moment_uy": M_uy,
+        "steel_required_x": Ast_x,
+        "steel_required_y": Ast_y,
+        "bar_dia_x": bar_dia_x,
+        "bar_dia_y": bar_dia_y,
+        "num_bars_x": num_bars_x,
+        "num_bars_y": num_bars_y,
+        "steel_provided_x": Ast_provided_x,
+        "steel_provided_y": Ast_provided_y,
+        "development_length": Ld,
+        "development_ok": development_ok,
+        "design_ok": design_ok,
+    }
+
+    result: Dict[str, Any] = {"count": count}
+    if "column_ids" in input_data:
+        result["column_ids"] = list(input_data["column_ids"])
+    for name, values in columns.items():
+        result[name] = values.tolist()
+
+    result["warnings"] = _collect_warnings(
+        count, result, resized, no_shear_x, no_shear_y, deepened,
+        development_ok, L_available
+    )
+    result["design_code_used"] = inputs["design_code"].tolist()
+    result["calculation_timestamp"] = datetime.utcnow().isoformat()
+
+    return result
+
+
+def batch_result_to_records(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Split a columnar batch result into per-column design dictionaries.
+
+    Each record carries the same fields as design_isolated_footing() output
+    (without the input echo), so it can be fed to optimize_schedule().
+
+    Args:
+        result: Output of design_isolated_footings_batch()
+
+    Returns:
+        List of per-column dictionaries
+    """
+    fields = FLOAT_OUTPUTS + INT_OUTPUTS + BOOL_OUTPUTS + ["warnings", "design_code_used"]
+    records = []
+    for i in range(result["count"]):
+        record = {name: result[name][i] for name in fields}
+        if "column_ids" in result:
+            record["column_id"] = result["column_ids"][i]
+        record["calculation_timestamp"] = result["calculation_timestamp"]
+        records.append(record)
+    return records
+
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+def _prepare_inputs(input_data: Dict[str, Any]) -> tuple:
+    """
+    Broadcast, default and validate the columnar input.
+
+    Mirrors the FoundationInput constraints so invalid rows are rejected
+    exactly where the scalar engine would reject them.
+
+    Returns:
+        (inputs, count) where inputs maps field name to a NumPy array
+    """
+    lengths = {
+        name: len(value)
+        for name, value in input_data.items()
+        if name in NUMERIC_FIELDS or name in CATEGORICAL_FIELDS or name == "column_ids"
+        if isinstance(value, (list, tuple, np.ndarray))
+    }
+    if not lengths:
+        raise ValueError("Batch input must contain at least one column array")
+    if len(set(lengths.values())) > 1:
+        raise ValueError(f"Batch input columns have different lengths: {lengths}")
+    count = next(iter(lengths.values()))
+
+    inputs: Dict[str, np.ndarray] = {}
+    errors: List[str] = []
+
+    for name, (default, positive) in NUMERIC_FIELDS.items():
+        value = input_data.get(name, default)
+        if value is None:
+            if default is None:
+                errors.append(f"{name}: field required")
+                continue
+            value = default
+        try:
+            array = np.broadcast_to(np.asarray(value, dtype=float), (count,)).copy()
+        except (TypeError, ValueError):
+            errors.append(f"{name}: must be numeric")
+            continue
+        if positive:
+            bad = np.flatnonzero(~(array > 0))
+            if bad.size:
+                errors.append(f"{name}: must be greater than 0 (rows {_row_list(bad)})")
+        inputs[name] = array
+
+    for name, (default, allowed) in CATEGORICAL_FIELDS.items():
+        value = input_data.get(name, default)
+        array = np.broadcast_to(np.asarray(value, dtype=object), (count,))
+        bad = np.flatnonzero(~np.isin(array, allowed))
+        if bad.size:
+            errors.append(f"{name}: must be one of {list(allowed)} (rows {_row_list(bad)})")
+        inputs[name] = array
+
+    # Like FoundationInput, an explicit aspect ratio must exceed 1 even for square rows
+    if "aspect_ratio" in inputs and input_data.get("aspect_ratio") is not None:
+        bad = np.flatnonzero(~(inputs["aspect_ratio"] > 1.0))
+        if bad.size:
+            errors.append(f"aspect_ratio: must be greater than 1 (rows {_row_list(bad)})")
+
+    if errors:
+        raise ValueError("Invalid batch foundation input: " + "; ".join(errors))
+
+    inputs["concrete_grade_index"] = _category_index(inputs["concrete_grade"], CONCRETE_PROPERTIES)
+    inputs["steel_grade_index"] = _category_index(inputs["steel_grade"], STEEL_PROPERTIES)
+
+    return inputs, count
+
+
+def _category_index(values: np.ndarray, table: Dict[str, Any]) -> np.ndarray:
+    """Map categorical values to their position in a property table."""
+    index = np.zeros(len(values), dtype=np.intp)
+    for position, key in enumerate(table):
+        index[values == key] = position
+    return index
+
+
+def _row_list(rows: np.ndarray, limit: int = 10) -> str:
+    """Format offending row indices for error messages."""
+    shown = ", ".join(str(row) for row in rows[:limit])
+    return shown + (", ..." if rows.size > limit else "")
+
+
+def _ceil_to_increment(values: np.ndarray) -> np.ndarray:
+    """Round up to the nearest 0.05 m, as math.ceil(x / 0.05) * 0.05."""
+    return np.ceil(values / 0.05) * 0.05
+
+
+def _base_pressures(P_total, L, B, D, A_actual) -> tuple:
+    """Service and ultimate base pressures including footing self-weight."""
+    W_footing = (L * B * D) * CONCRETE_DENSITY
+    P_total_actual = P_total + W_footing
+    P_u_actual = LOAD_FACTOR * P_total_actual
+    return P_total_actual, P_u_actual, P_total_actual / A_actual, P_u_actual / A_actual
+
+
+def _required_steel(M_u: np.ndarray, d: np.ndarray, fy: np.ndarray) -> np.ndarray:
+    """Steel area (mm²) with a 0.9d lever arm, as _calculate_reinforcement()."""
+    return (M_u * 1e6) / (0.87 * fy * 0.9 * (d * 1000))
+
+
+def _select_bars(Ast_required: np.ndarray, width: np.ndarray) -> tuple:
+    """
+    Vectorized _select_bars(): first bar size in search order whose spacing
+    fits, falling back to 25 mm bars.
+
+    Returns:
+        (bar_dia, num_bars, Ast_provided) arrays
+    """
+    bar_dia = np.full(Ast_required.shape, FALLBACK_BAR, dtype=np.int64)
+    A_fallback = np.pi * (FALLBACK_BAR ** 2) / 4
+    num_bars = np.ceil(Ast_required / A_fallback)
+    Ast_provided = num_bars * A_fallback
+
+    available_width = width * 1000 - 2 * 75
+    pending = np.ones(Ast_required.shape, dtype=bool)
+
+    for size in BAR_SEARCH_ORDER:
+        A_bar = np.pi * (size ** 2) / 4
+        num_required = np.ceil(Ast_required / A_bar)
+        multiple = num_required > 1
+        spacing = available_width.copy()
+        spacing[multiple] = available_width[multiple] / (num_required[multiple] - 1)
+
+        chosen = pending & (spacing >= max(size, 75))
+        bar_dia[chosen] = size
+        num_bars[chosen] = num_required[chosen]
+        Ast_provided[chosen] = num_required[chosen] * A_bar
+        pending &= ~chosen
+        if not pending.any():
+            break
+
+    return bar_dia, num_bars.astype(np.int64), Ast_provided
+
+
+def _collect_warnings(
+    count: int,
+    result: Dict[str, Any],
+    resized: np.ndarray,
+    no_shear_x: np.ndarray,
+    no_shear_y: np.ndarray,
+    deepened: np.ndarray,
+    development_ok: np.ndarray,
+    L_available: np.ndarray,
+) -> List[List[str]]:
+    """Build the per-column warning lists in the scalar engine's order."""
+    warnings: List[List[str]] = [[] for _ in range(count)]
+    flagged = resized | no_shear_x | no_shear_y | deepened | ~development_ok
+
+    for i in np.flatnonzero(flagged).tolist():
+        row = warnings[i]
+        if resized[i]:
+            row.append(
+                f"Footing size increased to {result['footing_length'][i]:.2f}m × "
+                f"{result['footing_width'][i]:.2f}m to satisfy bearing capacity"
+            )
+        if no_shear_x[i]:
+            row.append("No shear check needed in X direction - shallow footing")
+        if no_shear_y[i]:
+            row.append("No shear check needed in Y direction - shallow footing")
+        if deepened[i]:
+            row.append(
+                f"Depth increased to {result['footing_depth'][i]:.3f}m to satisfy shear requirements"
+            )
+        if not development_ok[i]:
+            row.append(
+                f"Development length ({result['development_length'][i]:.3f}m) exceeds available length "
+                f"({float(L_available[i]):.3f}m). Consider increasing footing size or using "
+                "hooks/bends."
+            )
+
+    return warnings
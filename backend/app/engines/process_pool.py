@@ -0,0 +1,384 @@
+"""
+CSA AIaaS Platform - Engine Process Pool
+Performance: Run CPU-bound calculation engines on all cores
+
+Calculation engines (slab coefficient interpolation, retaining wall
+stability, QAP assembly, constructability analysis) are pure-Python CPU work.
+On threads they share one GIL, so concurrent design requests queue behind
+each other. Engines registered with execution="process" are instead sent to a
+warm, bounded pool of worker processes.
+
+Features:
+- Workers import the engine registry once (warm_up() at startup), so a call
+  pays only for pickling its input and output
+- Bounded: at most ENGINE_PROCESS_POOL_MAX_PENDING calls queued or running;
+  further callers wait for a slot instead of growing an unbounded queue, for
+  at most ENGINE_PROCESS_POOL_SLOT_TIMEOUT_SECONDS capped by the step deadline
+  (then EngineProcessPoolBusyError)
+- Picklable contracts: process engines must be module-level functions taking
+  and returning plain data (dicts of numbers, strings, lists, datetimes...).
+  Inputs that cannot be pickled run inline in the caller instead
+- Falls back to inline execution if worker processes cannot be started.
+  When a worker dies during a call (e.g. the input exhausted memory) the
+  pool is rebuilt and the call retried once on it, never inline: an input
+  that kills workers must not take down the API process. A second crash
+  raises EngineProcessCrashedError
+- Metrics: submitted/completed/failed calls, fallbacks, worker crashes,
+  in-flight and peak, and per-function call counts and compute time
+  measured in the workers
+
+Engines in a worker process do not see the caller's step deadline or circuit
+breakers; the caller still stops waiting at its timeout.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# True inside pool workers: engines calling the registry there run inline
+_in_worker = False
+
+
+class EngineProcessCrashedError(RuntimeError):
+    """A process engine call killed its worker, also when retried on a new pool"""
+
+    error_type = "worker_crashed"
+
+
+class EngineProcessPoolBusyError(TimeoutError):
+    """No pool slot became free before the call's timeout"""
+
+    error_type = "timeout"
+
+
+# ============================================================================
+# WORKER SIDE
+# ============================================================================
+
+def _init_worker() -> None:
+    global _in_worker
+    _in_worker = True
+    # Populates the engine registry (and imports every engine) once per worker
+    import app.engines.registry  # noqa: F401
+
+
+def _run_in_worker(func: Callable[..., Any], payload: bytes) -> Tuple[Any, float]:
+    args = pickle.loads(payload)
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def in_worker_process() -> bool:
+    """Whether this process is an engine pool worker"""
+    return _in_worker
+
+
+# ============================================================================
+# POOL
+# ============================================================================
+
+class EngineProcessPool:
+    """
+    Bounded pool of warm worker processes for CPU-bound engines
+
+    Args:
+        max_workers: Worker processes (default: one per CPU core)
+        max_pending: Calls queued or running at once (default: 2 x workers)
+        start_method: multiprocessing start method ("spawn", "forkserver")
+        slot_timeout_seconds: Longest wait for a free slot (capped by the
+            current step deadline)
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        start_method: str = "spawn",
+        slot_timeout_seconds: float = 60.0
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 2 * self.max_workers
+        self.start_method = start_method
+        self.slot_timeout_seconds = slot_timeout_seconds
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._in_flight = 0
+        self._functions: Dict[str, Dict[str, float]] = {}
+        self.stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "inline_fallbacks": 0,
+            "unpicklable_inputs": 0,
+            "pool_restarts": 0,
+            "worker_crashes": 0,
+            "peak_in_flight": 0,
+            "slot_timeouts": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        with self._lock:
+            if self._executor is None:
+                try:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context(self.start_method),
+                        initializer=_init_worker
+                    )
+                except (OSError, ValueError, NotImplementedError) as e:
+                    logger.warning(f"Engine process pool unavailable, running engines inline: {e}")
+                    return None
+            return self._executor
+
+    def warm_up(self) -> int:
+        """Start every worker and load the engines in it; returns live workers"""
+        executor = self._get_executor()
+        if executor is None:
+            return 0
+        try:
+            pids = {f.result() for f in [executor.submit(_ping) for _ in range(self.max_workers)]}
+        except (BrokenProcessPool, OSError) as e:
+            logger.warning(f"Engine process pool warm-up failed: {e}")
+            self._reset(executor)
+            return 0
+        return len(pids)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _reset(self, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+                self.stats["pool_restarts"] += 1
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # Calls
+    # ------------------------------------------------------------------
+
+    def run(self, name: str, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run func(*args) in a worker process and wait for the result
+
+        Args:
+            name: Metrics key (e.g. "tool.function")
+            func: Module-level (picklable) function
+            *args: Picklable arguments
+
+        Returns:
+            func's return value
+
+        Raises:
+            EngineProcessPoolBusyError: No slot became free in time
+            EngineProcessCrashedError: The call killed its worker twice
+            Exception: Whatever func raised in the worker
+        """
+        future = self._submit(name, func, args, blocking=True)
+        if future is None:
+            return func(*args)
+        try:
+            return self._result(name, future)
+        except BrokenProcessPool as e:
+            return self._retry_after_crash(name, func, args, e)
+
+    async def run_async(self, name: str, func: Callable[..., Any], *args: Any) -> Any:
+        """Async run(): the event loop is not blocked while waiting for a worker"""
+        future = self._submit(name, func, args, blocking=False)
+        if future is None:
+            return await asyncio.to_thread(func, *args)
+        if future is _NO_SLOT:
+            return await asyncio.to_thread(self.run, name, func, *args)
+        try:
+            await asyncio.wrap_future(future)
+        except Exception:
+            pass  # re-raised (or recovered from) by _result
+        try:
+            return self._result(name, future)
+        except BrokenProcessPool as e:
+            return await asyncio.to_thread(self._retry_after_crash, name, func, args, e)
+
+    def _submit(self, name: str, func: Callable[..., Any], args: Tuple, blocking: bool):
+        """Future for the call, _NO_SLOT if full (non-blocking), None to run inline; blocking waits are bounded"""
+        if _in_worker:
+            return None
+        try:
+            payload = pickle.dumps(args, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug(f"Engine {name} input not picklable, running inline: {e}")
+            with self._lock:
+                self.stats["unpicklable_inputs"] += 1
+                self.stats["inline_fallbacks"] += 1
+            return None
+
+        executor = self._get_executor()
+        if executor is None:
+            with self._lock:
+                self.stats["inline_fallbacks"] += 1
+            return None
+
+        if not blocking:
+            if not self._slots.acquire(blocking=False):
+                return _NO_SLOT
+        else:
+            # Imported here: app.execution imports the engine registry, which imports this module
+            from app.execution.timeout_manager import remaining_seconds
+
+            wait = remaining_seconds(self.slot_timeout_seconds)
+            if wait <= 0 or not self._slots.acquire(timeout=wait):
+                with self._lock:
+                    self.stats["slot_timeouts"] += 1
+                raise EngineProcessPoolBusyError(
+                    f"Engine {name} waited {max(wait, 0):g}s for a free process pool slot "
+                    f"(all {self.max_pending} taken)"
+                )
+
+        try:
+            future = executor.submit(_run_in_worker, func, payload)
+        except (BrokenProcessPool, RuntimeError) as e:
+            self._slots.release()
+            logger.warning(f"Engine process pool broken, running {name} inline: {e}")
+            self._reset(executor)
+            with self._lock:
+                self.stats["inline_fallbacks"] += 1
+            return None
+
+        with self._lock:
+            self.stats["submitted"] += 1
+            self._in_flight += 1
+            self.stats["peak_in_flight"] = max(self.stats["peak_in_flight"], self._in_flight)
+        future.add_done_callback(self._release)
+        future.pool_executor = executor
+        return future
+
+    def _release(self, future: Future) -> None:
+        self._slots.release()
+        with self._lock:
+            self._in_flight -= 1
+
+    def _result(self, name: str, future: Future) -> Any:
+        try:
+            result, elapsed = future.result()
+        except BrokenProcessPool:
+            # A worker died (e.g. killed by the OS): rebuild the pool
+            self._reset(future.pool_executor)
+            with self._lock:
+                self.stats["worker_crashes"] += 1
+            raise
+        except Exception:
+            with self._lock:
+                self.stats["failed"] += 1
+                self._functions.setdefault(name, {"calls": 0, "errors": 0, "compute_ms": 0.0})["errors"] += 1
+            raise
+
+        with self._lock:
+            self.stats["completed"] += 1
+            counts = self._functions.setdefault(name, {"calls": 0, "errors": 0, "compute_ms": 0.0})
+            counts["calls"] += 1
+            counts["compute_ms"] += elapsed * 1000
+        return result
+
+    def _retry_after_crash(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        args: Tuple,
+        error: BrokenProcessPool
+    ) -> Any:
+        """Run a call whose worker died once more on the rebuilt pool (never inline)."""
+        logger.warning(f"Engine process pool worker died during {name}, retrying on a new pool: {error}")
+        future = self._submit(name, func, args, blocking=True)
+        if future is not None:
+            try:
+                return self._result(name, future)
+            except BrokenProcessPool as e:
+                error = e
+        raise EngineProcessCrashedError(
+            f"Engine {name} worker process died during the call ({error})"
+        ) from error
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool size, call counters and per-function compute time"""
+        with self._lock:
+            return {
+                **self.stats,
+                "workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "start_method": self.start_method,
+                "running": self._executor is not None,
+                "in_flight": self._in_flight,
+                "functions": {
+                    name: {
+                        **counts,
+                        "compute_ms": round(counts["compute_ms"], 2),
+                        "avg_ms": round(counts["compute_ms"] / counts["calls"], 2) if counts["calls"] else 0.0,
+                    }
+                    for name, counts in self._functions.items()
+                },
+            }
+
+
+_NO_SLOT = object()
+
+
+# ============================================================================
+# GLOBAL INSTANCE
+# ============================================================================
+
+_global_pool: Optional[EngineProcessPool] = None
+_global_lock = threading.Lock()
+
+
+def get_engine_process_pool() -> Optional[EngineProcessPool]:
+    """
+    Get the process-wide engine pool (created lazily, workers start on first use).
+
+    Returns:
+        The shared EngineProcessPool, or None if ENGINE_PROCESS_POOL_ENABLED is
+        off or this is already a worker process
+    """
+    global _global_pool
+    if not settings.ENGINE_PROCESS_POOL_ENABLED or _in_worker:
+        return None
+    with _global_lock:
+        if _global_pool is None:
+            _global_pool = EngineProcessPool(
+                max_workers=settings.ENGINE_PROCESS_POOL_WORKERS or None,
+                max_pending=settings.ENGINE_PROCESS_POOL_MAX_PENDING or None,
+                start_method=settings.ENGINE_PROCESS_POOL_START_METHOD,
+                slot_timeout_seconds=settings.ENGINE_PROCESS_POOL_SLOT_TIMEOUT_SECONDS,
+            )
+    return _global_pool
+
+
+def shutdown_engine_process_pool() -> None:
+    """Stop the worker processes (application shutdown)."""
+    global _global_pool
+    with _global_lock:
+        pool, _global_pool = _global_pool, None
+    if pool is not None:
+        pool.shutdown()
@@ -153,12 +153,20 @@ def _extract_with_llm(data: ScopeExtractionInput) -> Dict[str, Any]:
     """
     Extract scope items using LLM analysis.
 
+    The call goes through the "llm:openrouter" circuit breaker, so while the
+    provider is down extraction falls back to rules immediately, and its HTTP
+    timeout is capped by the running workflow step's deadline.
+
     Args:
         data: Validated scope extraction input
 
     Returns:
         Extraction result dictionary
     """
+    # Imported here: app.execution imports the engine registry, which imports this module
+    from app.execution.circuit_breaker import get_circuit_breaker
+    from app.execution.timeout_manager import remaining_seconds
+
     # Get API key
     api_key = os.getenv("OPENROUTER_API_KEY")
     if not api_key:
@@ -190,15 +198,21 @@ def _extract_with_llm(data: ScopeExtractionInput) -> Dict[str, Any]:
 
     print("[SCOPE EXTRACTOR] Calling LLM for extraction...")
 
-    with httpx.Client(timeout=120.0) as client:
-        response = client.post(
-            "https://openrouter.ai/api/v1/chat/completions",
-            headers=headers,
-            json=payload
-        )
+    def call_llm() -> httpx.Response:
+        with httpx.Client(timeout=remaining_seconds(120.0)) as client:
+            response = client.post(
+                "https://openrouter.ai/api/v1/chat/completions",
+                headers=headers,
+                json=payload
+            )
+        if response.status_code != 200:
+            # Reason phrase ("503 Service Unavailable") marks transient errors for the breaker
+            raise ValueError(
+                f"LLM API error: {response.status_code} {response.reason_phrase} - {response.text}"
+            )
+        return response
 
-    if response.status_code != 200:
-        raise ValueError(f"LLM API error: {response.status_code} - {response.text}")
+    response = get_circuit_breaker("llm:openrouter").call(call_llm)
 
     # Parse response
     result = response.json()
@@ -12,19 +12,46 @@ Registry Structure:
             "function_name": callable,
             "description": str,
             "input_schema": dict,
-            "output_schema": dict
+            "output_schema": dict,
+            "pure": bool,
+            "version": str,
+            "execution": "inline" | "thread" | "process" | "sandbox"
         }
     }
 
+Engines registered with pure=True have their results memoized by invoke()
+(see app/engines/result_cache.py); bump an engine's version whenever its
+calculation changes so cached results are discarded.
+
+Execution tiers (where the function runs when invoked):
+- inline:  in the calling thread (cheap engines)
+- thread:  inline for invoke(); a worker thread for invoke_async()
+           (I/O-bound engines, e.g. LLM calls)
+- process: the warm engine process pool (app/engines/process_pool.py) for
+           CPU-bound engines, so concurrent requests use every core. Such
+           functions must be module-level, with picklable input and output
+- sandbox: a supervised worker process (app/engines/sandbox.py) with a hard
+           wall-clock and memory limit, killed on breach. For engines whose
+           loops a pathological input can keep running. Any engine can be
+           sandboxed per call with invoke(..., sandbox=True)
+
 Usage:
     >>> from app.engines.registry import engine_registry
     >>> func = engine_registry.get_function("civil_foundation_designer_v1", "design_isolated_footing")
     >>> result = func(input_data)
 """
 
-from typing import Dict, Any, Callable, Optional
+from typing import Dict, Any, Callable, Optional, Set, Tuple
 from pydantic import BaseModel
+import asyncio
 import inspect
+import pickle
+
+from app.engines.result_cache import EngineResultCache, canonical_input_hash, get_engine_result_cache
+from app.engines.process_pool import EngineProcessPool, get_engine_process_pool
+from app.engines.sandbox import EngineSandbox, get_engine_sandbox
+
+EXECUTION_TIERS = ("inline", "thread", "process", "sandbox")
 
 
 # ============================================================================
@@ -39,9 +66,50 @@ class EngineRegistry:
     in the database (Phase 2 Sprint 2+).
     """
 
-    def __init__(self):
-        """Initialize empty registry."""
+    def __init__(
+        self,
+        result_cache: Optional[EngineResultCache] = None,
+        process_pool: Optional[EngineProcessPool] = None,
+        sandbox: Optional[EngineSandbox] = None
+    ):
+        """
+        Initialize empty registry.
+
+        Args:
+            result_cache: Cache for pure engine results (default: the
+                          process-wide cache, if ENGINE_MEMO_ENABLED)
+            process_pool: Pool for execution="process" engines (default: the
+                          process-wide pool, if ENGINE_PROCESS_POOL_ENABLED)
+            sandbox: Supervisor for sandboxed calls (default: the process-wide
+                     sandbox, if ENGINE_SANDBOX_ENABLED)
+        """
         self._registry: Dict[str, Dict[str, Any]] = {}
+        self._result_cache = result_cache
+        self._process_pool = process_pool
+        self._sandbox = sandbox
+        # (tool, function, version) whose older cached versions were purged
+        self._current_versions: Set[Tuple[str, str, str]] = set()
+
+    @property
+    def result_cache(self) -> Optional[EngineResultCache]:
+        """Cache used for pure engines, or None when memoization is off."""
+        if self._result_cache is not None:
+            return self._result_cache
+        return get_engine_result_cache()
+
+    @property
+    def process_pool(self) -> Optional[EngineProcessPool]:
+        """Pool for process engines, or None to run them inline."""
+        if self._process_pool is not None:
+            return self._process_pool
+        return get_engine_process_pool()
+
+    @property
+    def sandbox(self) -> Optional[EngineSandbox]:
+        """Supervisor for sandboxed engines, or None to run them inline."""
+        if self._sandbox is not None:
+            return self._sandbox
+        return get_engine_sandbox()
 
     def register_tool(
         self,
@@ -50,7 +118,10 @@ class EngineRegistry:
         function: Callable,
         description: str = "",
         input_schema: Optional[type] = None,
-        output_schema: Optional[type] = None
+        output_schema: Optional[type] = None,
+        pure: bool = False,
+        version: str = "1.0.0",
+        execution: str = "inline"
     ) -> None:
         """
         Register a calculation function under a tool name.
@@ -62,6 +133,15 @@ class EngineRegistry:
             description: Human-readable description
             input_schema: Pydantic model for input validation (optional)
             output_schema: Pydantic model for output validation (optional)
+            pure: Output depends only on the input dict (no IDs, I/O or
+                  randomness), so invoke() may memoize it
+            version: Engine version; change it when the calculation changes
+                     to invalidate memoized results
+            execution: Execution tier: "inline", "thread", "process" or "sandbox"
+
+        Raises:
+            ValueError: Unknown execution tier, or a process or sandbox engine
+                        that cannot be pickled (lambdas, nested functions)
 
         Example:
             >>> registry = EngineRegistry()
@@ -72,6 +152,17 @@ class EngineRegistry:
             ...     "Design isolated RCC footing per IS 456:2000"
             ... )
         """
+        if execution not in EXECUTION_TIERS:
+            raise ValueError(f"execution must be one of {EXECUTION_TIERS}, got '{execution}'")
+        if execution in ("process", "sandbox"):
+            try:
+                pickle.dumps(function)
+            except Exception as e:
+                raise ValueError(
+                    f"{tool_name}.{function_name} must be a module-level function "
+                    f"to run in an engine worker process: {e}"
+                ) from e
+
         if tool_name not in self._registry:
             self._registry[tool_name] = {}
 
@@ -80,7 +171,10 @@ class EngineRegistry:
             "description": description,
             "input_schema": input_schema,
             "output_schema": output_schema,
-            "signature": str(inspect.signature(function))
+            "signature": str(inspect.signature(function)),
+            "pure": pure,
+            "version": version,
+            "execution": execution
         }
 
     def get_function(self, tool_name: str, function_name: str) -> Optional[Callable]:
@@ -141,21 +235,33 @@ class EngineRegistry:
         self,
         tool_name: str,
         function_name: str,
-        input_data: Dict[str, Any]
+        input_data: Dict[str, Any],
+        use_cache: bool = True,
+        sandbox: bool = False,
+        timeout_seconds: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Invoke a registered function with input data.
 
+        Results of pure engines are memoized by (tool, function, version,
+        canonical input hash); a cache hit returns a fresh copy.
+
         Args:
             tool_name: Tool name
             function_name: Function name
             input_data: Input dictionary
+            use_cache: Set False to always recompute
+            sandbox: Run in a sandboxed worker, whatever the engine's tier
+            timeout_seconds: Wall-clock limit for a sandboxed call (default:
+                             ENGINE_SANDBOX_TIMEOUT_SECONDS)
 
         Returns:
             Output dictionary from function
 
         Raises:
             ValueError: If tool or function not found
+            EngineSandboxError: A sandboxed call hit its wall-clock or memory
+                                limit, or its worker died
             Exception: Any exception raised by the function
 
         Example:
@@ -165,19 +271,157 @@ class EngineRegistry:
             ...     {"axial_load_dead": 600, ...}
             ... )
         """
-        func = self.get_function(tool_name, function_name)
+        func_info = self._registry.get(tool_name, {}).get(function_name)
 
-        if func is None:
+        if func_info is None:
             raise ValueError(
                 f"Function '{function_name}' not found in tool '{tool_name}'. "
                 f"Available tools: {self.list_tools()}"
             )
 
+        if sandbox or timeout_seconds is not None:
+            func_info = {
+                **func_info,
+                "execution": "sandbox" if sandbox else func_info["execution"],
+                "timeout_seconds": timeout_seconds
+            }
+
+        return self._call(tool_name, function_name, func_info, input_data, use_cache)
+
+    async def invoke_async(
+        self,
+        tool_name: str,
+        function_name: str,
+        input_data: Dict[str, Any],
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        invoke() for async callers, without blocking the event loop.
+
+        Inline engines run on the loop; thread and process engines are
+        awaited from a worker thread (process engines compute in the engine
+        process pool while that thread waits).
+
+        Raises:
+            ValueError: If tool or function not found
+            Exception: Any exception raised by the function
+        """
+        func_info = self._registry.get(tool_name, {}).get(function_name)
+
+        if func_info is None or func_info["execution"] == "inline":
+            return self.invoke(tool_name, function_name, input_data, use_cache)
+
+        return await asyncio.to_thread(
+            self._call, tool_name, function_name, func_info, input_data, use_cache
+        )
+
+    def bind(
+        self,
+        tool_name: str,
+        function_name: str,
+        sandbox: bool = False,
+        timeout_seconds: Optional[float] = None
+    ) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Bind a registered function once, for callers that invoke it repeatedly.
+
+        The returned callable behaves like invoke(tool_name, function_name, ...)
+        (including memoization of pure engines) without the registry lookup.
+        Functions registered after binding, or re-registered, are not seen;
+        an unknown function binds to invoke() so it raises the same error.
+
+        Args:
+            tool_name: Tool name
+            function_name: Function name
+            sandbox: Run in a sandboxed worker, whatever the engine's tier
+            timeout_seconds: Wall-clock limit for sandboxed calls
+
+        Returns:
+            Callable taking the input dictionary
+
+        Example:
+            >>> design = registry.bind("civil_foundation_designer_v1", "design_isolated_footing")
+            >>> result = design({"axial_load_dead": 600, ...})
+        """
+        func_info = self._registry.get(tool_name, {}).get(function_name)
+
+        if func_info is None:
+            return lambda input_data: self.invoke(
+                tool_name, function_name, input_data, sandbox=sandbox, timeout_seconds=timeout_seconds
+            )
+
+        if sandbox or timeout_seconds is not None:
+            func_info = {
+                **func_info,
+                "execution": "sandbox" if sandbox else func_info["execution"],
+                "timeout_seconds": timeout_seconds
+            }
+
+        return lambda input_data: self._call(tool_name, function_name, func_info, input_data, True)
+
+    def _call(
+        self,
+        tool_name: str,
+        function_name: str,
+        func_info: Dict[str, Any],
+        input_data: Dict[str, Any],
+        use_cache: bool
+    ) -> Dict[str, Any]:
+        """Invoke a looked-up function, memoizing pure engines."""
+        cache = self.result_cache if func_info["pure"] and use_cache else None
+        if cache is None:
+            return self._execute(tool_name, function_name, func_info, input_data)
+
+        version = func_info["version"]
+        try:
+            key = (tool_name, function_name, version, canonical_input_hash(input_data))
+        except (TypeError, ValueError):
+            cache.record_uncacheable()
+            return self._execute(tool_name, function_name, func_info, input_data)
+
+        if (tool_name, function_name, version) not in self._current_versions:
+            # First use of this version: drop results of any other version
+            cache.invalidate(tool_name, function_name, keep_version=version)
+            self._current_versions.add((tool_name, function_name, version))
+
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
         # Invoke function
-        result = func(input_data)
+        result = self._execute(tool_name, function_name, func_info, input_data)
+        cache.put(key, result)
 
         return result
 
+    def _execute(
+        self,
+        tool_name: str,
+        function_name: str,
+        func_info: Dict[str, Any],
+        input_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Run the function in its execution tier (process engines in the pool)."""
+        if func_info["execution"] == "process":
+            pool = self.process_pool
+            if pool is not None:
+                return pool.run(f"{tool_name}.{function_name}", func_info["function"], input_data)
+        elif func_info["execution"] == "sandbox":
+            sandbox = self.sandbox
+            if sandbox is not None:
+                return sandbox.run(
+                    f"{tool_name}.{function_name}",
+                    func_info["function"],
+                    input_data,
+                    func_info.get("timeout_seconds")
+                )
+        return func_info["function"](input_data)
+
+    def get_execution_tier(self, tool_name: str, function_name: str) -> Optional[str]:
+        """Execution tier of a registered function, or None if not found."""
+        func_info = self._registry.get(tool_name, {}).get(function_name)
+        return func_info["execution"] if func_info else None
+
     def get_registry_summary(self) -> Dict[str, Any]:
         """
         Get a summary of the entire registry.
@@ -197,7 +441,10 @@ class EngineRegistry:
                     {
                         "name": func_name,
                         "description": func_info["description"],
-                        "signature": func_info["signature"]
+                        "signature": func_info["signature"],
+                        "pure": func_info["pure"],
+                        "version": func_info["version"],
+                        "execution": func_info["execution"]
                     }
                     for func_name, func_info in functions.items()
                 ]
@@ -237,6 +484,9 @@ def register_all_engines():
         optimize_schedule,
         FinalDesignData
     )
+    from app.engines.foundation.design_isolated_footing_batch import (
+        design_isolated_footings_batch
+    )
 
     # Register civil_foundation_designer_v1 tool
     engine_registry.register_tool(
@@ -246,7 +496,8 @@ def register_all_engines():
         description="Design isolated RCC footing following IS 456:2000. "
                     "Calculates dimensions, reinforcement, and performs code checks.",
         input_schema=FoundationInput,
-        output_schema=InitialDesignData
+        output_schema=InitialDesignData,
+        pure=True
     )
 
     engine_registry.register_tool(
@@ -256,7 +507,21 @@ def register_all_engines():
         description="Optimize foundation design, standardize dimensions, "
                     "generate bar bending schedule and material quantities.",
         input_schema=InitialDesignData,
-        output_schema=FinalDesignData
+        output_schema=FinalDesignData,
+        pure=True
+    )
+
+    engine_registry.register_tool(
+        tool_name="civil_foundation_designer_v1",
+        function_name="design_isolated_footings_batch",
+        function=design_isolated_footings_batch,
+        description="Design a whole foundation schedule in one vectorized call. "
+                    "Takes columnar column loads and geometries; each row matches "
+                    "design_isolated_footing.",
+        input_schema=None,
+        output_schema=None,
+        pure=True,
+        execution="process"
     )
 
     # ========================================================================
@@ -277,7 +542,8 @@ def register_all_engines():
         description="Analyze RCC beam for bending moments and shear forces. "
                     "Step 1 of beam design following IS 456:2000.",
         input_schema=BeamInput,
-        output_schema=None  # Returns analysis dict
+        output_schema=None,  # Returns analysis dict
+        pure=True
     )
 
     engine_registry.register_tool(
@@ -287,7 +553,8 @@ def register_all_engines():
         description="Design flexural and shear reinforcement for RCC beam. "
                     "Step 2 of beam design following IS 456:2000.",
         input_schema=None,  # Takes analysis dict
-        output_schema=BeamDesignOutput
+        output_schema=BeamDesignOutput,
+        pure=True
     )
 
     # ========================================================================
@@ -307,7 +574,8 @@ def register_all_engines():
         description="Check steel column capacity for axial loads. "
                     "Includes section selection, slenderness, and buckling checks per IS 800:2007.",
         input_schema=SteelColumnInput,
-        output_schema=None  # Returns capacity dict
+        output_schema=None,  # Returns capacity dict
+        pure=True
     )
 
     engine_registry.register_tool(
@@ -317,7 +585,9 @@ def register_all_engines():
         description="Design column base plate and connections. "
                     "Includes anchor bolts, welds, and material quantities.",
         input_schema=None,  # Takes capacity dict
-        output_schema=SteelColumnOutput
+        output_schema=SteelColumnOutput,
+        pure=True,
+        execution="sandbox"
     )
 
     # ========================================================================
@@ -337,7 +607,9 @@ def register_all_engines():
         description="Analyze RCC slab (one-way or two-way) for bending moments. "
                     "Step 1 of slab design following IS 456:2000.",
         input_schema=SlabInput,
-        output_schema=None  # Returns analysis dict
+        output_schema=None,  # Returns analysis dict
+        pure=True,
+        execution="process"
     )
 
     engine_registry.register_tool(
@@ -347,7 +619,9 @@ def register_all_engines():
         description="Design reinforcement for RCC slab including deflection check. "
                     "Step 2 of slab design following IS 456:2000.",
         input_schema=None,  # Takes analysis dict
-        output_schema=SlabDesignOutput
+        output_schema=SlabDesignOutput,
+        pure=True,
+        execution="process"
     )
 
     # ========================================================================
@@ -365,7 +639,8 @@ def register_all_engines():
         description="Analyze combined footing for multiple columns. "
                     "Calculates dimensions, load distribution, and stability per IS 456:2000.",
         input_schema=None,
-        output_schema=None
+        output_schema=None,
+        pure=True
     )
 
     engine_registry.register_tool(
@@ -375,7 +650,8 @@ def register_all_engines():
         description="Design reinforcement for combined footing including punching shear check. "
                     "Step 2 of combined footing design following IS 456:2000.",
         input_schema=None,
-        output_schema=None
+        output_schema=None,
+        pure=True
     )
 
     # ========================================================================
@@ -393,7 +669,9 @@ def register_all_engines():
         description="Analyze cantilever retaining wall for stability. "
                     "Checks overturning, sliding, and bearing per IS 14458.",
         input_schema=None,
-        output_schema=None
+        output_schema=None,
+        pure=True,
+        execution="process"
     )
 
     engine_registry.register_tool(
@@ -403,7 +681,9 @@ def register_all_engines():
         description="Design reinforcement for retaining wall stem and base. "
                     "Step 2 of retaining wall design following IS 456:2000.",
         input_schema=None,
-        output_schema=None
+        output_schema=None,
+        pure=True,
+        execution="process"
     )
 
     # ========================================================================
@@ -421,7 +701,9 @@ def register_all_engines():
         description="Analyze steel column base plate requirements. "
                     "Calculates plate dimensions and bearing check per IS 800:2007.",
         input_schema=None,
-        output_schema=None
+        output_schema=None,
+        pure=True,
+        execution="sandbox"
     )
 
     engine_registry.register_tool(
@@ -431,7 +713,8 @@ def register_all_engines():
         description="Design anchor bolts and connection details for base plate. "
                     "Includes embedment, weld design, and layout per IS 800:2007.",
         input_schema=None,
-        output_schema=None
+        output_schema=None,
+        pure=True
     )
 
     # ========================================================================
@@ -449,7 +732,8 @@ def register_all_engines():
         description="Analyze room requirements based on type and dimensions. "
                     "Step 1 of Room Data Sheet generation following NBC 2016.",
         input_schema=None,
-        output_schema=None
+        output_schema=None,
+        pure=True
     )
 
     engine_registry.register_tool(
@@ -493,7 +777,8 @@ def register_all_engines():
         description="Analyze rebar congestion in structural members. "
                     "Checks reinforcement ratio and clear spacing per IS 456:2000.",
         input_schema=RebarCongestionInput,
-        output_schema=RebarCongestionResult
+        output_schema=RebarCongestionResult,
+        pure=True
     )
 
     # Formwork complexity analysis
@@ -504,7 +789,8 @@ def register_all_engines():
         description="Analyze formwork complexity for structural members. "
                     "Evaluates dimension standardization and custom requirements.",
         input_schema=FormworkComplexityInput,
-        output_schema=FormworkComplexityResult
+        output_schema=FormworkComplexityResult,
+        pure=True
     )
 
     # Comprehensive constructability analysis
@@ -515,7 +801,8 @@ def register_all_engines():
         description="Comprehensive constructability analysis combining rebar congestion, "
                     "formwork complexity, access constraints, and sequencing evaluation.",
         input_schema=ConstructabilityAnalysisInput,
-        output_schema=ConstructabilityAnalysisResult
+        output_schema=ConstructabilityAnalysisResult,
+        execution="process"
     )
 
     # Red Flag Report generation
@@ -526,7 +813,8 @@ def register_all_engines():
         description="Generate Red Flag Report from constructability analysis results. "
                     "Executive summary of critical issues requiring attention.",
         input_schema=None,  # Takes analysis result dict
-        output_schema=RedFlagReport
+        output_schema=RedFlagReport,
+        execution="thread"
     )
 
     # Constructability plan generation
@@ -566,7 +854,8 @@ def register_all_engines():
         description="Generate complete Quality Assurance Plan from a scope document. "
                     "Extracts scope items, maps to ITPs, and assembles the QAP document.",
         input_schema=QAPGeneratorInput,
-        output_schema=QAPGeneratorOutput
+        output_schema=QAPGeneratorOutput,
+        execution="thread"
     )
 
     # Step 1: Scope extraction
@@ -577,7 +866,8 @@ def register_all_engines():
         description="Extract scope items from a Project Scope of Work document. "
                     "Identifies construction activities, categories, and quantities.",
         input_schema=ScopeExtractionInput,
-        output_schema=ScopeExtractionResult
+        output_schema=ScopeExtractionResult,
+        execution="thread"
     )
 
     # Step 2: ITP mapping
@@ -588,7 +878,8 @@ def register_all_engines():
         description="Map scope items to standard Inspection Test Plans (ITPs). "
                     "Finds best matching ITPs for each scope item.",
         input_schema=ITPMappingInput,
-        output_schema=ITPMappingResult
+        output_schema=ITPMappingResult,
+        pure=True
     )
 
     # Step 3: QAP assembly
@@ -599,7 +890,8 @@ def register_all_engines():
         description="Assemble a complete QAP document from scope and ITP mappings. "
                     "Creates chapters, project ITPs, and inspection forms.",
         input_schema=QAPAssemblyInput,
-        output_schema=QAPDocument
+        output_schema=QAPDocument,
+        execution="process"
     )
 
     # Future registrations will go here:
@@ -625,7 +917,9 @@ def get_function_names(tool_name: str) -> list[str]:
 def invoke_engine(
     tool_name: str,
     function_name: str,
-    input_data: Dict[str, Any]
+    input_data: Dict[str, Any],
+    sandbox: bool = False,
+    timeout_seconds: Optional[float] = None
 ) -> Dict[str, Any]:
     """
     Convenience function to invoke an engine function.
@@ -634,11 +928,15 @@ def invoke_engine(
         tool_name: Tool name
         function_name: Function name
         input_data: Input dictionary
+        sandbox: Run in a sandboxed worker with hard time and memory limits
+        timeout_seconds: Wall-clock limit for a sandboxed call
 
     Returns:
         Output dictionary
     """
-    return engine_registry.invoke(tool_name, function_name, input_data)
+    return engine_registry.invoke(
+        tool_name, function_name, input_data, sandbox=sandbox, timeout_seconds=timeout_seconds
+    )
 
 
 def print_registry_summary():
@@ -0,0 +1,426 @@
+"""
+CSA AIaaS Platform - Engine Result Cache
+Performance: Memoized results for pure calculation engines
+
+Scenario comparisons, strategic partner reviews and chat-triggered tools
+re-run identical designs through EngineRegistry.invoke. Engines registered
+with ``pure=True`` compute their output from the input dict alone, so their
+results are cached and replayed.
+
+Features:
+- Key: (tool, function, engine version, SHA-256 of the canonical input JSON)
+- Bumping an engine's registered version makes its old entries unreachable
+  and purges them from both tiers
+- In-memory LRU front; optional SQLite file tier shared across restarts
+  and workers on the same host
+- Results stored pickled: every hit returns a fresh copy, so callers may
+  mutate what they get back
+- Volatile timestamps (calculation_timestamp, ...) restamped with the
+  current time on every hit, in the engine's own clock (local or UTC)
+- Hit/miss metrics overall and per engine function
+
+Engines that mint identifiers (report / plan IDs) are not pure and are never
+cached.
+"""
+
+import hashlib
+import json
+import logging
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# (tool_name, function_name, version, input_hash)
+ResultKey = Tuple[str, str, str, str]
+
+# Result keys stamped with the time of the calculation: a replayed result
+# must not report when the original calculation ran
+VOLATILE_TIMESTAMP_KEYS = frozenset({
+    "calculation_timestamp",
+    "analysis_timestamp",
+    "generation_timestamp",
+})
+
+# Clock offsets (e.g. utcnow() vs now()) are whole multiples of 15 minutes
+_CLOCK_OFFSET_STEP = timedelta(minutes=15)
+
+
+# ============================================================================
+# KEYS
+# ============================================================================
+
+def _canonical_default(value: Any) -> Any:
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if isinstance(value, bytes):
+        return value.hex()
+    raise TypeError(f"{type(value).__name__} is not hashable as engine input")
+
+
+def canonical_input_hash(input_data: Dict[str, Any]) -> str:
+    """
+    SHA-256 of the input serialized as canonical JSON (sorted keys).
+
+    Raises:
+        TypeError: If the input holds values with no canonical form
+    """
+    payload = json.dumps(
+        input_data,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=_canonical_default
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# ============================================================================
+# VOLATILE TIMESTAMPS
+# ============================================================================
+
+class _Restamp:
+    """Stored in place of a volatile timestamp: the clock the engine stamped with."""
+
+    __slots__ = ("offset", "tzinfo")
+
+    def __init__(self, offset: timedelta, tzinfo: Any = None):
+        self.offset = offset
+        self.tzinfo = tzinfo
+
+    def __getstate__(self):
+        return (self.offset, self.tzinfo)
+
+    def __setstate__(self, state):
+        self.offset, self.tzinfo = state
+
+    def now(self) -> str:
+        if self.tzinfo is not None:
+            return datetime.now(self.tzinfo).isoformat()
+        return (datetime.now() + self.offset).isoformat()
+
+
+def _restamp_marker(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    try:
+        stamped = datetime.fromisoformat(value)
+    except ValueError:
+        return value
+    if stamped.tzinfo is not None:
+        return _Restamp(timedelta(0), stamped.tzinfo)
+    steps = round((stamped - datetime.now()) / _CLOCK_OFFSET_STEP)
+    return _Restamp(steps * _CLOCK_OFFSET_STEP)
+
+
+def _freeze_timestamps(value: Any) -> Any:
+    """Copy of a result with volatile timestamps replaced by _Restamp markers."""
+    if isinstance(value, dict):
+        return {
+            key: _restamp_marker(item) if key in VOLATILE_TIMESTAMP_KEYS else _freeze_timestamps(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_freeze_timestamps(item) for item in value]
+    return value
+
+
+def _thaw_timestamps(value: Any) -> Any:
+    """Replace _Restamp markers with the current time (in place)."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, _Restamp):
+                value[key] = item.now()
+            else:
+                _thaw_timestamps(item)
+    elif isinstance(value, list):
+        for item in value:
+            _thaw_timestamps(item)
+    return value
+
+
+# ============================================================================
+# BACKING STORE
+# ============================================================================
+
+class SQLiteResultStore:
+    """Pickled engine results in a local SQLite file (opened lazily)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def get(self, key: ResultKey) -> Optional[bytes]:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT result FROM engine_results_v2 "
+                "WHERE tool_name = ? AND function_name = ? AND version = ? AND input_hash = ?",
+                key
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: ResultKey, blob: bytes) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO engine_results_v2 "
+                "(tool_name, function_name, version, input_hash, result) VALUES (?, ?, ?, ?, ?)",
+                (*key, blob)
+            )
+            conn.commit()
+
+    def purge(self, tool_name: str, function_name: str, keep_version: str) -> int:
+        """Delete a function's results computed by any other version."""
+        with self._lock:
+            conn = self._connect()
+            cursor = conn.execute(
+                "DELETE FROM engine_results_v2 WHERE tool_name = ? AND function_name = ? AND version != ?",
+                (tool_name, function_name, keep_version)
+            )
+            conn.commit()
+            return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            # v2: volatile timestamps stored as _Restamp markers (v1 rows replayed them)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS engine_results_v2 ("
+                " tool_name TEXT NOT NULL,"
+                " function_name TEXT NOT NULL,"
+                " version TEXT NOT NULL,"
+                " input_hash TEXT NOT NULL,"
+                " result BLOB NOT NULL,"
+                " created_at TEXT DEFAULT CURRENT_TIMESTAMP,"
+                " PRIMARY KEY (tool_name, function_name, version, input_hash))"
+            )
+        return self._conn
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+class EngineResultCache:
+    """
+    Two-tier cache of pure engine results.
+
+    Usage:
+        key = (tool_name, function_name, version, canonical_input_hash(input_data))
+        result = cache.get(key)
+        if result is None:
+            result = func(input_data)
+            cache.put(key, result)
+    """
+
+    def __init__(self, max_entries: int = 1024, store: Optional[SQLiteResultStore] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum results kept in memory (LRU eviction)
+            store: Persistent backing store (None keeps the cache in memory only)
+        """
+        if max_entries < 1:
+            raise ValueError(f"Invalid cache limit: max_entries={max_entries}")
+
+        self.max_entries = max_entries
+        self.store = store
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[ResultKey, bytes]" = OrderedDict()
+        self._functions: Dict[str, Dict[str, int]] = {}
+
+        self.stats = {
+            "memory_hits": 0,
+            "store_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+            "invalidations": 0,
+            "uncacheable": 0,
+            "store_errors": 0,
+        }
+
+    def get(self, key: ResultKey) -> Optional[Any]:
+        """Get a copy of a cached result, or None on miss."""
+        with self._lock:
+            blob = self._entries.get(key)
+            if blob is not None:
+                self._entries.move_to_end(key)
+                self._count_locked(key, "memory_hits")
+
+        if blob is None and self.store is not None:
+            try:
+                blob = self.store.get(key)
+            except Exception as e:
+                self._record_store_error("read", e)
+            if blob is not None:
+                with self._lock:
+                    self._remember_locked(key, blob)
+                    self._count_locked(key, "store_hits")
+
+        if blob is None:
+            with self._lock:
+                self._count_locked(key, "misses")
+            return None
+        return _thaw_timestamps(pickle.loads(blob))
+
+    def put(self, key: ResultKey, result: Any) -> None:
+        """Cache a result (memory and backing store)."""
+        try:
+            blob = pickle.dumps(_freeze_timestamps(result), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug("Engine result for %s.%s not cacheable: %s", key[0], key[1], e)
+            self.record_uncacheable()
+            return
+
+        with self._lock:
+            self._remember_locked(key, blob)
+            self.stats["writes"] += 1
+
+        if self.store is not None:
+            try:
+                self.store.put(key, blob)
+            except Exception as e:
+                self._record_store_error("write", e)
+
+    def record_uncacheable(self) -> None:
+        """Count an invocation whose input or result has no cacheable form."""
+        with self._lock:
+            self.stats["uncacheable"] += 1
+
+    def invalidate(self, tool_name: str, function_name: str, keep_version: Optional[str] = None) -> None:
+        """
+        Drop a function's cached results.
+
+        Args:
+            tool_name: Tool name
+            function_name: Function name
+            keep_version: Keep results of this version (drop every other one)
+        """
+        with self._lock:
+            stale = [
+                key for key in self._entries
+                if key[0] == tool_name and key[1] == function_name and key[2] != keep_version
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.stats["invalidations"] += 1
+
+        if self.store is not None:
+            try:
+                self.store.purge(tool_name, function_name, keep_version or "")
+            except Exception as e:
+                self._record_store_error("purge", e)
+
+    def clear(self) -> None:
+        """Drop every in-memory entry (the backing store is kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache size, hit/miss counters and hit rates."""
+        with self._lock:
+            lookups = self.stats["memory_hits"] + self.stats["store_hits"] + self.stats["misses"]
+            hits = lookups - self.stats["misses"]
+            return {
+                **self.stats,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "backend": type(self.store).__name__ if self.store is not None else "memory",
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "functions": {
+                    name: {
+                        **counts,
+                        "hit_rate": round(counts["hits"] / (counts["hits"] + counts["misses"]), 4)
+                        if counts["hits"] + counts["misses"] else 0.0,
+                    }
+                    for name, counts in self._functions.items()
+                },
+            }
+
+    def _count_locked(self, key: ResultKey, counter: str) -> None:
+        self.stats[counter] += 1
+        counts = self._functions.setdefault(f"{key[0]}.{key[1]}", {"hits": 0, "misses": 0})
+        counts["misses" if counter == "misses" else "hits"] += 1
+
+    def _remember_locked(self, key: ResultKey, blob: bytes) -> None:
+        self._entries[key] = blob
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def _record_store_error(self, operation: str, error: Exception) -> None:
+        with self._lock:
+            self.stats["store_errors"] += 1
+        logger.warning("Engine result store %s failed: %s", operation, error)
+
+
+# ============================================================================
+# GLOBAL INSTANCE
+# ============================================================================
+
+_global_result_cache: Optional[EngineResultCache] = None
+_global_lock = threading.Lock()
+
+
+def _build_store() -> Optional[SQLiteResultStore]:
+    backend = settings.ENGINE_MEMO_BACKEND.lower()
+    if backend == "disk":
+        return SQLiteResultStore(settings.ENGINE_MEMO_PATH)
+    if backend == "memory":
+        return None
+    raise ValueError(
+        f"Unknown ENGINE_MEMO_BACKEND '{settings.ENGINE_MEMO_BACKEND}' (expected memory or disk)"
+    )
+
+
+def get_engine_result_cache() -> Optional[EngineResultCache]:
+    """
+    Get the process-wide engine result cache.
+
+    Returns:
+        The shared EngineResultCache, or None if ENGINE_MEMO_ENABLED is off
+    """
+    global _global_result_cache
+    if not settings.ENGINE_MEMO_ENABLED:
+        return None
+    with _global_lock:
+        if _global_result_cache is None:
+            _global_result_cache = EngineResultCache(
+                max_entries=settings.ENGINE_MEMO_MAX_ENTRIES,
+                store=_build_store(),
+            )
+    return _global_result_cache
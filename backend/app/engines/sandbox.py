@@ -0,0 +1,430 @@
+"""
+CSA AIaaS Platform - Sandboxed Engine Workers
+Performance: Hard wall-clock and memory limits for engines that can run away
+
+A pathological input can keep an engine looping (e.g. the plate-growth loops
+in design_column_connection / analyze_base_plate with an absurd axial load)
+or allocating without bound. asyncio.wait_for only stops *waiting* for a
+thread; the loop keeps burning a core and holding memory. Engines registered
+with execution="sandbox" (or invoked with invoke_engine(..., sandbox=True))
+instead run in supervised worker processes that can be killed.
+
+Features:
+- Warm workers (engines imported once), each running one call at a time
+- Wall-clock limit per call: ENGINE_SANDBOX_TIMEOUT_SECONDS, capped by the
+  running workflow step's deadline; on breach the worker is killed and
+  EngineTimeoutError raised. Waiting for a free worker is bounded the same
+  way, so a queued call never outlives its step deadline
+- Memory limit per worker (RLIMIT_AS, ENGINE_SANDBOX_MEMORY_MB): an engine
+  exceeding it gets MemoryError in the worker, which is then recycled and
+  EngineMemoryLimitError raised
+- Workers that die (OS OOM killer, segfault) raise EngineWorkerCrashedError
+- Killed workers are replaced in the background; healthy workers are
+  recycled after ENGINE_SANDBOX_MAX_TASKS calls
+- Metrics: calls, completions, engine errors, timeouts, memory breaches,
+  crashes, workers started and recycled
+
+Each error has an error_type ("timeout", "memory_limit", "worker_crashed")
+that the workflow orchestrator records on the failed StepResult.
+"""
+
+import logging
+import multiprocessing
+import pickle
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.engines import process_pool
+
+logger = logging.getLogger(__name__)
+
+
+class EngineSandboxError(RuntimeError):
+    """A sandboxed engine call was stopped by the supervisor"""
+
+    error_type = "sandbox_error"
+
+
+class EngineTimeoutError(EngineSandboxError, TimeoutError):
+    """Engine exceeded its wall-clock limit; its worker was killed"""
+
+    error_type = "timeout"
+
+
+class EngineMemoryLimitError(EngineSandboxError, MemoryError):
+    """Engine exceeded the worker memory limit; the worker was recycled"""
+
+    error_type = "memory_limit"
+
+
+class EngineWorkerCrashedError(EngineSandboxError):
+    """Worker process died during the call (e.g. killed by the OS)"""
+
+    error_type = "worker_crashed"
+
+
+# ============================================================================
+# WORKER SIDE
+# ============================================================================
+
+def _set_memory_limit(memory_limit_mb: int) -> None:
+    if not memory_limit_mb:
+        return
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return
+    limit = memory_limit_mb * 1024 * 1024
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _worker_main(conn, memory_limit_mb: int) -> None:
+    # Marks this process as a worker (engines calling the registry run
+    # inline) and imports every engine before the memory limit applies
+    process_pool._init_worker()
+    _set_memory_limit(memory_limit_mb)
+    conn.send("ready")
+
+    while True:
+        try:
+            message = conn.recv_bytes()
+        except (EOFError, OSError):
+            return
+        started = time.perf_counter()
+        try:
+            func, input_data = pickle.loads(message)
+            outcome = ("ok", func(input_data))
+        except MemoryError:
+            outcome = ("memory", None)
+        except Exception as e:
+            outcome = ("error", e)
+        elapsed = time.perf_counter() - started
+
+        try:
+            conn.send((*outcome, elapsed))
+        except MemoryError:
+            return  # no memory left even to reply: exit, the parent sees a crash
+        except Exception as e:
+            # Unpicklable result or exception
+            conn.send(("error", RuntimeError(f"{type(e).__name__}: {e}"), elapsed))
+
+
+class _Worker:
+    # Engine imports happen at startup, not inside a call's wall-clock limit
+    STARTUP_TIMEOUT_SECONDS = 60.0
+
+    def __init__(self, context, memory_limit_mb: int):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, memory_limit_mb),
+            name="engine-sandbox",
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.tasks = 0
+        try:
+            ready = self.conn.poll(self.STARTUP_TIMEOUT_SECONDS) and self.conn.recv() == "ready"
+        except (EOFError, OSError):
+            ready = False
+        if not ready:
+            self.kill()
+            raise RuntimeError(f"Engine sandbox worker failed to start (exit code {self.process.exitcode})")
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+
+# ============================================================================
+# SUPERVISOR
+# ============================================================================
+
+class EngineSandbox:
+    """
+    Supervisor of killable engine worker processes
+
+    Args:
+        max_workers: Concurrent sandboxed calls (further callers wait)
+        timeout_seconds: Default wall-clock limit per call
+        memory_limit_mb: Address-space limit per worker (0 = unlimited)
+        max_tasks_per_worker: Calls after which a worker is replaced
+        start_method: multiprocessing start method ("spawn", "forkserver")
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        timeout_seconds: float = 30.0,
+        memory_limit_mb: int = 1024,
+        max_tasks_per_worker: int = 500,
+        start_method: str = "spawn"
+    ):
+        self.max_workers = max(1, max_workers)
+        self.timeout_seconds = timeout_seconds
+        self.memory_limit_mb = memory_limit_mb
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self._context = multiprocessing.get_context(start_method)
+        self._idle: List[_Worker] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+        self._closed = False
+        self.stats = {
+            "calls": 0,
+            "completed": 0,
+            "engine_errors": 0,
+            "timeouts": 0,
+            "slot_timeouts": 0,
+            "memory_breaches": 0,
+            "crashes": 0,
+            "inline_fallbacks": 0,
+            "workers_started": 0,
+            "workers_recycled": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    def _start_worker(self) -> _Worker:
+        worker = _Worker(self._context, self.memory_limit_mb)
+        with self._lock:
+            self.stats["workers_started"] += 1
+        return worker
+
+    def _add_idle_worker(self) -> None:
+        try:
+            worker = self._start_worker()
+        except Exception as e:
+            logger.warning(f"Engine sandbox could not start a worker: {e}")
+            return
+        with self._lock:
+            if self._closed or len(self._idle) >= self.max_workers:
+                surplus = worker
+            else:
+                self._idle.append(worker)
+                surplus = None
+        if surplus is not None:
+            surplus.kill()
+
+    def warm_up(self) -> int:
+        """Start the workers now so the first calls don't pay for it; returns idle workers"""
+        while len(self._idle) < self.max_workers:
+            started = len(self._idle)
+            self._add_idle_worker()
+            if len(self._idle) == started:
+                break
+        return len(self._idle)
+
+    def _checkout(self) -> _Worker:
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.process.is_alive():
+                    return worker
+                worker.conn.close()
+        return self._start_worker()
+
+    def _checkin(self, worker: _Worker) -> None:
+        if worker.tasks >= self.max_tasks_per_worker:
+            self._recycle(worker)
+            return
+        with self._lock:
+            if not self._closed:
+                self._idle.append(worker)
+                return
+        worker.kill()
+
+    def _recycle(self, worker: _Worker) -> None:
+        """Kill a worker and start its replacement in the background"""
+        worker.kill()
+        with self._lock:
+            self.stats["workers_recycled"] += 1
+            if self._closed:
+                return
+        threading.Thread(target=self._add_idle_worker, name="engine-sandbox-replace", daemon=True).start()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+            workers, self._idle = self._idle, []
+        for worker in workers:
+            worker.kill()
+
+    # ------------------------------------------------------------------
+    # Calls
+    # ------------------------------------------------------------------
+
+    def run(
+        self,
+        name: str,
+        func: Callable[[Dict[str, Any]], Any],
+        input_data: Dict[str, Any],
+        timeout_seconds: Optional[float] = None
+    ) -> Any:
+        """
+        Run func(input_data) in a sandboxed worker
+
+        Args:
+            name: Engine name for errors and logs (e.g. "tool.function")
+            func: Module-level (picklable) engine function
+            input_data: Picklable input dictionary
+            timeout_seconds: Wall-clock limit (default: the sandbox's), capped
+                             by the current step deadline; also bounds the
+                             wait for a free worker
+
+        Returns:
+            The engine's output
+
+        Raises:
+            EngineTimeoutError: Wall-clock limit exceeded (worker killed), or
+                                no worker became free within it
+            EngineMemoryLimitError: Memory limit exceeded (worker recycled)
+            EngineWorkerCrashedError: Worker died during the call
+            Exception: Whatever the engine raised
+        """
+        # Imported here: app.execution imports the engine registry, which imports this module
+        from app.execution.timeout_manager import remaining_seconds
+
+        budget = timeout_seconds or self.timeout_seconds
+        try:
+            message = pickle.dumps((func, input_data), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"Engine {name} cannot be sandboxed (not picklable), running inline: {e}")
+            with self._lock:
+                self.stats["inline_fallbacks"] += 1
+            return func(input_data)
+
+        wait = remaining_seconds(budget)
+        if wait <= 0 or not self._slots.acquire(timeout=wait):
+            raise self._slot_timeout(name, wait)
+        try:
+            # Recomputed: the step deadline kept running while waiting
+            limit = remaining_seconds(budget)
+            if limit <= 0:
+                raise self._slot_timeout(name, 0)
+            try:
+                worker = self._checkout()
+            except Exception as e:
+                logger.warning(f"Engine sandbox unavailable, running {name} inline: {e}")
+                with self._lock:
+                    self.stats["inline_fallbacks"] += 1
+                return func(input_data)
+            with self._lock:
+                self.stats["calls"] += 1
+            status, value = self._call(worker, message, limit)
+        finally:
+            self._slots.release()
+
+        if status == "ok":
+            with self._lock:
+                self.stats["completed"] += 1
+            return value
+        if status == "error":
+            with self._lock:
+                self.stats["engine_errors"] += 1
+            raise value
+
+        if status == "timeout":
+            error = EngineTimeoutError(
+                f"Engine {name} exceeded its {limit:g}s wall-clock limit; worker killed"
+            )
+        elif status == "memory":
+            error = EngineMemoryLimitError(
+                f"Engine {name} exceeded the {self.memory_limit_mb} MB memory limit; worker recycled"
+            )
+        else:
+            error = EngineWorkerCrashedError(f"Engine {name} worker died during the call ({value})")
+        with self._lock:
+            self.stats[{"timeout": "timeouts", "memory": "memory_breaches"}.get(status, "crashes")] += 1
+        logger.warning(str(error))
+        raise error
+
+    def _slot_timeout(self, name: str, waited: float) -> EngineTimeoutError:
+        with self._lock:
+            self.stats["slot_timeouts"] += 1
+        if waited <= 0:
+            return EngineTimeoutError(f"Engine {name} ran out of time before a sandbox worker was free")
+        return EngineTimeoutError(
+            f"Engine {name} waited {waited:g}s for a free sandbox worker (all {self.max_workers} busy)"
+        )
+
+    def _call(self, worker: _Worker, message: bytes, limit: float) -> Tuple[str, Any]:
+        """Send one call to a worker and supervise it; returns (status, value)"""
+        try:
+            worker.conn.send_bytes(message)
+            if not worker.conn.poll(limit):
+                self._recycle(worker)
+                return "timeout", None
+            status, value, _elapsed = worker.conn.recv()
+        except (EOFError, OSError, pickle.UnpicklingError):
+            worker.process.join(timeout=1)
+            exit_code = worker.process.exitcode
+            self._recycle(worker)
+            return "crashed", f"exit code {exit_code}"
+
+        worker.tasks += 1
+        if status == "memory":
+            self._recycle(worker)
+        else:
+            self._checkin(worker)
+        return status, value
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Worker counts and supervision counters"""
+        with self._lock:
+            return {
+                **self.stats,
+                "max_workers": self.max_workers,
+                "idle_workers": len(self._idle),
+                "timeout_seconds": self.timeout_seconds,
+                "memory_limit_mb": self.memory_limit_mb,
+            }
+
+
+# ============================================================================
+# GLOBAL INSTANCE
+# ============================================================================
+
+_global_sandbox: Optional[EngineSandbox] = None
+_global_lock = threading.Lock()
+
+
+def get_engine_sandbox() -> Optional[EngineSandbox]:
+    """
+    Get the process-wide engine sandbox (workers start on first use or warm_up()).
+
+    Returns:
+        The shared EngineSandbox, or None if ENGINE_SANDBOX_ENABLED is off or
+        this is already a worker process
+    """
+    global _global_sandbox
+    if not settings.ENGINE_SANDBOX_ENABLED or process_pool.in_worker_process():
+        return None
+    with _global_lock:
+        if _global_sandbox is None:
+            _global_sandbox = EngineSandbox(
+                max_workers=settings.ENGINE_SANDBOX_WORKERS,
+                timeout_seconds=settings.ENGINE_SANDBOX_TIMEOUT_SECONDS,
+                memory_limit_mb=settings.ENGINE_SANDBOX_MEMORY_MB,
+                max_tasks_per_worker=settings.ENGINE_SANDBOX_MAX_TASKS,
+                start_method=settings.ENGINE_PROCESS_POOL_START_METHOD,
+            )
+    return _global_sandbox
+
+
+def shutdown_engine_sandbox() -> None:
+    """Kill the sandbox workers (application shutdown)."""
+    global _global_sandbox
+    with _global_lock:
+        sandbox, _global_sandbox = _global_sandbox, None
+    if sandbox is not None:
+        sandbox.shutdown()
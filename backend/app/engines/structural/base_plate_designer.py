@@ -131,6 +131,9 @@ def analyze_base_plate(input_data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Analysis results including plate dimensions and bearing check
     """
+    # Imported here: app.execution imports the engine registry, which imports this module
+    from app.execution.timeout_manager import check_deadline
+
     # Parse input
     if isinstance(input_data, dict):
         data = BasePlateInput(**input_data)
@@ -176,6 +179,7 @@ def analyze_base_plate(input_data: Dict[str, Any]) -> Dict[str, Any]:
 
         # Check if area sufficient
         while plate_length * plate_width < required_area:
+            check_deadline()  # grows for hours on an absurd load
             plate_length += 25
             plate_width += 25
 
@@ -411,6 +411,9 @@ def design_column_connection(capacity_data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Complete column design output with connection details
     """
+    # Imported here: app.execution imports the engine registry, which imports this module
+    from app.execution.timeout_manager import check_deadline
+
     # Handle wrapped input
     if "capacity_data" in capacity_data and len(capacity_data) == 1:
         capacity_data = capacity_data["capacity_data"]
@@ -440,6 +443,7 @@ def design_column_connection(capacity_data: Dict[str, Any]) -> Dict[str, Any]:
 
     # Ensure minimum area
     while bp_length * bp_width < A_req:
+        check_deadline()  # grows for hours on an absurd load
         bp_length += 50
         bp_width += 50
 
@@ -16,10 +16,28 @@ from pathlib import Path
 from datetime import datetime
 import uuid
 
+from psycopg2.extras import Json, execute_values
+
+from app.core.config import settings
 from app.etl.document_processor import DocumentProcessor
 from app.utils.text_chunker import TextChunker, TextChunk, chunk_design_code, chunk_company_manual
 from app.services.embedding_service import EmbeddingService
-from app.core.database import get_db
+from app.core.database import db_config, get_db
+
+
+# Rows per INSERT statement when bulk-loading chunks (all in one transaction)
+CHUNK_INSERT_PAGE_SIZE = 200
+
+INSERT_CHUNKS_SQL = """
+    INSERT INTO knowledge_chunks
+        (chunk_text, embedding, source_document_id, metadata, chunk_index, chunk_length)
+    VALUES %s
+"""
+
+
+def _vector_literal(embedding: List[float]) -> str:
+    """Format an embedding as a pgvector text literal."""
+    return "[" + ",".join(repr(float(value)) for value in embedding) + "]"
 
 
 class ETLPipeline:
@@ -123,19 +141,15 @@ class ETLPipeline:
 
             # Step 3: Chunk the text
             print("Step 3: Chunking text semantically...")
-            base_metadata = {
-                "source_document_name": file_metadata['file_name'],
-                "document_type": document_type,
-                "discipline": discipline,
-                "author": author,
-                "tags": tags or [],
-                "project_context": "GENERAL"
-            }
-
-            if custom_metadata:
-                base_metadata.update(custom_metadata)
-
-            chunks = self.text_chunker.chunk_text(extracted_text, base_metadata)
+            chunks = self._chunk_document(
+                text=extracted_text,
+                file_metadata=file_metadata,
+                document_type=document_type,
+                discipline=discipline,
+                author=author,
+                tags=tags,
+                custom_metadata=custom_metadata
+            )
             print(f"  ✓ Created {len(chunks)} chunks")
 
             # Step 4: Generate embeddings
@@ -187,7 +201,8 @@ class ETLPipeline:
         document_type: str = "GENERAL",
         discipline: str = "GENERAL",
         recursive: bool = True,
-        file_pattern: Optional[str] = None
+        file_pattern: Optional[str] = None,
+        pipelined: bool = False
     ) -> Dict:
         """
         Ingest all supported documents from a directory.
@@ -198,9 +213,13 @@ class ETLPipeline:
             discipline: Default discipline for all files
             recursive: Whether to search subdirectories
             file_pattern: Optional glob pattern to filter files
+            pipelined: Overlap extraction, embedding and storage across
+                       documents (see app.etl.pipelined_ingestion) instead
+                       of ingesting files one after another
 
         Returns:
-            Dictionary with batch ingestion results
+            Dictionary with batch ingestion results (plus per-stage
+            throughput when pipelined)
         """
         print(f"\n{'='*80}")
         print(f"Batch Ingestion from: {directory_path}")
@@ -214,23 +233,19 @@ class ETLPipeline:
                 'documents_processed': 0
             }
 
-        # Find all supported files
-        files_to_process = []
-        if file_pattern:
-            if recursive:
-                files_to_process = list(directory.rglob(file_pattern))
-            else:
-                files_to_process = list(directory.glob(file_pattern))
-        else:
-            for ext in self.document_processor.SUPPORTED_FORMATS:
-                pattern = f"*{ext}"
-                if recursive:
-                    files_to_process.extend(directory.rglob(pattern))
-                else:
-                    files_to_process.extend(directory.glob(pattern))
+        files_to_process = self._find_files(directory, recursive, file_pattern)
 
         print(f"Found {len(files_to_process)} documents to process\n")
 
+        if pipelined:
+            from app.etl.pipelined_ingestion import PipelinedIngestion
+
+            return PipelinedIngestion(self).run(
+                files=files_to_process,
+                document_type=document_type,
+                discipline=discipline
+            )
+
         # Process each file
         results = []
         for file_path in files_to_process:
@@ -262,6 +277,76 @@ class ETLPipeline:
             'stats': self.stats
         }
 
+    def _find_files(
+        self,
+        directory: Path,
+        recursive: bool,
+        file_pattern: Optional[str]
+    ) -> List[Path]:
+        """
+        Find all supported files in a directory.
+
+        Args:
+            directory: Directory to search
+            recursive: Whether to search subdirectories
+            file_pattern: Optional glob pattern to filter files
+
+        Returns:
+            List of file paths
+        """
+        if file_pattern:
+            if recursive:
+                return list(directory.rglob(file_pattern))
+            return list(directory.glob(file_pattern))
+
+        files_to_process = []
+        for ext in self.document_processor.SUPPORTED_FORMATS:
+            pattern = f"*{ext}"
+            if recursive:
+                files_to_process.extend(directory.rglob(pattern))
+            else:
+                files_to_process.extend(directory.glob(pattern))
+        return files_to_process
+
+    def _chunk_document(
+        self,
+        text: str,
+        file_metadata: Dict,
+        document_type: str,
+        discipline: str,
+        author: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        custom_metadata: Optional[Dict] = None
+    ) -> List[TextChunk]:
+        """
+        Chunk extracted text and attach the document-level metadata.
+
+        Args:
+            text: Extracted document text
+            file_metadata: Metadata extracted from file
+            document_type: Type of document
+            discipline: Engineering discipline
+            author: Document author
+            tags: List of tags for categorization
+            custom_metadata: Additional metadata
+
+        Returns:
+            List of text chunks
+        """
+        base_metadata = {
+            "source_document_name": file_metadata['file_name'],
+            "document_type": document_type,
+            "discipline": discipline,
+            "author": author,
+            "tags": tags or [],
+            "project_context": "GENERAL"
+        }
+
+        if custom_metadata:
+            base_metadata.update(custom_metadata)
+
+        return self.text_chunker.chunk_text(text, base_metadata)
+
     def _create_document_record(
         self,
         file_metadata: Dict,
@@ -320,36 +405,87 @@ class ETLPipeline:
         """
         Store chunks and embeddings in the database.
 
+        All chunks of a document are written together in a single
+        transaction: a multi-row INSERT over a pooled PostgreSQL connection
+        when DATABASE_URL is configured, otherwise one bulk Supabase insert
+        request. Either every chunk is stored or none is.
+
         Args:
             chunks: List of text chunks
             embeddings: List of embedding vectors
             document_id: UUID of source document
 
         Returns:
-            Number of chunks successfully stored
+            Number of chunks stored
+
+        Raises:
+            ValueError: If chunk and embedding counts differ
+            Exception: If the bulk insert fails (nothing is stored)
         """
         if len(chunks) != len(embeddings):
             raise ValueError(f"Chunk count ({len(chunks)}) != embedding count ({len(embeddings)})")
 
-        stored_count = 0
-
-        for chunk, embedding in zip(chunks, embeddings):
-            try:
-                self.db.table("knowledge_chunks").insert({
-                    "chunk_text": chunk.text,
-                    "embedding": embedding,
-                    "source_document_id": document_id,
-                    "metadata": chunk.metadata,
-                    "chunk_index": chunk.index,
-                    "chunk_length": chunk.char_length
-                }).execute()
-
-                stored_count += 1
-            except Exception as e:
-                print(f"Warning: Failed to store chunk {chunk.index}: {e}")
-                continue
-
-        return stored_count
+        if not chunks:
+            return 0
+
+        if settings.DATABASE_URL:
+            return self._insert_chunks_sql(chunks, embeddings, document_id)
+
+        self.db.table("knowledge_chunks").insert([
+            {
+                "chunk_text": chunk.text,
+                "embedding": embedding,
+                "source_document_id": document_id,
+                "metadata": chunk.metadata,
+                "chunk_index": chunk.index,
+                "chunk_length": chunk.char_length
+            }
+            for chunk, embedding in zip(chunks, embeddings)
+        ]).execute()
+
+        return len(chunks)
+
+    def _insert_chunks_sql(
+        self,
+        chunks: List[TextChunk],
+        embeddings: List[List[float]],
+        document_id: str
+    ) -> int:
+        """
+        Insert a document's chunks with multi-row INSERTs in one transaction.
+
+        Args:
+            chunks: List of text chunks
+            embeddings: List of embedding vectors
+            document_id: UUID of source document
+
+        Returns:
+            Number of chunks stored
+        """
+        rows = [
+            (
+                chunk.text,
+                _vector_literal(embedding),
+                document_id,
+                Json(chunk.metadata),
+                chunk.index,
+                chunk.char_length
+            )
+            for chunk, embedding in zip(chunks, embeddings)
+        ]
+
+        with db_config.connection() as conn:
+            with conn.cursor() as cursor:
+                execute_values(
+                    cursor,
+                    INSERT_CHUNKS_SQL,
+                    rows,
+                    template="(%s, %s::vector, %s, %s, %s, %s)",
+                    page_size=CHUNK_INSERT_PAGE_SIZE
+                )
+            conn.commit()
+
+        return len(rows)
 
     def _update_document_chunk_count(self, document_id: str, chunk_count: int):
         """
@@ -0,0 +1,513 @@
+"""
+CSA AIaaS Platform - Pipelined Document Ingestion
+Sprint 2: The Memory Implantation (bulk ingestion mode)
+
+ETLPipeline.ingest_directory() processes one file at a time: extract,
+chunk, embed, store, then the next file. For a full design-code library
+the CPU-bound PDF extraction, the network-bound embedding calls and the
+database writes never overlap. This module runs them as a bounded
+producer/consumer pipeline:
+
+    files -> [extract: process pool] -> queue -> [chunk + embed: threads] -> queue -> [store: writer]
+
+Features:
+- PDF extraction on a process pool (CPU-bound work outside the GIL)
+- Bounded queues between stages, so extraction never runs far ahead of
+  embedding and memory stays flat on large libraries
+- Concurrent embedding batches under an AIMD limiter: concurrency halves
+  when the provider rate-limits and recovers one slot at a time
+- One bulk insert per document, in a single transaction
+  (ETLPipeline._store_chunks)
+- Per-stage throughput report
+"""
+
+import queue
+import random
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait
+)
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.etl.document_processor import DocumentProcessor
+
+
+# Queue sentinel: no more work for the consuming stage
+_DONE = object()
+
+
+def _extract_document(file_path: str) -> Tuple[Dict, float]:
+    """
+    Extract one document (runs in a worker process).
+
+    Returns:
+        (extraction_result, seconds) tuple
+    """
+    start = time.perf_counter()
+    result = DocumentProcessor().extract_text(file_path)
+    return result, time.perf_counter() - start
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    """Detect provider rate limiting (HTTP 429) across client libraries."""
+    status = getattr(error, "status_code", None) or getattr(
+        getattr(error, "response", None), "status_code", None
+    )
+    if status == 429:
+        return True
+    message = str(error).lower()
+    return "rate limit" in message or "rate_limit" in message or "429" in message
+
+
+# =============================================================================
+# STAGE METRICS
+# =============================================================================
+
+class StageMetrics:
+    """Thread-safe counters for one pipeline stage."""
+
+    def __init__(self, name: str, unit: str):
+        self.name = name
+        self.unit = unit
+        self.items = 0
+        self.units = 0
+        self.busy_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, units: int = 0) -> None:
+        with self._lock:
+            self.items += 1
+            self.units += units
+            self.busy_seconds += seconds
+
+    def as_dict(self, wall_seconds: float) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "documents": self.items,
+                self.unit: self.units,
+                "busy_seconds": round(self.busy_seconds, 3),
+                f"{self.unit}_per_sec": round(self.units / wall_seconds, 2) if wall_seconds else 0.0,
+            }
+
+
+# =============================================================================
+# RATE-LIMIT-AWARE EMBEDDING
+# =============================================================================
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Additive-increase / multiplicative-decrease limit on in-flight calls.
+
+    A rate-limited call halves the limit; every ``increase_after``
+    consecutive successes raise it by one, up to ``max_concurrency``.
+    """
+
+    def __init__(self, max_concurrency: int, increase_after: int = 5):
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+
+        self.max_concurrency = max_concurrency
+        self.limit = max_concurrency
+        self.increase_after = increase_after
+        self.rate_limited = 0
+        self._active = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+
+    def release(self, rate_limited: bool = False) -> None:
+        with self._cond:
+            self._active -= 1
+            if rate_limited:
+                self.rate_limited += 1
+                self.limit = max(1, self.limit // 2)
+                self._successes = 0
+            else:
+                self._successes += 1
+                if self._successes >= self.increase_after and self.limit < self.max_concurrency:
+                    self.limit += 1
+                    self._successes = 0
+            self._cond.notify_all()
+
+
+class RateLimitedEmbedder:
+    """
+    Embeds a document's chunks as concurrent API batches.
+
+    Batches share one AdaptiveConcurrencyLimiter, so all documents in
+    flight back off together when the provider returns 429.
+    """
+
+    def __init__(
+        self,
+        embedding_service: Any,
+        max_concurrency: int = 4,
+        max_retries: int = 5,
+        base_backoff: float = 1.0,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initialize the embedder.
+
+        Args:
+            embedding_service: EmbeddingService (client and batch size)
+            max_concurrency: Upper bound on concurrent embedding requests
+            max_retries: Retries per batch after a rate-limit response
+            base_backoff: First retry delay in seconds (doubles per retry)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.embedding_service = embedding_service
+        self.limiter = AdaptiveConcurrencyLimiter(max_concurrency)
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self._sleep = sleep
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            thread_name_prefix="etl-embed"
+        )
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts in batches, preserving input order.
+
+        Texts already in the service's embedding cache are not sent.
+        """
+        service = self.embedding_service
+        cache = getattr(service, "cache", None)
+        cached = cache.get_many(service.model, service.dimensions, texts) if cache else {}
+        pending = [text for i, text in enumerate(texts) if i not in cached]
+
+        batch_size = service.batch_size
+        futures = [
+            self._executor.submit(self._embed_batch, pending[i:i + batch_size])
+            for i in range(0, len(pending), batch_size)
+        ]
+        generated = iter([embedding for future in futures for embedding in future.result()])
+        return [cached[i] if i in cached else next(generated) for i in range(len(texts))]
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def _embed_batch(self, batch: List[str]) -> List[List[float]]:
+        client = self.embedding_service.embeddings_client
+
+        attempt = 0
+        while True:
+            self.limiter.acquire()
+            try:
+                embeddings = client.embed_documents(batch)
+            except Exception as e:
+                rate_limited = _is_rate_limit_error(e)
+                self.limiter.release(rate_limited=rate_limited)
+                if not rate_limited or attempt == self.max_retries:
+                    raise
+                delay = self.base_backoff * (2 ** attempt)
+                self._sleep(delay + random.uniform(0, delay / 4))
+                attempt += 1
+                continue
+
+            self.limiter.release()
+            cache = getattr(self.embedding_service, "cache", None)
+            if cache is not None:
+                service = self.embedding_service
+                cache.put_many(service.model, service.dimensions, batch, embeddings)
+            return embeddings
+
+
+# =============================================================================
+# PIPELINE
+# =============================================================================
+
+class PipelinedIngestion:
+    """
+    Bounded producer/consumer ingestion of many documents.
+
+    Stages:
+    - extract: DocumentProcessor.extract_text on a process pool
+      (``extract_workers=0`` extracts inline in the producer thread)
+    - embed: ``document_workers`` threads create the document record,
+      chunk the text and embed the chunks through RateLimitedEmbedder
+    - store: a single writer bulk-inserts each document's chunks in one
+      transaction and marks the document completed
+    """
+
+    def __init__(
+        self,
+        pipeline: Any,
+        extract_workers: Optional[int] = None,
+        document_workers: Optional[int] = None,
+        embed_concurrency: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        embedder: Optional[RateLimitedEmbedder] = None
+    ):
+        """
+        Initialize the pipelined ingestion.
+
+        Args:
+            pipeline: ETLPipeline providing chunking, embedding and storage
+            extract_workers: Extraction processes (default: settings)
+            document_workers: Threads chunking/embedding documents (default: settings)
+            embed_concurrency: Max concurrent embedding requests (default: settings)
+            queue_size: Documents buffered between stages (default: settings)
+            embedder: Pre-built embedder (defaults to one over pipeline.embedding_service)
+        """
+        self.pipeline = pipeline
+        self.extract_workers = (
+            settings.ETL_EXTRACT_WORKERS if extract_workers is None else extract_workers
+        )
+        self.document_workers = document_workers or settings.ETL_DOCUMENT_WORKERS
+        self.queue_size = queue_size or settings.ETL_QUEUE_SIZE
+        self.embedder = embedder or RateLimitedEmbedder(
+            pipeline.embedding_service,
+            max_concurrency=embed_concurrency or settings.ETL_EMBED_CONCURRENCY
+        )
+
+        self.metrics = {
+            "extract": StageMetrics("extract", "characters"),
+            "chunk": StageMetrics("chunk", "chunks"),
+            "embed": StageMetrics("embed", "embeddings"),
+            "store": StageMetrics("store", "rows"),
+        }
+        self._results: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def run(
+        self,
+        files: List[Path],
+        document_type: str = "GENERAL",
+        discipline: str = "GENERAL"
+    ) -> Dict:
+        """
+        Ingest all files through the pipeline.
+
+        Args:
+            files: Documents to ingest
+            document_type: Document type for all files
+            discipline: Discipline for all files
+
+        Returns:
+            Dictionary shaped like ETLPipeline.ingest_directory() results,
+            plus per-stage ``throughput``
+        """
+        start = time.perf_counter()
+        paths = [str(path) for path in files]
+        for path in paths:
+            self._results[path] = {
+                'success': False,
+                'document_id': None,
+                'chunks_created': 0,
+                'error': None,
+                'file_path': path
+            }
+
+        extracted: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        embedded: queue.Queue = queue.Queue(maxsize=self.queue_size)
+
+        workers = [
+            threading.Thread(
+                target=self._embed_worker,
+                args=(extracted, embedded, document_type, discipline),
+                name=f"etl-document-{i}",
+                daemon=True
+            )
+            for i in range(self.document_workers)
+        ]
+        writer = threading.Thread(target=self._store_worker, args=(embedded,), name="etl-store", daemon=True)
+        for thread in workers + [writer]:
+            thread.start()
+
+        try:
+            self._extract_all(paths, extracted)
+        finally:
+            for _ in workers:
+                extracted.put(_DONE)
+            for thread in workers:
+                thread.join()
+            embedded.put(_DONE)
+            writer.join()
+            self.embedder.close()
+
+        wall_seconds = time.perf_counter() - start
+        results = [self._results[path] for path in paths]
+        successful = sum(1 for r in results if r['success'])
+        throughput = {
+            "wall_seconds": round(wall_seconds, 3),
+            "documents_per_sec": round(len(results) / wall_seconds, 2) if wall_seconds else 0.0,
+            **{name: stage.as_dict(wall_seconds) for name, stage in self.metrics.items()},
+            "embedding_rate_limited": self.embedder.limiter.rate_limited,
+        }
+
+        self._print_report(results, successful, throughput)
+
+        return {
+            'success': True,
+            'documents_processed': len(results),
+            'successful': successful,
+            'failed': len(results) - successful,
+            'results': results,
+            'stats': self.pipeline.stats,
+            'throughput': throughput
+        }
+
+    # =========================================================================
+    # STAGES
+    # =========================================================================
+
+    def _extract_all(self, paths: List[str], extracted: queue.Queue) -> None:
+        """Producer: extract documents and feed the bounded queue."""
+        if self.extract_workers <= 0:
+            for path in paths:
+                self._forward_extraction(path, _completed(_extract_document, path), extracted)
+            return
+
+        in_flight = self.extract_workers * 2
+        with ProcessPoolExecutor(max_workers=self.extract_workers) as pool:
+            pending: Dict[Future, str] = {}
+            for path in paths:
+                if len(pending) >= in_flight:
+                    self._drain(pending, extracted)
+                pending[pool.submit(_extract_document, path)] = path
+            while pending:
+                self._drain(pending, extracted)
+
+    def _drain(self, pending: Dict[Future, str], extracted: queue.Queue) -> None:
+        """Forward every extraction that has finished (waits for at least one)."""
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            self._forward_extraction(pending.pop(future), future, extracted)
+
+    def _forward_extraction(self, path: str, future: Future, extracted: queue.Queue) -> None:
+        try:
+            extraction, seconds = future.result()
+        except Exception as e:
+            self._fail(path, f"Extraction failed: {e}")
+            return
+
+        if not extraction['success']:
+            self._fail(path, f"Extraction failed: {extraction['error']}")
+            return
+
+        self.metrics["extract"].record(seconds, len(extraction['text']))
+        extracted.put((path, extraction))
+
+    def _embed_worker(
+        self,
+        extracted: queue.Queue,
+        embedded: queue.Queue,
+        document_type: str,
+        discipline: str
+    ) -> None:
+        """Consumer/producer: document record, chunking and embeddings."""
+        while True:
+            item = extracted.get()
+            if item is _DONE:
+                return
+
+            path, extraction = item
+            try:
+                file_metadata = extraction['metadata']
+                document_id = self.pipeline._create_document_record(
+                    file_metadata=file_metadata,
+                    document_type=document_type,
+                    discipline=discipline,
+                    author=None,
+                    custom_metadata={}
+                )
+                self._results[path]['document_id'] = document_id
+
+                started = time.perf_counter()
+                chunks = self.pipeline._chunk_document(
+                    text=extraction['text'],
+                    file_metadata=file_metadata,
+                    document_type=document_type,
+                    discipline=discipline
+                )
+                self.metrics["chunk"].record(time.perf_counter() - started, len(chunks))
+
+                started = time.perf_counter()
+                embeddings = self.embedder.embed([chunk.text for chunk in chunks])
+                self.metrics["embed"].record(time.perf_counter() - started, len(embeddings))
+            except Exception as e:
+                self._fail(path, f"Pipeline error: {e}")
+                continue
+
+            embedded.put((path, document_id, chunks, embeddings))
+
+    def _store_worker(self, embedded: queue.Queue) -> None:
+        """Consumer: one bulk insert (single transaction) per document."""
+        while True:
+            item = embedded.get()
+            if item is _DONE:
+                return
+
+            path, document_id, chunks, embeddings = item
+            try:
+                started = time.perf_counter()
+                stored_count = self.pipeline._store_chunks(
+                    chunks=chunks,
+                    embeddings=embeddings,
+                    document_id=document_id
+                )
+                self.pipeline._update_document_chunk_count(document_id, stored_count)
+                self.metrics["store"].record(time.perf_counter() - started, stored_count)
+            except Exception as e:
+                self._fail(path, f"Pipeline error: {e}")
+                continue
+
+            with self._lock:
+                stats = self.pipeline.stats
+                stats['documents_processed'] += 1
+                stats['chunks_created'] += len(chunks)
+                stats['embeddings_generated'] += len(embeddings)
+                stats['db_inserts'] += stored_count
+
+            self._results[path].update({'success': True, 'chunks_created': stored_count})
+            print(f"  ✓ {Path(path).name}: {stored_count} chunks")
+
+    # =========================================================================
+    # HELPERS
+    # =========================================================================
+
+    def _fail(self, path: str, error: str) -> None:
+        self._results[path]['error'] = error
+        with self._lock:
+            self.pipeline.stats['errors'].append(error)
+        print(f"  ❌ {Path(path).name}: {error}")
+
+    def _print_report(self, results: List[Dict], successful: int, throughput: Dict) -> None:
+        print(f"\n{'='*80}")
+        print("Pipelined Ingestion Complete")
+        print(f"{'='*80}")
+        print(f"Total documents: {len(results)}")
+        print(f"Successful: {successful}")
+        print(f"Failed: {len(results) - successful}")
+        print(f"Wall time: {throughput['wall_seconds']:.2f}s "
+              f"({throughput['documents_per_sec']:.2f} documents/sec)")
+        for name, stage in self.metrics.items():
+            rate = throughput[name][f"{stage.unit}_per_sec"]
+            print(f"  {name:<8} {stage.units:>10,} {stage.unit:<11} "
+                  f"{rate:>12,.1f}/sec   busy {stage.busy_seconds:,.2f}s")
+        if throughput["embedding_rate_limited"]:
+            print(f"  Embedding requests rate-limited: {throughput['embedding_rate_limited']}")
+
+
+def _completed(fn: Callable, *args: Any) -> Future:
+    """Run fn inline and wrap its outcome in a completed Future."""
+    future: Future = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
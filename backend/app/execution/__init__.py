@@ -8,16 +8,47 @@ This module contains the advanced execution components for Phase 2 Sprint 3:
 - Retry logic
 - Streaming outputs
 - Full validation
-- Timeout enforcement
+- Timeout enforcement and deadlines
+- Circuit breakers
+- Incremental re-execution planning
+- Compiled per-schema execution plans
 """
 
 from .dependency_graph import DependencyGraph, DependencyAnalyzer, GraphStats
 from .retry_manager import RetryManager, RetryConfig, RetryMetadata, ErrorType
 from .condition_parser import ConditionEvaluator, SimpleConditionEvaluator
-from .validation_engine import ValidationEngine, ValidationResult, ValidationIssue, ValidationSeverity
+from .validation_engine import (
+    ValidationEngine,
+    ValidationResult,
+    ValidationIssue,
+    ValidationSeverity,
+    ValidatorCache,
+    get_validator_cache,
+    check_json_schema,
+)
 from .parallel_executor import ParallelExecutor, ExecutionContext, ParallelExecutionResult, create_parallel_executor
-from .timeout_manager import TimeoutManager, TimeoutConfig, TimeoutResult, TimeoutStrategy
-from .streaming_manager import StreamingManager, StreamEvent, StreamEventType, get_streaming_manager
+from .timeout_manager import (
+    TimeoutManager,
+    TimeoutConfig,
+    TimeoutResult,
+    TimeoutStrategy,
+    Deadline,
+    DeadlineExceeded,
+    check_deadline,
+    remaining_seconds,
+)
+from .circuit_breaker import CircuitBreaker, CircuitOpenError, get_circuit_breaker, get_circuit_breaker_stats
+from .step_threads import StepCapacityError, StepThreadPool, get_step_thread_pool
+from .streaming_manager import (
+    StreamingManager,
+    StreamEvent,
+    StreamEventType,
+    get_streaming_manager,
+    shutdown_streaming_manager,
+)
+from .stream_broker import StreamBroker, InProcessStreamBroker, PostgresStreamBroker
+from .rerun_planner import RerunPlan, RerunSource
+from .execution_plan import ExecutionPlan, CompiledStep, get_execution_plan
 
 __all__ = [
     # Dependency graph
@@ -40,6 +71,9 @@ __all__ = [
     "ValidationResult",
     "ValidationIssue",
     "ValidationSeverity",
+    "ValidatorCache",
+    "get_validator_cache",
+    "check_json_schema",
 
     # Parallel execution
     "ParallelExecutor",
@@ -52,10 +86,36 @@ __all__ = [
     "TimeoutConfig",
     "TimeoutResult",
     "TimeoutStrategy",
+    "Deadline",
+    "DeadlineExceeded",
+    "check_deadline",
+    "remaining_seconds",
+
+    # Circuit breakers
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "get_circuit_breaker",
+    "get_circuit_breaker_stats",
+    "StepCapacityError",
+    "StepThreadPool",
+    "get_step_thread_pool",
 
     # Streaming
     "StreamingManager",
     "StreamEvent",
     "StreamEventType",
     "get_streaming_manager",
+    "shutdown_streaming_manager",
+    "StreamBroker",
+    "InProcessStreamBroker",
+    "PostgresStreamBroker",
+
+    # Incremental re-execution
+    "RerunPlan",
+    "RerunSource",
+
+    # Compiled execution plans
+    "ExecutionPlan",
+    "CompiledStep",
+    "get_execution_plan",
 ]
@@ -0,0 +1,208 @@
+"""
+CSA AIaaS Platform - Circuit Breakers
+Performance: Fail fast while a dependency is down instead of waiting on it
+
+A step whose engine (or the LLM provider behind it) is down fails only after
+its timeout, and retries multiply that wait for every execution in flight.
+A circuit breaker counts consecutive dependency failures; once they reach the
+threshold it "opens" and calls are rejected immediately with
+CircuitOpenError. After the recovery period a single probe call is let
+through ("half-open"): success closes the breaker, failure re-opens it.
+
+Breakers are process-wide and keyed by dependency:
+- "engine:<tool>.<function>" - per calculation engine (workflow steps)
+- "llm:<provider>"           - per LLM provider (e.g. "llm:openrouter")
+
+Only dependency failures (timeouts, connection errors, 5xx, rate limits) should
+be recorded; a validation error says nothing about the dependency's health.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+from .retry_manager import ErrorType, RetryManager
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_error_classifier = RetryManager()
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a dependency whose circuit breaker is open"""
+
+    def __init__(self, name: str, retry_after_seconds: float):
+        super().__init__(
+            f"Circuit breaker '{name}' is open (dependency failing); "
+            f"retry in {retry_after_seconds:.0f}s"
+        )
+        self.name = name
+        self.retry_after_seconds = retry_after_seconds
+
+
+def is_dependency_failure(error: Exception) -> bool:
+    """Whether an error says the dependency is unhealthy (transient or timeout)"""
+    if isinstance(error, CircuitOpenError):
+        return False
+    return _error_classifier.classify_error(error) in (ErrorType.TRANSIENT, ErrorType.TIMEOUT)
+
+
+class CircuitBreaker:
+    """
+    Thread-safe consecutive-failure circuit breaker
+
+    Args:
+        name: Dependency name (used in errors and stats)
+        failure_threshold: Consecutive failures that open the breaker
+        recovery_seconds: Time the breaker stays open before a probe call
+        clock: Monotonic clock (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_seconds = recovery_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.stats = {"calls": 0, "failures": 0, "rejected": 0, "opened": 0}
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and self._clock() - self._opened_at >= self.recovery_seconds:
+            self._state = HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def before_call(self) -> None:
+        """Admit a call or raise CircuitOpenError"""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED or (state == HALF_OPEN and not self._probe_in_flight):
+                self._probe_in_flight = state == HALF_OPEN
+                self.stats["calls"] += 1
+                return
+            self.stats["rejected"] += 1
+            retry_after = max(0.0, self.recovery_seconds - (self._clock() - self._opened_at))
+        raise CircuitOpenError(self.name, retry_after)
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info(f"Circuit breaker '{self.name}' closed")
+            self._state = CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.stats["failures"] += 1
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    self.stats["opened"] += 1
+                    logger.warning(
+                        f"Circuit breaker '{self.name}' opened after {self._failures} "
+                        f"consecutive failures"
+                    )
+                self._state = OPEN
+                self._opened_at = self._clock()
+
+    def release(self) -> None:
+        """End an admitted call without judging the dependency (e.g. invalid input)"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def call(
+        self,
+        func: Callable[..., Any],
+        *args,
+        is_failure: Callable[[Exception], bool] = is_dependency_failure,
+        **kwargs
+    ) -> Any:
+        """
+        Call func through the breaker
+
+        Raises:
+            CircuitOpenError: Breaker open; func was not called
+        """
+        self.before_call()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            if is_failure(e):
+                self.record_failure()
+            else:
+                self.release()
+            raise
+        self.record_success()
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self._current_state(),
+                "consecutive_failures": self._failures,
+                **self.stats
+            }
+
+
+# ============================================================================
+# PROCESS-WIDE REGISTRY
+# ============================================================================
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(
+    name: str,
+    failure_threshold: Optional[int] = None,
+    recovery_seconds: Optional[float] = None
+) -> CircuitBreaker:
+    """Shared breaker for a dependency (thresholds default to settings)"""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(
+                name,
+                failure_threshold=failure_threshold or settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+                recovery_seconds=(
+                    recovery_seconds if recovery_seconds is not None
+                    else settings.CIRCUIT_BREAKER_RECOVERY_SECONDS
+                )
+            )
+        return breaker
+
+
+def get_circuit_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats of every breaker created in this process"""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.get_stats() for breaker in breakers}
+
+
+def reset_circuit_breakers() -> None:
+    """Forget all breakers (tests, or after an operator fixed a dependency)"""
+    with _breakers_lock:
+        _breakers.clear()
@@ -4,21 +4,29 @@ Advanced Conditional Expression Parser
 Supports complex boolean expressions with:
 - Logical operators: AND, OR, NOT
 - Comparison operators: ==, !=, <, >, <=, >=, IN, NOT IN
+- Arithmetic on operands: +, -, *, /
+- Counting ternaries: (condition ? 1 : 0)
 - Variable references: $input.field, $stepN.variable, $context.key
 - Parentheses for grouping
 - Type-safe evaluation
+
+Conditions are parsed once and compiled into closures. Compiled conditions
+are cached by condition text in a bounded LRU shared by every evaluator, so
+repeated evaluations of the same rule skip pyparsing entirely.
 """
 
 import re
 import logging
-from typing import Any, Dict, List, Union
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Tuple
 from enum import Enum
 
 try:
     from pyparsing import (
         Word, alphas, alphanums, nums, oneOf, infixNotation, opAssoc,
         Suppress, Literal, QuotedString, pyparsing_common, ParserElement,
-        ParseException, CaselessKeyword
+        ParseException, CaselessKeyword, Forward, Group, ParseResults
     )
 except ImportError:
     raise ImportError(
@@ -31,6 +39,9 @@ logger = logging.getLogger(__name__)
 # Enable packrat parsing for better performance
 ParserElement.enablePackrat()
 
+# Compiled condition: context -> value
+CompiledCondition = Callable[[Dict[str, Any]], Any]
+
 
 class ComparisonOp(str, Enum):
     """Comparison operators"""
@@ -51,6 +62,120 @@ class LogicalOp(str, Enum):
     NOT = "NOT"
 
 
+# ============================================================================
+# COMPILED CONDITION CACHE
+# ============================================================================
+
+class CompiledCache:
+    """
+    Thread-safe bounded LRU cache for compiled expressions.
+
+    Keyed by condition text (or any hashable key built from it).
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get_or_compile(self, key: Hashable, compile_fn: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, compiling it on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return self._entries[key]
+            self.stats["misses"] += 1
+
+        # Compile outside the lock; a concurrent duplicate compile is harmless
+        value = compile_fn()
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            size = len(self._entries)
+        return {**self.stats, "size": size, "maxsize": self.maxsize}
+
+
+# Shared by every ConditionEvaluator: compiled closures depend only on the text
+_compiled_conditions = CompiledCache(maxsize=1024)
+
+
+def get_condition_cache_stats() -> Dict[str, Any]:
+    """Get hit/miss statistics for the compiled condition cache."""
+    return _compiled_conditions.get_stats()
+
+
+# ============================================================================
+# AST NODES
+# ============================================================================
+#
+# Parse actions turn tokens into tagged tuples so the AST is unambiguous:
+#   ("var", ("input", "field"))          variable reference
+#   ("list", [1, 2])                     list literal
+#   ("cmp", op, left, right)             comparison
+#   ("arith", [a, "+", b, "*", c])       arithmetic (left to right)
+#   ("ternary", cond, true_val, false_val)
+#   ("not", operand) / ("and", [..]) / ("or", [..])
+# Literals are plain Python values (int, float, str, bool).
+
+def _unwrap(token):
+    """Strip the group pyparsing wraps around parenthesized sub-expressions."""
+    while isinstance(token, ParseResults) and len(token) == 1:
+        token = token[0]
+    return token
+
+
+def _variable_action(tokens):
+    return ("var", tuple(tokens[0]))
+
+
+def _list_action(tokens):
+    return ("list", list(tokens[0]))
+
+
+def _boolean_action(tokens):
+    return tokens[0].lower() == "true"
+
+
+def _comparison_action(tokens):
+    left, op, right = tokens
+    return ("cmp", op.upper(), _unwrap(left), _unwrap(right))
+
+
+def _ternary_action(tokens):
+    return ("ternary", _unwrap(tokens[0]), _unwrap(tokens[1]), _unwrap(tokens[2]))
+
+
+def _arith_action(tokens):
+    return ("arith", [_unwrap(token) for token in tokens[0]])
+
+
+def _not_action(tokens):
+    return ("not", _unwrap(tokens[0][1]))
+
+
+def _logical_action(kind):
+    def action(tokens):
+        # [a, OP, b, OP, c] -> operands only
+        return (kind, [_unwrap(token) for token in list(tokens[0])[::2]])
+    return action
+
+
 class ConditionEvaluator:
     """
     Evaluates complex conditional expressions
@@ -60,44 +185,77 @@ class ConditionEvaluator:
     - "$input.discipline IN ['civil', 'structural']"
     - "NOT ($step2.risk_score >= 0.9 OR $input.override == true)"
     - "($input.load > 1000 OR $input.force > 500) AND $step1.design_ok == true"
+    - "(($input.a > 1 ? 1 : 0) + ($input.b > 1 ? 1 : 0)) >= 1"
     """
 
+    _grammar = None
+    _grammar_lock = threading.Lock()
+
     def __init__(self):
-        """Initialize parser with grammar definition"""
-        self.grammar = self._build_grammar()
+        """Initialize parser with grammar definition (built once per process)"""
+        self.grammar = self._get_grammar()
 
-    def _build_grammar(self):
+    @classmethod
+    def _get_grammar(cls):
+        if cls._grammar is None:
+            with cls._grammar_lock:
+                if cls._grammar is None:
+                    cls._grammar = cls._build_grammar()
+        return cls._grammar
+
+    @staticmethod
+    def _build_grammar():
         """
         Build pyparsing grammar for conditional expressions
 
         Grammar:
             expression := logical_expr
-            logical_expr := comparison_expr ((AND | OR) comparison_expr)*
-            comparison_expr := NOT? (value op value | (expression))
-            value := variable | number | string | boolean | list
+            logical_expr := comparison ((AND | OR) comparison)*
+            comparison := NOT? (operand op operand | (expression))
+            operand := term ((+ | - | * | /) term)*
+            term := ternary | variable | list | number | string | boolean
+            ternary := ( expression ? operand : operand )
             variable := $word(.word)*
             op := == | != | < | > | <= | >= | IN | NOT IN
         """
+        expression = Forward()
+        operand = Forward()
+
         # Basic literals
         number = pyparsing_common.number()
         string = QuotedString("'") | QuotedString('"')
         boolean = (
-            CaselessKeyword("true") | CaselessKeyword("false") |
-            CaselessKeyword("True") | CaselessKeyword("False")
-        )
+            CaselessKeyword("true") | CaselessKeyword("false")
+        ).setParseAction(_boolean_action)
 
         # Variable reference: $input.field, $step1.variable, $context.key
         variable_name = Word(alphas + "_", alphanums + "_")
-        variable = Suppress("$") + variable_name + \
-            (Suppress(".") + variable_name)[...] # Allow nested: $step1.data.value
+        variable = Group(
+            Suppress("$") + variable_name + (Suppress(".") + variable_name)[...]
+        ).setParseAction(_variable_action)  # Allow nested: $step1.data.value
 
         # List literal: ['a', 'b', 'c'] or [1, 2, 3]
         list_element = string | number
-        list_expr = Suppress("[") + list_element + \
-            (Suppress(",") + list_element)[...] + Suppress("]")
+        list_expr = Group(
+            Suppress("[") + list_element + (Suppress(",") + list_element)[...] + Suppress("]")
+        ).setParseAction(_list_action)
+
+        # Counting ternary: (condition ? 1 : 0)
+        ternary = (
+            Suppress("(") + expression + Suppress("?") + operand +
+            Suppress(":") + operand + Suppress(")")
+        ).setParseAction(_ternary_action)
+
+        # Value can be ternary, variable, list, number, string, or boolean
+        term = ternary | variable | list_expr | number | string | boolean
 
-        # Value can be variable, number, string, boolean, or list
-        value = variable | list_expr | number | string | boolean
+        operand <<= infixNotation(
+            term,
+            [
+                (oneOf("* /"), 2, opAssoc.LEFT, _arith_action),
+                (oneOf("+ -"), 2, opAssoc.LEFT, _arith_action),
+            ]
+        )
 
         # Comparison operators
         comparison_op = (
@@ -107,19 +265,19 @@ class ConditionEvaluator:
             CaselessKeyword("NOT IN") | CaselessKeyword("IN")
         )
 
-        # Comparison expression: value op value
-        comparison = value + comparison_op + value
+        # Comparison expression: operand op operand
+        comparison = (operand + comparison_op + operand).setParseAction(_comparison_action)
 
         # Logical expression with precedence:
         # 1. NOT (highest precedence, right-associative)
         # 2. AND (medium precedence, left-associative)
         # 3. OR (lowest precedence, left-associative)
-        expression = infixNotation(
+        expression <<= infixNotation(
             comparison,
             [
-                (CaselessKeyword("NOT"), 1, opAssoc.RIGHT),
-                (CaselessKeyword("AND"), 2, opAssoc.LEFT),
-                (CaselessKeyword("OR"), 2, opAssoc.LEFT),
+                (CaselessKeyword("NOT"), 1, opAssoc.RIGHT, _not_action),
+                (CaselessKeyword("AND"), 2, opAssoc.LEFT, _logical_action("and")),
+                (CaselessKeyword("OR"), 2, opAssoc.LEFT, _logical_action("or")),
             ]
         )
 
@@ -133,23 +291,41 @@ class ConditionEvaluator:
             condition: Condition string to parse
 
         Returns:
-            Parsed AST (nested list structure)
+            Parsed AST (single-element list holding the root node)
 
         Raises:
-            ParseException: If condition has syntax errors
+            ValueError: If condition has syntax errors
         """
         try:
             logger.debug(f"Parsing condition: {condition}")
-            result = self.grammar.parseString(condition, parseAll=True)
-            logger.debug(f"Parsed AST: {result.asList()}")
-            return result.asList()
+            with self._grammar_lock:
+                result = self.grammar.parseString(condition, parseAll=True)
+            return [_unwrap(node) for node in result]
         except ParseException as e:
             logger.error(f"Parse error: {e}")
             raise ValueError(f"Invalid condition syntax: {str(e)}")
 
+    def compile(self, condition: str) -> CompiledCondition:
+        """
+        Compile a condition into a closure, using the shared LRU cache
+
+        Args:
+            condition: Condition string to compile
+
+        Returns:
+            Callable taking the execution context and returning the result
+
+        Raises:
+            ValueError: If condition has syntax errors
+        """
+        return _compiled_conditions.get_or_compile(
+            condition,
+            lambda: _compile_node(self.parse(condition)[0])
+        )
+
     def evaluate(self, condition: str, context: Dict[str, Any]) -> bool:
         """
-        Parse and evaluate condition against context
+        Evaluate condition against context (compiling it on first use)
 
         Args:
             condition: Condition string to evaluate
@@ -166,215 +342,216 @@ class ConditionEvaluator:
             return True
 
         try:
-            ast = self.parse(condition)
-            result = self._evaluate_node(ast[0], context)
-            logger.info(f"Condition '{condition}' evaluated to {result}")
+            result = self.compile(condition)(context)
+            logger.debug("Condition '%s' evaluated to %s", condition, result)
             return result
         except Exception as e:
             logger.error(f"Evaluation error for '{condition}': {e}")
             raise
 
-    def _evaluate_node(self, node: Union[List, str, float, int, bool], context: Dict[str, Any]) -> Any:
+    def _resolve_variable(self, var_path: List[str], context: Dict[str, Any]) -> Any:
         """
-        Recursively evaluate AST node
+        Resolve variable reference from context
 
         Args:
-            node: AST node (can be list, literal, or operator)
-            context: Execution context
+            var_path: Variable path components (e.g., ['input', 'field'] for $input.field)
+            context: Execution context with 'input', 'steps', 'context' keys
 
         Returns:
-            Evaluated value
+            Resolved variable value
+
+        Raises:
+            ValueError: If variable not found
         """
-        # Literal values
-        if isinstance(node, (int, float)):
-            return node
-        elif isinstance(node, str):
-            if node.lower() in ["true", "false"]:
-                return node.lower() == "true"
-            # Could be a string literal or variable - context will determine
-            return node
-
-        # Must be a list (operator with operands)
-        if not isinstance(node, list):
-            raise ValueError(f"Unexpected node type: {type(node)}")
-
-        # Check for logical operators
-        if len(node) == 2 and str(node[0]).upper() == "NOT":
-            # NOT operator (unary)
-            return not self._evaluate_node(node[1], context)
-
-        elif len(node) == 3:
-            left = node[0]
-            op = str(node[1]).upper()
-            right = node[2]
-
-            # Logical operators
-            if op == "AND":
-                left_val = self._evaluate_node(left, context)
-                if not left_val:
-                    return False  # Short-circuit
-                return self._evaluate_node(right, context)
+        return _compile_variable(tuple(var_path))(context)
 
-            elif op == "OR":
-                left_val = self._evaluate_node(left, context)
-                if left_val:
-                    return True  # Short-circuit
-                return self._evaluate_node(right, context)
 
-            # Comparison operators
-            else:
-                return self._evaluate_comparison(left, op, right, context)
+# ============================================================================
+# COMPILER
+# ============================================================================
 
-        else:
-            raise ValueError(f"Unexpected node structure: {node}")
-
-    def _evaluate_comparison(
-        self,
-        left: Any,
-        op: str,
-        right: Any,
-        context: Dict[str, Any]
-    ) -> bool:
-        """
-        Evaluate comparison expression
+def _compile_node(node: Any) -> CompiledCondition:
+    """Compile an AST node into a closure over the execution context."""
+    if not isinstance(node, tuple):
+        # Literal value
+        return lambda context: node
 
-        Args:
-            left: Left operand (can be variable reference or literal)
-            op: Comparison operator
-            right: Right operand (can be variable reference or literal)
-            context: Execution context
+    kind = node[0]
 
-        Returns:
-            Boolean result of comparison
-        """
-        # Resolve values (variables or literals)
-        left_val = self._resolve_value(left, context)
-        right_val = self._resolve_value(right, context)
+    if kind == "var":
+        return _compile_variable(node[1])
+
+    if kind == "list":
+        values = list(node[1])
+        return lambda context: values
+
+    if kind == "not":
+        operand = _compile_node(node[1])
+        return lambda context: not operand(context)
+
+    if kind == "and":
+        operands = [_compile_node(child) for child in node[1]]
+
+        def evaluate_and(context):
+            for operand in operands:
+                if not operand(context):
+                    return False  # Short-circuit
+            return True
+        return evaluate_and
 
-        logger.debug(f"Comparing: {left_val} {op} {right_val}")
+    if kind == "or":
+        operands = [_compile_node(child) for child in node[1]]
 
-        # Type checking for numeric comparisons
-        if op in ["<", ">", "<=", ">="]:
+        def evaluate_or(context):
+            for operand in operands:
+                if operand(context):
+                    return True  # Short-circuit
+            return False
+        return evaluate_or
+
+    if kind == "cmp":
+        return _compile_comparison(node[1], _compile_node(node[2]), _compile_node(node[3]))
+
+    if kind == "arith":
+        return _compile_arithmetic(node[1])
+
+    if kind == "ternary":
+        condition = _compile_node(node[1])
+        true_value = _compile_node(node[2])
+        false_value = _compile_node(node[3])
+
+        def evaluate_ternary(context):
+            try:
+                result = condition(context)
+            except Exception:
+                # Counting semantics: an unevaluable condition counts as false
+                return false_value(context)
+            return true_value(context) if result else false_value(context)
+        return evaluate_ternary
+
+    raise ValueError(f"Unexpected node structure: {node}")
+
+
+_ORDERING_OPS = {
+    "<": lambda a, b: a < b,
+    ">": lambda a, b: a > b,
+    "<=": lambda a, b: a <= b,
+    ">=": lambda a, b: a >= b,
+}
+
+_EQUALITY_OPS = {
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    "IN": lambda a, b: a in b,
+    "NOT IN": lambda a, b: a not in b,
+}
+
+
+def _compile_comparison(
+    op: str,
+    left: CompiledCondition,
+    right: CompiledCondition
+) -> CompiledCondition:
+    """Compile a comparison with the same type rules as the interpreter."""
+    if op in _ORDERING_OPS:
+        compare = _ORDERING_OPS[op]
+
+        def evaluate_ordering(context):
+            left_val = left(context)
+            right_val = right(context)
+            # Type checking for numeric comparisons
             if not (isinstance(left_val, (int, float)) and isinstance(right_val, (int, float))):
                 raise TypeError(
                     f"Cannot compare {type(left_val).__name__} and {type(right_val).__name__} with {op}"
                 )
+            return compare(left_val, right_val)
+        return evaluate_ordering
 
-        # Perform comparison
-        try:
-            if op == "==":
-                return left_val == right_val
-            elif op == "!=":
-                return left_val != right_val
-            elif op == "<":
-                return left_val < right_val
-            elif op == ">":
-                return left_val > right_val
-            elif op == "<=":
-                return left_val <= right_val
-            elif op == ">=":
-                return left_val >= right_val
-            elif op == "IN":
-                return left_val in right_val
-            elif op == "NOT IN":
-                return left_val not in right_val
-            else:
-                raise ValueError(f"Unsupported operator: {op}")
-        except Exception as e:
-            raise ValueError(f"Comparison failed: {left_val} {op} {right_val} - {str(e)}")
+    if op in _EQUALITY_OPS:
+        compare = _EQUALITY_OPS[op]
 
-    def _resolve_value(self, value: Any, context: Dict[str, Any]) -> Any:
-        """
-        Resolve a value (variable reference or literal)
+        def evaluate_equality(context):
+            left_val = left(context)
+            right_val = right(context)
+            try:
+                return compare(left_val, right_val)
+            except Exception as e:
+                raise ValueError(f"Comparison failed: {left_val} {op} {right_val} - {str(e)}")
+        return evaluate_equality
 
-        Args:
-            value: Value to resolve (can be variable reference or literal)
-            context: Execution context
+    raise ValueError(f"Unsupported operator: {op}")
 
-        Returns:
-            Resolved value
-        """
-        # Already a literal number or boolean
-        if isinstance(value, (int, float, bool)):
-            return value
-
-        # String could be literal or variable reference
-        if isinstance(value, str):
-            # Boolean strings
-            if value.lower() in ["true", "false"]:
-                return value.lower() == "true"
-            # Otherwise treat as string literal
-            return value
-
-        # List of tokens (variable reference or list literal)
-        if isinstance(value, list):
-            # Check if it's a variable reference
-            if len(value) >= 2 and isinstance(value[0], str):
-                # Variable reference: ['input', 'field'] or ['step1', 'data', 'value']
-                return self._resolve_variable(value, context)
-            else:
-                # List literal
-                return [self._resolve_value(v, context) for v in value]
 
-        raise ValueError(f"Cannot resolve value: {value} (type: {type(value)})")
+_ARITHMETIC_OPS = {
+    "+": lambda a, b: a + b,
+    "-": lambda a, b: a - b,
+    "*": lambda a, b: a * b,
+    "/": lambda a, b: a / b,
+}
 
-    def _resolve_variable(self, var_path: List[str], context: Dict[str, Any]) -> Any:
-        """
-        Resolve variable reference from context
 
-        Args:
-            var_path: Variable path components (e.g., ['input', 'field'] for $input.field)
-            context: Execution context with 'input', 'steps', 'context' keys
-
-        Returns:
-            Resolved variable value
-
-        Raises:
-            ValueError: If variable not found
-        """
-        if not var_path:
-            raise ValueError("Empty variable path")
+def _compile_arithmetic(tokens: List[Any]) -> CompiledCondition:
+    """Compile [a, op, b, op, c, ...] into a left-to-right fold."""
+    first = _compile_node(tokens[0])
+    steps: List[Tuple[Callable[[Any, Any], Any], CompiledCondition]] = [
+        (_ARITHMETIC_OPS[tokens[i]], _compile_node(tokens[i + 1]))
+        for i in range(1, len(tokens), 2)
+    ]
 
-        source = var_path[0]
-        path = var_path[1:]
+    def evaluate_arithmetic(context):
+        value = first(context)
+        for apply, operand in steps:
+            value = apply(value, operand(context))
+        return value
+    return evaluate_arithmetic
 
-        logger.debug(f"Resolving variable: ${'.'.join(var_path)}")
 
-        # Get source data
-        if source == "input":
-            data = context.get("input", {})
-        elif source == "context":
-            data = context.get("context", {})
-        elif source.startswith("step"):
-            # Extract step number: step1 -> 1
-            match = re.match(r"step(\d+)", source)
-            if not match:
-                raise ValueError(f"Invalid step reference: {source}")
+_STEP_SOURCE = re.compile(r"step(\d+)")
 
-            step_num = int(match.group(1))
 
-            # Get step data from context
-            steps_data = context.get("steps", {})
-
-            # Find the output variable for this step
-            # Context structure: {"steps": {"output_var_name": {...}, ...}}
-            # We need to find which output_var belongs to step_num
+def _compile_variable(var_path: Tuple[str, ...]) -> CompiledCondition:
+    """
+    Compile a variable reference into a context lookup
 
-            # For now, assume direct access by step number
-            # This requires the context to be structured with step numbers
-            if not path:
-                raise ValueError(f"Step reference must include output variable: $step{step_num}.variable")
+    Context structure: {"input": {...}, "context": {...},
+    "steps": {"output_var_name": {...}}}. Step references are resolved by
+    output variable name ($step1.output_var.key).
+    """
+    if not var_path:
+        raise ValueError("Empty variable path")
 
-            var_name = path[0]
-            path = path[1:]
+    source = var_path[0]
+    path = list(var_path[1:])
 
+    if source in ("input", "context"):
+        def get_source(context):
+            return context.get(source, {})
+    elif source.startswith("step"):
+        match = _STEP_SOURCE.match(source)
+        if not match:
+            raise ValueError(f"Invalid step reference: {source}")
+        if not path:
+            raise ValueError(
+                f"Step reference must include output variable: $step{match.group(1)}.variable"
+            )
+        var_name = path.pop(0)
+
+        def get_source(context):
+            steps_data = context.get("steps", {})
             if var_name not in steps_data:
-                raise ValueError(f"Step output variable '{var_name}' not found. Available: {list(steps_data.keys())}")
-
-            data = steps_data[var_name]
-        else:
-            raise ValueError(f"Unknown variable source: {source}")
-
+                raise ValueError(
+                    f"Step output variable '{var_name}' not found. Available: {list(steps_data.keys())}"
+                )
+            return steps_data[var_name]
+    else:
+        # Extra top-level sources supplied by the caller (e.g. $assessment.*)
+        def get_source(context):
+            if source not in context:
+                raise ValueError(f"Unknown variable source: {source}")
+            return context[source]
+
+    def resolve(context):
+        data = get_source(context)
         # Traverse nested path
         for key in path:
             if isinstance(data, dict):
@@ -383,9 +560,8 @@ class ConditionEvaluator:
                 data = data[key]
             else:
                 raise ValueError(f"Cannot access key '{key}' on non-dict value: {type(data)}")
-
-        logger.debug(f"Resolved ${'.'.join(var_path)} = {data}")
         return data
+    return resolve
 
 
 # Simple regex-based fallback for basic conditions (backward compatibility)
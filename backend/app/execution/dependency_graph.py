@@ -121,6 +121,60 @@ class DependencyGraph:
         logger.debug(f"Step {step.step_number} depends on: {dependencies}")
         return dependencies
 
+    def _extract_data_references(self, step: WorkflowStep) -> Set[str]:
+        """
+        Extract $input / $context references from a workflow step
+
+        References are reduced to their top-level field ("input.field",
+        "context.key"); a bare $input or $context yields "input" / "context".
+
+        Args:
+            step: Workflow step to analyze
+
+        Returns:
+            Set of references found in input_mapping values and condition
+        """
+        references = set()
+
+        # Pattern to match $input[.field] and $context[.key] references
+        data_ref_pattern = r'\$(input|context)(?:\.(\w+))?'
+
+        expressions = [v for v in step.input_mapping.values() if isinstance(v, str)]
+        if step.condition:
+            expressions.append(step.condition)
+
+        for expression in expressions:
+            for source, key in re.findall(data_ref_pattern, expression):
+                references.add(f"{source}.{key}" if key else source)
+
+        return references
+
+    def get_affected_steps(self, changed_references: Set[str]) -> Set[int]:
+        """
+        Get all steps whose result may change when data references change
+
+        A step is affected if it reads a changed "input.field" /
+        "context.key" (or the whole $input / $context object), or if it
+        depends, directly or transitively, on an affected step.
+
+        Args:
+            changed_references: Changed references, e.g. {"input.safe_bearing_capacity"}
+
+        Returns:
+            Set of affected step numbers
+        """
+        affected = set()
+        for step_number, step in self.steps.items():
+            for reference in self._extract_data_references(step):
+                if any(c == reference or c.startswith(reference + ".") for c in changed_references):
+                    affected.add(step_number)
+                    break
+
+        for step_number in list(affected):
+            affected.update(nx.descendants(self.graph, step_number))
+
+        return affected
+
     def get_execution_order(self) -> List[List[int]]:
         """
         Get execution order with parallel groups
@@ -0,0 +1,274 @@
+"""
+CSA AIaaS Platform - Compiled Workflow Execution Plans
+Performance: Per-schema-version compilation of workflow steps
+
+Every execution used to re-parse each "$stepN.var.path" reference with
+string splits, re-split function_to_call, look the engine up in the
+registry, re-parse conditions and rebuild the networkx dependency graph
+(regex scan of every mapping, topological generations, critical path).
+None of this depends on the input, so it is compiled once per schema
+version into an ExecutionPlan and kept on the cached DeliverableSchema.
+
+Features:
+- Variable references compiled into accessor closures (pre-split path,
+  pre-parsed list indexes); same values and error messages as before
+- Engine callables bound from the registry once (EngineRegistry.bind)
+- Simple "$ref <op> literal" conditions compiled with their literal parsed
+- Dependency graph, statistics, topological order and critical path
+  computed once and handed to ParallelExecutor
+
+Per-execution overhead is then dictionary lookups plus the engine math.
+Plans are read-only and shared between concurrent executions.
+"""
+
+import logging
+import operator
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.engines.registry import EngineRegistry, engine_registry
+from app.schemas.workflow.schema_models import WorkflowStep
+from .dependency_graph import DependencyAnalyzer, DependencyGraph, GraphStats
+
+logger = logging.getLogger(__name__)
+
+Accessor = Callable[[Dict[str, Any]], Any]
+
+# Simple condition syntax: "$input.field == value" (see WorkflowOrchestrator._evaluate_condition)
+_CONDITION_PATTERN = re.compile(r"\$[\w.]+\s*(==|!=|<|>|<=|>=)\s*(\S+)")
+
+_COMPARISONS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+}
+
+
+# ============================================================================
+# VARIABLE ACCESSORS
+# ============================================================================
+
+def _raising(error: Exception) -> Accessor:
+    """Accessor for a reference that can never resolve (fails when used)."""
+    def resolve(execution_context):
+        raise error
+    return resolve
+
+
+@lru_cache(maxsize=4096)
+def compile_reference(variable_ref: str) -> Accessor:
+    """
+    Compile a variable reference into a function of the execution context.
+
+    Supported formats: $input[.path], $context[.path], $stepN.output_var[.path]
+    (path segments are dict keys, or list indexes when numeric). Strings not
+    starting with "$" are literals.
+
+    Args:
+        variable_ref: Reference string, e.g. "$step1.initial_design_data.area"
+
+    Returns:
+        Accessor raising ValueError (as WorkflowOrchestrator._resolve_variable
+        always has) when the reference cannot be resolved
+    """
+    if not variable_ref.startswith("$"):
+        return lambda execution_context: variable_ref
+
+    parts = variable_ref[1:].split(".")
+    source = parts[0]
+    path = parts[1:]
+    var_name = None
+
+    if source in ("input", "context"):
+        pass
+    elif source.startswith("step"):
+        if not path:
+            return _raising(ValueError(
+                f"Invalid step reference: {variable_ref}. Must specify output variable name."
+            ))
+        var_name = path[0]
+        path = path[1:]
+    else:
+        return _raising(ValueError(f"Unknown variable source: '{source}' in {variable_ref}"))
+
+    keys = tuple((key, int(key) if key.isdigit() else None) for key in path)
+
+    def resolve(execution_context):
+        if var_name is None:
+            data = execution_context.get(source, {})
+        else:
+            steps = execution_context.get("steps", {})
+            data = steps.get(var_name)
+            if data is None:
+                raise ValueError(
+                    f"Step output variable '{var_name}' not found. "
+                    f"Available variables: {list(steps.keys())}"
+                )
+
+        for key, index in keys:
+            if isinstance(data, dict):
+                if key not in data:
+                    raise ValueError(f"Key '{key}' not found in path for {variable_ref}")
+                data = data[key]
+            elif isinstance(data, list) and index is not None:
+                if index < len(data):
+                    data = data[index]
+                else:
+                    raise ValueError(f"Index {index} out of range in {variable_ref}")
+            else:
+                raise ValueError(f"Cannot access key '{key}' in {variable_ref} - data is not a dict")
+
+        return data
+
+    return resolve
+
+
+def _parse_literal(value_str: str) -> Any:
+    """Condition literal: true/false, int, float, else an unquoted string."""
+    if value_str.lower() == "true":
+        return True
+    if value_str.lower() == "false":
+        return False
+    if value_str.isdigit():
+        return int(value_str)
+    if value_str.replace(".", "").isdigit():
+        return float(value_str)
+    return value_str.strip("'\"")
+
+
+@lru_cache(maxsize=1024)
+def compile_condition(condition: str) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Compile a simple step condition ("$ref <op> literal").
+
+    Conditions that do not match the syntax always hold; a reference that
+    cannot be resolved makes the condition false.
+    """
+    match = _CONDITION_PATTERN.match(condition)
+    if not match:
+        return lambda execution_context: True
+
+    resolve = compile_reference(condition.split()[0])
+    compare = _COMPARISONS[match.group(1)]
+    value = _parse_literal(match.group(2))
+
+    def evaluate(execution_context):
+        try:
+            variable_value = resolve(execution_context)
+        except ValueError:
+            return False
+        return compare(variable_value, value)
+
+    return evaluate
+
+
+# ============================================================================
+# COMPILED STEPS
+# ============================================================================
+
+@dataclass(frozen=True)
+class CompiledStep:
+    """A workflow step with its references, condition and engine resolved."""
+
+    step: WorkflowStep
+    inputs: Tuple[Tuple[str, Accessor], ...]
+    condition: Optional[Callable[[Dict[str, Any]], bool]]
+    engine: Callable[[Dict[str, Any]], Dict[str, Any]]
+    # Engine runs in a sandboxed worker (killed at its limit, never left hanging)
+    sandboxed: bool = False
+
+    @classmethod
+    def compile(cls, step: WorkflowStep, registry: Optional[EngineRegistry] = None) -> "CompiledStep":
+        registry = registry or engine_registry
+
+        inputs = tuple(
+            (name, compile_reference(ref) if isinstance(ref, str) else (lambda ctx, value=ref: value))
+            for name, ref in step.input_mapping.items()
+        )
+
+        parts = step.function_to_call.split(".")
+        sandboxed = False
+        if len(parts) == 2:
+            sandboxed = step.error_handling.sandbox or registry.get_execution_tier(*parts) == "sandbox"
+            if step.error_handling.sandbox:
+                engine = registry.bind(*parts, sandbox=True, timeout_seconds=step.timeout_seconds)
+            else:
+                engine = registry.bind(*parts)
+        else:
+            error = ValueError(
+                f"Invalid function_to_call format: '{step.function_to_call}'. "
+                f"Expected 'tool_name.function_name'"
+            )
+            engine = _raising(error)
+
+        return cls(
+            step=step,
+            inputs=inputs,
+            condition=compile_condition(step.condition) if step.condition else None,
+            engine=engine,
+            sandboxed=sandboxed
+        )
+
+    def resolve_inputs(self, execution_context: Dict[str, Any]) -> Dict[str, Any]:
+        """Resolved engine input for this step."""
+        return {name: resolve(execution_context) for name, resolve in self.inputs}
+
+
+# ============================================================================
+# EXECUTION PLAN
+# ============================================================================
+
+class ExecutionPlan:
+    """
+    Compiled form of a schema's workflow steps.
+
+    Attributes:
+        steps: The workflow step list the plan was compiled from
+        compiled: step_number -> CompiledStep
+        graph / stats: Dependency graph and its statistics
+        execution_order: Topological generations ([] if the graph has cycles)
+        critical_path: Longest dependency chain ([] if the graph has cycles)
+    """
+
+    def __init__(self, steps: List[WorkflowStep], registry: Optional[EngineRegistry] = None):
+        self.steps = steps
+        self.compiled: Dict[int, CompiledStep] = {
+            step.step_number: CompiledStep.compile(step, registry) for step in steps
+        }
+
+        self.graph: DependencyGraph
+        self.stats: GraphStats
+        self.graph, self.stats = DependencyAnalyzer.analyze(steps)
+        if self.stats.has_cycles:
+            self.execution_order: List[List[int]] = []
+            self.critical_path: List[int] = []
+        else:
+            self.execution_order = self.graph.get_execution_order()
+            self.critical_path = self.graph.calculate_critical_path()
+
+    def get(self, step: WorkflowStep) -> CompiledStep:
+        """Compiled form of a step (compiled on the fly if not from this plan)."""
+        compiled = self.compiled.get(step.step_number)
+        if compiled is None or compiled.step is not step:
+            return CompiledStep.compile(step)
+        return compiled
+
+
+def get_execution_plan(schema: Any) -> ExecutionPlan:
+    """
+    Execution plan of a schema, compiled on first use and kept on the schema.
+
+    Cached DeliverableSchema objects are shared, so the plan is compiled once
+    per cached schema version. Copies made for per-execution overrides
+    (model_copy) share the plan as long as their workflow steps are unchanged.
+    """
+    plan = getattr(schema, "_execution_plan", None)
+    if plan is None or plan.steps is not schema.workflow_steps:
+        plan = ExecutionPlan(schema.workflow_steps)
+        schema._execution_plan = plan
+    return plan
@@ -4,6 +4,7 @@ Parallel Execution Engine
 Executes workflow steps with intelligent parallelization:
 - Analyzes dependencies to identify parallel execution groups
 - Executes independent steps concurrently using asyncio
+- Dataflow scheduling: a step starts as soon as its own dependencies finish
 - Maintains execution order for dependent steps
 - Handles errors without blocking parallel tracks
 - Provides progress tracking and cancellation support
@@ -17,6 +18,7 @@ from datetime import datetime
 from enum import Enum
 
 from app.execution.dependency_graph import DependencyGraph, DependencyAnalyzer
+from app.execution.execution_plan import ExecutionPlan
 from app.execution.retry_manager import RetryManager, RetryConfig, RetryMetadata
 from app.schemas.workflow.schema_models import WorkflowStep, StepResult, ErrorHandling
 
@@ -83,6 +85,8 @@ class ParallelExecutionResult:
     parallel_speedup: float  # Estimated vs sequential
     error_message: Optional[str] = None
     cancelled_at_step: Optional[int] = None
+    sequential_time_ms: float = 0.0  # Sum of individual step times
+    measured_speedup: float = 1.0  # sequential_time_ms / total_time_ms
 
 
 class ParallelExecutor:
@@ -109,12 +113,14 @@ class ParallelExecutor:
         Args:
             step_executor: Function to execute individual steps
                            Signature: async def execute_step(step, context) -> StepResult
-            retry_manager: Optional retry manager for transient failures
+            retry_manager: Retry manager for transient failures (None runs each
+                           step once: pass one only if step_executor does not
+                           apply its own retry policy, or retries multiply)
             progress_callback: Optional callback for progress updates
                               Signature: async def callback(completed, total, current_step)
         """
         self.step_executor = step_executor
-        self.retry_manager = retry_manager or RetryManager()
+        self.retry_manager = retry_manager
         self.progress_callback = progress_callback
         self.execution_stats = {
             "total_executions": 0,
@@ -129,7 +135,10 @@ class ParallelExecutor:
         steps: List[WorkflowStep],
         input_data: Dict[str, Any],
         context_data: Optional[Dict[str, Any]] = None,
-        enable_parallel: bool = True
+        enable_parallel: bool = True,
+        scheduling: str = "dataflow",
+        execution_context: Optional[ExecutionContext] = None,
+        plan: Optional[ExecutionPlan] = None
     ) -> ParallelExecutionResult:
         """
         Execute workflow with parallel optimization
@@ -139,6 +148,14 @@ class ParallelExecutor:
             input_data: Input data for workflow
             context_data: Additional context data
             enable_parallel: If False, execute sequentially (for debugging)
+            scheduling: "dataflow" starts each step as soon as its own
+                        dependencies finish; "generations" runs topological
+                        generations with a barrier between them
+            execution_context: Optional pre-built context (e.g. seeded with
+                               step outputs); built from input_data otherwise
+            plan: Optional compiled ExecutionPlan for these steps; its
+                  dependency graph, statistics and execution order are used
+                  instead of analyzing the steps again
 
         Returns:
             ParallelExecutionResult with all step results
@@ -146,16 +163,20 @@ class ParallelExecutor:
         start_time = asyncio.get_event_loop().time()
 
         # Initialize execution context
-        execution_context = ExecutionContext(
-            input=input_data,
-            context=context_data or {},
-            total_steps=len(steps)
-        )
+        if execution_context is None:
+            execution_context = ExecutionContext(
+                input=input_data,
+                context=context_data or {},
+                total_steps=len(steps)
+            )
 
         # Analyze dependencies
         try:
-            graph, stats = DependencyAnalyzer.analyze(steps)
-            logger.info(f"Workflow analysis: {stats}")
+            if plan is not None:
+                graph, stats = plan.graph, plan.stats
+            else:
+                graph, stats = DependencyAnalyzer.analyze(steps)
+                logger.info(f"Workflow analysis: {stats}")
 
             if stats.has_cycles:
                 raise ValueError(f"Workflow has circular dependencies: {stats.cycles}")
@@ -172,7 +193,7 @@ class ParallelExecutor:
             )
 
         # Get execution order (parallel groups)
-        execution_order = graph.get_execution_order()
+        execution_order = plan.execution_order if plan is not None else graph.get_execution_order()
         logger.info(f"Execution order (parallel groups): {execution_order}")
 
         # Execute workflow
@@ -180,7 +201,17 @@ class ParallelExecutor:
         execution_status = ExecutionStatus.RUNNING
 
         try:
-            if enable_parallel and stats.max_width > 1:
+            if enable_parallel and stats.max_width > 1 and scheduling == "dataflow":
+                # Dataflow execution (ready queue)
+                logger.info(f"🚀 Executing workflow with dataflow scheduling (max width: {stats.max_width})")
+                step_results = await self._execute_dataflow(
+                    steps,
+                    graph,
+                    execution_context
+                )
+                self.execution_stats["parallel_executions"] += 1
+                self.execution_stats["total_steps_parallel"] += stats.total_steps
+            elif enable_parallel and stats.max_width > 1:
                 # Parallel execution
                 logger.info(f"🚀 Executing workflow in parallel (max width: {stats.max_width})")
                 step_results = await self._execute_parallel(
@@ -234,10 +265,14 @@ class ParallelExecutor:
         # Estimate speedup
         estimated_speedup = DependencyAnalyzer.estimate_speedup(stats) if enable_parallel else 1.0
 
+        # Measured speedup against running the same steps one after another
+        sequential_time_ms = float(sum(r.execution_time_ms or 0 for r in step_results))
+        measured_speedup = sequential_time_ms / total_time_ms if total_time_ms > 0 and sequential_time_ms > 0 else 1.0
+
         logger.info(
             f"✅ Workflow execution complete: {execution_status} "
             f"({len(step_results)} steps in {total_time_ms:.2f}ms, "
-            f"estimated speedup: {estimated_speedup:.2f}x)"
+            f"estimated speedup: {estimated_speedup:.2f}x, measured speedup: {measured_speedup:.2f}x)"
         )
 
         return ParallelExecutionResult(
@@ -247,9 +282,105 @@ class ParallelExecutor:
             total_time_ms=total_time_ms,
             parallel_speedup=estimated_speedup,
             error_message=failed_steps[0].error_message if failed_steps else None,
-            cancelled_at_step=step_results[-1].step_number if execution_context.cancelled else None
+            cancelled_at_step=step_results[-1].step_number if execution_context.cancelled and step_results else None,
+            sequential_time_ms=sequential_time_ms,
+            measured_speedup=measured_speedup
         )
 
+    async def _execute_dataflow(
+        self,
+        steps: List[WorkflowStep],
+        graph: DependencyGraph,
+        execution_context: ExecutionContext
+    ) -> List[StepResult]:
+        """
+        Execute workflow with dataflow (ready-queue) scheduling
+
+        Unlike _execute_parallel there is no barrier between topological
+        generations: each step is started as soon as all of its own $stepN
+        dependencies have finished, so the workflow takes as long as its
+        critical path.
+
+        Args:
+            steps: All workflow steps
+            graph: Dependency graph for the steps
+            execution_context: Shared execution context
+
+        Returns:
+            List of step results
+        """
+        step_map = {s.step_number: s for s in steps}
+        remaining_deps = {n: len(graph.get_dependencies(n)) for n in step_map}
+        all_results: List[StepResult] = []
+        running: Dict[asyncio.Task, int] = {}
+
+        def start(step_number: int):
+            step = step_map[step_number]
+            task = asyncio.ensure_future(self._execute_single_step(step, execution_context))
+            running[task] = step_number
+
+        # Seed the ready queue with steps that have no dependencies
+        for step_number in sorted(n for n, count in remaining_deps.items() if count == 0):
+            start(step_number)
+
+        try:
+            while running:
+                done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+
+                newly_ready = []
+                for task in done:
+                    step_number = running.pop(task)
+                    step = step_map[step_number]
+
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        logger.error(f"Step {step_number} raised exception: {e}")
+                        result = StepResult(
+                            step_number=step_number,
+                            step_name=step.step_name,
+                            status="failed",
+                            error_message=str(e)
+                        )
+                    all_results.append(result)
+
+                    if result.status == "failed" and step.error_handling.on_error == "fail":
+                        logger.error(f"Critical step {step_number} failed, stopping execution")
+                        execution_context.cancelled = True
+
+                    for dependent in graph.get_dependents(step_number):
+                        remaining_deps[dependent] -= 1
+                        if remaining_deps[dependent] == 0:
+                            newly_ready.append(dependent)
+
+                if execution_context.cancelled:
+                    break
+
+                for step_number in sorted(newly_ready):
+                    start(step_number)
+
+            if running:
+                # Critical failure: let in-flight steps finish so their
+                # results are recorded, but start nothing new
+                finished = await asyncio.gather(*running.keys(), return_exceptions=True)
+                for task, outcome in zip(list(running.keys()), finished):
+                    step_number = running[task]
+                    if isinstance(outcome, Exception):
+                        outcome = StepResult(
+                            step_number=step_number,
+                            step_name=step_map[step_number].step_name,
+                            status="failed",
+                            error_message=str(outcome)
+                        )
+                    all_results.append(outcome)
+                running.clear()
+
+        finally:
+            for task in running:
+                task.cancel()
+
+        return sorted(all_results, key=lambda r: r.step_number)
+
     async def _execute_parallel(
         self,
         steps: List[WorkflowStep],
@@ -401,7 +532,7 @@ class ParallelExecutor:
         execution_context: ExecutionContext
     ) -> StepResult:
         """
-        Execute a single workflow step with retry support
+        Execute a single workflow step (retried only with a retry_manager)
 
         Args:
             step: Workflow step to execute
@@ -425,14 +556,14 @@ class ParallelExecutor:
 
         # Execute step with retry if configured
         try:
-            if step.error_handling.retry_count > 0:
+            if self.retry_manager is not None and step.error_handling.retry_count > 0:
                 # Use retry manager
                 retry_config = RetryConfig(
                     retry_count=step.error_handling.retry_count,
-                    base_delay_seconds=getattr(step.error_handling, 'base_delay_seconds', 1.0),
-                    max_delay_seconds=getattr(step.error_handling, 'max_delay_seconds', 60.0),
-                    retry_on_timeout=True,
-                    retry_on_transient_only=True
+                    base_delay_seconds=step.error_handling.base_delay_seconds,
+                    max_delay_seconds=step.error_handling.max_delay_seconds,
+                    retry_on_timeout=step.error_handling.retry_on_timeout,
+                    retry_on_transient_only=step.error_handling.retry_on_transient_only
                 )
 
                 result, retry_metadata = await self.retry_manager.execute_with_retry(
@@ -0,0 +1,201 @@
+"""
+CSA AIaaS Platform - Incremental Re-execution Planner
+Performance: Re-run only the steps whose inputs changed
+
+Engineers iterate on a deliverable by tweaking one input and re-running it.
+A re-run starts from a finished execution: steps that cannot see the change
+take their stored result from that execution instead of calling the engine
+again.
+
+Planning:
+- The changed $input fields (and $context keys, e.g. execution_id) are
+  mapped to the steps reading them; those steps and everything depending
+  on them (DependencyGraph) are "affected"
+- Unaffected steps reuse their stored result (completed or skipped)
+- Affected steps are compared once their dependencies have finished: if the
+  resolved input_mapping and condition outcome equal those of the source
+  execution (an upstream step was recomputed but produced the same output),
+  the stored result is reused as well
+
+Failed steps, and steps the source execution never reached, always run.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set
+from uuid import UUID
+
+from app.schemas.workflow.schema_models import StepResult, WorkflowStep
+from .dependency_graph import DependencyGraph
+
+logger = logging.getLogger(__name__)
+
+REUSABLE_STATUSES = ("completed", "skipped")
+
+
+@dataclass
+class RerunSource:
+    """Stored state of the execution a re-run starts from"""
+
+    execution_id: UUID
+    schema_id: UUID
+    schema_version: Optional[int]
+    deliverable_type: str
+    input_data: Dict[str, Any]
+    context: Dict[str, Any]
+    step_results: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "RerunSource":
+        """Build from a csa.workflow_executions row"""
+        return cls(
+            execution_id=row["id"],
+            schema_id=row["schema_id"],
+            schema_version=row.get("schema_version"),
+            deliverable_type=row["deliverable_type"],
+            input_data=row.get("input_data") or {},
+            context={
+                "user_id": row.get("user_id"),
+                "project_id": str(row["project_id"]) if row.get("project_id") else None,
+                "execution_id": str(row["id"])
+            },
+            step_results={
+                sr["step_number"]: sr for sr in (row.get("intermediate_results") or [])
+            }
+        )
+
+
+def changed_references(
+    old: Dict[str, Any],
+    new: Dict[str, Any],
+    source: str
+) -> Set[str]:
+    """Top-level fields that differ between two dicts, as "source.field" references"""
+    return {
+        f"{source}.{key}"
+        for key in set(old) | set(new)
+        if key not in old or key not in new or old[key] != new[key]
+    }
+
+
+class RerunPlan:
+    """
+    Decides, step by step, whether a re-run can reuse the source result
+
+    Args:
+        steps: Workflow steps (of the same schema version as the source)
+        source: Execution the re-run starts from
+        input_data: Input of the re-run
+        context: $context of the re-run
+        graph: Dependency graph of the steps (built from them if not given)
+    """
+
+    def __init__(
+        self,
+        steps: List[WorkflowStep],
+        source: RerunSource,
+        input_data: Dict[str, Any],
+        context: Dict[str, Any],
+        graph: Optional[DependencyGraph] = None
+    ):
+        self.source = source
+        self.changed = (
+            changed_references(source.input_data, input_data, "input")
+            | changed_references(source.context, context, "context")
+        )
+        graph = graph or DependencyGraph(steps)
+        self.affected_steps = graph.get_affected_steps(self.changed)
+        self.reused_steps: List[int] = []
+
+        # What $stepN references resolved to in the source execution
+        source_outputs = {}
+        for step in steps:
+            prior = source.step_results.get(step.step_number)
+            if prior is None:
+                continue
+            if prior["status"] == "completed" and prior.get("output_data"):
+                source_outputs[step.output_variable] = prior["output_data"]
+            elif (
+                prior["status"] == "failed"
+                and step.error_handling.on_error == "continue"
+                and step.error_handling.fallback_value is not None
+            ):
+                source_outputs[step.output_variable] = step.error_handling.fallback_value
+
+        self.source_context = {
+            "input": source.input_data,
+            "steps": source_outputs,
+            "context": source.context
+        }
+
+    def reuse(
+        self,
+        step: WorkflowStep,
+        execution_context: Dict[str, Any],
+        resolve_inputs: Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]],
+        evaluate_condition: Callable[[str, Dict[str, Any]], bool]
+    ) -> Optional[StepResult]:
+        """
+        Stored result of a step, if the re-run can reuse it
+
+        Args:
+            step: Step about to run (its dependencies have finished)
+            execution_context: Current execution context
+            resolve_inputs: Resolves an input_mapping against a context
+            evaluate_condition: Evaluates a condition against a context
+
+        Returns:
+            StepResult marked reused, or None if the step must run
+        """
+        prior = self.source.step_results.get(step.step_number)
+        if prior is None or prior["status"] not in REUSABLE_STATUSES:
+            return None
+
+        if step.step_number in self.affected_steps and not self._same_inputs(
+            step, prior, execution_context, resolve_inputs, evaluate_condition
+        ):
+            return None
+
+        self.reused_steps.append(step.step_number)
+        return StepResult(
+            step_number=step.step_number,
+            step_name=step.step_name,
+            status=prior["status"],
+            output_data=prior.get("output_data"),
+            execution_time_ms=0,
+            reused=True
+        )
+
+    def _same_inputs(
+        self,
+        step: WorkflowStep,
+        prior: Dict[str, Any],
+        execution_context: Dict[str, Any],
+        resolve_inputs: Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]],
+        evaluate_condition: Callable[[str, Dict[str, Any]], bool]
+    ) -> bool:
+        """Whether the step sees exactly what it saw in the source execution"""
+        try:
+            if step.condition:
+                if evaluate_condition(step.condition, execution_context) != evaluate_condition(
+                    step.condition, self.source_context
+                ):
+                    return False
+                if prior["status"] == "skipped":
+                    return True
+            return resolve_inputs(step.input_mapping, execution_context) == resolve_inputs(
+                step.input_mapping, self.source_context
+            )
+        except Exception as e:
+            logger.debug(f"Step {step.step_number} inputs not comparable, recomputing: {e}")
+            return False
+
+    def get_stats(self, step_results: List[StepResult]) -> Dict[str, Any]:
+        """Re-run summary for execution_stats"""
+        return {
+            "source_execution_id": str(self.source.execution_id),
+            "changed": sorted(self.changed),
+            "affected_steps": sorted(self.affected_steps),
+            "reused_steps": sorted(self.reused_steps),
+            "recomputed_steps": sorted(r.step_number for r in step_results if not r.reused)
+        }
@@ -0,0 +1,149 @@
+"""
+CSA AIaaS Platform - Workflow Step Threads
+Performance: Bounded threads for step attempts, hung engines fail fast
+
+Step attempts run on worker threads so the orchestrator can stop waiting at
+the step timeout. A thread cannot be killed, though: an inline engine that
+hangs keeps its thread after the step gave up on it (an abandoned attempt).
+On an unbounded or shared pool, a few hung engines would leave every later
+attempt queued, timing out before it even started.
+
+Features:
+- Fixed number of threads (WORKFLOW_STEP_THREADS); an attempt holds its slot
+  until the engine call returns, abandoned or not, so attempts never queue
+- Fails fast with StepCapacityError when no thread is free
+- At most WORKFLOW_STEP_MAX_ABANDONED abandoned attempts: beyond that, only
+  sandboxed steps (whose engines are killed at the step timeout) may start
+- Metrics: running and abandoned attempts, rejections
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+
+
+class StepCapacityError(RuntimeError):
+    """No workflow step thread is free for a new attempt"""
+
+    error_type = "capacity"
+
+
+class StepThreadPool:
+    """
+    Bounded threads for workflow step attempts
+
+    Args:
+        max_threads: Attempts running at once (abandoned ones included)
+        max_abandoned: Abandoned attempts after which only sandboxed steps start
+    """
+
+    def __init__(self, max_threads: int = 32, max_abandoned: int = 8):
+        self.max_threads = max(1, max_threads)
+        self.max_abandoned = max_abandoned
+        self._executor = ThreadPoolExecutor(max_workers=self.max_threads, thread_name_prefix="workflow-step")
+        self._slots = threading.BoundedSemaphore(self.max_threads)
+        self._lock = threading.Lock()
+        self._running = 0
+        self._abandoned = 0
+        self.stats = {
+            "submitted": 0,
+            "abandoned_total": 0,
+            "rejected": 0,
+        }
+
+    def submit(self, func: Callable[..., Any], *args: Any, sandboxed: bool = False) -> Future:
+        """
+        Start func(*args) on a step thread
+
+        Args:
+            func: Attempt to run
+            *args: Its arguments
+            sandboxed: The attempt's engine runs in a killable sandbox worker,
+                       so it may start while many attempts are abandoned
+
+        Raises:
+            StepCapacityError: No thread free (or too many abandoned attempts)
+        """
+        with self._lock:
+            abandoned = self._abandoned
+        if not sandboxed and abandoned >= self.max_abandoned:
+            self._reject()
+            raise StepCapacityError(
+                f"{abandoned} timed-out step attempts are still running; "
+                f"only sandboxed steps can start until they finish"
+            )
+        if not self._slots.acquire(blocking=False):
+            self._reject()
+            raise StepCapacityError(
+                f"All {self.max_threads} workflow step threads are busy "
+                f"({abandoned} held by timed-out attempts)"
+            )
+
+        try:
+            future = self._executor.submit(func, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._running += 1
+            self.stats["submitted"] += 1
+        future.add_done_callback(self._finished)
+        return future
+
+    def abandon(self, future: Future) -> None:
+        """The step stopped waiting for this attempt (timeout); it keeps its slot until it returns"""
+        with self._lock:
+            if future.done() or getattr(future, "abandoned", False):
+                return
+            future.abandoned = True
+            self._abandoned += 1
+            self.stats["abandoned_total"] += 1
+
+    def _finished(self, future: Future) -> None:
+        with self._lock:
+            self._running -= 1
+            if getattr(future, "abandoned", False):
+                self._abandoned -= 1
+        self._slots.release()
+
+    def _reject(self) -> None:
+        with self._lock:
+            self.stats["rejected"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Thread limits, running and abandoned attempts"""
+        with self._lock:
+            return {
+                **self.stats,
+                "max_threads": self.max_threads,
+                "max_abandoned": self.max_abandoned,
+                "running": self._running,
+                "abandoned": self._abandoned,
+            }
+
+
+# ============================================================================
+# GLOBAL INSTANCE
+# ============================================================================
+
+_global_pool: Optional[StepThreadPool] = None
+_global_lock = threading.Lock()
+
+
+def get_step_thread_pool() -> StepThreadPool:
+    """
+    Get the process-wide step thread pool
+
+    Returns:
+        StepThreadPool sized by WORKFLOW_STEP_THREADS / WORKFLOW_STEP_MAX_ABANDONED
+    """
+    global _global_pool
+    with _global_lock:
+        if _global_pool is None:
+            _global_pool = StepThreadPool(
+                max_threads=settings.WORKFLOW_STEP_THREADS,
+                max_abandoned=settings.WORKFLOW_STEP_MAX_ABANDONED,
+            )
+    return _global_pool
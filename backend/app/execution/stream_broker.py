@@ -0,0 +1,247 @@
+"""
+CSA AIaaS Platform - Stream Event Brokers
+Performance: Cross-worker fan-out for execution streams
+
+StreamingManager delivers events to the subscribers of its own process. With
+several uvicorn workers, a client streaming an execution is often connected
+to a different worker than the one running it. A broker carries each event
+to the other workers, whose StreamingManager then delivers it (and keeps it
+in history) as if it had been emitted locally.
+
+Backends:
+- memory:   single process; publish() is a no-op
+- postgres: PostgreSQL LISTEN/NOTIFY on one channel. Events are published by
+            a sender thread (many NOTIFYs per round trip) and received by a
+            listener thread on a dedicated connection; a worker ignores its
+            own notifications.
+
+Features:
+- Publishing never blocks the emitting thread (bounded outbox)
+- NOTIFY payload limit handled by dropping large event data for remote
+  workers (local subscribers still get the full event)
+- Listener reconnects with backoff after connection loss
+"""
+
+import json
+import logging
+import queue
+import select
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional
+from uuid import uuid4
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+STREAM_NOTIFY_CHANNEL = "csa_stream_events"
+
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more
+MAX_NOTIFY_PAYLOAD_BYTES = 7900
+
+NOTIFY_BATCH_SQL = "SELECT pg_notify(%s, payload) FROM unnest(%s::text[]) AS payload"
+
+EventHandler = Callable[[Dict[str, Any]], None]
+
+
+class StreamBroker(ABC):
+    """
+    Carries stream events between worker processes.
+
+    ``publish()`` is called for every locally emitted event (as a
+    ``StreamEvent.to_dict()`` payload); events from other processes are
+    passed to the handler given to ``start()``.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def start(self, on_remote_event: EventHandler) -> None:
+        """Start receiving events published by other processes."""
+        pass
+
+    @abstractmethod
+    def publish(self, payload: Dict[str, Any]) -> None:
+        """Publish a locally emitted event to other processes (non-blocking)."""
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Stop background work."""
+        pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend": self.name}
+
+
+class InProcessStreamBroker(StreamBroker):
+    """Single-process broker: every subscriber lives in this process."""
+
+    name = "memory"
+
+    def start(self, on_remote_event: EventHandler) -> None:
+        pass
+
+    def publish(self, payload: Dict[str, Any]) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class PostgresStreamBroker(StreamBroker):
+    """
+    Fan-out through PostgreSQL LISTEN/NOTIFY.
+
+    Every worker LISTENs on the channel, so every worker keeps the history of
+    every execution and a subscriber may connect to any of them.
+    """
+
+    name = "postgres"
+
+    POLL_INTERVAL_SECONDS = 5.0
+    SEND_BATCH_SIZE = 100
+
+    def __init__(
+        self,
+        connection_string: str,
+        channel: str = STREAM_NOTIFY_CHANNEL,
+        outbox_size: int = 10000,
+        db: Optional[Any] = None
+    ):
+        self.connection_string = connection_string
+        self.channel = channel
+        self.origin = uuid4().hex
+        self._db = db
+        self._outbox: "queue.Queue[str]" = queue.Queue(maxsize=outbox_size)
+        self._on_remote_event: Optional[EventHandler] = None
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self.stats = {"published": 0, "received": 0, "dropped": 0, "truncated": 0, "send_failures": 0}
+
+    @property
+    def db(self) -> Any:
+        if self._db is None:
+            from app.core.database import DatabaseConfig
+            self._db = DatabaseConfig()
+        return self._db
+
+    def start(self, on_remote_event: EventHandler) -> None:
+        if self._threads:
+            return
+        self._on_remote_event = on_remote_event
+        self._stop.clear()
+        for target, name in ((self._send_loop, "stream-broker-sender"), (self._listen_loop, "stream-broker-listener")):
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def publish(self, payload: Dict[str, Any]) -> None:
+        try:
+            self._outbox.put_nowait(self.encode(payload))
+        except queue.Full:
+            self.stats["dropped"] += 1
+            logger.warning(f"Stream broker outbox full, event not sent to other workers: {payload.get('event')}")
+
+    def close(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def encode(self, payload: Dict[str, Any]) -> str:
+        """Wrap an event for NOTIFY, shrinking its data to fit the payload limit."""
+        message = json.dumps({"origin": self.origin, "event": payload}, default=str)
+        if len(message.encode("utf-8")) <= MAX_NOTIFY_PAYLOAD_BYTES:
+            return message
+
+        self.stats["truncated"] += 1
+        data = payload.get("data") or {}
+        small = {
+            key: value for key, value in data.items()
+            if isinstance(value, (int, float, bool, type(None))) or (isinstance(value, str) and len(value) <= 200)
+        }
+        message = json.dumps({"origin": self.origin, "event": {**payload, "data": {**small, "truncated": True}}}, default=str)
+        if len(message.encode("utf-8")) <= MAX_NOTIFY_PAYLOAD_BYTES:
+            return message
+        return json.dumps({"origin": self.origin, "event": {**payload, "data": {"truncated": True}}}, default=str)
+
+    def _send_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                batch = [self._outbox.get(timeout=self.POLL_INTERVAL_SECONDS)]
+            except queue.Empty:
+                continue
+            while len(batch) < self.SEND_BATCH_SIZE:
+                try:
+                    batch.append(self._outbox.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self.db.execute_query(NOTIFY_BATCH_SQL, (self.channel, batch), fetch=False)
+                self.stats["published"] += len(batch)
+            except Exception as e:
+                self.stats["send_failures"] += 1
+                logger.warning(f"Failed to publish {len(batch)} stream events to other workers: {e}")
+
+    def _listen_loop(self) -> None:
+        from app.core.database import _build_connection_params, _connect_with_retry
+
+        while not self._stop.is_set():
+            conn = None
+            try:
+                conn = _connect_with_retry(_build_connection_params(self.connection_string))
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    cursor.execute(f"LISTEN {self.channel};")
+
+                while not self._stop.is_set():
+                    readable, _, _ = select.select([conn], [], [], self.POLL_INTERVAL_SECONDS)
+                    if not readable:
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        self.handle_notification(conn.notifies.pop(0).payload)
+            except Exception as e:
+                logger.warning(f"Stream broker listener error, reconnecting: {e}")
+                self._stop.wait(self.POLL_INTERVAL_SECONDS)
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+    def handle_notification(self, raw: str) -> None:
+        """Deliver one NOTIFY payload published by another worker."""
+        try:
+            message = json.loads(raw)
+            if message["origin"] == self.origin:
+                return
+            event = message["event"]
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed stream notification")
+            return
+
+        self.stats["received"] += 1
+        try:
+            self._on_remote_event(event)
+        except Exception as e:
+            logger.error(f"Failed to deliver stream event from another worker: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend": self.name, "outbox": self._outbox.qsize(), **self.stats}
+
+
+def create_stream_broker() -> StreamBroker:
+    """Build the broker selected by STREAM_BROKER (memory | postgres)."""
+    backend = settings.STREAM_BROKER.lower()
+    if backend == "postgres":
+        if not settings.DATABASE_URL:
+            logger.warning("STREAM_BROKER=postgres requires DATABASE_URL; using the in-process broker")
+            return InProcessStreamBroker()
+        return PostgresStreamBroker(settings.DATABASE_URL)
+    if backend != "memory":
+        logger.warning(f"Unknown STREAM_BROKER '{settings.STREAM_BROKER}'; using the in-process broker")
+    return InProcessStreamBroker()
@@ -7,16 +7,28 @@ Provides real-time execution updates via:
 - In-memory event streams
 - Progress tracking
 - Error streaming
+
+Events carry a per-execution sequence number so clients can resume a stream
+(SSE Last-Event-ID). History is kept in fixed-size ring buffers, and a
+pluggable StreamBroker (see stream_broker.py) fans events out to the other
+worker processes. Every worker keeps the history of every execution it sees
+(local or remote) until cleanup_after_seconds after its terminal event;
+run_cleanup() does this periodically.
 """
 
 import asyncio
 import json
 import logging
-from typing import Dict, Any, List, Optional, Callable, Set, AsyncIterator
-from dataclasses import dataclass, asdict
+import threading
+import time
+from typing import Deque, Dict, Any, List, Optional, Callable, Set, AsyncIterator
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from collections import defaultdict
+from collections import defaultdict, deque
+
+from app.core.config import settings
+from app.execution.stream_broker import InProcessStreamBroker, StreamBroker, create_stream_broker
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +47,17 @@ class StreamEventType(str, Enum):
     ERROR_MESSAGE = "error_message"
 
 
+# Events after which an execution stream produces nothing more
+TERMINAL_EVENT_TYPES = frozenset({StreamEventType.EXECUTION_COMPLETED, StreamEventType.EXECUTION_FAILED})
+
+_TERMINAL_STATUS = {
+    StreamEventType.EXECUTION_COMPLETED: "completed",
+    StreamEventType.EXECUTION_FAILED: "failed",
+}
+
+_FINISHED_STATUSES = ("completed", "failed", "closed")
+
+
 @dataclass
 class StreamEvent:
     """Single stream event"""
@@ -43,6 +66,7 @@ class StreamEvent:
     execution_id: str
     timestamp: str  # ISO format
     data: Dict[str, Any]
+    sequence: Optional[int] = None  # assigned on emit, 1-based per execution
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -50,13 +74,43 @@ class StreamEvent:
             "event": self.event_type.value,
             "execution_id": self.execution_id,
             "timestamp": self.timestamp,
-            "data": self.data
+            "data": self.data,
+            "sequence": self.sequence
         }
 
     def to_json(self) -> str:
         """Convert to JSON string"""
         return json.dumps(self.to_dict())
 
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "StreamEvent":
+        """Rebuild an event from to_dict() output (e.g. received from another worker)"""
+        return cls(
+            event_type=StreamEventType(payload["event"]),
+            execution_id=payload["execution_id"],
+            timestamp=payload["timestamp"],
+            data=payload.get("data") or {},
+            sequence=payload.get("sequence")
+        )
+
+
+class _StreamSubscription:
+    """Queue feeding one stream_events() iterator; only touched on its event loop."""
+
+    __slots__ = ("loop", "queue")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.queue: "asyncio.Queue[Optional[StreamEvent]]" = asyncio.Queue()
+
+    def __call__(self, event: Optional[StreamEvent]):
+        self.queue.put_nowait(event)
+
+
+def _push(subscriptions: List[_StreamSubscription], event: Optional[StreamEvent]):
+    for subscription in subscriptions:
+        subscription(event)
+
 
 class StreamingManager:
     """
@@ -64,31 +118,53 @@ class StreamingManager:
 
     Features:
     - Multi-subscriber support (many clients per execution)
-    - Event history buffering
+    - Event history buffering (ring buffer per execution)
+    - Resumable streams via per-execution sequence numbers
+    - Cross-worker fan-out through a StreamBroker
     - Automatic cleanup of old streams
     - WebSocket and SSE compatible
     - Thread-safe event broadcasting
     """
 
-    def __init__(self, max_history: int = 1000, cleanup_after_seconds: int = 3600):
+    def __init__(
+        self,
+        max_history: int = 1000,
+        cleanup_after_seconds: int = 3600,
+        broker: Optional[StreamBroker] = None
+    ):
         """
         Initialize streaming manager
 
         Args:
             max_history: Maximum events to keep in history per execution
             cleanup_after_seconds: Auto-cleanup streams after this duration
+            broker: Cross-worker fan-out backend (default: in-process only)
         """
         self.max_history = max_history
         self.cleanup_after_seconds = cleanup_after_seconds
+        self.broker = broker or InProcessStreamBroker()
+
+        # Guards history, sequences and subscriber sets; emit() is called
+        # from worker threads and the broker's listener thread
+        self._lock = threading.RLock()
 
         # Subscribers: execution_id -> set of callbacks
         self.subscribers: Dict[str, Set[Callable]] = defaultdict(set)
 
-        # Event history: execution_id -> list of events
-        self.event_history: Dict[str, List[StreamEvent]] = defaultdict(list)
+        # Event loop owning each async subscriber, so emit() can be called
+        # from worker threads (e.g. WorkflowRunner executions)
+        self._subscriber_loops: Dict[Callable, asyncio.AbstractEventLoop] = {}
+
+        # Event history: execution_id -> ring buffer of the latest events
+        self.event_history: Dict[str, Deque[StreamEvent]] = defaultdict(lambda: deque(maxlen=self.max_history))
+
+        # Last sequence number per execution
+        self._sequences: Dict[str, int] = {}
 
-        # Event queues for async iteration: execution_id -> asyncio.Queue
-        self.event_queues: Dict[str, asyncio.Queue] = {}
+        # Monotonic time of the last event per execution (local and remote),
+        # and the executions that have ended: cleanup drops their history
+        self._last_event_at: Dict[str, float] = {}
+        self._finished: Set[str] = set()
 
         # Stream metadata
         self.stream_metadata: Dict[str, Dict[str, Any]] = {}
@@ -98,9 +174,19 @@ class StreamingManager:
             "total_streams": 0,
             "active_streams": 0,
             "total_events": 0,
+            "remote_events": 0,
             "total_subscribers": 0,
+            "streams_cleaned_up": 0,
         }
 
+    def start(self):
+        """Start receiving events emitted by other worker processes"""
+        self.broker.start(self._receive_remote)
+
+    def close(self):
+        """Stop the broker"""
+        self.broker.close()
+
     async def create_stream(self, execution_id: str, metadata: Optional[Dict[str, Any]] = None):
         """
         Create a new event stream for an execution
@@ -119,7 +205,6 @@ class StreamingManager:
             "status": "active"
         }
 
-        self.event_queues[execution_id] = asyncio.Queue()
         self.stats["total_streams"] += 1
         self.stats["active_streams"] += 1
 
@@ -127,11 +212,12 @@ class StreamingManager:
 
     def emit(self, execution_id: str, event: StreamEvent):
         """
-        Synchronous emit method for backward compatibility
-        
+        Emit an event to local subscribers and other workers (thread-safe)
+
         Args:
             execution_id: Execution identifier
-            event: Event to broadcast (with 'type' field)
+            event: Event to broadcast (with 'type' field); its sequence
+                   number is assigned here
         """
         # Convert 'type' field to 'event_type' if needed
         if hasattr(event, 'type') and not hasattr(event, 'event_type'):
@@ -142,70 +228,102 @@ class StreamingManager:
                 timestamp=datetime.utcnow().isoformat(),
                 data=event.data if hasattr(event, 'data') else {}
             )
-        
-        # Add to history synchronously
-        history = self.event_history[execution_id]
-        history.append(event)
-        
-        # Trim history if too large
-        if len(history) > self.max_history:
-            self.event_history[execution_id] = history[-self.max_history:]
-        
-        self.stats["total_events"] += 1
-        
-        # Add to queue for async iteration (non-blocking)
-        if execution_id in self.event_queues:
-            try:
-                self.event_queues[execution_id].put_nowait(event)
-            except asyncio.QueueFull:
-                logger.warning(f"Event queue full for {execution_id}")
-        
-        # Broadcast to subscribers (synchronous only)
-        subscribers = self.subscribers.get(execution_id, set())
-        for callback in subscribers:
-            try:
-                if not asyncio.iscoroutinefunction(callback):
-                    callback(event)
-                # Skip async callbacks in sync emit
-            except Exception as e:
-                logger.error(f"Subscriber callback failed: {e}")
-        
-        logger.debug(f"📤 Emitted {event.event_type} to {len(subscribers)} subscribers")
+
+        with self._lock:
+            event.sequence = self._sequences.get(execution_id, 0) + 1
+            self._sequences[execution_id] = event.sequence
+            delivered = self._deliver(execution_id, event)
+            # Published under the lock so other workers see sequence order
+            self.broker.publish(event.to_dict())
+
+        logger.debug(f"📤 Emitted {event.event_type} to {delivered} subscribers")
 
     async def broadcast_event(self, execution_id: str, event: StreamEvent):
         """
         Broadcast event to all subscribers
 
+        Async subscriber callbacks are scheduled on their event loop rather
+        than awaited here.
+
         Args:
             execution_id: Execution identifier
             event: Event to broadcast
         """
-        # Add to history
-        history = self.event_history[execution_id]
-        history.append(event)
+        self.emit(execution_id, event)
 
-        # Trim history if too large
-        if len(history) > self.max_history:
-            self.event_history[execution_id] = history[-self.max_history:]
+    def _receive_remote(self, payload: Dict[str, Any]):
+        """Deliver an event emitted by another worker process"""
+        try:
+            event = StreamEvent.from_dict(payload)
+        except (KeyError, ValueError) as e:
+            logger.warning(f"Ignoring malformed remote stream event: {e}")
+            return
 
+        execution_id = event.execution_id
+        with self._lock:
+            if event.sequence is not None:
+                if event.sequence <= self._sequences.get(execution_id, 0):
+                    return  # already delivered
+                self._sequences[execution_id] = event.sequence
+            self.stats["remote_events"] += 1
+            self._deliver(execution_id, event)
+
+    def _deliver(self, execution_id: str, event: StreamEvent) -> int:
+        """Record an event and hand it to local subscribers (caller holds the lock)"""
+        self.event_history[execution_id].append(event)
         self.stats["total_events"] += 1
+        self._last_event_at[execution_id] = time.monotonic()
 
-        # Add to queue for async iteration
-        if execution_id in self.event_queues:
-            await self.event_queues[execution_id].put(event)
+        status = _TERMINAL_STATUS.get(event.event_type)
+        if status:
+            self._finished.add(execution_id)
+            if execution_id in self.stream_metadata:
+                self.stream_metadata[execution_id]["status"] = status
 
-        # Broadcast to subscribers
-        subscribers = self.subscribers.get(execution_id, set())
+        subscribers = self.subscribers.get(execution_id)
+        if not subscribers:
+            return 0
+
+        # Stream iterators are fed per event loop: one thread-safe wakeup
+        # per loop instead of one per subscriber
+        streams: Dict[asyncio.AbstractEventLoop, List[_StreamSubscription]] = {}
         for callback in subscribers:
+            if isinstance(callback, _StreamSubscription):
+                streams.setdefault(callback.loop, []).append(callback)
+                continue
+            # Async callbacks are scheduled on the event loop they
+            # subscribed from (thread-safe)
             try:
                 if asyncio.iscoroutinefunction(callback):
-                    await callback(event)
+                    self._schedule_async_callback(callback, event)
                 else:
                     callback(event)
             except Exception as e:
                 logger.error(f"Subscriber callback failed: {e}")
 
-        logger.debug(f"📤 Broadcasted {event.event_type} to {len(subscribers)} subscribers")
+        for loop, subscriptions in streams.items():
+            self._push_to_loop(loop, subscriptions, event)
+
+        return len(subscribers)
+
+    @staticmethod
+    def _push_to_loop(
+        loop: asyncio.AbstractEventLoop,
+        subscriptions: List[_StreamSubscription],
+        event: Optional[StreamEvent]
+    ):
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is loop:
+            _push(subscriptions, event)
+            return
+        try:
+            loop.call_soon_threadsafe(_push, subscriptions, event)
+        except RuntimeError:
+            logger.debug("Skipping stream subscribers of a closed event loop")
 
     async def broadcast_execution_started(
         self,
@@ -243,10 +361,6 @@ class StreamingManager:
         )
         await self.broadcast_event(execution_id, event)
 
-        # Mark stream as completed
-        if execution_id in self.stream_metadata:
-            self.stream_metadata[execution_id]["status"] = "completed"
-
     async def broadcast_execution_failed(
         self,
         execution_id: str,
@@ -265,10 +379,6 @@ class StreamingManager:
         )
         await self.broadcast_event(execution_id, event)
 
-        # Mark stream as failed
-        if execution_id in self.stream_metadata:
-            self.stream_metadata[execution_id]["status"] = "failed"
-
     async def broadcast_step_started(
         self,
         execution_id: str,
@@ -376,8 +486,14 @@ class StreamingManager:
             callback: Callback function (sync or async)
                      Signature: def callback(event: StreamEvent)
         """
-        self.subscribers[execution_id].add(callback)
-        self.stats["total_subscribers"] += 1
+        with self._lock:
+            self.subscribers[execution_id].add(callback)
+            if asyncio.iscoroutinefunction(callback):
+                try:
+                    self._subscriber_loops[callback] = asyncio.get_running_loop()
+                except RuntimeError:
+                    pass
+            self.stats["total_subscribers"] += 1
         logger.info(f"➕ Subscriber added to execution {execution_id}")
 
     def unsubscribe(self, execution_id: str, callback: Callable):
@@ -388,17 +504,50 @@ class StreamingManager:
             execution_id: Execution identifier
             callback: Callback function to remove
         """
-        if execution_id in self.subscribers:
-            self.subscribers[execution_id].discard(callback)
+        with self._lock:
+            subscribers = self.subscribers.get(execution_id)
+            if subscribers is None or callback not in subscribers:
+                return
+            subscribers.discard(callback)
+            if not subscribers:
+                del self.subscribers[execution_id]
+            self._subscriber_loops.pop(callback, None)
             self.stats["total_subscribers"] -= 1
-            logger.info(f"➖ Subscriber removed from execution {execution_id}")
+        logger.info(f"➖ Subscriber removed from execution {execution_id}")
+
+    def _schedule_async_callback(self, callback: Callable, event: StreamEvent):
+        """Run an async subscriber callback on its own event loop."""
+        loop = self._subscriber_loops.get(callback)
+        if loop is None or loop.is_closed():
+            logger.debug("Skipping async subscriber without a live event loop")
+            return
 
-    async def stream_events(self, execution_id: str) -> AsyncIterator[StreamEvent]:
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is loop:
+            loop.create_task(callback(event))
+        else:
+            asyncio.run_coroutine_threadsafe(callback(event), loop)
+
+    async def stream_events(
+        self,
+        execution_id: str,
+        last_event_id: Optional[int] = None
+    ) -> AsyncIterator[StreamEvent]:
         """
         Async iterator for execution events
 
+        Replays the buffered history after ``last_event_id``, then yields
+        new events as they are emitted. Ends after the execution's
+        completed/failed event or when the stream is closed.
+
         Args:
             execution_id: Execution identifier
+            last_event_id: Sequence number of the last event the client
+                           already has (e.g. the SSE Last-Event-ID header)
 
         Yields:
             StreamEvent objects as they occur
@@ -407,53 +556,61 @@ class StreamingManager:
             async for event in manager.stream_events(execution_id):
                 print(f"Event: {event.event_type}")
         """
-        # Send event history first
-        for event in self.event_history.get(execution_id, []):
-            yield event
-
-        # Then stream new events
-        if execution_id not in self.event_queues:
-            logger.warning(f"No event queue for execution {execution_id}")
-            return
-
-        queue = self.event_queues[execution_id]
+        subscription = _StreamSubscription(asyncio.get_running_loop())
+        last_sequence = last_event_id or 0
+
+        # History snapshot and subscription taken together: no event is
+        # missed or replayed twice between the two
+        with self._lock:
+            backlog = [
+                event for event in self.event_history.get(execution_id, ())
+                if (event.sequence or 0) > last_sequence
+            ]
+            self.subscribers[execution_id].add(subscription)
+            self.stats["total_subscribers"] += 1
+            finished = self.stream_metadata.get(execution_id, {}).get("status") in _FINISHED_STATUSES
 
         try:
+            for event in backlog:
+                last_sequence = event.sequence or last_sequence
+                yield event
+                if event.event_type in TERMINAL_EVENT_TYPES:
+                    return
+            if finished:
+                return
+
             while True:
-                # Get event from queue (with timeout to allow checking stream status)
-                try:
-                    event = await asyncio.wait_for(queue.get(), timeout=1.0)
-                    yield event
-
-                    # Check if execution is complete
-                    metadata = self.stream_metadata.get(execution_id, {})
-                    if metadata.get("status") in ["completed", "failed"]:
-                        # Drain remaining events then stop
-                        while not queue.empty():
-                            yield queue.get_nowait()
-                        break
-
-                except asyncio.TimeoutError:
-                    # Check if stream still active
-                    metadata = self.stream_metadata.get(execution_id, {})
-                    if metadata.get("status") in ["completed", "failed"]:
-                        break
-                    continue
+                event = await subscription.queue.get()
+                if event is None:  # stream closed
+                    return
+                if event.sequence is not None:
+                    if event.sequence <= last_sequence:
+                        continue
+                    last_sequence = event.sequence
+                yield event
+                if event.event_type in TERMINAL_EVENT_TYPES:
+                    return
 
         finally:
+            self.unsubscribe(execution_id, subscription)
             logger.info(f"Stream ended for execution {execution_id}")
 
-    def get_event_history(self, execution_id: str) -> List[StreamEvent]:
+    def get_event_history(self, execution_id: str, after_sequence: Optional[int] = None) -> List[StreamEvent]:
         """
         Get event history for an execution
 
         Args:
             execution_id: Execution identifier
+            after_sequence: Only return events with a higher sequence number
 
         Returns:
             List of historical events
         """
-        return self.event_history.get(execution_id, []).copy()
+        with self._lock:
+            history = list(self.event_history.get(execution_id, ()))
+        if after_sequence is not None:
+            history = [event for event in history if (event.sequence or 0) > after_sequence]
+        return history
 
     async def close_stream(self, execution_id: str):
         """
@@ -462,71 +619,120 @@ class StreamingManager:
         Args:
             execution_id: Execution identifier
         """
-        # Remove subscribers
-        if execution_id in self.subscribers:
-            del self.subscribers[execution_id]
-
-        # Clear event queue
-        if execution_id in self.event_queues:
-            del self.event_queues[execution_id]
-
-        # Keep metadata and history for a while (for replay)
-        if execution_id in self.stream_metadata:
-            self.stream_metadata[execution_id]["status"] = "closed"
-            self.stream_metadata[execution_id]["closed_at"] = datetime.utcnow().isoformat()
+        with self._lock:
+            # Remove subscribers, ending any stream_events() iterators
+            subscribers = self.subscribers.pop(execution_id, set())
+            streams: Dict[asyncio.AbstractEventLoop, List[_StreamSubscription]] = {}
+            for callback in subscribers:
+                self._subscriber_loops.pop(callback, None)
+                if isinstance(callback, _StreamSubscription):
+                    streams.setdefault(callback.loop, []).append(callback)
+            self.stats["total_subscribers"] -= len(subscribers)
+
+            # Keep metadata and history for a while (for replay)
+            self._finished.add(execution_id)
+            self._last_event_at[execution_id] = time.monotonic()
+            if execution_id in self.stream_metadata:
+                self.stream_metadata[execution_id]["status"] = "closed"
+                self.stream_metadata[execution_id]["closed_at"] = datetime.utcnow().isoformat()
+
+        for loop, subscriptions in streams.items():
+            self._push_to_loop(loop, subscriptions, None)
 
         self.stats["active_streams"] -= 1
 
         logger.info(f"🔒 Closed stream for execution {execution_id}")
 
-    async def cleanup_old_streams(self):
-        """Cleanup old completed/failed streams"""
-        now = datetime.utcnow()
-        to_remove = []
-
-        for execution_id, metadata in self.stream_metadata.items():
-            if metadata.get("status") in ["closed", "completed", "failed"]:
-                created_at = datetime.fromisoformat(metadata["created_at"])
-                age_seconds = (now - created_at).total_seconds()
-
-                if age_seconds > self.cleanup_after_seconds:
-                    to_remove.append(execution_id)
+    async def cleanup_old_streams(self) -> int:
+        """
+        Cleanup streams of executions that ended cleanup_after_seconds ago
 
-        for execution_id in to_remove:
-            # Remove from all collections
-            self.event_history.pop(execution_id, None)
-            self.stream_metadata.pop(execution_id, None)
-            self.subscribers.pop(execution_id, None)
-            self.event_queues.pop(execution_id, None)
+        Covers executions run by other workers (no stream metadata here) as
+        well as local ones.
 
-            logger.info(f"🗑️  Cleaned up old stream {execution_id}")
+        Returns:
+            Number of streams removed
+        """
+        cutoff = time.monotonic() - self.cleanup_after_seconds
+
+        with self._lock:
+            to_remove = [
+                execution_id for execution_id in self._finished
+                if self._last_event_at.get(execution_id, 0.0) <= cutoff
+            ]
+            for execution_id in to_remove:
+                # Remove from all collections
+                self.event_history.pop(execution_id, None)
+                self.stream_metadata.pop(execution_id, None)
+                self._sequences.pop(execution_id, None)
+                self._last_event_at.pop(execution_id, None)
+                self._finished.discard(execution_id)
+                for callback in self.subscribers.pop(execution_id, set()):
+                    self._subscriber_loops.pop(callback, None)
+                    self.stats["total_subscribers"] -= 1
+            self.stats["streams_cleaned_up"] += len(to_remove)
+
+        if to_remove:
+            logger.info(f"🗑️  Cleaned up {len(to_remove)} old streams")
+        return len(to_remove)
+
+    async def run_cleanup(self, interval_seconds: float):
+        """Run cleanup_old_streams() every interval_seconds (until cancelled)"""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.cleanup_old_streams()
+            except Exception as e:
+                logger.error(f"Stream cleanup failed: {e}")
 
-    def get_stats(self) -> Dict[str, int]:
+    def get_stats(self) -> Dict[str, Any]:
         """
         Get streaming statistics
 
         Returns:
             Dictionary of streaming stats
         """
-        return {
-            **self.stats,
-            "event_history_size": sum(len(h) for h in self.event_history.values()),
-            "active_subscribers": sum(len(s) for s in self.subscribers.values()),
-        }
+        with self._lock:
+            return {
+                **self.stats,
+                "event_history_size": sum(len(h) for h in self.event_history.values()),
+                "tracked_executions": len(self._sequences),
+                "active_subscribers": sum(len(s) for s in self.subscribers.values()),
+                "broker": self.broker.get_stats(),
+            }
 
 
 # Global streaming manager instance
 _global_streaming_manager: Optional[StreamingManager] = None
+_global_lock = threading.Lock()
 
 
 def get_streaming_manager() -> StreamingManager:
     """
     Get global streaming manager instance
 
+    The broker is chosen by STREAM_BROKER and started on first use.
+
     Returns:
         StreamingManager singleton
     """
     global _global_streaming_manager
-    if _global_streaming_manager is None:
-        _global_streaming_manager = StreamingManager()
+    with _global_lock:
+        if _global_streaming_manager is None:
+            manager = StreamingManager(
+                max_history=settings.STREAM_HISTORY_SIZE,
+                cleanup_after_seconds=settings.STREAM_CLEANUP_AFTER_SECONDS,
+                broker=create_stream_broker()
+            )
+            manager.start()
+            _global_streaming_manager = manager
     return _global_streaming_manager
+
+
+def shutdown_streaming_manager():
+    """Stop the global streaming manager's broker (application shutdown)"""
+    global _global_streaming_manager
+    with _global_lock:
+        manager, _global_streaming_manager = _global_streaming_manager, None
+    if manager is not None:
+        manager.close()
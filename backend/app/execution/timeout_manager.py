@@ -7,10 +7,14 @@ Provides timeout enforcement with:
 - Fallback value support
 - Timeout event logging
 - Context cleanup
+- Deadlines shared by a step and its workflow, with cooperative cancellation
 """
 
 import asyncio
+import contextvars
 import logging
+import threading
+import time
 from typing import Callable, Any, Optional, Dict
 from dataclasses import dataclass
 from datetime import datetime
@@ -320,3 +324,107 @@ def timeout(seconds: float, fallback: Optional[Any] = None):
 
         return wrapper
     return decorator
+
+
+# ============================================================================
+# DEADLINES (cooperative cancellation)
+# ============================================================================
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    """Raised when work continues past its deadline (classified as a timeout)"""
+
+
+class Deadline:
+    """
+    Point in time by which work must finish
+
+    asyncio.wait_for stops waiting for a step at its deadline, but an engine
+    running on a worker thread cannot be interrupted. Engines and clients
+    cooperate instead: while a step runs, its deadline is the current
+    deadline of the thread (see run_with_deadline), so long calls can bound
+    their own timeouts with remaining_seconds() and check_deadline() between
+    units of work. cancel() makes check_deadline() fail immediately.
+
+    Args:
+        expires_at: time.monotonic() value at which the deadline passes
+                    (None = no time limit, cancellation only)
+        parent: Enclosing deadline (e.g. the workflow's); expires with it
+    """
+
+    def __init__(self, expires_at: Optional[float] = None, parent: Optional["Deadline"] = None):
+        if parent is not None and parent.expires_at is not None:
+            expires_at = parent.expires_at if expires_at is None else min(expires_at, parent.expires_at)
+        self.expires_at = expires_at
+        self.parent = parent
+        self._cancelled = threading.Event()
+
+    @classmethod
+    def after(cls, seconds: Optional[float], parent: Optional["Deadline"] = None) -> "Deadline":
+        """Deadline `seconds` from now (None or <= 0 = no own time limit)"""
+        expires_at = time.monotonic() + seconds if seconds and seconds > 0 else None
+        return cls(expires_at, parent)
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left (never negative), or None without a time limit"""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set() or (self.parent is not None and self.parent.cancelled)
+
+    @property
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return self.cancelled or (remaining is not None and remaining <= 0)
+
+    def cancel(self) -> None:
+        """Ask work running under this deadline to stop at its next check"""
+        self._cancelled.set()
+
+    def check(self) -> None:
+        """Raise DeadlineExceeded if the deadline has passed or was cancelled"""
+        if self.cancelled:
+            raise DeadlineExceeded("Deadline exceeded: execution cancelled")
+        if self.expired:
+            raise DeadlineExceeded("Deadline exceeded")
+
+
+_current_deadline: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar(
+    "current_deadline", default=None
+)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Deadline of the step running in this thread/task, if any"""
+    return _current_deadline.get()
+
+
+def remaining_seconds(default: float) -> float:
+    """
+    Timeout to use for a blocking call: `default`, capped by the current deadline
+
+    Example:
+        with httpx.Client(timeout=remaining_seconds(120.0)) as client:
+            ...
+    """
+    deadline = _current_deadline.get()
+    remaining = deadline.remaining() if deadline is not None else None
+    return default if remaining is None else min(default, remaining)
+
+
+def check_deadline() -> None:
+    """Raise DeadlineExceeded if the current deadline has passed (no-op without one)"""
+    deadline = _current_deadline.get()
+    if deadline is not None:
+        deadline.check()
+
+
+def run_with_deadline(deadline: Optional[Deadline], func: Callable, *args, **kwargs) -> Any:
+    """Call func with `deadline` as the current deadline (use on the worker thread)"""
+    token = _current_deadline.set(deadline)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _current_deadline.reset(token)
@@ -8,10 +8,19 @@ Provides full JSON Schema validation for:
 - Range constraints
 - Pattern matching
 - Custom validation rules
+
+Validators are compiled once and cached (see ValidatorCache): keyed by
+(schema id, version, kind) for deliverable schemas, or by a hash of the
+schema content otherwise. Meta-schema checking runs once per compile, and
+SchemaService checks schemas when they are created or updated.
 """
 
+import hashlib
+import json
 import logging
-from typing import Dict, Any, List, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Hashable, List, Optional, Union
 from dataclasses import dataclass
 from enum import Enum
 
@@ -74,6 +83,102 @@ class ValidationResult:
         return [i.message for i in self.warnings]
 
 
+class ValidatorCache:
+    """
+    LRU cache of compiled Draft 7 validators.
+
+    A schema that fails meta-schema validation is cached as its SchemaError,
+    so an invalid schema is not re-checked on every call either.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Union[Draft7Validator, SchemaError]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "compiles": 0, "invalid_schemas": 0, "evictions": 0}
+
+    @staticmethod
+    def content_key(schema: Dict[str, Any]) -> str:
+        """Cache key for a schema without an id/version: hash of its canonical JSON."""
+        payload = json.dumps(schema, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, schema: Dict[str, Any], key: Optional[Hashable] = None) -> Draft7Validator:
+        """
+        Get the compiled validator for a schema.
+
+        Args:
+            schema: JSON Schema
+            key: Stable identity of this schema content, e.g.
+                 (schema_id, version, "input"); defaults to a content hash
+
+        Raises:
+            SchemaError: If the schema is not a valid Draft 7 schema
+        """
+        if key is None:
+            key = self.content_key(schema)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+
+        if entry is None:
+            try:
+                Draft7Validator.check_schema(schema)
+                entry = Draft7Validator(schema)
+            except SchemaError as e:
+                entry = e
+            with self._lock:
+                self.stats["compiles"] += 1
+                if isinstance(entry, SchemaError):
+                    self.stats["invalid_schemas"] += 1
+                self._entries[key] = entry
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.stats["evictions"] += 1
+
+        if isinstance(entry, SchemaError):
+            raise entry
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self.stats, "entries": len(self._entries), "max_entries": self.max_entries}
+
+
+_global_validator_cache: Optional[ValidatorCache] = None
+_global_lock = threading.Lock()
+
+
+def get_validator_cache() -> ValidatorCache:
+    """Get the process-wide compiled validator cache."""
+    global _global_validator_cache
+    with _global_lock:
+        if _global_validator_cache is None:
+            _global_validator_cache = ValidatorCache()
+    return _global_validator_cache
+
+
+def check_json_schema(schema: Dict[str, Any], name: str = "schema") -> None:
+    """
+    Check a JSON Schema against the Draft 7 meta-schema.
+
+    Raises:
+        ValueError: If the schema is invalid
+    """
+    try:
+        Draft7Validator.check_schema(schema)
+    except SchemaError as e:
+        location = ".".join(str(p) for p in e.path)
+        raise ValueError(f"Invalid {name}{f' at {location}' if location else ''}: {e.message}") from e
+
+
 class ValidationEngine:
     """
     JSON Schema validation engine with enhanced error reporting
@@ -89,15 +194,21 @@ class ValidationEngine:
     - Detailed error formatting
     """
 
-    def __init__(self):
-        """Initialize validation engine"""
-        self.validation_cache: Dict[str, Draft7Validator] = {}
+    def __init__(self, validation_cache: Optional[ValidatorCache] = None):
+        """
+        Initialize validation engine
+
+        Args:
+            validation_cache: Compiled validator cache (default: process-wide)
+        """
+        self.validation_cache = validation_cache or get_validator_cache()
 
     def validate_input(
         self,
         data: Dict[str, Any],
         schema: Dict[str, Any],
-        strict: bool = True
+        strict: bool = True,
+        schema_key: Optional[Hashable] = None
     ) -> ValidationResult:
         """
         Validate input data against JSON Schema
@@ -106,6 +217,7 @@ class ValidationEngine:
             data: Data to validate
             schema: JSON Schema definition
             strict: If True, treat all issues as errors. If False, some may be warnings.
+            schema_key: Stable identity of the schema, e.g. (schema_id, version, "input")
 
         Returns:
             ValidationResult with issues
@@ -127,14 +239,15 @@ class ValidationEngine:
                 }
             }
         """
-        logger.info("Validating input data against schema")
-        return self._validate(data, schema, "input", strict)
+        logger.debug("Validating input data against schema")
+        return self._validate(data, schema, "input", strict, schema_key)
 
     def validate_output(
         self,
         data: Dict[str, Any],
         schema: Dict[str, Any],
-        strict: bool = False
+        strict: bool = False,
+        schema_key: Optional[Hashable] = None
     ) -> ValidationResult:
         """
         Validate output data against JSON Schema
@@ -143,19 +256,21 @@ class ValidationEngine:
             data: Data to validate
             schema: JSON Schema definition
             strict: If True, treat all issues as errors
+            schema_key: Stable identity of the schema, e.g. (schema_id, version, "output")
 
         Returns:
             ValidationResult with issues
         """
-        logger.info("Validating output data against schema")
-        return self._validate(data, schema, "output", strict)
+        logger.debug("Validating output data against schema")
+        return self._validate(data, schema, "output", strict, schema_key)
 
     def _validate(
         self,
         data: Dict[str, Any],
         schema: Dict[str, Any],
         context: str,
-        strict: bool
+        strict: bool,
+        schema_key: Optional[Hashable] = None
     ) -> ValidationResult:
         """
         Core validation logic
@@ -165,6 +280,7 @@ class ValidationEngine:
             schema: JSON Schema
             context: Context name for error messages
             strict: Strict mode flag
+            schema_key: Validator cache key (default: schema content hash)
 
         Returns:
             ValidationResult
@@ -172,9 +288,9 @@ class ValidationEngine:
         issues: List[ValidationIssue] = []
 
         try:
-            # Validate schema itself first
+            # Compiled (and meta-schema checked) once per schema
             try:
-                Draft7Validator.check_schema(schema)
+                validator = self.validation_cache.get(schema, schema_key)
             except SchemaError as e:
                 logger.error(f"Invalid schema: {e}")
                 issues.append(ValidationIssue(
@@ -184,9 +300,6 @@ class ValidationEngine:
                 ))
                 return ValidationResult(valid=False, issues=issues)
 
-            # Create validator
-            validator = Draft7Validator(schema)
-
             # Collect all validation errors
             errors = list(validator.iter_errors(data))
 
@@ -198,7 +311,7 @@ class ValidationEngine:
                 logger.warning(f"Validation found {len(issues)} issues")
                 return ValidationResult(valid=False, issues=issues)
 
-            logger.info("✅ Validation passed")
+            logger.debug("✅ Validation passed")
             return ValidationResult(valid=True, issues=[])
 
         except Exception as e:
@@ -20,6 +20,13 @@ from app.risk.calculators import (
     ExecutionRiskCalculator,
     AnomalyRiskCalculator
 )
+from app.risk.historical_stats import (
+    HistoricalStatsStore,
+    HistorySummary,
+    ParameterSummary,
+    get_historical_stats_store,
+    record_execution,
+)
 
 # Phase 3 Sprint 2 - Dynamic Risk Engine
 from app.risk.rule_parser import (
@@ -55,6 +62,11 @@ __all__ = [
     "ComplianceRiskCalculator",
     "ExecutionRiskCalculator",
     "AnomalyRiskCalculator",
+    "HistoricalStatsStore",
+    "HistorySummary",
+    "ParameterSummary",
+    "get_historical_stats_store",
+    "record_execution",
 
     # Phase 3 Sprint 2 - Rule Parser
     "RiskRuleParser",
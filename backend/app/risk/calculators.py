@@ -15,6 +15,8 @@ from typing import Dict, Any, List, Optional
 from abc import ABC, abstractmethod
 import logging
 
+from app.risk.historical_stats import HistorySummary, extract_parameters, summarize_history
+
 logger = logging.getLogger(__name__)
 
 
@@ -501,98 +503,58 @@ class AnomalyRiskCalculator(RiskCalculator):
     - Z-score > 2.5 = high anomaly
     - Z-score > 2.0 = moderate anomaly
 
-    Requires sufficient historical data (n >= 10).
+    Requires sufficient historical data (n >= 10). Reads running summaries
+    from context["historical_summary"] (see HistoricalStatsStore); a raw
+    context["historical_data"] list is summarized in one pass instead.
     """
 
+    # Parameters to check for anomalies
+    PARAMETERS = [
+        "footing_length_final",
+        "footing_width_final",
+        "footing_depth_final",
+        "material_quantities.steel_weight_total",
+        "material_quantities.concrete_volume_m3"
+    ]
+
+    MIN_SAMPLE_SIZE = 10
+
     def calculate(
         self,
         design_data: Dict[str, Any],
         context: Optional[Dict[str, Any]] = None
     ) -> float:
         """Calculate anomaly risk score."""
-        if not context or "historical_data" not in context:
-            return 0.0
-
-        historical_data = context.get("historical_data", [])
-        if not historical_data or len(historical_data) < 10:
+        summary = self._history(context)
+        if summary is None or summary.sample_size < self.MIN_SAMPLE_SIZE:
             # Not enough historical data for statistical analysis
             return 0.0
 
         risk = 0.0
-
-        # Parameters to check for anomalies
-        params_to_check = [
-            "footing_length_final",
-            "footing_width_final",
-            "footing_depth_final",
-            ("material_quantities", "steel_weight_total"),
-            ("material_quantities", "concrete_volume_m3")
-        ]
-
-        try:
-            import numpy as np
-        except ImportError:
-            logger.warning("numpy not available - skipping anomaly detection")
-            return 0.0
-
+        current_values = extract_parameters(design_data)
         anomalies_detected = []
 
-        for param in params_to_check:
-            # Handle nested parameters
-            if isinstance(param, tuple):
-                current_value = design_data.get(param[0], {}).get(param[1])
-                param_name = f"{param[0]}.{param[1]}"
-            else:
-                current_value = design_data.get(param)
-                param_name = param
-
-            if current_value is None:
-                continue
-
-            # Extract historical values
-            historical_values = []
-            for hist_design in historical_data:
-                if isinstance(param, tuple):
-                    val = hist_design.get(param[0], {}).get(param[1])
-                else:
-                    val = hist_design.get(param)
-                if val is not None:
-                    historical_values.append(val)
-
-            if not historical_values:
-                continue
-
-            # Calculate statistics
-            mean = np.mean(historical_values)
-            std = np.std(historical_values)
-
-            if std == 0:
+        for param_name in self.PARAMETERS:
+            current_value = current_values.get(param_name)
+            stats = summary.get(param_name)
+            if current_value is None or stats is None or stats.std == 0:
                 continue
 
             # Calculate z-score
-            z_score = abs((current_value - mean) / std)
+            z_score = abs((current_value - stats.mean) / stats.std)
 
-            if z_score > 2.5:
-                risk += 0.25
-                anomalies_detected.append({
-                    "parameter": param_name,
-                    "value": current_value,
-                    "z_score": round(z_score, 2),
-                    "historical_mean": round(mean, 2),
-                    "historical_std": round(std, 2)
-                })
-            elif z_score > 2.0:
-                risk += 0.1
+            if z_score > 2.0:
+                risk += 0.25 if z_score > 2.5 else 0.1
                 anomalies_detected.append({
                     "parameter": param_name,
                     "value": current_value,
                     "z_score": round(z_score, 2),
-                    "historical_mean": round(mean, 2),
-                    "historical_std": round(std, 2)
+                    "historical_mean": round(stats.mean, 2),
+                    "historical_std": round(stats.std, 2)
                 })
 
         # Store anomalies in context for reporting
-        if context:
+        if context is not None:
             context["anomalies_detected"] = anomalies_detected
 
         return self._clamp_score(risk)
@@ -603,13 +565,25 @@ class AnomalyRiskCalculator(RiskCalculator):
         context: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Get detailed anomaly risk factors."""
-        historical_data = context.get("historical_data", []) if context else []
+        summary = self._history(context)
+        sample_size = summary.sample_size if summary else 0
         anomalies_detected = context.get("anomalies_detected", []) if context else []
 
         factors = {
-            "historical_sample_size": len(historical_data),
+            "historical_sample_size": sample_size,
             "anomalies_detected_count": len(anomalies_detected),
             "anomalies": anomalies_detected,
-            "has_sufficient_data": len(historical_data) >= 10
+            "has_sufficient_data": sample_size >= self.MIN_SAMPLE_SIZE
         }
         return factors
+
+    def _history(self, context: Optional[Dict[str, Any]]) -> Optional[HistorySummary]:
+        """Historical summary from the context (summarizing raw history once)."""
+        if not context:
+            return None
+        if context.get("historical_summary") is None:
+            historical_data = context.get("historical_data")
+            if not historical_data:
+                return None
+            context["historical_summary"] = summarize_history(historical_data)
+        return context["historical_summary"]
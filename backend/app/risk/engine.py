@@ -18,6 +18,13 @@ from app.risk.calculators import (
     ExecutionRiskCalculator,
     AnomalyRiskCalculator
 )
+from app.risk.historical_stats import (
+    HistoricalStatsStore,
+    HistorySummary,
+    get_historical_stats_store,
+    summarize_history
+)
+from app.core.config import settings
 from app.schemas.approval.models import (
     RiskFactors,
     RiskAssessment,
@@ -61,8 +68,21 @@ class RiskAssessmentEngine:
         "critical": 1.0
     }
 
-    def __init__(self):
-        """Initialize risk assessment engine with all calculators."""
+    # Parameters reported in the historical baseline
+    BASELINE_PARAMETERS = [
+        "footing_length_final",
+        "footing_width_final",
+        "footing_depth_final"
+    ]
+
+    def __init__(self, stats_store: Optional[HistoricalStatsStore] = None):
+        """
+        Initialize risk assessment engine with all calculators.
+
+        Args:
+            stats_store: Running historical statistics (default: process-wide store)
+        """
+        self.stats_store = stats_store or get_historical_stats_store()
         self.technical_calculator = TechnicalRiskCalculator()
         self.safety_calculator = SafetyRiskCalculator()
         self.financial_calculator = FinancialRiskCalculator()
@@ -80,7 +100,8 @@ class RiskAssessmentEngine:
         design_data: Dict[str, Any],
         step_results: List[Dict[str, Any]],
         schema: Optional[Any] = None,
-        historical_data: Optional[List[Dict[str, Any]]] = None
+        historical_data: Optional[List[Dict[str, Any]]] = None,
+        deliverable_type: Optional[str] = None
     ) -> RiskAssessment:
         """
         Perform comprehensive risk assessment.
@@ -90,18 +111,25 @@ class RiskAssessmentEngine:
             design_data: Final design output data
             step_results: Results from all workflow steps
             schema: Deliverable schema (for compliance checks)
-            historical_data: Historical designs for anomaly detection
+            historical_data: Historical designs for anomaly detection (overrides
+                             the statistics store)
+            deliverable_type: Deliverable type whose running statistics are
+                              used when no historical_data is given
 
         Returns:
             RiskAssessment with full details
         """
         logger.info(f"Starting risk assessment for execution {execution_id}")
 
+        # Historical statistics, computed once and shared by the calculators
+        historical_summary = self._historical_summary(historical_data, deliverable_type)
+
         # Prepare context for calculators
         context = {
             "schema": schema,
             "step_results": step_results,
-            "historical_data": historical_data or []
+            "historical_data": historical_data or [],
+            "historical_summary": historical_summary
         }
 
         # Calculate individual risk factors
@@ -150,7 +178,7 @@ class RiskAssessmentEngine:
         # Calculate historical baseline stats
         historical_baseline = self._calculate_historical_baseline(
             design_data,
-            historical_data or []
+            historical_summary
         )
 
         # Calculate deviation score
@@ -283,41 +311,50 @@ class RiskAssessmentEngine:
 
         return issues
 
+    def _historical_summary(
+        self,
+        historical_data: Optional[List[Dict[str, Any]]],
+        deliverable_type: Optional[str]
+    ) -> Optional[HistorySummary]:
+        """Summarize explicit history, or read the running statistics of the deliverable type."""
+        parameters = set(self.BASELINE_PARAMETERS) | set(self.anomaly_calculator.PARAMETERS)
+        if historical_data:
+            return summarize_history(historical_data, parameters)
+        if deliverable_type and self.stats_store is not None:
+            window_days = settings.RISK_STATS_WINDOW_DAYS
+            return self.stats_store.snapshot(
+                deliverable_type,
+                parameters=parameters,
+                window_seconds=window_days * 86400 if window_days > 0 else None
+            )
+        return None
+
     def _calculate_historical_baseline(
         self,
         design_data: Dict[str, Any],
-        historical_data: List[Dict[str, Any]]
+        historical_summary: Optional[HistorySummary]
     ) -> Optional[Dict[str, Any]]:
         """Calculate statistical baseline from historical data."""
-        if not historical_data or len(historical_data) < 10:
+        if historical_summary is None or historical_summary.sample_size < 10:
             return None
 
-        try:
-            import numpy as np
-        except ImportError:
-            return None
-
-        # Calculate statistics for key parameters
+        # Statistics for key parameters
         baseline = {}
 
-        params = [
-            "footing_length_final",
-            "footing_width_final",
-            "footing_depth_final"
-        ]
-
-        for param in params:
-            values = [d.get(param) for d in historical_data if d.get(param) is not None]
-            if values:
+        for param in self.BASELINE_PARAMETERS:
+            stats = historical_summary.get(param)
+            if stats is not None:
                 baseline[param] = {
-                    "mean": round(np.mean(values), 3),
-                    "std": round(np.std(values), 3),
-                    "min": round(np.min(values), 3),
-                    "max": round(np.max(values), 3),
-                    "sample_size": len(values)
+                    "mean": round(stats.mean, 3),
+                    "std": round(stats.std, 3),
+                    "min": round(stats.min, 3),
+                    "max": round(stats.max, 3),
+                    "median": round(stats.median, 3),
+                    "p95": round(stats.p95, 3),
+                    "sample_size": stats.count
                 }
 
-        baseline["sample_size"] = len(historical_data)
+        baseline["sample_size"] = historical_summary.sample_size
         return baseline
 
     # ========================================================================
@@ -0,0 +1,566 @@
+"""
+CSA AIaaS Platform - Historical Statistics Store
+Performance: Incremental per-deliverable baselines for anomaly and baseline risk
+
+AnomalyRiskCalculator and RiskAssessmentEngine._calculate_historical_baseline
+used to receive the raw list of past designs and recompute mean/std over it
+on every assessment. This store keeps running summaries per
+(deliverable_type, parameter) instead, updated once when an execution is
+finalized, so an assessment reads O(1) summaries whatever the history size.
+
+Features:
+- Welford running mean/variance with min/max (merged with Chan's formula)
+- Mergeable quantile sketch (log-bucketed, 1% relative accuracy) for
+  median / p95
+- Time-bucketed series for sliding windows (e.g. last 90 days), plus
+  totals over the same retention period as the buckets
+- Lazy rebuild per deliverable type from csa.workflow_executions
+  (completed and approved executions), repeated once the loaded history is
+  older than refresh_seconds so executions finalized by other workers are
+  picked up
+- Tracks every numeric value in the design output up to one nesting level
+  ("footing_length_final", "material_quantities.steel_weight_total")
+"""
+
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# deliverable_type, output_data, completed_at
+HistoryRow = Tuple[str, Dict[str, Any], Optional[datetime]]
+HistoryLoader = Callable[[Optional[str], Optional[datetime]], Iterable[HistoryRow]]
+
+
+# ============================================================================
+# RUNNING STATISTICS
+# ============================================================================
+
+class QuantileSketch:
+    """
+    Log-bucketed quantile sketch (DDSketch-style).
+
+    Values are counted in buckets whose bounds grow geometrically, so any
+    quantile is estimated within ``relative_accuracy`` of the true value and
+    two sketches merge by adding bucket counts.
+    """
+
+    MIN_INDEXABLE = 1e-9
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self._zeros = 0
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        if value > self.MIN_INDEXABLE:
+            key = self._key(value)
+            self._positive[key] = self._positive.get(key, 0) + 1
+        elif value < -self.MIN_INDEXABLE:
+            key = self._key(-value)
+            self._negative[key] = self._negative.get(key, 0) + 1
+        else:
+            self._zeros += 1
+        self.count += 1
+
+    def merge(self, other: "QuantileSketch") -> None:
+        for key, count in other._positive.items():
+            self._positive[key] = self._positive.get(key, 0) + count
+        for key, count in other._negative.items():
+            self._negative[key] = self._negative.get(key, 0) + count
+        self._zeros += other._zeros
+        self.count += other.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimated q-quantile (0 <= q <= 1), or None if empty."""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self._zeros
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self._positive))
+
+    def _key(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+
+class RunningStats:
+    """Welford running mean/variance, min/max and a quantile sketch."""
+
+    __slots__ = ("count", "mean", "m2", "min", "max", "sketch")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sketch = QuantileSketch()
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.sketch.add(value)
+
+    def merge(self, other: "RunningStats") -> None:
+        if not other.count:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation (same as numpy.std)."""
+        return math.sqrt(max(self.m2, 0.0) / self.count) if self.count else 0.0
+
+    def summary(self) -> "ParameterSummary":
+        return ParameterSummary(
+            count=self.count,
+            mean=self.mean,
+            std=self.std,
+            min=self.min,
+            max=self.max,
+            median=self.sketch.quantile(0.5),
+            p95=self.sketch.quantile(0.95),
+        )
+
+
+@dataclass(frozen=True)
+class ParameterSummary:
+    """Point-in-time statistics of one design parameter."""
+
+    count: int
+    mean: float
+    std: float
+    min: float
+    max: float
+    median: Optional[float]
+    p95: Optional[float]
+
+
+@dataclass
+class HistorySummary:
+    """Statistics of past designs of one deliverable type."""
+
+    sample_size: int
+    parameters: Dict[str, ParameterSummary] = field(default_factory=dict)
+
+    def get(self, parameter: str) -> Optional[ParameterSummary]:
+        return self.parameters.get(parameter)
+
+
+def extract_parameters(design_data: Dict[str, Any]) -> Dict[str, float]:
+    """Numeric values of a design output, nested dicts flattened one level ("a.b")."""
+    values = {}
+    for name, value in design_data.items():
+        if isinstance(value, dict):
+            for child, child_value in value.items():
+                if _is_number(child_value):
+                    values[f"{name}.{child}"] = float(child_value)
+        elif _is_number(value):
+            values[name] = float(value)
+    return values
+
+
+def summarize_history(
+    historical_data: List[Dict[str, Any]],
+    parameters: Optional[Iterable[str]] = None
+) -> HistorySummary:
+    """
+    Summarize an explicit list of past designs in one pass.
+
+    Args:
+        historical_data: Past design outputs
+        parameters: Parameters to summarize (default: all numeric ones)
+    """
+    wanted = set(parameters) if parameters is not None else None
+    stats: Dict[str, RunningStats] = {}
+    for design in historical_data:
+        for name, value in extract_parameters(design).items():
+            if wanted is None or name in wanted:
+                stats.setdefault(name, RunningStats()).add(value)
+    return HistorySummary(
+        sample_size=len(historical_data),
+        parameters={name: s.summary() for name, s in stats.items()}
+    )
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+
+def _epoch(timestamp: Optional[datetime]) -> float:
+    if timestamp is None:
+        return time.time()
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)  # stored as UTC
+    return timestamp.timestamp()
+
+
+# ============================================================================
+# STORE
+# ============================================================================
+
+class _DeliverableSeries:
+    """Totals and time buckets of one deliverable type (within retention)."""
+
+    def __init__(self):
+        self.sample_size = 0
+        self.totals: Dict[str, RunningStats] = {}
+        self.bucket_sizes: Dict[int, int] = {}
+        self.buckets: Dict[int, Dict[str, RunningStats]] = {}
+
+
+class HistoricalStatsStore:
+    """
+    Running statistics of finalized designs, per deliverable type and parameter.
+
+    Usage:
+        store.record("foundation_design", output_data, completed_at)
+        summary = store.snapshot("foundation_design", window_seconds=90 * 86400)
+        summary.get("footing_length_final").mean
+    """
+
+    def __init__(
+        self,
+        bucket_seconds: float = 86400,
+        retention_seconds: Optional[float] = None,
+        max_parameters: int = 256,
+        loader: Optional[HistoryLoader] = None,
+        refresh_seconds: Optional[float] = None
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            bucket_seconds: Width of the time buckets used for sliding windows
+            retention_seconds: Drop designs older than this from buckets and
+                               totals; None keeps all history
+            max_parameters: Parameters tracked per deliverable type
+            loader: Source of past executions for rebuilds (None: start empty)
+            refresh_seconds: Rebuild a deliverable type from the loader once its
+                             history is older than this; None loads it once
+        """
+        if bucket_seconds <= 0:
+            raise ValueError(f"Invalid bucket width: bucket_seconds={bucket_seconds}")
+
+        self.bucket_seconds = bucket_seconds
+        self.retention_seconds = retention_seconds
+        self.max_parameters = max_parameters
+        self.loader = loader
+        self.refresh_seconds = refresh_seconds
+
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._series: Dict[str, _DeliverableSeries] = {}
+        self._loaded: Dict[str, float] = {}  # deliverable type -> monotonic load time
+
+        self.stats = {
+            "recorded": 0,
+            "snapshots": 0,
+            "rebuilds": 0,
+            "rows_loaded": 0,
+            "load_errors": 0,
+            "dropped_parameters": 0,
+        }
+
+    # ------------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------------
+
+    def record(
+        self,
+        deliverable_type: str,
+        design_data: Dict[str, Any],
+        completed_at: Optional[datetime] = None
+    ) -> None:
+        """
+        Add one finalized design to the running statistics.
+
+        Call after the execution row is committed: if the deliverable type's
+        history is (re)loaded now, it already includes this execution.
+        """
+        if self._ensure_loaded(deliverable_type):
+            return
+        with self._lock:
+            self._add_locked(deliverable_type, extract_parameters(design_data), _epoch(completed_at))
+            self.stats["recorded"] += 1
+
+    def rebuild(self, deliverable_type: Optional[str] = None) -> int:
+        """
+        Replace the statistics with a fresh scan of past executions.
+
+        Args:
+            deliverable_type: Rebuild one deliverable type (default: all)
+
+        Returns:
+            Number of executions loaded
+        """
+        if self.loader is None:
+            return 0
+        since = None
+        if self.retention_seconds is not None:
+            since = datetime.fromtimestamp(time.time() - self.retention_seconds, tz=timezone.utc).replace(tzinfo=None)
+
+        rows = list(self.loader(deliverable_type, since))
+        loaded_at = time.monotonic()
+        with self._lock:
+            if deliverable_type is None:
+                self._series.clear()
+            else:
+                self._series.pop(deliverable_type, None)
+            for row_type, output_data, completed_at in rows:
+                if output_data:
+                    self._add_locked(row_type, extract_parameters(output_data), _epoch(completed_at))
+                    self._loaded[row_type] = loaded_at
+            if deliverable_type is not None:
+                self._loaded[deliverable_type] = loaded_at
+            self.stats["rebuilds"] += 1
+            self.stats["rows_loaded"] += len(rows)
+        logger.info(
+            "Rebuilt historical statistics for %s from %d executions",
+            deliverable_type or "all deliverables", len(rows)
+        )
+        return len(rows)
+
+    def clear(self) -> None:
+        """Drop all statistics (the next access reloads from the database)."""
+        with self._lock:
+            self._series.clear()
+            self._loaded.clear()
+
+    # ------------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------------
+
+    def snapshot(
+        self,
+        deliverable_type: str,
+        parameters: Optional[Iterable[str]] = None,
+        window_seconds: Optional[float] = None,
+        now: Optional[float] = None
+    ) -> HistorySummary:
+        """
+        Statistics of past designs of a deliverable type.
+
+        Args:
+            deliverable_type: Deliverable type
+            parameters: Parameters to include (default: all tracked)
+            window_seconds: Only designs finalized in this trailing window,
+                            at bucket granularity (default: all history)
+            now: Window end as epoch seconds (default: current time)
+        """
+        self._ensure_loaded(deliverable_type)
+        with self._lock:
+            self.stats["snapshots"] += 1
+            series = self._series.get(deliverable_type)
+            if series is None:
+                return HistorySummary(sample_size=0)
+            self._expire_locked(series)
+
+            names = list(parameters) if parameters is not None else list(series.totals)
+            if window_seconds is None:
+                return HistorySummary(
+                    sample_size=series.sample_size,
+                    parameters={
+                        name: series.totals[name].summary()
+                        for name in names if name in series.totals
+                    }
+                )
+
+            first_bucket = self._bucket((now if now is not None else time.time()) - window_seconds)
+            buckets = [b for b in series.buckets if b >= first_bucket]
+            merged: Dict[str, RunningStats] = {}
+            for name in names:
+                for bucket in buckets:
+                    stats = series.buckets[bucket].get(name)
+                    if stats is not None:
+                        merged.setdefault(name, RunningStats()).merge(stats)
+            return HistorySummary(
+                sample_size=sum(series.bucket_sizes[b] for b in buckets),
+                parameters={name: s.summary() for name, s in merged.items()}
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                "deliverable_types": len(self._series),
+                "samples": sum(s.sample_size for s in self._series.values()),
+                "parameters": sum(len(s.totals) for s in self._series.values()),
+            }
+
+    # ------------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------------
+
+    def _ensure_loaded(self, deliverable_type: str) -> bool:
+        """(Re)load a deliverable type's history when missing or stale; True if it was loaded now."""
+        if self.loader is None or not self._needs_load(deliverable_type):
+            return False
+        # A stale type is refreshed by one caller while the others keep reading it
+        if not self._load_lock.acquire(blocking=deliverable_type not in self._loaded):
+            return False
+        try:
+            if not self._needs_load(deliverable_type):
+                return False
+            self.rebuild(deliverable_type)
+            return True
+        except Exception as e:
+            with self._lock:
+                self.stats["load_errors"] += 1
+                self._loaded[deliverable_type] = time.monotonic()  # don't retry on every assessment
+            logger.warning("Historical statistics load for %s failed: %s", deliverable_type, e)
+            return False
+        finally:
+            self._load_lock.release()
+
+    def _needs_load(self, deliverable_type: str) -> bool:
+        loaded_at = self._loaded.get(deliverable_type)
+        if loaded_at is None:
+            return True
+        return self.refresh_seconds is not None and time.monotonic() - loaded_at >= self.refresh_seconds
+
+    def _bucket(self, epoch: float) -> int:
+        return int(epoch // self.bucket_seconds)
+
+    def _add_locked(self, deliverable_type: str, values: Dict[str, float], epoch: float) -> None:
+        series = self._series.setdefault(deliverable_type, _DeliverableSeries())
+        bucket_key = self._bucket(epoch)
+        bucket = series.buckets.setdefault(bucket_key, {})
+        series.sample_size += 1
+        series.bucket_sizes[bucket_key] = series.bucket_sizes.get(bucket_key, 0) + 1
+
+        for name, value in values.items():
+            totals = series.totals.get(name)
+            if totals is None:
+                if len(series.totals) >= self.max_parameters:
+                    self.stats["dropped_parameters"] += 1
+                    continue
+                totals = series.totals[name] = RunningStats()
+            totals.add(value)
+            bucket.setdefault(name, RunningStats()).add(value)
+
+        self._expire_locked(series)
+
+    def _expire_locked(self, series: _DeliverableSeries) -> None:
+        """Drop buckets past retention and recompute the totals from the rest."""
+        if self.retention_seconds is None or not series.buckets:
+            return
+        oldest = self._bucket(time.time() - self.retention_seconds)
+        if min(series.buckets) >= oldest:
+            return
+        for stale in [b for b in series.buckets if b < oldest]:
+            del series.buckets[stale]
+            del series.bucket_sizes[stale]
+        # Happens at most once per bucket width, so the O(1) snapshot is kept
+        series.totals = {}
+        for bucket in series.buckets.values():
+            for name, stats in bucket.items():
+                series.totals.setdefault(name, RunningStats()).merge(stats)
+        series.sample_size = sum(series.bucket_sizes.values())
+
+
+# ============================================================================
+# DATABASE LOADER
+# ============================================================================
+
+def load_execution_history(
+    deliverable_type: Optional[str] = None,
+    since: Optional[datetime] = None
+) -> List[HistoryRow]:
+    """Completed and approved executions from csa.workflow_executions, oldest first."""
+    from app.core.database import DatabaseConfig
+
+    query = """
+        SELECT deliverable_type, output_data, COALESCE(completed_at, created_at) AS completed_at
+        FROM csa.workflow_executions
+        WHERE execution_status IN ('completed', 'approved')
+          AND output_data IS NOT NULL
+          AND (%s::text IS NULL OR deliverable_type = %s)
+          AND (%s::timestamp IS NULL OR COALESCE(completed_at, created_at) >= %s)
+        ORDER BY completed_at;
+    """
+    rows = DatabaseConfig().execute_query_dict(query, (deliverable_type, deliverable_type, since, since))
+    return [(row["deliverable_type"], row["output_data"], row["completed_at"]) for row in rows]
+
+
+# ============================================================================
+# GLOBAL INSTANCE
+# ============================================================================
+
+_global_stats_store: Optional[HistoricalStatsStore] = None
+_global_lock = threading.Lock()
+
+
+def get_historical_stats_store() -> Optional[HistoricalStatsStore]:
+    """
+    Get the process-wide historical statistics store.
+
+    Returns:
+        The shared HistoricalStatsStore, or None if RISK_STATS_ENABLED is off
+    """
+    global _global_stats_store
+    if not settings.RISK_STATS_ENABLED:
+        return None
+    with _global_lock:
+        if _global_stats_store is None:
+            retention_days = settings.RISK_STATS_RETENTION_DAYS
+            refresh_seconds = settings.RISK_STATS_REFRESH_SECONDS
+            _global_stats_store = HistoricalStatsStore(
+                bucket_seconds=settings.RISK_STATS_BUCKET_SECONDS,
+                retention_seconds=retention_days * 86400 if retention_days > 0 else None,
+                loader=load_execution_history if settings.DATABASE_URL else None,
+                refresh_seconds=refresh_seconds if refresh_seconds > 0 else None,
+            )
+    return _global_stats_store
+
+
+def record_execution(
+    deliverable_type: str,
+    output_data: Optional[Dict[str, Any]],
+    completed_at: Optional[datetime] = None
+) -> None:
+    """Add a finalized execution to the shared store (never raises)."""
+    if not output_data:
+        return
+    try:
+        store = get_historical_stats_store()
+        if store is not None:
+            store.record(deliverable_type, output_data, completed_at)
+    except Exception as e:
+        logger.warning("Failed to record historical statistics for %s: %s", deliverable_type, e)
@@ -10,15 +10,20 @@ Features:
 - Risk assessment context ($assessment.*)
 - Safe evaluation with error handling
 - Performance metrics tracking
+- Conditions compiled once and cached (LRU) by condition text
 """
 
 import re
 import logging
 import time
-from typing import Any, Dict, List, Optional, Tuple, Set
+from typing import Any, Callable, Dict, List, Optional, Tuple, Set
 from dataclasses import dataclass
 
-from app.execution.condition_parser import ConditionEvaluator, SimpleConditionEvaluator
+from app.execution.condition_parser import (
+    ConditionEvaluator,
+    SimpleConditionEvaluator,
+    CompiledCache
+)
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +65,24 @@ class RuleEvalResult:
             self.variables_resolved = {}
 
 
+@dataclass
+class CompiledRule:
+    """A rule condition compiled once and reused for every evaluation."""
+    condition: str
+    evaluate: Callable[[Dict[str, Any]], Any]
+    variables: List[ParsedVariable]
+    required_steps: Set[int]
+
+
+# Compiled rules shared by every parser, keyed by (condition, advanced parser?)
+_compiled_rules = CompiledCache(maxsize=1024)
+
+
+def get_rule_cache_stats() -> Dict[str, Any]:
+    """Get hit/miss statistics for the compiled rule cache."""
+    return _compiled_rules.get_stats()
+
+
 class RiskRuleParser:
     """
     Parser for risk rule conditions.
@@ -70,7 +93,8 @@ class RiskRuleParser:
     - Complex boolean expressions: AND, OR, NOT
     - Ternary-like expressions for counting: (cond1 ? 1 : 0) + (cond2 ? 1 : 0)
 
-    Thread-safe and cacheable.
+    Thread-safe. Conditions are compiled on first use and cached, so the
+    per-evaluation cost is a closure call plus variable lookups.
     """
 
     # Pattern for extracting variable references
@@ -123,10 +147,10 @@ class RiskRuleParser:
             # Find required step numbers
             required_steps = self._find_required_steps(condition)
 
-            # Try to parse with evaluator to validate syntax
+            # Try to compile with evaluator to validate syntax
             if self.use_advanced_parser and self._evaluator:
                 try:
-                    self._evaluator.parse(condition)
+                    self._compile(condition)
                 except Exception as e:
                     return RuleParseResult(
                         is_valid=False,
@@ -175,22 +199,17 @@ class RiskRuleParser:
             )
 
         try:
+            compiled = self._compile(condition)
+
             # Build extended context with assessment data
             extended_context = self._build_extended_context(context, assessment)
 
-            # Handle ternary expressions first (preprocessing)
-            processed_condition = self._preprocess_ternary(condition, extended_context)
-
-            # Evaluate using appropriate evaluator
-            if self.use_advanced_parser and self._evaluator:
-                result = self._evaluator.evaluate(processed_condition, extended_context)
-            else:
-                result = SimpleConditionEvaluator.evaluate(processed_condition, extended_context)
+            result = compiled.evaluate(extended_context)
 
             elapsed_ms = int((time.perf_counter() - start_time) * 1000)
 
             # Track resolved variables for debugging
-            variables_resolved = self._resolve_all_variables(condition, extended_context)
+            variables_resolved = self._resolve_all_variables(compiled.variables, extended_context)
 
             return RuleEvalResult(
                 success=True,
@@ -268,6 +287,36 @@ class RiskRuleParser:
     # Private Methods
     # =========================================================================
 
+    def _compile(self, condition: str) -> CompiledRule:
+        """
+        Get the compiled form of a condition (cached by condition text).
+
+        The advanced parser compiles the whole condition, ternaries
+        included, into a closure. The simple evaluator keeps the regex
+        ternary preprocessing, but the variable metadata is still cached.
+
+        Raises:
+            ValueError: If the condition has syntax errors
+        """
+        use_advanced = bool(self.use_advanced_parser and self._evaluator)
+
+        def build() -> CompiledRule:
+            if use_advanced:
+                evaluate = self._evaluator.compile(condition)
+            else:
+                def evaluate(context):
+                    processed = self._preprocess_ternary(condition, context)
+                    return SimpleConditionEvaluator.evaluate(processed, context)
+
+            return CompiledRule(
+                condition=condition,
+                evaluate=evaluate,
+                variables=self._extract_variables(condition),
+                required_steps=self._find_required_steps(condition)
+            )
+
+        return _compiled_rules.get_or_compile((condition, use_advanced), build)
+
     def _extract_variables(self, condition: str) -> List[ParsedVariable]:
         """Extract all variable references from condition."""
         variables = []
@@ -337,12 +386,11 @@ class RiskRuleParser:
 
     def _resolve_all_variables(
         self,
-        condition: str,
+        variables: List[ParsedVariable],
         context: Dict[str, Any]
     ) -> Dict[str, Any]:
-        """Resolve all variables in condition for debugging."""
+        """Resolve all variables of a condition for debugging."""
         resolved = {}
-        variables = self._extract_variables(condition)
 
         for var in variables:
             try:
@@ -10,14 +10,23 @@ Key Features:
 - Track routing decisions with full traceability
 - Update rule effectiveness statistics
 - Support for compliance reporting
+- Audit rows written through the buffered audit writer (batched,
+  write-ahead logged); audit queries flush it first
 """
 
 import logging
 import json
-from typing import Dict, Any, List, Optional
-from uuid import UUID
-from datetime import datetime
-
+from typing import Dict, Any, List, Optional, Sequence
+from uuid import UUID, uuid4
+from datetime import datetime, timezone
+
+from app.core.audit_writer import (
+    AuditTable,
+    AuditWriter,
+    PostgresAuditSink,
+    get_audit_writer,
+    register_audit_table,
+)
 from app.core.database import DatabaseConfig
 from app.schemas.risk.models import (
     RiskRuleType,
@@ -35,6 +44,38 @@ from app.risk.routing_engine import RoutingResult
 
 logger = logging.getLogger(__name__)
 
+RISK_RULES_AUDIT_TABLE = register_audit_table(AuditTable(
+    name="risk_rules_audit",
+    sql="""
+    INSERT INTO csa.risk_rules_audit (
+        id, execution_id, deliverable_type, step_number, step_name,
+        rule_id, rule_type, rule_condition, evaluation_context,
+        condition_result, calculated_risk_factor,
+        triggered_action, action_reason,
+        evaluation_time_ms, user_id, project_id, evaluated_at
+    ) VALUES %s
+    ON CONFLICT (id) DO NOTHING
+    """,
+    template=(
+        "(%s::uuid, %s::uuid, %s, %s, %s, %s, %s, %s, %s::jsonb, %s, %s, %s, %s, %s, %s, "
+        "%s::uuid, %s::timestamptz)"
+    ),
+))
+
+SAFETY_ROUTING_LOG_TABLE = register_audit_table(AuditTable(
+    name="safety_routing_log",
+    sql="""
+    INSERT INTO csa.safety_routing_log (
+        id, execution_id, deliverable_type, decision_point, decision_type,
+        risk_score_before, risk_score_after, risk_delta,
+        routing_decision, decision_reason, triggered_rules,
+        required_human_review, processing_time_ms, user_id, decided_at
+    ) VALUES %s
+    ON CONFLICT (id) DO NOTHING
+    """,
+    template="(%s::uuid, %s::uuid, %s, %s, %s, %s, %s, %s, %s, %s, %s::jsonb, %s, %s, %s, %s::timestamptz)",
+))
+
 
 class SafetyAuditLogger:
     """
@@ -47,14 +88,21 @@ class SafetyAuditLogger:
     - Compliance reporting
     """
 
-    def __init__(self, db: Optional[DatabaseConfig] = None):
+    def __init__(
+        self,
+        db: Optional[DatabaseConfig] = None,
+        audit_writer: Optional[AuditWriter] = None
+    ):
         """
         Initialize safety audit logger.
 
         Args:
             db: Database configuration (uses singleton if not provided)
+            audit_writer: Buffered audit writer (uses the process-wide writer
+                if not provided; rows are written synchronously without one)
         """
         self.db = db or DatabaseConfig()
+        self.audit_writer = audit_writer or get_audit_writer()
 
     def log_rule_evaluation(
         self,
@@ -63,7 +111,8 @@ class SafetyAuditLogger:
         rule_result: RuleEvaluationResult,
         evaluation_context: Dict[str, Any],
         user_id: str,
-        project_id: Optional[UUID] = None
+        project_id: Optional[UUID] = None,
+        step_number: Optional[int] = None
     ) -> Optional[UUID]:
         """
         Log a single rule evaluation.
@@ -75,53 +124,61 @@ class SafetyAuditLogger:
             evaluation_context: Context snapshot at evaluation time
             user_id: User who triggered the execution
             project_id: Optional project ID
+            step_number: Step number for step rules (NULL for global rules)
 
         Returns:
             Audit record ID or None if logging failed
         """
-        try:
-            # Sanitize context for storage (remove large binary data)
-            sanitized_context = self._sanitize_context(evaluation_context)
-
-            action_reason = None
-            if rule_result.was_triggered:
-                action_reason = rule_result.message or "Rule condition evaluated to true"
-
-            query = """
-                SELECT csa.log_risk_rule_evaluation(
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                ) AS audit_id;
-            """
-
-            result = self.db.execute_query(
-                query,
-                (
-                    str(execution_id),
-                    deliverable_type,
-                    rule_result.step_name,  # step_number will be NULL for global
-                    rule_result.step_name,
-                    rule_result.rule_id,
-                    rule_result.rule_type.value if isinstance(rule_result.rule_type, RiskRuleType) else str(rule_result.rule_type),
-                    rule_result.condition,
-                    json.dumps(sanitized_context),
-                    rule_result.condition_result,
-                    rule_result.calculated_risk_factor,
-                    rule_result.triggered_action.value if rule_result.triggered_action else None,
-                    action_reason,
-                    rule_result.evaluation_time_ms,
-                    user_id,
-                    str(project_id) if project_id else None,
-                )
-            )
-
-            if result:
-                audit_id = result[0][0] if isinstance(result[0], tuple) else result[0].get('audit_id')
-                logger.debug(f"Logged rule evaluation: {rule_result.rule_id} -> {audit_id}")
-                return UUID(audit_id) if audit_id else None
+        return self._log_rule_evaluation(
+            execution_id=execution_id,
+            deliverable_type=deliverable_type,
+            rule_result=rule_result,
+            context_json=self._serialize_context(evaluation_context),
+            user_id=user_id,
+            project_id=project_id,
+            step_number=step_number,
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to log rule evaluation: {e}")
+    def _log_rule_evaluation(
+        self,
+        execution_id: UUID,
+        deliverable_type: str,
+        rule_result: RuleEvaluationResult,
+        context_json: str,
+        user_id: str,
+        project_id: Optional[UUID],
+        step_number: Optional[int] = None
+    ) -> Optional[UUID]:
+        """Log a rule evaluation with an already serialized context snapshot."""
+        audit_id = uuid4()
+
+        action_reason = None
+        if rule_result.was_triggered:
+            action_reason = rule_result.message or "Rule condition evaluated to true"
+
+        row = (
+            str(audit_id),
+            str(execution_id),
+            deliverable_type,
+            step_number,
+            rule_result.step_name,
+            rule_result.rule_id,
+            rule_result.rule_type.value if isinstance(rule_result.rule_type, RiskRuleType) else str(rule_result.rule_type),
+            rule_result.condition,
+            context_json,
+            rule_result.condition_result,
+            rule_result.calculated_risk_factor,
+            rule_result.triggered_action.value if rule_result.triggered_action else None,
+            action_reason,
+            rule_result.evaluation_time_ms,
+            user_id,
+            str(project_id) if project_id else None,
+            datetime.now(timezone.utc).isoformat(),
+        )
 
+        if self._write_audit_row(RISK_RULES_AUDIT_TABLE, row):
+            logger.debug(f"Logged rule evaluation: {rule_result.rule_id} -> {audit_id}")
+            return audit_id
         return None
 
     def log_workflow_evaluation(
@@ -145,14 +202,17 @@ class SafetyAuditLogger:
         """
         audit_ids: List[UUID] = []
 
+        # One context snapshot shared by every rule evaluation of the workflow
+        context_json = self._serialize_context(evaluation_context)
+
         # Log global rules
         if workflow_result.global_evaluation:
             for rule_result in workflow_result.global_evaluation.triggered_rules:
-                audit_id = self.log_rule_evaluation(
+                audit_id = self._log_rule_evaluation(
                     execution_id=workflow_result.execution_id,
                     deliverable_type=workflow_result.deliverable_type,
                     rule_result=rule_result,
-                    evaluation_context=evaluation_context,
+                    context_json=context_json,
                     user_id=user_id,
                     project_id=project_id,
                 )
@@ -162,24 +222,25 @@ class SafetyAuditLogger:
         # Log step rules
         for step_name, step_eval in workflow_result.step_evaluations.items():
             for rule_result in step_eval.triggered_rules:
-                audit_id = self.log_rule_evaluation(
+                audit_id = self._log_rule_evaluation(
                     execution_id=workflow_result.execution_id,
                     deliverable_type=workflow_result.deliverable_type,
                     rule_result=rule_result,
-                    evaluation_context=evaluation_context,
+                    context_json=context_json,
                     user_id=user_id,
                     project_id=project_id,
+                    step_number=step_eval.step_number,
                 )
                 if audit_id:
                     audit_ids.append(audit_id)
 
         # Log exception rules
         for rule_result in workflow_result.exception_overrides:
-            audit_id = self.log_rule_evaluation(
+            audit_id = self._log_rule_evaluation(
                 execution_id=workflow_result.execution_id,
                 deliverable_type=workflow_result.deliverable_type,
                 rule_result=rule_result,
-                evaluation_context=evaluation_context,
+                context_json=context_json,
                 user_id=user_id,
                 project_id=project_id,
             )
@@ -188,11 +249,11 @@ class SafetyAuditLogger:
 
         # Log escalation rules
         for rule_result in workflow_result.escalation_triggers:
-            audit_id = self.log_rule_evaluation(
+            audit_id = self._log_rule_evaluation(
                 execution_id=workflow_result.execution_id,
                 deliverable_type=workflow_result.deliverable_type,
                 rule_result=rule_result,
-                evaluation_context=evaluation_context,
+                context_json=context_json,
                 user_id=user_id,
                 project_id=project_id,
             )
@@ -243,34 +304,28 @@ class SafetyAuditLogger:
             else:
                 decision_type = "risk_assessment"
 
-            query = """
-                SELECT csa.log_routing_decision(
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                ) AS log_id;
-            """
-
-            result = self.db.execute_query(
-                query,
-                (
-                    str(execution_id),
-                    deliverable_type,
-                    decision_point,
-                    decision_type,
-                    risk_score_before,
-                    risk_score_after,
-                    routing_result.routing_decision.value,
-                    routing_result.message or "No specific reason",
-                    json.dumps(routing_result.triggered_rule_ids),
-                    routing_result.requires_approval,
-                    processing_time_ms,
-                    user_id,
-                )
+            log_id = uuid4()
+            row = (
+                str(log_id),
+                str(execution_id),
+                deliverable_type,
+                decision_point,
+                decision_type,
+                risk_score_before,
+                risk_score_after,
+                risk_score_after - risk_score_before,
+                routing_result.routing_decision.value,
+                routing_result.message or "No specific reason",
+                json.dumps(routing_result.triggered_rule_ids),
+                routing_result.requires_approval,
+                processing_time_ms,
+                user_id,
+                datetime.now(timezone.utc).isoformat(),
             )
 
-            if result:
-                log_id = result[0][0] if isinstance(result[0], tuple) else result[0].get('log_id')
+            if self._write_audit_row(SAFETY_ROUTING_LOG_TABLE, row):
                 logger.debug(f"Logged routing decision: {decision_point} -> {log_id}")
-                return UUID(log_id) if log_id else None
+                return log_id
 
         except Exception as e:
             logger.error(f"Failed to log routing decision: {e}")
@@ -340,6 +395,8 @@ class SafetyAuditLogger:
             List of audit records
         """
         try:
+            self._flush_audit_writer()
+
             query = """
                 SELECT * FROM csa.get_risk_audit_trail(%s);
             """
@@ -365,6 +422,8 @@ class SafetyAuditLogger:
             List of routing decisions
         """
         try:
+            self._flush_audit_writer()
+
             query = """
                 SELECT
                     id,
@@ -443,6 +502,8 @@ class SafetyAuditLogger:
             True if update succeeded
         """
         try:
+            self._flush_audit_writer()
+
             query = """
                 UPDATE csa.risk_rules_audit
                 SET
@@ -484,6 +545,8 @@ class SafetyAuditLogger:
             True if update succeeded
         """
         try:
+            self._flush_audit_writer()
+
             query = """
                 UPDATE csa.safety_routing_log
                 SET
@@ -527,6 +590,8 @@ class SafetyAuditLogger:
             Compliance report data
         """
         try:
+            self._flush_audit_writer()
+
             # Get rule evaluation statistics
             eval_query = """
                 SELECT
@@ -590,10 +655,42 @@ class SafetyAuditLogger:
     # Private Methods
     # =========================================================================
 
+    def _write_audit_row(self, table: AuditTable, row: Sequence[Any]) -> bool:
+        """
+        Write one audit row through the audit writer (or synchronously without one).
+
+        Returns:
+            True if the row was accepted
+        """
+        try:
+            if self.audit_writer is not None:
+                self.audit_writer.submit(table.name, row)
+            else:
+                PostgresAuditSink(self.db).write(table, [row])
+            return True
+        except Exception as e:
+            logger.error(f"Failed to log {table.name} row: {e}")
+            return False
+
+    def _flush_audit_writer(self) -> None:
+        """Write buffered audit rows before reading or updating audit tables."""
+        if self.audit_writer is not None:
+            self.audit_writer.flush()
+
+    def _serialize_context(self, context: Dict[str, Any]) -> str:
+        """Sanitize and JSON-encode a context snapshot for storage."""
+        try:
+            return json.dumps(self._sanitize_context(context), default=str)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Context snapshot not serializable: {e}")
+            return json.dumps({"unserializable_context": str(e)})
+
     def _sanitize_context(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Sanitize context for storage (remove large/sensitive data).
 
+        Containers are only copied when something inside them is replaced.
+
         Args:
             context: Raw context
 
@@ -605,11 +702,25 @@ class SafetyAuditLogger:
                 return "<truncated>"
 
             if isinstance(value, dict):
-                return {k: sanitize_value(v, depth + 1) for k, v in value.items()}
+                sanitized = None
+                for k, v in value.items():
+                    new_v = sanitize_value(v, depth + 1)
+                    if new_v is not v:
+                        if sanitized is None:
+                            sanitized = dict(value)
+                        sanitized[k] = new_v
+                return value if sanitized is None else sanitized
             elif isinstance(value, list):
                 if len(value) > 100:
                     return value[:100] + ["<truncated>"]
-                return [sanitize_value(v, depth + 1) for v in value]
+                sanitized = None
+                for i, v in enumerate(value):
+                    new_v = sanitize_value(v, depth + 1)
+                    if new_v is not v:
+                        if sanitized is None:
+                            sanitized = list(value)
+                        sanitized[i] = new_v
+                return value if sanitized is None else sanitized
             elif isinstance(value, bytes):
                 return f"<bytes:{len(value)}>"
             elif isinstance(value, str) and len(value) > 10000:
@@ -181,6 +181,31 @@ class GraphPathResponse(BaseModel):
     paths: List[GraphPath]
 
 
+class NeighborhoodRequest(BaseModel):
+    """Request model for a k-hop neighborhood."""
+    entity_type: KnowledgeEntityType
+    entity_id: UUID
+    hops: int = Field(2, ge=1, le=4, description="Maximum number of edges from the entity")
+    relationship_types: Optional[List[RelationshipType]] = None
+    limit: int = Field(100, ge=1, le=500)
+
+
+class NeighborhoodEntity(BaseModel):
+    """An entity in a k-hop neighborhood."""
+    entity_type: KnowledgeEntityType
+    entity_id: UUID
+    entity_name: str
+    distance: int = Field(description="Number of edges from the requested entity")
+
+
+class NeighborhoodResponse(BaseModel):
+    """Response model for a k-hop neighborhood."""
+    entity: GraphPathNode
+    hops: int
+    total_entities: int
+    entities: List[NeighborhoodEntity]
+
+
 # =============================================================================
 # KNOWLEDGE GRAPH STATISTICS
 # =============================================================================
@@ -228,6 +228,28 @@ class RuleEvaluationResponse(BaseModel):
     evaluation_timestamp: datetime
 
 
+class RuleBatchEvaluationRequest(BaseModel):
+    """Request model for evaluating rules against many input records."""
+    input_records: List[Dict[str, Any]] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="Input records, each evaluated like RuleEvaluationRequest.input_data"
+    )
+    discipline: Optional[RuleDiscipline] = None
+    workflow_type: Optional[str] = Field(None, description="Filter rules by workflow type")
+    include_info: bool = Field(False, description="Include info-level rules")
+    execution_id: Optional[UUID] = Field(None, description="Link to workflow execution")
+
+
+class RuleBatchEvaluationResponse(BaseModel):
+    """Response model for batch rule evaluation."""
+    total_records: int
+    records_with_triggers: int
+    has_blockers: bool = Field(description="True if any record triggered a critical/mandatory rule")
+    evaluations: List[RuleEvaluationResponse] = Field(description="One response per input record, in order")
+
+
 # =============================================================================
 # RULE SEARCH MODELS
 # =============================================================================
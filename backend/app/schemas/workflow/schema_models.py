@@ -7,7 +7,7 @@ These models ensure type safety and validation for the "Configuration over Code"
 """
 
 from typing import Dict, Any, List, Optional, Literal
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, validator
 from datetime import datetime
 from uuid import UUID
 
@@ -24,6 +24,25 @@ class ErrorHandling(BaseModel):
         description="Action to take on error: fail (stop workflow), skip (skip step), continue (proceed anyway)"
     )
     fallback_value: Optional[Any] = Field(None, description="Fallback value if step fails and on_error='continue'")
+    base_delay_seconds: float = Field(
+        1.0, ge=0.1, le=60.0, description="Backoff before the first retry (doubles per retry, jittered)"
+    )
+    max_delay_seconds: float = Field(60.0, ge=1.0, le=3600.0, description="Upper bound for the retry backoff")
+    retry_on_transient_only: bool = Field(
+        True,
+        description="Retry only transient errors and timeouts (network, rate limits, 5xx), not engine errors"
+    )
+    retry_on_timeout: bool = Field(
+        False,
+        description="Retry a step that timed out; only sandboxed steps are retried (a timed-out inline engine may still be running)"
+    )
+    sandbox: bool = Field(
+        False,
+        description="Run the engine in a sandboxed worker process that is killed at the step timeout (for engines that can hang)"
+    )
+    circuit_breaker: bool = Field(
+        True, description="Fail fast while the step's engine keeps failing for every execution"
+    )
 
 
 class WorkflowStep(BaseModel):
@@ -234,6 +253,9 @@ class DeliverableSchema(DeliverableSchemaBase):
     created_by: str
     updated_by: str
 
+    # Compiled ExecutionPlan (app/execution/execution_plan.py); not serialized
+    _execution_plan: Optional[Any] = PrivateAttr(default=None)
+
     class Config:
         from_attributes = True
 
@@ -261,6 +283,12 @@ class StepResult(BaseModel):
     execution_time_ms: Optional[int] = None
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
+    # True when a re-run took this result from its source execution
+    reused: bool = False
+    # Retries performed before this result (see ErrorHandling.retry_count)
+    retry_count: int = 0
+    # Failure kind: "timeout", "memory_limit", "worker_crashed", "circuit_open", "error"
+    error_type: Optional[str] = None
 
 
 class WorkflowExecution(BaseModel):
@@ -292,6 +320,9 @@ class WorkflowExecution(BaseModel):
     project_id: Optional[UUID] = None
     created_at: datetime
 
+    # Scheduling statistics (wall time, measured speedup vs sequential); not persisted
+    execution_stats: Optional[Dict[str, Any]] = None
+
     class Config:
         from_attributes = True
 
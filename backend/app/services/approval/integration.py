@@ -86,7 +86,8 @@ class RiskApprovalIntegration:
                 for sr in step_results
             ],
             schema=schema,
-            historical_data=historical_data
+            historical_data=historical_data,
+            deliverable_type=deliverable_type
         )
 
         logger.info(
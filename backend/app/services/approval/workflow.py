@@ -22,6 +22,7 @@ from app.schemas.approval.models import (
     ApprovalHistoryAction
 )
 from app.core.database import DatabaseConfig
+from app.risk.historical_stats import record_execution
 
 logger = logging.getLogger(__name__)
 
@@ -659,9 +660,14 @@ class ApprovalWorkflowService:
         query = """
             UPDATE csa.workflow_executions
             SET execution_status = %s
-            WHERE id = %s;
+            WHERE id = %s
+            RETURNING deliverable_type, output_data, completed_at;
         """
-        self.db.execute_query(query, (status, execution_id))
+        rows = self.db.execute_query_dict(query, (status, execution_id))
+
+        # Approved designs feed the running baselines used for anomaly risk
+        if status == "approved" and rows:
+            record_execution(rows[0]["deliverable_type"], rows[0]["output_data"], rows[0]["completed_at"])
 
     def _add_history(
         self,
@@ -114,7 +114,7 @@ class DynamicWorkflowOrchestrator(WorkflowOrchestrator):
             raise ValueError(f"Schema '{deliverable_type}' is {schema.status}, cannot execute")
 
         # Validate input
-        self._validate_input(input_data, schema.input_schema)
+        self._validate_input(input_data, schema.input_schema, schema_key=(schema.id, schema.version, "input"))
 
         # Load risk rules from schema
         rules_config = self._load_risk_rules(schema)
@@ -0,0 +1,347 @@
+"""
+CSA AIaaS Platform - Embedding Cache
+Performance: Content-hash embedding cache shared by all EmbeddingService consumers
+
+The same texts are embedded over and over: repeated chat queries, cost
+search strings generated per BOQ line ("concrete M25"), lesson/rule search
+text and feedback descriptions. Each of those was a remote API call. This
+module caches embeddings by content so a text is embedded once per model.
+
+Features:
+- Key: SHA-256 of (model, dimensions, whitespace-normalized text)
+- In-memory LRU front
+- Persistent backing store: SQLite file on disk (default) or PostgreSQL
+  table (init_embedding_cache.sql)
+- Vectors stored as compact float32 blobs (4 bytes per dimension), both
+  in memory and in the backing store
+- Hit/miss metrics per tier
+
+Backing-store failures never fail an embedding request; they are logged
+and the cache degrades to memory-only for that call.
+"""
+
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+# ============================================================================
+# KEYS AND ENCODING
+# ============================================================================
+
+def normalize_text(text: str) -> str:
+    """Collapse runs of whitespace and strip the ends (case is preserved)."""
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def embedding_cache_key(model: str, dimensions: int, text: str) -> str:
+    """Content-hash key for an embedding."""
+    payload = f"{model}\x00{dimensions}\x00{normalize_text(text)}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def encode_vector(vector: Sequence[float]) -> bytes:
+    """Pack an embedding as a float32 blob."""
+    return array("f", vector).tobytes()
+
+
+def decode_vector(blob: bytes) -> List[float]:
+    """Unpack a float32 blob into a list of floats."""
+    vector = array("f")
+    vector.frombytes(bytes(blob))
+    return vector.tolist()
+
+
+# ============================================================================
+# BACKING STORES
+# ============================================================================
+
+class SQLiteEmbeddingStore:
+    """Embedding blobs in a local SQLite file (opened lazily)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        found: Dict[str, bytes] = {}
+        with self._lock:
+            conn = self._connect()
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    f"SELECT key, embedding FROM embedding_cache WHERE key IN ({placeholders})",
+                    batch
+                ).fetchall()
+                found.update(rows)
+        return found
+
+    def put_many(self, entries: List[Tuple[str, str, int, bytes]]) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT OR IGNORE INTO embedding_cache (key, model, dimensions, embedding) "
+                "VALUES (?, ?, ?, ?)",
+                entries
+            )
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embedding_cache ("
+                " key TEXT PRIMARY KEY,"
+                " model TEXT NOT NULL,"
+                " dimensions INTEGER NOT NULL,"
+                " embedding BLOB NOT NULL,"
+                " created_at TEXT DEFAULT CURRENT_TIMESTAMP)"
+            )
+        return self._conn
+
+
+class PostgresEmbeddingStore:
+    """Embedding blobs in the csa.embedding_cache table (init_embedding_cache.sql)."""
+
+    def __init__(self, db: Any = None):
+        if db is None:
+            from app.core.database import DatabaseConfig
+            db = DatabaseConfig()
+        self.db = db
+
+    def get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        rows = self.db.execute_query(
+            "SELECT key, embedding FROM csa.embedding_cache WHERE key = ANY(%s)",
+            (keys,)
+        )
+        return {key: bytes(blob) for key, blob in rows}
+
+    def put_many(self, entries: List[Tuple[str, str, int, bytes]]) -> None:
+        from psycopg2 import Binary
+        from psycopg2.extras import execute_values
+
+        with self.db.connection() as conn:
+            with conn.cursor() as cursor:
+                execute_values(
+                    cursor,
+                    "INSERT INTO csa.embedding_cache (key, model, dimensions, embedding) "
+                    "VALUES %s ON CONFLICT (key) DO NOTHING",
+                    [(key, model, dims, Binary(blob)) for key, model, dims, blob in entries]
+                )
+            conn.commit()
+
+    def close(self) -> None:
+        pass
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+class EmbeddingCache:
+    """
+    Two-tier embedding cache: in-memory LRU in front of a persistent store.
+
+    Usage:
+        cache = EmbeddingCache(max_entries=10000, store=SQLiteEmbeddingStore(path))
+        cached = cache.get_many(model, dimensions, texts)   # {index: vector}
+        ...embed the misses...
+        cache.put_many(model, dimensions, missed_texts, vectors)
+    """
+
+    def __init__(self, max_entries: int = 10000, store: Optional[Any] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum vectors kept in memory (LRU eviction)
+            store: Persistent backing store (None keeps the cache in memory only)
+        """
+        if max_entries < 1:
+            raise ValueError(f"Invalid cache limit: max_entries={max_entries}")
+
+        self.max_entries = max_entries
+        self.store = store
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+
+        self.stats = {
+            "memory_hits": 0,
+            "store_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+            "store_errors": 0,
+        }
+
+    def get(self, model: str, dimensions: int, text: str) -> Optional[List[float]]:
+        """Get a cached embedding, or None on miss."""
+        return self.get_many(model, dimensions, [text]).get(0)
+
+    def get_many(self, model: str, dimensions: int, texts: Sequence[str]) -> Dict[int, List[float]]:
+        """
+        Look up embeddings for many texts.
+
+        Returns:
+            Mapping of input index -> embedding for every cache hit
+        """
+        keys = [embedding_cache_key(model, dimensions, text) for text in texts]
+        found: Dict[str, bytes] = {}
+
+        with self._lock:
+            for key in keys:
+                blob = self._entries.get(key)
+                if blob is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = blob
+
+        missing = list(dict.fromkeys(key for key in keys if key not in found))
+        stored: Dict[str, bytes] = {}
+        if missing and self.store is not None:
+            try:
+                stored = self.store.get_many(missing)
+            except Exception as e:
+                self._record_store_error("read", e)
+            if stored:
+                with self._lock:
+                    for key, blob in stored.items():
+                        self._remember_locked(key, blob)
+                found.update(stored)
+
+        hits: Dict[int, List[float]] = {}
+        with self._lock:
+            for index, key in enumerate(keys):
+                blob = found.get(key)
+                if blob is None:
+                    self.stats["misses"] += 1
+                    continue
+                self.stats["store_hits" if key in stored else "memory_hits"] += 1
+                hits[index] = decode_vector(blob)
+        return hits
+
+    def put(self, model: str, dimensions: int, text: str, vector: Sequence[float]) -> None:
+        """Cache one embedding."""
+        self.put_many(model, dimensions, [text], [vector])
+
+    def put_many(
+        self,
+        model: str,
+        dimensions: int,
+        texts: Sequence[str],
+        vectors: Iterable[Sequence[float]]
+    ) -> None:
+        """Cache embeddings for many texts (memory and backing store)."""
+        entries = {
+            embedding_cache_key(model, dimensions, text): encode_vector(vector)
+            for text, vector in zip(texts, vectors)
+        }
+        if not entries:
+            return
+
+        with self._lock:
+            for key, blob in entries.items():
+                self._remember_locked(key, blob)
+            self.stats["writes"] += len(entries)
+
+        if self.store is not None:
+            try:
+                self.store.put_many([
+                    (key, model, dimensions, blob) for key, blob in entries.items()
+                ])
+            except Exception as e:
+                self._record_store_error("write", e)
+
+    def clear(self) -> None:
+        """Drop every in-memory entry (the backing store is kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache size, hit/miss counters and hit rate."""
+        with self._lock:
+            lookups = self.stats["memory_hits"] + self.stats["store_hits"] + self.stats["misses"]
+            hits = lookups - self.stats["misses"]
+            return {
+                **self.stats,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "backend": type(self.store).__name__ if self.store is not None else "memory",
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def _remember_locked(self, key: str, blob: bytes) -> None:
+        self._entries[key] = blob
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def _record_store_error(self, operation: str, error: Exception) -> None:
+        with self._lock:
+            self.stats["store_errors"] += 1
+        logger.warning("Embedding cache store %s failed: %s", operation, error)
+
+
+# ============================================================================
+# GLOBAL INSTANCE
+# ============================================================================
+
+_global_embedding_cache: Optional[EmbeddingCache] = None
+_global_lock = threading.Lock()
+
+
+def _build_store() -> Optional[Any]:
+    backend = settings.EMBEDDING_CACHE_BACKEND.lower()
+    if backend == "disk":
+        return SQLiteEmbeddingStore(settings.EMBEDDING_CACHE_PATH)
+    if backend == "postgres":
+        return PostgresEmbeddingStore()
+    if backend == "memory":
+        return None
+    raise ValueError(
+        f"Unknown EMBEDDING_CACHE_BACKEND '{settings.EMBEDDING_CACHE_BACKEND}' "
+        "(expected disk, postgres or memory)"
+    )
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """
+    Get the process-wide embedding cache.
+
+    Returns:
+        The shared EmbeddingCache, or None if EMBEDDING_CACHE_ENABLED is off
+    """
+    global _global_embedding_cache
+    if not settings.EMBEDDING_CACHE_ENABLED:
+        return None
+    with _global_lock:
+        if _global_embedding_cache is None:
+            _global_embedding_cache = EmbeddingCache(
+                max_entries=settings.EMBEDDING_CACHE_MAX_ENTRIES,
+                store=_build_store(),
+            )
+    return _global_embedding_cache
@@ -6,10 +6,14 @@ This module handles vector embedding generation using OpenRouter's API.
 Supports multiple embedding models with configurable dimensions.
 
 Default: OpenAI text-embedding-3-large (1536 dimensions)
+
+Embeddings are served from the shared content-hash cache
+(app.services.embedding_cache) when available; only cache misses reach the API.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 from app.utils.llm_utils import get_embeddings_client
+from app.services.embedding_cache import EmbeddingCache, get_embedding_cache
 from app.core.constants import (
     DEFAULT_EMBEDDING_MODEL,
     EMBEDDING_DIMENSIONS,
@@ -30,7 +34,9 @@ class EmbeddingService:
         self,
         model: str = DEFAULT_EMBEDDING_MODEL,
         dimensions: int = EMBEDDING_DIMENSIONS,
-        batch_size: int = EMBEDDING_BATCH_SIZE
+        batch_size: int = EMBEDDING_BATCH_SIZE,
+        cache: Optional[EmbeddingCache] = None,
+        use_cache: bool = True
     ):
         """
         Initialize the embedding service.
@@ -42,10 +48,13 @@ class EmbeddingService:
                    - text-embedding-ada-002: 1024 dims (legacy)
             dimensions: Vector dimensions (must match database schema)
             batch_size: Number of texts to process per API call
+            cache: Embedding cache (defaults to the process-wide cache)
+            use_cache: Set False to always call the API
         """
         self.model = model
         self.dimensions = dimensions
         self.batch_size = batch_size
+        self.cache = (cache or get_embedding_cache()) if use_cache else None
 
         # Initialize embeddings client using centralized utility
         self.embeddings_client = get_embeddings_client(model=model, dimensions=dimensions)
@@ -66,9 +75,16 @@ class EmbeddingService:
         if not text or not text.strip():
             raise ValueError("Cannot generate embedding for empty text")
 
+        if self.cache is not None:
+            cached = self.cache.get(self.model, self.dimensions, text)
+            if cached is not None:
+                return cached
+
         try:
             # Generate embedding
             embedding = self.embeddings_client.embed_query(text)
+            if self.cache is not None:
+                self.cache.put(self.model, self.dimensions, text, embedding)
             return embedding
         except Exception as e:
             print(f"Error generating embedding: {e}")
@@ -83,7 +99,8 @@ class EmbeddingService:
         Generate embeddings for multiple texts in batches.
 
         This is more efficient than calling generate_embedding() repeatedly
-        as it batches requests to the API.
+        as it batches requests to the API. Cached texts are served from the
+        embedding cache; only the (deduplicated) misses are sent.
 
         Args:
             texts: List of texts to embed
@@ -103,13 +120,25 @@ class EmbeddingService:
         if not valid_texts:
             raise ValueError("No valid texts provided for embedding")
 
+        cached = {}
+        if self.cache is not None:
+            cached = self.cache.get_many(self.model, self.dimensions, valid_texts)
+
+        # Unique texts that still need the API
+        pending = list(dict.fromkeys(
+            text for i, text in enumerate(valid_texts) if i not in cached
+        ))
+
         try:
             # Process in batches
-            all_embeddings = []
-            total_batches = (len(valid_texts) + self.batch_size - 1) // self.batch_size
+            generated = {}
+            total_batches = (len(pending) + self.batch_size - 1) // self.batch_size
+
+            if show_progress and cached:
+                print(f"Embedding cache: {len(cached)}/{len(valid_texts)} texts cached")
 
-            for i in range(0, len(valid_texts), self.batch_size):
-                batch = valid_texts[i:i + self.batch_size]
+            for i in range(0, len(pending), self.batch_size):
+                batch = pending[i:i + self.batch_size]
                 batch_num = i // self.batch_size + 1
 
                 if show_progress:
@@ -117,9 +146,15 @@ class EmbeddingService:
 
                 # Generate embeddings for batch
                 batch_embeddings = self.embeddings_client.embed_documents(batch)
-                all_embeddings.extend(batch_embeddings)
+                generated.update(zip(batch, batch_embeddings))
+
+                if self.cache is not None:
+                    self.cache.put_many(self.model, self.dimensions, batch, batch_embeddings)
 
-            return all_embeddings
+            return [
+                cached[i] if i in cached else generated[text]
+                for i, text in enumerate(valid_texts)
+            ]
         except Exception as e:
             print(f"Error generating batch embeddings: {e}")
             raise
@@ -136,7 +171,8 @@ class EmbeddingService:
             "dimensions": self.dimensions,
             "batch_size": self.batch_size,
             "api_provider": "OpenRouter",
-            "estimated_cost_per_1m_tokens": self._get_estimated_cost()
+            "estimated_cost_per_1m_tokens": self._get_estimated_cost(),
+            "cache": self.cache.get_stats() if self.cache is not None else None
         }
 
     def _get_estimated_cost(self) -> str:
@@ -8,7 +8,7 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from app.core.database import DatabaseConfig
+from app.core.async_database import get_async_db
 from app.schemas.feedback.models import (
     FeedbackSeverity,
     PatternStatus,
@@ -27,7 +27,7 @@ class PatternDetector:
     """
 
     def __init__(self):
-        self.db_config = DatabaseConfig()
+        self.db_config = get_async_db()
 
     async def detect_patterns(
         self,
@@ -52,7 +52,7 @@ class PatternDetector:
                 SELECT * FROM csa.detect_recurring_patterns()
             """
 
-            results = self.db_config.execute_query(query)
+            results = await self.db_config.fetch_all(query)
 
             if not results:
                 return []
@@ -149,7 +149,7 @@ class PatternDetector:
             """
 
             import json
-            result = self.db_config.execute_query(query, (
+            result = await self.db_config.fetch_all(query, (
                 pattern_type,
                 schema_key,
                 step_name,
@@ -165,7 +165,7 @@ class PatternDetector:
             ))
 
             if result and len(result) > 0:
-                pattern_id = UUID(result[0]['pattern_id'])
+                pattern_id = UUID(str(result[0]['pattern_id']))
 
                 logger.info(
                     f"Created pattern record {pattern_id}: {pattern_description}"
@@ -204,7 +204,7 @@ class PatternDetector:
                 ORDER BY occurrence_count DESC, severity_level DESC
             """
 
-            results = self.db_config.execute_query(query, (
+            results = await self.db_config.fetch_all(query, (
                 PatternStatus.ACTIVE.value,
                 schema_key,
                 schema_key,
@@ -281,7 +281,7 @@ class PatternDetector:
                 WHERE pattern_id = %s
             """
 
-            self.db_config.execute_query(query, (str(pattern_id),))
+            await self.db_config.execute(query, (str(pattern_id),))
 
             logger.info(f"Updated occurrence count for pattern {pattern_id}")
 
@@ -311,7 +311,7 @@ class PatternDetector:
                 WHERE pattern_id = %s
             """
 
-            self.db_config.execute_query(query, (
+            await self.db_config.execute(query, (
                 PatternStatus.RESOLVED.value,
                 resolution_notes,
                 str(pattern_id)
@@ -350,7 +350,7 @@ class PatternDetector:
                 WHERE %s IS NULL OR schema_key = %s
             """
 
-            result = self.db_config.execute_query(query, (
+            result = await self.db_config.fetch_all(query, (
                 PatternStatus.ACTIVE.value,
                 PatternStatus.RESOLVED.value,
                 FeedbackSeverity.CRITICAL.value,
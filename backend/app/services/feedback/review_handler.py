@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from app.core.database import DatabaseConfig
+from app.core.async_database import get_async_db
 from app.schemas.feedback.models import (
     FeedbackType,
     FeedbackSeverity,
@@ -28,7 +28,7 @@ class ReviewActionHandler:
     """
 
     def __init__(self):
-        self.db_config = DatabaseConfig()
+        self.db_config = get_async_db()
 
     async def handle_validation_failure(
         self,
@@ -70,7 +70,7 @@ class ReviewActionHandler:
             """
 
             import json
-            result = self.db_config.execute_query(query, (
+            result = await self.db_config.fetch_all(query, (
                 schema_key,
                 str(execution_id),
                 step_number,
@@ -99,7 +99,7 @@ class ReviewActionHandler:
                     }
                 )
 
-                return UUID(feedback_id)
+                return UUID(str(feedback_id))
             else:
                 raise Exception("Failed to create feedback log")
 
@@ -153,7 +153,7 @@ class ReviewActionHandler:
             """
 
             import json
-            result = self.db_config.execute_query(query, (
+            result = await self.db_config.fetch_all(query, (
                 schema_key,
                 str(execution_id),
                 step_number,
@@ -195,7 +195,7 @@ class ReviewActionHandler:
                     schema_key, step_name, fields_modified
                 )
 
-                return UUID(feedback_id)
+                return UUID(str(feedback_id))
             else:
                 raise Exception("Failed to create feedback log")
 
@@ -249,7 +249,7 @@ class ReviewActionHandler:
             """
 
             import json
-            result = self.db_config.execute_query(query, (
+            result = await self.db_config.fetch_all(query, (
                 schema_key,
                 str(execution_id),
                 FeedbackType.HITL_REJECTION.value,
@@ -284,7 +284,7 @@ class ReviewActionHandler:
                     }
                 )
 
-                return UUID(feedback_id)
+                return UUID(str(feedback_id))
             else:
                 raise Exception("Failed to create feedback log")
 
@@ -346,7 +346,7 @@ class ReviewActionHandler:
                     AND created_at >= NOW() - INTERVAL '30 days'
             """
 
-            result = self.db_config.execute_query(query, (
+            result = await self.db_config.fetch_all(query, (
                 schema_key,
                 step_name,
                 fields_modified
@@ -369,7 +369,7 @@ class ReviewActionHandler:
 
                     pattern_category = f"recurring_{step_name}_{'_'.join(fields_modified[:2])}"
 
-                    self.db_config.execute_query(update_query, (
+                    await self.db_config.execute(update_query, (
                         pattern_category,
                         schema_key,
                         step_name,
@@ -393,7 +393,9 @@ class ReviewActionHandler:
     ) -> None:
         """Log action to audit trail."""
         try:
-            self.db_config.log_audit(action, user_id, details)
+            await self.db_config.log_audit(
+                user_id, action, "feedback_log", details.get("feedback_id"), details
+            )
         except Exception as e:
             logger.error(f"Error logging audit: {e}")
 
@@ -420,7 +422,7 @@ class ReviewActionHandler:
                 )
             """
 
-            result = self.db_config.execute_query(query, (schema_key, days))
+            result = await self.db_config.fetch_all(query, (schema_key, days))
 
             if result and len(result) > 0:
                 return result[0]
@@ -458,7 +460,7 @@ class ReviewActionHandler:
                 )
             """
 
-            result = self.db_config.execute_query(query, (limit,))
+            result = await self.db_config.fetch_all(query, (limit,))
             return result if result else []
 
         except Exception as e:
@@ -8,7 +8,7 @@ import logging
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from app.core.database import DatabaseConfig
+from app.core.async_database import get_async_db
 from app.services.embedding_service import EmbeddingService
 
 logger = logging.getLogger(__name__)
@@ -23,7 +23,7 @@ class FeedbackVectorService:
     """
 
     def __init__(self):
-        self.db_config = DatabaseConfig()
+        self.db_config = get_async_db()
         self.embedding_service = EmbeddingService()
 
     async def create_vector_pair(
@@ -94,7 +94,7 @@ class FeedbackVectorService:
             """
 
             from datetime import datetime
-            result = self.db_config.execute_query(query, (
+            result = await self.db_config.fetch_all(query, (
                 str(feedback_id),
                 schema_key,
                 mistake_embedding,
@@ -105,7 +105,7 @@ class FeedbackVectorService:
             ))
 
             if result and len(result) > 0:
-                vector_id = UUID(result[0]['vector_id'])
+                vector_id = UUID(str(result[0]['vector_id']))
 
                 # Mark feedback as processed
                 await self._mark_feedback_processed(feedback_id, vector_id)
@@ -145,7 +145,7 @@ class FeedbackVectorService:
                 )
             """
 
-            feedback_items = self.db_config.execute_query(query, (limit,))
+            feedback_items = await self.db_config.fetch_all(query, (limit,))
 
             if not feedback_items:
                 logger.info("No unprocessed feedback found")
@@ -158,7 +158,7 @@ class FeedbackVectorService:
             for item in feedback_items:
                 try:
                     vector_id = await self.create_vector_pair(
-                        feedback_id=UUID(item['feedback_id']),
+                        feedback_id=UUID(str(item['feedback_id'])),
                         schema_key=item['schema_key'],
                         ai_output=item['ai_output'],
                         human_output=item['human_output'],
@@ -231,7 +231,7 @@ class FeedbackVectorService:
                 LIMIT %s
             """
 
-            results = self.db_config.execute_query(query, (
+            results = await self.db_config.fetch_all(query, (
                 current_embedding,
                 schema_key,
                 current_embedding,
@@ -241,7 +241,7 @@ class FeedbackVectorService:
             if results:
                 # Update retrieval stats
                 for result in results:
-                    await self._update_retrieval_stats(UUID(result['vector_id']))
+                    await self._update_retrieval_stats(UUID(str(result['vector_id'])))
 
                 return results
             else:
@@ -355,7 +355,7 @@ class FeedbackVectorService:
                 )
             """
 
-            self.db_config.execute_query(query, (
+            await self.db_config.execute(query, (
                 str(feedback_id),
                 str(vector_id)
             ))
@@ -377,7 +377,7 @@ class FeedbackVectorService:
                 WHERE vector_id = %s
             """
 
-            self.db_config.execute_query(query, (str(vector_id),))
+            await self.db_config.execute(query, (str(vector_id),))
 
         except Exception as e:
             logger.error(f"Error updating retrieval stats: {e}")
@@ -408,7 +408,7 @@ class FeedbackVectorService:
                 WHERE %s IS NULL OR schema_key = %s
             """
 
-            result = self.db_config.execute_query(query, (schema_key, schema_key))
+            result = await self.db_config.fetch_all(query, (schema_key, schema_key))
 
             if result and len(result) > 0:
                 return result[0]
@@ -18,7 +18,7 @@ import logging
 import re
 import json
 
-from app.core.database import DatabaseConfig
+from app.core.async_database import get_async_db
 from app.schemas.learning.models import (
     CorrectionCreate,
     CorrectionResponse,
@@ -46,7 +46,7 @@ class CorrectionLearner:
     """
 
     def __init__(self):
-        self.db_config = DatabaseConfig()
+        self.db_config = get_async_db()
         self.preference_manager = PreferenceManager()
         self.preference_extractor = PreferenceExtractor()
 
@@ -19,7 +19,7 @@ import logging
 import re
 import json
 
-from app.core.database import DatabaseConfig
+from app.core.async_database import get_async_db
 from app.schemas.learning.models import (
     UserPreferenceResponse,
     PreferenceType,
@@ -43,7 +43,7 @@ class PreferenceManager:
     """
 
     def __init__(self):
-        self.db_config = DatabaseConfig()
+        self.db_config = get_async_db()
 
     async def get_user_preferences(
         self,
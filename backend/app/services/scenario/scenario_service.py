@@ -17,6 +17,8 @@ from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
+from psycopg2.extras import execute_values
+
 from app.core.database import DatabaseConfig
 from app.engines.cost.boq_generator import BOQGenerator, generate_boq_from_design
 from app.engines.cost.cost_estimator import CostEstimator, estimate_costs
@@ -26,6 +28,31 @@ from app.engines.foundation.design_isolated_footing import design_isolated_footi
 
 logger = logging.getLogger(__name__)
 
+BOQ_INSERT_PAGE_SIZE = 500
+
+INSERT_SCENARIO_SQL = """
+INSERT INTO design_scenarios (
+    scenario_id, scenario_name, scenario_type, description,
+    project_id, comparison_group_id, design_variables, design_output,
+    material_quantities, cost_estimation, total_material_cost,
+    total_labor_cost, total_equipment_cost, total_cost,
+    estimated_duration_days, complexity_score, is_baseline,
+    status, created_by, created_at, updated_at
+) VALUES (
+    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW()
+)
+RETURNING id
+"""
+
+INSERT_BOQ_ITEMS_SQL = """
+INSERT INTO boq_items (
+    boq_id, scenario_id, item_number, item_code,
+    item_description, category, quantity, unit,
+    base_rate, complexity_multiplier, regional_multiplier,
+    adjusted_rate, amount, design_parameter, calculation_basis, notes
+) VALUES %s
+"""
+
 
 class ScenarioService:
     """
@@ -152,11 +179,8 @@ class ScenarioService:
             "created_at": datetime.utcnow().isoformat(),
         }
 
-        # Store in database
-        self._store_scenario(scenario_data)
-
-        # Store BOQ items
-        self._store_boq_items(scenario_data["scenario_id"], boq_items)
+        # Store scenario and BOQ items in one transaction
+        self._store_scenario(scenario_data, boq_items)
 
         logger.info(f"Created scenario: {scenario_id} ({scenario_name})")
 
@@ -731,23 +755,82 @@ class ScenarioService:
     # DATABASE OPERATIONS
     # =========================================================================
 
-    def _store_scenario(self, scenario_data: Dict[str, Any]) -> None:
-        """Store scenario in database."""
-        query = """
-        INSERT INTO design_scenarios (
-            id, scenario_id, scenario_name, scenario_type, description,
-            project_id, comparison_group_id, design_variables, design_output,
-            material_quantities, cost_estimation, total_material_cost,
-            total_labor_cost, total_equipment_cost, total_cost,
-            estimated_duration_days, complexity_score, is_baseline,
-            status, created_by, created_at, updated_at
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW()
-        )
+    def _store_scenario(
+        self,
+        scenario_data: Dict[str, Any],
+        boq_items: Optional[List[Dict[str, Any]]] = None
+    ) -> Optional[str]:
         """
+        Store a scenario and its BOQ items in one transaction.
 
-        params = (
-            str(uuid4()),
+        The scenario row is inserted with RETURNING id and the BOQ items follow
+        as multi-row INSERTs on the same connection, with a single commit.
+
+        Returns:
+            UUID of the design_scenarios row, or None if storing failed
+        """
+        try:
+            with self.db.connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(INSERT_SCENARIO_SQL, self._scenario_params(scenario_data))
+                    scenario_uuid = str(cursor.fetchone()[0])
+                    if boq_items:
+                        self._insert_boq_items(cursor, scenario_uuid, boq_items)
+                conn.commit()
+            return scenario_uuid
+        except Exception as e:
+            logger.warning(f"Failed to store scenario in DB: {e}")
+            return None
+
+    def _store_boq_items(self, scenario_id: str, boq_items: List[Dict[str, Any]]) -> None:
+        """Store BOQ items for an already stored scenario."""
+        if not boq_items:
+            return
+        try:
+            with self.db.connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT id FROM design_scenarios WHERE scenario_id = %s",
+                        (scenario_id,)
+                    )
+                    row = cursor.fetchone()
+                    if not row:
+                        return
+                    self._insert_boq_items(cursor, str(row[0]), boq_items)
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"Failed to store BOQ items: {e}")
+
+    @staticmethod
+    def _insert_boq_items(cursor, scenario_uuid: str, boq_items: List[Dict[str, Any]]) -> None:
+        """Insert BOQ items with multi-row INSERTs on an open cursor."""
+        rows = [
+            (
+                item["boq_id"],
+                scenario_uuid,
+                item["item_number"],
+                item["item_code"],
+                item["item_description"],
+                item["category"],
+                item["quantity"],
+                item["unit"],
+                item["base_rate"],
+                item.get("complexity_multiplier", 1.0),
+                item.get("regional_multiplier", 1.0),
+                item["adjusted_rate"],
+                item["amount"],
+                item.get("design_parameter"),
+                item.get("calculation_basis"),
+                item.get("notes"),
+            )
+            for item in boq_items
+        ]
+        execute_values(cursor, INSERT_BOQ_ITEMS_SQL, rows, page_size=BOQ_INSERT_PAGE_SIZE)
+
+    @staticmethod
+    def _scenario_params(scenario_data: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Parameters for INSERT_SCENARIO_SQL."""
+        return (
             scenario_data["scenario_id"],
             scenario_data["scenario_name"],
             scenario_data["scenario_type"],
@@ -769,59 +852,6 @@ class ScenarioService:
             scenario_data["created_by"],
         )
 
-        try:
-            self.db.execute_query_dict(query, params)
-        except Exception as e:
-            logger.warning(f"Failed to store scenario in DB: {e}")
-
-    def _store_boq_items(self, scenario_id: str, boq_items: List[Dict[str, Any]]) -> None:
-        """Store BOQ items in database."""
-        # Get scenario UUID
-        query = "SELECT id FROM design_scenarios WHERE scenario_id = %s"
-        try:
-            result = self.db.execute_query_dict(query, (scenario_id,))
-            if not result:
-                return
-            scenario_uuid = result[0]["id"]
-
-            for item in boq_items:
-                insert_query = """
-                INSERT INTO boq_items (
-                    id, boq_id, scenario_id, item_number, item_code,
-                    item_description, category, quantity, unit,
-                    base_rate, complexity_multiplier, regional_multiplier,
-                    adjusted_rate, amount, design_parameter, calculation_basis,
-                    notes, created_at
-                ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW()
-                )
-                """
-
-                params = (
-                    str(uuid4()),
-                    item["boq_id"],
-                    str(scenario_uuid),
-                    item["item_number"],
-                    item["item_code"],
-                    item["item_description"],
-                    item["category"],
-                    item["quantity"],
-                    item["unit"],
-                    item["base_rate"],
-                    item.get("complexity_multiplier", 1.0),
-                    item.get("regional_multiplier", 1.0),
-                    item["adjusted_rate"],
-                    item["amount"],
-                    item.get("design_parameter"),
-                    item.get("calculation_basis"),
-                    item.get("notes"),
-                )
-
-                self.db.execute_query_dict(insert_query, params)
-
-        except Exception as e:
-            logger.warning(f"Failed to store BOQ items: {e}")
-
     def _store_comparison(self, comparison_data: Dict[str, Any]) -> None:
         """Store comparison result in database."""
         # Simplified storage - in production would store in scenario_comparisons table
@@ -0,0 +1,424 @@
+"""
+CSA AIaaS Platform - Deliverable Schema Cache
+Performance: In-process schema metadata cache
+
+Every workflow execution needs the deliverable schema and, for A/B testing,
+the active variant allocation table. Both change rarely, so they are kept
+in a process-wide TTL/LRU cache and the per-execution metadata round trips
+disappear for hot deliverables.
+
+Features:
+- Parsed DeliverableSchema objects keyed by deliverable_type (entries carry
+  the schema version)
+- Active variant allocation tables keyed by schema_id + schema version
+- TTL bound on staleness, LRU bound on memory
+- Explicit invalidation from the write paths (SchemaService,
+  VersionControlService); a reader that loaded a row before an invalidation
+  cannot put it back afterwards (generation counter)
+- Optional cross-process invalidation via PostgreSQL LISTEN/NOTIFY
+- In-process weighted variant selection (same semantics as
+  csa.select_variant_for_execution)
+
+Cached objects are shared between callers and must be treated as read-only;
+copy them (``model_copy``) before applying per-execution overrides.
+"""
+
+import json
+import logging
+import random
+import select
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+from uuid import UUID
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL NOTIFY channel used for cross-process invalidation
+SCHEMA_CACHE_CHANNEL = "csa_schema_cache"
+
+_SCHEMA = "schema"
+_VARIANTS = "variants"
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+class SchemaCache:
+    """
+    Thread-safe TTL/LRU cache for schema metadata.
+
+    Usage:
+        cache = SchemaCache(ttl_seconds=60, max_entries=256)
+        schema = cache.get_schema("foundation_design")
+        if schema is None:
+            generation = cache.generation  # before reading the database
+            schema = load_from_db(...)
+            cache.put_schema(schema, generation)
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0, max_entries: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Seconds an entry stays valid (0 disables caching)
+            max_entries: Maximum number of cached entries (LRU eviction)
+        """
+        if ttl_seconds < 0 or max_entries < 1:
+            raise ValueError(
+                f"Invalid cache limits: ttl_seconds={ttl_seconds}, max_entries={max_entries}"
+            )
+
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        # key -> (value, expires_at_monotonic)
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Tuple[Any, float]]" = OrderedDict()
+        # Bumped by every invalidation; puts of data read before it are dropped
+        self._generation = 0
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "invalidations": 0,
+            "stale_puts": 0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    @property
+    def generation(self) -> int:
+        """Invalidation counter: read it before loading data to put."""
+        with self._lock:
+            return self._generation
+
+    # =========================================================================
+    # SCHEMAS
+    # =========================================================================
+
+    def get_schema(self, deliverable_type: str):
+        """Get a cached DeliverableSchema, or None on miss/expiry."""
+        return self._get((_SCHEMA, deliverable_type))
+
+    def put_schema(self, schema, generation: Optional[int] = None) -> None:
+        """Cache a DeliverableSchema under its deliverable_type (see _put for generation)."""
+        self._put((_SCHEMA, schema.deliverable_type), schema, generation)
+
+    def invalidate_schema(self, deliverable_type: str) -> None:
+        """Drop a cached schema and every variant table derived from it."""
+        with self._lock:
+            entry = self._entries.pop((_SCHEMA, deliverable_type), None)
+            if entry is not None:
+                self._drop_variants_locked(str(entry[0].id))
+            self._invalidated_locked()
+
+    # =========================================================================
+    # VARIANT ALLOCATION TABLES
+    # =========================================================================
+
+    def get_variants(self, schema_id: UUID, version: int) -> Optional[List[Any]]:
+        """Get the cached active variants for a schema version, or None on miss."""
+        return self._get((_VARIANTS, str(schema_id), version))
+
+    def put_variants(
+        self,
+        schema_id: UUID,
+        version: int,
+        variants: List[Any],
+        generation: Optional[int] = None
+    ) -> None:
+        """Cache the active variants (allocation table) for a schema version."""
+        self._put((_VARIANTS, str(schema_id), version), list(variants), generation)
+
+    def invalidate_variants(self, schema_id: UUID) -> None:
+        """Drop every cached variant table for a schema."""
+        with self._lock:
+            self._drop_variants_locked(str(schema_id))
+            self._invalidated_locked()
+
+    def find_variant(self, variant_id: UUID):
+        """Find a variant by ID in the cached allocation tables."""
+        now = time.monotonic()
+        with self._lock:
+            for key, (value, expires_at) in self._entries.items():
+                if key[0] != _VARIANTS or expires_at <= now:
+                    continue
+                for variant in value:
+                    if variant.id == variant_id:
+                        return variant
+        return None
+
+    # =========================================================================
+    # MAINTENANCE
+    # =========================================================================
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._invalidated_locked()
+
+    def apply_invalidation(self, message: Dict[str, Any]) -> None:
+        """
+        Apply an invalidation message (as published by ``publish_invalidation``).
+
+        Args:
+            message: {"kind": "schema"|"variants"|"all", "key": str}
+        """
+        kind = message.get("kind")
+        key = message.get("key")
+
+        if kind == _SCHEMA and key:
+            self.invalidate_schema(key)
+        elif kind == _VARIANTS and key:
+            self.invalidate_variants(key)
+        else:
+            self.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            size = len(self._entries)
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "size": size,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hit_rate": round(self.stats["hits"] / lookups, 4) if lookups else 0.0,
+        }
+
+    # =========================================================================
+    # INTERNALS
+    # =========================================================================
+
+    def _get(self, key: Tuple[Hashable, ...]) -> Any:
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return value
+
+    def _put(self, key: Tuple[Hashable, ...], value: Any, generation: Optional[int] = None) -> None:
+        """Store an entry, unless an invalidation happened since ``generation`` was read."""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                self.stats["stale_puts"] += 1
+                return
+            self._entries[key] = (value, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def _invalidated_locked(self) -> None:
+        self._generation += 1
+        self.stats["invalidations"] += 1
+
+    def _drop_variants_locked(self, schema_id: str) -> None:
+        stale = [
+            key for key in self._entries
+            if key[0] == _VARIANTS and key[1] == schema_id
+        ]
+        for key in stale:
+            del self._entries[key]
+
+
+# ============================================================================
+# VARIANT SELECTION
+# ============================================================================
+
+def select_weighted_variant(variants: List[Any], rng: Optional[random.Random] = None):
+    """
+    Pick a variant by traffic allocation, in process.
+
+    Mirrors csa.select_variant_for_execution: variants are ordered by
+    variant_key, a number is drawn in [0, 100) and the first variant whose
+    cumulative allocation reaches it wins. If allocations sum to less than
+    100 the remainder goes to the base version (returns None).
+
+    Args:
+        variants: Active variants with ``traffic_allocation`` > 0
+        rng: Optional random source (for deterministic tests)
+
+    Returns:
+        Selected variant, or None for the base version
+    """
+    draw = (rng or random).random() * 100
+    cumulative = 0
+    for variant in sorted(variants, key=lambda v: v.variant_key):
+        cumulative += variant.traffic_allocation
+        if draw <= cumulative:
+            return variant
+    return None
+
+
+# ============================================================================
+# CROSS-PROCESS INVALIDATION (LISTEN/NOTIFY)
+# ============================================================================
+
+def publish_invalidation(db, kind: str, key: Optional[str] = None) -> None:
+    """
+    Notify other processes that cached schema metadata changed.
+
+    No-op unless SCHEMA_CACHE_NOTIFY is enabled. Failures are logged and
+    swallowed: the TTL still bounds staleness.
+
+    Args:
+        db: DatabaseConfig used to send the notification
+        kind: "schema", "variants" or "all"
+        key: deliverable_type (schema) or schema_id (variants)
+    """
+    if not settings.SCHEMA_CACHE_NOTIFY:
+        return
+
+    payload = json.dumps({"kind": kind, "key": key})
+    try:
+        db.execute_query(
+            "SELECT pg_notify(%s, %s);",
+            (SCHEMA_CACHE_CHANNEL, payload),
+            fetch=False
+        )
+    except Exception as e:
+        logger.warning(f"Failed to publish schema cache invalidation: {e}")
+
+
+class SchemaCacheListener:
+    """
+    Background thread that LISTENs for invalidations from other processes.
+
+    Uses a dedicated (non-pooled) autocommit connection because LISTEN
+    registrations are tied to the session.
+    """
+
+    POLL_INTERVAL_SECONDS = 5.0
+
+    def __init__(self, connection_string: str, cache: SchemaCache):
+        self.connection_string = connection_string
+        self.cache = cache
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run,
+            name="schema-cache-listener",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        from app.core.database import _build_connection_params, _connect_with_retry
+
+        while not self._stop.is_set():
+            conn = None
+            try:
+                conn = _connect_with_retry(_build_connection_params(self.connection_string))
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    cursor.execute(f"LISTEN {SCHEMA_CACHE_CHANNEL};")
+
+                # Anything may have changed while we were not listening
+                self.cache.clear()
+
+                while not self._stop.is_set():
+                    readable, _, _ = select.select([conn], [], [], self.POLL_INTERVAL_SECONDS)
+                    if not readable:
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        notify = conn.notifies.pop(0)
+                        try:
+                            self.cache.apply_invalidation(json.loads(notify.payload))
+                        except (ValueError, TypeError):
+                            self.cache.clear()
+            except Exception as e:
+                logger.warning(f"Schema cache listener error, reconnecting: {e}")
+                self._stop.wait(self.POLL_INTERVAL_SECONDS)
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+
+# ============================================================================
+# GLOBAL INSTANCE
+# ============================================================================
+
+_global_schema_cache: Optional[SchemaCache] = None
+_global_listener: Optional[SchemaCacheListener] = None
+
+
+def get_schema_cache() -> SchemaCache:
+    """
+    Get global schema cache instance
+
+    Returns:
+        SchemaCache singleton
+    """
+    global _global_schema_cache
+    if _global_schema_cache is None:
+        _global_schema_cache = SchemaCache(
+            ttl_seconds=settings.SCHEMA_CACHE_TTL_SECONDS,
+            max_entries=settings.SCHEMA_CACHE_MAX_ENTRIES,
+        )
+    return _global_schema_cache
+
+
+def start_schema_cache_listener() -> bool:
+    """
+    Start the LISTEN/NOTIFY invalidation listener if enabled.
+
+    Returns:
+        True if a listener is running
+    """
+    global _global_listener
+    if not settings.SCHEMA_CACHE_NOTIFY or not settings.DATABASE_URL:
+        return False
+    if _global_listener is None:
+        _global_listener = SchemaCacheListener(settings.DATABASE_URL, get_schema_cache())
+        _global_listener.start()
+    return True
+
+
+def stop_schema_cache_listener() -> None:
+    """Stop the invalidation listener if it was started."""
+    global _global_listener
+    if _global_listener is not None:
+        _global_listener.stop()
+        _global_listener = None
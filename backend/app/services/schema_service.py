@@ -10,8 +10,11 @@ Key Features:
 - Create new schema with validation
 - Update existing schema with versioning
 - List schemas with filtering
-- Schema validation before insertion
+- Schema validation before insertion (input/output JSON Schemas checked
+  against the Draft 7 meta-schema here, not on every execution)
 - Automatic version management
+- In-process schema cache (see app/services/schema_cache.py), invalidated
+  on every write
 """
 
 from typing import Dict, Any, List, Optional
@@ -29,6 +32,8 @@ from app.schemas.workflow.schema_models import (
     RiskConfig
 )
 from app.core.database import DatabaseConfig
+from app.execution.validation_engine import check_json_schema
+from app.services.schema_cache import get_schema_cache, publish_invalidation
 from pydantic import ValidationError
 
 
@@ -42,6 +47,7 @@ class SchemaService:
     def __init__(self):
         """Initialize service with database connection."""
         self.db = DatabaseConfig()
+        self.cache = get_schema_cache()
 
     # ========================================================================
     # CREATE
@@ -63,7 +69,8 @@ class SchemaService:
             Created schema with ID and timestamps
 
         Raises:
-            ValueError: If schema with same deliverable_type already exists
+            ValueError: If schema with same deliverable_type already exists,
+                        or its input/output schema is not valid JSON Schema
             ValidationError: If schema validation fails
 
         Example:
@@ -77,8 +84,12 @@ class SchemaService:
             ... )
             >>> schema = schema_service.create_schema(schema_data, "user123")
         """
+        check_json_schema(schema_data.input_schema, "input_schema")
+        if schema_data.output_schema is not None:
+            check_json_schema(schema_data.output_schema, "output_schema")
+
         # Check if schema already exists
-        existing = self.get_schema(schema_data.deliverable_type)
+        existing = self.get_schema(schema_data.deliverable_type, use_cache=False)
         if existing:
             raise ValueError(
                 f"Schema with deliverable_type '{schema_data.deliverable_type}' already exists"
@@ -161,12 +172,20 @@ class SchemaService:
     # READ
     # ========================================================================
 
-    def get_schema(self, deliverable_type: str) -> Optional[DeliverableSchema]:
+    def get_schema(
+        self,
+        deliverable_type: str,
+        use_cache: bool = True
+    ) -> Optional[DeliverableSchema]:
         """
         Get schema by deliverable_type.
 
+        Served from the in-process schema cache when possible. The returned
+        object may be shared with other callers and must not be mutated.
+
         Args:
             deliverable_type: Unique identifier (e.g., "foundation_design")
+            use_cache: Set False to always read the database (write paths)
 
         Returns:
             Schema if found, None otherwise
@@ -176,6 +195,12 @@ class SchemaService:
             >>> if schema:
             ...     print(f"Found schema: {schema.display_name}")
         """
+        if use_cache:
+            cached = self.cache.get_schema(deliverable_type)
+            if cached is not None:
+                return cached
+        generation = self.cache.generation
+
         query = """
             SELECT * FROM csa.deliverable_schemas
             WHERE deliverable_type = %s;
@@ -186,7 +211,9 @@ class SchemaService:
         if not result:
             return None
 
-        return self._dict_to_schema(result[0])
+        schema = self._dict_to_schema(result[0])
+        self.cache.put_schema(schema, generation)
+        return schema
 
     def get_schema_by_id(self, schema_id: UUID) -> Optional[DeliverableSchema]:
         """
@@ -285,7 +312,8 @@ class SchemaService:
             Updated schema
 
         Raises:
-            ValueError: If schema not found
+            ValueError: If schema not found, or an updated input/output
+                        schema is not valid JSON Schema
 
         Example:
             >>> updates = DeliverableSchemaUpdate(
@@ -299,8 +327,13 @@ class SchemaService:
             ...     "Lowered auto-approve threshold for testing"
             ... )
         """
-        # Get existing schema
-        existing = self.get_schema(deliverable_type)
+        if updates.input_schema is not None:
+            check_json_schema(updates.input_schema, "input_schema")
+        if updates.output_schema is not None:
+            check_json_schema(updates.output_schema, "output_schema")
+
+        # Get existing schema (bypass the cache: the version must be current)
+        existing = self.get_schema(deliverable_type, use_cache=False)
         if not existing:
             raise ValueError(f"Schema '{deliverable_type}' not found")
 
@@ -376,6 +409,7 @@ class SchemaService:
             raise RuntimeError("Failed to update schema")
 
         updated_schema = self._row_to_schema(result[0])
+        self._invalidate_cache(deliverable_type)
 
         # Create version record
         self._create_version_record(
@@ -430,6 +464,7 @@ class SchemaService:
         """
 
         self.db.execute_query(query, (datetime.utcnow(), deleted_by, deliverable_type))
+        self._invalidate_cache(deliverable_type)
 
         # Log audit
         self.db.log_audit(
@@ -573,6 +608,11 @@ class SchemaService:
     # HELPER FUNCTIONS
     # ========================================================================
 
+    def _invalidate_cache(self, deliverable_type: str) -> None:
+        """Drop cached metadata for a schema here and in other processes."""
+        self.cache.invalidate_schema(deliverable_type)
+        publish_invalidation(self.db, "schema", deliverable_type)
+
     def _row_to_schema(self, row) -> DeliverableSchema:
         """Convert database row to DeliverableSchema object."""
         return DeliverableSchema(
@@ -5,6 +5,7 @@ Provides functionality for:
 - Managing cost catalogs and items
 - Regional cost adjustments
 - Semantic search for cost data
+- Batched BOQ rate resolution from an in-memory rate index
 - Cost versioning and audit trail
 """
 
@@ -32,6 +33,13 @@ from app.schemas.skg.cost_models import (
     RegionalFactor,
     RegionalFactorCreate,
 )
+from app.services.skg.rate_index import (
+    RateIndex,
+    RateKey,
+    ResolvedRate,
+    build_rate_index,
+    get_rate_index_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -277,6 +285,7 @@ class CostDatabaseService:
 
         result = self.db.execute_query_dict(query, params)
         item = CostItem(**result[0])
+        self.invalidate_rate_index()
 
         # Generate embedding for semantic search
         if generate_embedding:
@@ -475,6 +484,7 @@ class CostDatabaseService:
 
         if result:
             updated_item = CostItem(**result[0])
+            self.invalidate_rate_index()
 
             # Update embedding
             self._create_cost_embedding(updated_item)
@@ -565,6 +575,7 @@ class CostDatabaseService:
         )
 
         result = self.db.execute_query_dict(query, params)
+        self.invalidate_rate_index()
 
         self.db.log_audit(
             user_id=created_by,
@@ -661,17 +672,23 @@ class CostDatabaseService:
 
         result = self.db.execute_query_dict(query, params)
 
-        # Apply regional adjustment if requested
+        # Apply regional adjustment if requested (from the rate index rather
+        # than one get_regional_cost() round trip per row)
+        rate_index = self.get_rate_index() if request.region_code and result else None
         search_results = []
         for row in result:
             adjusted_cost = None
-            if request.region_code:
-                regional = self.get_regional_cost(
-                    UUID(row["cost_item_id"]),
-                    request.region_code
-                )
-                if regional:
-                    adjusted_cost = regional.adjusted_cost
+            if rate_index is not None:
+                rate = rate_index.item_rate(row["cost_item_id"], request.region_code)
+                if rate is not None:
+                    adjusted_cost = rate.adjusted_cost
+                else:
+                    regional = self.get_regional_cost(
+                        UUID(str(row["cost_item_id"])),
+                        request.region_code
+                    )
+                    if regional:
+                        adjusted_cost = regional.adjusted_cost
 
             search_results.append(CostSearchResult(
                 cost_item_id=UUID(row["cost_item_id"]),
@@ -697,6 +714,81 @@ class CostDatabaseService:
 
         return search_results
 
+    # =========================================================================
+    # RATE RESOLUTION
+    # =========================================================================
+
+    def get_rate_index(self) -> RateIndex:
+        """Get the shared in-memory rate index, loading it if missing or stale."""
+        return get_rate_index_cache().get(lambda: build_rate_index(self.db))
+
+    def invalidate_rate_index(self) -> None:
+        """Drop the shared rate index after a catalog write."""
+        get_rate_index_cache().invalidate()
+
+    def resolve_rates(
+        self,
+        keys: List[Tuple[str, Optional[str], Optional[str], Optional[str]]],
+        semantic_fallback: bool = True
+    ) -> Dict[RateKey, Optional[ResolvedRate]]:
+        """
+        Resolve many (category, sub_category, grade, region_code) keys in one pass.
+
+        Exact catalog matches come from the in-memory rate index. Only keys the
+        index cannot match go to semantic search, once per key per index load.
+
+        Args:
+            keys: Rate keys (RateKey or plain 4-tuples)
+            semantic_fallback: Search unmatched keys semantically
+
+        Returns:
+            Mapping of RateKey -> ResolvedRate (None if nothing matched)
+        """
+        index = self.get_rate_index()
+        resolved = index.resolve_many(keys)
+
+        if semantic_fallback:
+            for key, rate in resolved.items():
+                if rate is None and not index.searched(key):
+                    resolved[key] = self._semantic_rate(key, index)
+
+        return resolved
+
+    def _semantic_rate(self, key: RateKey, index: RateIndex) -> Optional[ResolvedRate]:
+        """Semantic search for a key the catalogs cannot match exactly."""
+        query = " ".join(part for part in (key.category, key.sub_category, key.grade) if part)
+        try:
+            category = CostCategory(key.category)
+        except ValueError:
+            category = None
+
+        rate = None
+        try:
+            results = self.search_costs(
+                CostSearchRequest(query=query, category=category, limit=1),
+                "system"
+            )
+            if results:
+                match = results[0]
+                rate = index.item_rate(match.cost_item_id, key.region_code, match="semantic")
+                if rate is None:
+                    rate = ResolvedRate(
+                        cost_item_id=str(match.cost_item_id),
+                        item_code=match.item_code,
+                        item_name=match.item_name,
+                        unit=match.unit,
+                        base_cost=match.base_cost,
+                        adjustment_factor=Decimal("1"),
+                        adjusted_cost=match.base_cost,
+                        match="semantic",
+                    )
+        except Exception as e:
+            logger.warning(f"Semantic rate search failed for {query!r}: {e}")
+            return None
+
+        index.remember_semantic(key, rate)
+        return rate
+
     # =========================================================================
     # BULK IMPORT
     # =========================================================================
@@ -0,0 +1,407 @@
+"""
+CSA AIaaS Platform - SKG Graph Index
+Performance: In-memory adjacency index for knowledge graph traversal
+
+find_paths used to run a list-based BFS that issued two SQL queries per
+visited node (outgoing and incoming neighbors) plus one name lookup per path
+node. This module loads knowledge_relationships once into a compact CSR
+(compressed sparse row) structure and answers traversals from memory.
+
+Features:
+- One query loads every relationship; entities interned to integer node ids
+- CSR offsets/edge arrays for outgoing and incoming edges, strongest first
+- Incremental refresh on create/delete: new edges go to per-node delta lists
+  and removed edges to a tombstone set, folded into the CSR on compaction
+- Path search, related entities and k-hop neighborhoods answered in memory,
+  returning resolved edges and entities (compaction renumbers edge numbers)
+- Process-wide IndexCache (index_cache.py); KnowledgeRelationshipService
+  applies its own writes in place
+"""
+
+import threading
+from array import array
+from collections import deque
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+from uuid import UUID
+
+from app.core.config import settings
+from app.schemas.skg.relationship_models import KnowledgeEntityType, RelationshipType
+from app.services.skg.index_cache import IndexCache
+
+GRAPH_INDEX_SQL = """
+SELECT id, source_type, source_id, target_type, target_id, relationship_type, strength
+FROM knowledge_relationships
+"""
+
+# Fold the delta lists into the CSR once they reach this share of the edges
+COMPACTION_RATIO = 0.25
+MIN_COMPACTION_DELTA = 256
+
+_RELATIONSHIP_TYPES: List[RelationshipType] = list(RelationshipType)
+_RELATIONSHIP_TYPE_CODES: Dict[RelationshipType, int] = {
+    rel_type: code for code, rel_type in enumerate(_RELATIONSHIP_TYPES)
+}
+
+Entity = Tuple[KnowledgeEntityType, UUID]
+
+
+class GraphEdge(NamedTuple):
+    """A relationship resolved from the index (safe to use after compaction)."""
+    relationship_id: str
+    source: Entity
+    target: Entity
+    relationship_type: RelationshipType
+    strength: Decimal
+
+
+PathEdges = Tuple[Tuple[GraphEdge, str], ...]
+
+
+# ============================================================================
+# GRAPH INDEX
+# ============================================================================
+
+class GraphIndex:
+    """
+    Adjacency index over knowledge_relationships.
+
+    Edges live in parallel arrays (source, target, type code, strength). The
+    CSR arrays list edge numbers grouped by source node (outgoing) and by
+    target node (incoming); edges added since the last compaction are kept in
+    per-node delta lists.
+    """
+
+    def __init__(self, rows: Iterable[Dict[str, Any]]):
+        self._lock = threading.RLock()
+
+        self._node_ids: Dict[Tuple[str, str], int] = {}
+        self._nodes: List[Entity] = []
+
+        self._relationship_ids: List[str] = []
+        self._edge_numbers: Dict[str, int] = {}
+        self._sources = array("i")
+        self._targets = array("i")
+        self._types = array("b")
+        self._strengths = array("d")
+
+        self._removed: Set[int] = set()
+        self._delta_out: Dict[int, List[int]] = {}
+        self._delta_in: Dict[int, List[int]] = {}
+        self._delta_count = 0
+
+        for row in rows:
+            self._append_edge(row)
+        self._compact()
+
+    def __len__(self) -> int:
+        return len(self._edge_numbers)
+
+    @property
+    def node_count(self) -> int:
+        return len(self._nodes)
+
+    # ------------------------------------------------------------------------
+    # Nodes and edges
+    # ------------------------------------------------------------------------
+
+    def node_id(self, entity_type: KnowledgeEntityType, entity_id: UUID) -> Optional[int]:
+        """Integer id of an entity, or None if it has no relationships."""
+        return self._node_ids.get((KnowledgeEntityType(entity_type).value, str(entity_id)))
+
+    def node(self, node: int) -> Entity:
+        """(entity_type, entity_id) of an integer node id (node ids are never renumbered)."""
+        return self._nodes[node]
+
+    def edge(self, edge: int) -> GraphEdge:
+        """
+        Resolve an edge number; call with the lock held.
+
+        Edge numbers are renumbered by compaction, so traversals resolve them
+        before releasing the lock and only GraphEdge values leave the index.
+        """
+        return GraphEdge(
+            relationship_id=self._relationship_ids[edge],
+            source=self._nodes[self._sources[edge]],
+            target=self._nodes[self._targets[edge]],
+            relationship_type=_RELATIONSHIP_TYPES[self._types[edge]],
+            strength=Decimal(str(self._strengths[edge])),
+        )
+
+    def _intern(self, entity_type: Any, entity_id: Any) -> int:
+        key = (KnowledgeEntityType(entity_type).value, str(entity_id))
+        node = self._node_ids.get(key)
+        if node is None:
+            node = len(self._nodes)
+            self._node_ids[key] = node
+            self._nodes.append((KnowledgeEntityType(entity_type), UUID(str(entity_id))))
+        return node
+
+    def _append_edge(self, row: Dict[str, Any]) -> int:
+        relationship_id = str(row["id"])
+        edge = len(self._relationship_ids)
+        self._relationship_ids.append(relationship_id)
+        self._edge_numbers[relationship_id] = edge
+        self._sources.append(self._intern(row["source_type"], row["source_id"]))
+        self._targets.append(self._intern(row["target_type"], row["target_id"]))
+        self._types.append(_RELATIONSHIP_TYPE_CODES[RelationshipType(row["relationship_type"])])
+        self._strengths.append(float(row["strength"]) if row.get("strength") is not None else 0.5)
+        return edge
+
+    # ------------------------------------------------------------------------
+    # Incremental refresh
+    # ------------------------------------------------------------------------
+
+    def add_relationship(self, row: Dict[str, Any]) -> None:
+        """Add a created relationship row (ignored if already indexed)."""
+        with self._lock:
+            if str(row["id"]) in self._edge_numbers:
+                return
+            edge = self._append_edge(row)
+            self._delta_out.setdefault(self._sources[edge], []).append(edge)
+            self._delta_in.setdefault(self._targets[edge], []).append(edge)
+            self._note_delta()
+
+    def remove_relationship(self, relationship_id: Any) -> None:
+        """Drop a deleted relationship (ignored if not indexed)."""
+        with self._lock:
+            edge = self._edge_numbers.pop(str(relationship_id), None)
+            if edge is None:
+                return
+            self._removed.add(edge)
+            self._note_delta()
+
+    def _note_delta(self) -> None:
+        self._delta_count += 1
+        if self._delta_count >= max(MIN_COMPACTION_DELTA, len(self._edge_numbers) * COMPACTION_RATIO):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rebuild the edge arrays and CSR from the live edges."""
+        with self._lock:
+            if self._removed:
+                live = [edge for edge in range(len(self._relationship_ids)) if edge not in self._removed]
+                self._relationship_ids = [self._relationship_ids[edge] for edge in live]
+                self._sources = array("i", (self._sources[edge] for edge in live))
+                self._targets = array("i", (self._targets[edge] for edge in live))
+                self._types = array("b", (self._types[edge] for edge in live))
+                self._strengths = array("d", (self._strengths[edge] for edge in live))
+                self._edge_numbers = {rid: edge for edge, rid in enumerate(self._relationship_ids)}
+                self._removed = set()
+
+            # Strongest edges first, so per-node scans come out pre-sorted
+            order = sorted(range(len(self._relationship_ids)), key=lambda edge: -self._strengths[edge])
+            self._out_offsets, self._out_edges = self._build_csr(order, self._sources)
+            self._in_offsets, self._in_edges = self._build_csr(order, self._targets)
+            self._delta_out = {}
+            self._delta_in = {}
+            self._delta_count = 0
+
+    def _build_csr(self, order: List[int], endpoints: array) -> Tuple[array, array]:
+        node_count = len(self._nodes)
+        offsets = array("i", bytes(4 * (node_count + 1)))
+        for edge in order:
+            offsets[endpoints[edge] + 1] += 1
+        for node in range(node_count):
+            offsets[node + 1] += offsets[node]
+
+        edges = array("i", bytes(4 * len(order)))
+        cursor = array("i", offsets[:-1])
+        for edge in order:
+            node = endpoints[edge]
+            edges[cursor[node]] = edge
+            cursor[node] += 1
+        return offsets, edges
+
+    # ------------------------------------------------------------------------
+    # Adjacency
+    # ------------------------------------------------------------------------
+
+    def _scan(self, node: int, offsets: array, edges: array, delta: Dict[int, List[int]]) -> Iterator[int]:
+        if node + 1 < len(offsets):
+            for position in range(offsets[node], offsets[node + 1]):
+                edge = edges[position]
+                if edge not in self._removed:
+                    yield edge
+        for edge in delta.get(node, ()):
+            if edge not in self._removed:
+                yield edge
+
+    def _outgoing(self, node: int, type_codes: Optional[Set[int]]) -> Iterator[int]:
+        for edge in self._scan(node, self._out_offsets, self._out_edges, self._delta_out):
+            if type_codes is None or self._types[edge] in type_codes:
+                yield edge
+
+    def _incoming(self, node: int, type_codes: Optional[Set[int]]) -> Iterator[int]:
+        for edge in self._scan(node, self._in_offsets, self._in_edges, self._delta_in):
+            if type_codes is None or self._types[edge] in type_codes:
+                yield edge
+
+    def _neighbors(self, node: int, type_codes: Optional[Set[int]]) -> Iterator[Tuple[int, int, str]]:
+        """(neighbor, edge, direction) over outgoing ("forward") then incoming ("reverse") edges."""
+        for edge in self._outgoing(node, type_codes):
+            yield self._targets[edge], edge, "forward"
+        for edge in self._incoming(node, type_codes):
+            yield self._sources[edge], edge, "reverse"
+
+    @staticmethod
+    def _type_codes(relationship_types: Optional[Iterable[RelationshipType]]) -> Optional[Set[int]]:
+        if not relationship_types:
+            return None
+        return {_RELATIONSHIP_TYPE_CODES[RelationshipType(rel_type)] for rel_type in relationship_types}
+
+    # ------------------------------------------------------------------------
+    # Traversals
+    # ------------------------------------------------------------------------
+
+    def find_paths(
+        self,
+        start: Entity,
+        end: Entity,
+        max_depth: int,
+        relationship_types: Optional[List[RelationshipType]] = None,
+        max_paths: int = 10
+    ) -> List[Tuple[Tuple[Entity, ...], PathEdges]]:
+        """
+        Breadth-first path search without repeated nodes.
+
+        Returns:
+            Up to ``max_paths`` (entities, ((GraphEdge, direction), ...))
+            pairs, shortest first
+        """
+        type_codes = self._type_codes(relationship_types)
+        with self._lock:
+            source = self.node_id(*start)
+            target = self.node_id(*end)
+            if source is None or target is None:
+                return []
+
+            paths: List[Tuple[Tuple[int, ...], Tuple[Tuple[int, str], ...]]] = []
+            visited: Set[Tuple[int, int]] = set()
+            queue = deque([((source,), ())])
+
+            while queue and len(paths) < max_paths:
+                nodes, edges = queue.popleft()
+                current = nodes[-1]
+
+                if current == target:
+                    if len(nodes) > 1:
+                        paths.append((nodes, edges))
+                    continue
+
+                visit_key = (current, len(nodes))
+                if visit_key in visited or len(nodes) > max_depth:
+                    continue
+                visited.add(visit_key)
+
+                for neighbor, edge, direction in self._neighbors(current, type_codes):
+                    if neighbor not in nodes:
+                        queue.append((nodes + (neighbor,), edges + ((edge, direction),)))
+
+            return [
+                (
+                    tuple(self._nodes[node] for node in nodes),
+                    tuple((self.edge(edge), direction) for edge, direction in edges),
+                )
+                for nodes, edges in paths
+            ]
+
+    def related(
+        self,
+        entity: Entity,
+        relationship_types: Optional[List[RelationshipType]] = None,
+        entity_types: Optional[List[KnowledgeEntityType]] = None,
+        min_strength: float = 0.0,
+        include_reverse: bool = True,
+        limit: int = 20
+    ) -> List[Tuple[Entity, GraphEdge, str]]:
+        """
+        Direct neighbors of an entity, strongest first per direction.
+
+        Returns:
+            (neighbor, GraphEdge, "outgoing" | "incoming") triples, at most
+            ``limit`` per direction
+        """
+        type_codes = self._type_codes(relationship_types)
+        allowed_types = {KnowledgeEntityType(t) for t in entity_types} if entity_types else None
+
+        def collect(edges: Iterator[int], endpoints: array, direction: str) -> List[Tuple[int, int, str]]:
+            found = []
+            for edge in edges:
+                neighbor = endpoints[edge]
+                if self._strengths[edge] < min_strength:
+                    continue
+                if allowed_types is not None and self._nodes[neighbor][0] not in allowed_types:
+                    continue
+                found.append((neighbor, edge, direction))
+            found.sort(key=lambda item: -self._strengths[item[1]])
+            return found[:limit]
+
+        with self._lock:
+            node = self.node_id(*entity)
+            if node is None:
+                return []
+            related = collect(self._outgoing(node, type_codes), self._targets, "outgoing")
+            if include_reverse:
+                related += collect(self._incoming(node, type_codes), self._sources, "incoming")
+            return [(self._nodes[neighbor], self.edge(edge), direction) for neighbor, edge, direction in related]
+
+    def neighborhood(
+        self,
+        entity: Entity,
+        hops: int,
+        relationship_types: Optional[List[RelationshipType]] = None
+    ) -> Dict[Entity, int]:
+        """
+        Entities within ``hops`` edges of an entity (either direction).
+
+        Returns:
+            Mapping of entity -> hop distance (the entity itself excluded),
+            nearest first
+        """
+        type_codes = self._type_codes(relationship_types)
+        with self._lock:
+            start = self.node_id(*entity)
+            if start is None:
+                return {}
+
+            distances = {start: 0}
+            frontier = [start]
+            for hop in range(1, hops + 1):
+                next_frontier = []
+                for node in frontier:
+                    for neighbor, _, _ in self._neighbors(node, type_codes):
+                        if neighbor not in distances:
+                            distances[neighbor] = hop
+                            next_frontier.append(neighbor)
+                if not next_frontier:
+                    break
+                frontier = next_frontier
+
+            del distances[start]
+            return {self._nodes[node]: distance for node, distance in distances.items()}
+
+
+# ============================================================================
+# PROCESS-WIDE CACHE
+# ============================================================================
+
+_global_graph_index_cache: Optional[IndexCache[GraphIndex]] = None
+_global_lock = threading.Lock()
+
+
+def get_graph_index_cache() -> IndexCache[GraphIndex]:
+    """Get the process-wide graph index cache."""
+    global _global_graph_index_cache
+    with _global_lock:
+        if _global_graph_index_cache is None:
+            _global_graph_index_cache = IndexCache(
+                "SKG graph index", "relationships", ttl_seconds=settings.SKG_GRAPH_INDEX_TTL_SECONDS
+            )
+    return _global_graph_index_cache
+
+
+def build_graph_index(db: Any) -> GraphIndex:
+    """Load every relationship with one query."""
+    rows: List[Dict[str, Any]] = db.execute_query_dict(GRAPH_INDEX_SQL) or []
+    return GraphIndex(rows)
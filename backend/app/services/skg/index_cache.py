@@ -0,0 +1,91 @@
+"""
+CSA AIaaS Platform - SKG Index Cache
+Performance: Process-wide TTL cache for in-memory SKG indexes
+
+The rate index, graph index and compiled rule set each load a whole SKG
+table into memory and answer lookups from it. IndexCache holds the current
+instance of one such index for the process.
+
+Features:
+- Loader called under the lock, so concurrent requests never load twice
+- Reload after the TTL (bounds staleness across worker processes) or an
+  explicit invalidation by the owning service on writes
+- In-place updates of the loaded index (apply) for services that keep it
+  current instead of invalidating
+- Hit/load/update/invalidation counters
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Generic, Optional, Sized, TypeVar
+
+logger = logging.getLogger(__name__)
+
+IndexT = TypeVar("IndexT", bound=Sized)
+
+
+class IndexCache(Generic[IndexT]):
+    """
+    Holds the current index; reloads after the TTL or an invalidation.
+
+    Usage:
+        cache = IndexCache("SKG rate index", "items", ttl_seconds=300)
+        index = cache.get(lambda: build_rate_index(db))
+    """
+
+    def __init__(self, name: str, size_label: str, ttl_seconds: float = 300.0):
+        """
+        Initialize the cache.
+
+        Args:
+            name: Index name used in log messages
+            size_label: What len(index) counts (also its key in get_stats())
+            ttl_seconds: Reload an index older than this
+        """
+        self.name = name
+        self.size_label = size_label
+        self.ttl_seconds = ttl_seconds
+        self._index: Optional[IndexT] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "loads": 0, "updates": 0, "invalidations": 0}
+
+    def get(self, loader: Callable[[], IndexT]) -> IndexT:
+        """Return the cached index, loading it with ``loader`` when missing or stale."""
+        with self._lock:
+            index = self._index
+            if index is not None and time.time() - self._loaded_at < self.ttl_seconds:
+                self.stats["hits"] += 1
+                return index
+
+            index = loader()
+            self._index = index
+            self._loaded_at = time.time()
+            self.stats["loads"] += 1
+            logger.info("Loaded %s: %d %s", self.name, len(index), self.size_label)
+            return index
+
+    def apply(self, update: Callable[[IndexT], None]) -> None:
+        """Apply a write to the cached index in place (no-op when nothing is loaded)."""
+        with self._lock:
+            index = self._index
+            if index is None:
+                return
+            self.stats["updates"] += 1
+        update(index)
+
+    def invalidate(self) -> None:
+        """Drop the cached index; the next lookup reloads it."""
+        with self._lock:
+            self._index = None
+            self.stats["invalidations"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                "loaded": self._index is not None,
+                self.size_label: len(self._index) if self._index is not None else 0,
+                "ttl_seconds": self.ttl_seconds,
+            }
@@ -0,0 +1,255 @@
+"""
+CSA AIaaS Platform - SKG Rate Index
+Performance: In-memory rate table for N+1-free BOQ rate resolution
+
+BOQ generation used to run one semantic cost search per line (an embedding
+API call plus a pgvector query), and each search result then cost another
+get_regional_cost() round trip. This module loads the active cost items and
+regional factors once and answers rate lookups from memory.
+
+Features:
+- Two queries load the whole rate table (cost_items + regional_cost_factors)
+- Exact (category, sub_category, grade) lookups, then (category, grade) or
+  (category, sub_category) matches; a grade is never matched to another grade
+- Regional factors applied in memory, category-specific factor preferred over
+  the all-categories (NULL) factor
+- Semantic-search fallbacks remembered per index, so an unmatched key is
+  searched at most once per load
+- Process-wide IndexCache (index_cache.py); CostDatabaseService invalidates
+  it on every catalog write
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from app.core.config import settings
+from app.services.skg.index_cache import IndexCache
+
+RATE_INDEX_ITEMS_SQL = """
+SELECT id, catalog_id, item_code, item_name, category, sub_category, unit,
+       base_cost, specifications, confidence, updated_at
+FROM cost_items
+WHERE is_active = true
+"""
+
+RATE_INDEX_FACTORS_SQL = """
+SELECT catalog_id, region_code, category, adjustment_factor
+FROM regional_cost_factors
+WHERE is_active = true
+"""
+
+_GRADE_SPEC_KEYS = ("grade", "concrete_grade", "steel_grade")
+_GRADE_PATTERN = re.compile(r"(?<![A-Za-z0-9])(M\d{2,3}|Fe\s?\d{3}D?)(?![A-Za-z0-9])", re.IGNORECASE)
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+# ============================================================================
+# KEYS AND RESULTS
+# ============================================================================
+
+class RateKey(NamedTuple):
+    """A BOQ rate request. Plain 4-tuples in the same order are accepted too."""
+    category: str
+    sub_category: Optional[str] = None
+    grade: Optional[str] = None
+    region_code: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ResolvedRate:
+    """A rate resolved from the cost catalogs."""
+    cost_item_id: Optional[str]
+    item_code: Optional[str]
+    item_name: Optional[str]
+    unit: Optional[str]
+    base_cost: Decimal
+    adjustment_factor: Decimal
+    adjusted_cost: Decimal
+    match: str  # exact | grade | sub_category | semantic
+
+
+def normalize_token(value: Optional[Any]) -> str:
+    """Lower-case a key part and collapse separators ("Beam Sides" -> "beam_sides")."""
+    if value is None:
+        return ""
+    return _NON_WORD.sub("_", str(value).lower()).strip("_")
+
+
+def _item_grade(row: Dict[str, Any]) -> str:
+    """Grade from the item specifications, else from a grade token in its code/name."""
+    specifications = row.get("specifications") or {}
+    if isinstance(specifications, dict):
+        for key in _GRADE_SPEC_KEYS:
+            if specifications.get(key):
+                return normalize_token(specifications[key])
+
+    for text in (row.get("item_code"), row.get("item_name")):
+        match = _GRADE_PATTERN.search(text or "")
+        if match:
+            return normalize_token(match.group(1))
+    return ""
+
+
+def _rank(row: Dict[str, Any]) -> Tuple[float, str]:
+    """Preference among rows competing for one key: confidence, then recency."""
+    return float(row.get("confidence") or 0), str(row.get("updated_at") or "")
+
+
+# ============================================================================
+# RATE INDEX
+# ============================================================================
+
+class RateIndex:
+    """
+    Immutable lookup tables over the active cost catalogs.
+
+    Usage:
+        index = RateIndex(item_rows, factor_rows)
+        rates = index.resolve_many([("concrete", "rcc", "M25", "IN-MH")])
+    """
+
+    def __init__(self, items: Iterable[Dict[str, Any]], factors: Iterable[Dict[str, Any]]):
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._exact: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        self._by_grade: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._by_sub_category: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._factors: Dict[Tuple[str, str, str], Decimal] = {}
+
+        for row in items:
+            category = normalize_token(row.get("category"))
+            sub_category = normalize_token(row.get("sub_category"))
+            grade = _item_grade(row)
+
+            self._by_id[str(row["id"])] = row
+            self._keep_best(self._exact, (category, sub_category, grade), row)
+            if grade:
+                self._keep_best(self._by_grade, (category, grade), row)
+            if sub_category:
+                self._keep_best(self._by_sub_category, (category, sub_category), row)
+
+        for row in factors:
+            key = (str(row["catalog_id"]), row["region_code"], normalize_token(row.get("category")))
+            self._factors[key] = Decimal(str(row["adjustment_factor"]))
+
+        self._semantic: Dict[RateKey, Optional[ResolvedRate]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _keep_best(table: Dict[Any, Dict[str, Any]], key: Any, row: Dict[str, Any]) -> None:
+        current = table.get(key)
+        if current is None or _rank(row) > _rank(current):
+            table[key] = row
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def regional_factor(self, catalog_id: Any, category: Any, region_code: Optional[str]) -> Decimal:
+        """Adjustment factor for a catalog/category in a region (1.0 when none applies)."""
+        if not region_code:
+            return Decimal("1")
+        catalog_id = str(catalog_id)
+        factor = self._factors.get((catalog_id, region_code, normalize_token(category)))
+        if factor is None:
+            factor = self._factors.get((catalog_id, region_code, ""))
+        return factor if factor is not None else Decimal("1")
+
+    def item_rate(self, item_id: Any, region_code: Optional[str], match: str = "exact") -> Optional[ResolvedRate]:
+        """Rate for a known cost item id, or None if it is not in the index."""
+        row = self._by_id.get(str(item_id))
+        return self._to_rate(row, region_code, match) if row is not None else None
+
+    def lookup(self, key: Iterable[Optional[str]]) -> Optional[ResolvedRate]:
+        """Resolve one key from the catalog tables (no semantic search)."""
+        category, sub_category, grade, region_code = RateKey(*key)
+        category = normalize_token(category)
+        sub_category = normalize_token(sub_category)
+        grade = normalize_token(grade)
+
+        row = self._exact.get((category, sub_category, grade))
+        if row is not None:
+            return self._to_rate(row, region_code, "exact")
+
+        if grade:
+            row = self._by_grade.get((category, grade))
+            match = "grade"
+        else:
+            row = self._by_sub_category.get((category, sub_category))
+            match = "sub_category"
+        return self._to_rate(row, region_code, match) if row is not None else None
+
+    def resolve_many(self, keys: Iterable[Iterable[Optional[str]]]) -> Dict[RateKey, Optional[ResolvedRate]]:
+        """
+        Resolve many keys in one pass.
+
+        Returns:
+            Mapping of RateKey -> ResolvedRate (None where the catalogs have no
+            match and no remembered semantic result)
+        """
+        resolved: Dict[RateKey, Optional[ResolvedRate]] = {}
+        for key in keys:
+            key = RateKey(*key)
+            if key in resolved:
+                continue
+            rate = self.lookup(key)
+            if rate is None:
+                rate = self.remembered_semantic(key)
+            resolved[key] = rate
+        return resolved
+
+    def remembered_semantic(self, key: RateKey) -> Optional[ResolvedRate]:
+        """Semantic fallback result remembered for a key (None if no match or never searched)."""
+        with self._lock:
+            return self._semantic.get(RateKey(*key))
+
+    def searched(self, key: RateKey) -> bool:
+        """Whether a semantic fallback was already run for a key."""
+        with self._lock:
+            return RateKey(*key) in self._semantic
+
+    def remember_semantic(self, key: RateKey, rate: Optional[ResolvedRate]) -> None:
+        """Remember a semantic fallback result (None remembers "no match")."""
+        with self._lock:
+            self._semantic[RateKey(*key)] = rate
+
+    def _to_rate(self, row: Dict[str, Any], region_code: Optional[str], match: str) -> ResolvedRate:
+        base_cost = Decimal(str(row["base_cost"]))
+        factor = self.regional_factor(row["catalog_id"], row.get("category"), region_code)
+        return ResolvedRate(
+            cost_item_id=str(row["id"]),
+            item_code=row.get("item_code"),
+            item_name=row.get("item_name"),
+            unit=row.get("unit"),
+            base_cost=base_cost,
+            adjustment_factor=factor,
+            adjusted_cost=base_cost * factor,
+            match=match,
+        )
+
+
+# ============================================================================
+# PROCESS-WIDE CACHE
+# ============================================================================
+
+_global_rate_index_cache: Optional[IndexCache[RateIndex]] = None
+_global_lock = threading.Lock()
+
+
+def get_rate_index_cache() -> IndexCache[RateIndex]:
+    """Get the process-wide rate index cache."""
+    global _global_rate_index_cache
+    with _global_lock:
+        if _global_rate_index_cache is None:
+            _global_rate_index_cache = IndexCache(
+                "SKG rate index", "items", ttl_seconds=settings.RATE_INDEX_TTL_SECONDS
+            )
+    return _global_rate_index_cache
+
+
+def build_rate_index(db: Any) -> RateIndex:
+    """Load the rate table with two queries."""
+    items: List[Dict[str, Any]] = db.execute_query_dict(RATE_INDEX_ITEMS_SQL) or []
+    factors: List[Dict[str, Any]] = db.execute_query_dict(RATE_INDEX_FACTORS_SQL) or []
+    return RateIndex(items, factors)
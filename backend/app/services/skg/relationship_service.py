@@ -12,7 +12,7 @@ import json
 import logging
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID, uuid4
 
 from app.core.database import DatabaseConfig
@@ -28,15 +28,28 @@ from app.schemas.skg.relationship_models import (
     KnowledgeEntityType,
     KnowledgeRelationship,
     KnowledgeRelationshipCreate,
+    NeighborhoodEntity,
+    NeighborhoodRequest,
+    NeighborhoodResponse,
     RelatedEntitiesResponse,
     RelatedEntity,
     RelatedEntityRequest,
     RelationshipType,
     RelationshipWithDetails,
 )
+from app.services.skg.graph_index import GraphIndex, build_graph_index, get_graph_index_cache
 
 logger = logging.getLogger(__name__)
 
+ENTITY_NAME_QUERIES = {
+    KnowledgeEntityType.COST_ITEM:
+        "SELECT id, item_name, item_code FROM cost_items WHERE id = ANY(%s::uuid[])",
+    KnowledgeEntityType.RULE:
+        "SELECT id, rule_name, description FROM constructability_rules WHERE id = ANY(%s::uuid[])",
+    KnowledgeEntityType.LESSON:
+        "SELECT id, title, issue_description FROM lessons_learned WHERE id = ANY(%s::uuid[])",
+}
+
 
 class KnowledgeRelationshipService:
     """Service for managing relationships in the Strategic Knowledge Graph."""
@@ -87,6 +100,7 @@ class KnowledgeRelationshipService:
         )
 
         result = self.db.execute_query_dict(query, params)
+        get_graph_index_cache().apply(lambda index: index.add_relationship(result[0]))
 
         self.db.log_audit(
             user_id=data.created_by,
@@ -127,6 +141,9 @@ class KnowledgeRelationshipService:
         result = self.db.execute_query_dict(query, (str(relationship_id),))
 
         if result:
+            get_graph_index_cache().apply(
+                lambda index: index.remove_relationship(relationship_id)
+            )
             self.db.log_audit(
                 user_id=deleted_by,
                 action="delete_relationship",
@@ -205,6 +222,10 @@ class KnowledgeRelationshipService:
     # GRAPH QUERIES
     # =========================================================================
 
+    def get_graph_index(self) -> GraphIndex:
+        """Get the shared in-memory graph index, loading it if missing or stale."""
+        return get_graph_index_cache().get(lambda: build_graph_index(self.db))
+
     def get_related_entities(
         self,
         request: RelatedEntityRequest
@@ -218,111 +239,36 @@ class KnowledgeRelationshipService:
         Returns:
             Related entities response
         """
-        related = []
-
-        # Get outgoing relationships
-        outgoing_query = """
-        SELECT
-            kr.target_type as entity_type,
-            kr.target_id as entity_id,
-            kr.relationship_type,
-            kr.strength,
-            'outgoing' as direction
-        FROM knowledge_relationships kr
-        WHERE kr.source_type = %s AND kr.source_id = %s
-        """
-        params: List[Any] = [request.entity_type.value, str(request.entity_id)]
-
-        if request.relationship_types:
-            placeholders = ','.join(['%s'] * len(request.relationship_types))
-            outgoing_query += f" AND kr.relationship_type IN ({placeholders})"
-            params.extend([rt.value for rt in request.relationship_types])
-
-        if request.target_types:
-            placeholders = ','.join(['%s'] * len(request.target_types))
-            outgoing_query += f" AND kr.target_type IN ({placeholders})"
-            params.extend([tt.value for tt in request.target_types])
-
-        outgoing_query += " AND kr.strength >= %s"
-        params.append(float(request.min_strength))
-
-        outgoing_query += " ORDER BY kr.strength DESC LIMIT %s"
-        params.append(request.limit)
+        index = self.get_graph_index()
+        source = (request.entity_type, request.entity_id)
+        neighbors = index.related(
+            source,
+            relationship_types=request.relationship_types,
+            entity_types=request.target_types,
+            min_strength=float(request.min_strength),
+            include_reverse=request.include_reverse,
+            limit=request.limit
+        )
 
-        outgoing_results = self.db.execute_query_dict(outgoing_query, tuple(params))
+        names = self._get_entity_names([source] + [neighbor for neighbor, _, _ in neighbors])
 
-        for row in outgoing_results:
-            entity_name, entity_summary = self._get_entity_name_and_summary(
-                KnowledgeEntityType(row["entity_type"]),
-                UUID(row["entity_id"])
-            )
+        related = []
+        for (entity_type, entity_id), edge, direction in neighbors:
+            entity_name, entity_summary = names[(entity_type, entity_id)]
             related.append(RelatedEntity(
-                entity_type=KnowledgeEntityType(row["entity_type"]),
-                entity_id=UUID(row["entity_id"]),
+                entity_type=entity_type,
+                entity_id=entity_id,
                 entity_name=entity_name,
                 entity_summary=entity_summary,
-                relationship_type=RelationshipType(row["relationship_type"]),
-                relationship_direction="outgoing",
-                strength=Decimal(str(row["strength"]))
+                relationship_type=edge.relationship_type,
+                relationship_direction=direction,
+                strength=edge.strength
             ))
 
-        # Get incoming relationships if requested
-        if request.include_reverse:
-            incoming_query = """
-            SELECT
-                kr.source_type as entity_type,
-                kr.source_id as entity_id,
-                kr.relationship_type,
-                kr.strength,
-                'incoming' as direction
-            FROM knowledge_relationships kr
-            WHERE kr.target_type = %s AND kr.target_id = %s
-            """
-            params = [request.entity_type.value, str(request.entity_id)]
-
-            if request.relationship_types:
-                placeholders = ','.join(['%s'] * len(request.relationship_types))
-                incoming_query += f" AND kr.relationship_type IN ({placeholders})"
-                params.extend([rt.value for rt in request.relationship_types])
-
-            if request.target_types:
-                placeholders = ','.join(['%s'] * len(request.target_types))
-                incoming_query += f" AND kr.source_type IN ({placeholders})"
-                params.extend([tt.value for tt in request.target_types])
-
-            incoming_query += " AND kr.strength >= %s"
-            params.append(float(request.min_strength))
-
-            incoming_query += " ORDER BY kr.strength DESC LIMIT %s"
-            params.append(request.limit)
-
-            incoming_results = self.db.execute_query_dict(incoming_query, tuple(params))
-
-            for row in incoming_results:
-                entity_name, entity_summary = self._get_entity_name_and_summary(
-                    KnowledgeEntityType(row["entity_type"]),
-                    UUID(row["entity_id"])
-                )
-                related.append(RelatedEntity(
-                    entity_type=KnowledgeEntityType(row["entity_type"]),
-                    entity_id=UUID(row["entity_id"]),
-                    entity_name=entity_name,
-                    entity_summary=entity_summary,
-                    relationship_type=RelationshipType(row["relationship_type"]),
-                    relationship_direction="incoming",
-                    strength=Decimal(str(row["strength"]))
-                ))
-
-        # Get source entity name
-        source_name, _ = self._get_entity_name_and_summary(
-            request.entity_type,
-            request.entity_id
-        )
-
         return RelatedEntitiesResponse(
             source_type=request.entity_type,
             source_id=request.entity_id,
-            source_name=source_name,
+            source_name=names[source][0],
             total_relationships=len(related),
             related_entities=related[:request.limit]
         )
@@ -333,27 +279,44 @@ class KnowledgeRelationshipService:
         entity_id: UUID
     ) -> tuple[str, Optional[str]]:
         """Get the name and summary of an entity."""
-        if entity_type == KnowledgeEntityType.COST_ITEM:
-            query = "SELECT item_name, item_code FROM cost_items WHERE id = %s"
-            result = self.db.execute_query_dict(query, (str(entity_id),))
-            if result:
-                return result[0]["item_name"], f"Code: {result[0]['item_code']}"
-
-        elif entity_type == KnowledgeEntityType.RULE:
-            query = "SELECT rule_name, description FROM constructability_rules WHERE id = %s"
-            result = self.db.execute_query_dict(query, (str(entity_id),))
-            if result:
-                return result[0]["rule_name"], result[0].get("description")
-
-        elif entity_type == KnowledgeEntityType.LESSON:
-            query = "SELECT title, issue_description FROM lessons_learned WHERE id = %s"
-            result = self.db.execute_query_dict(query, (str(entity_id),))
-            if result:
-                desc = result[0]["issue_description"]
-                summary = desc[:200] + "..." if len(desc) > 200 else desc
-                return result[0]["title"], summary
-
-        return "Unknown", None
+        return self._get_entity_names([(entity_type, entity_id)])[(entity_type, entity_id)]
+
+    def _get_entity_names(
+        self,
+        entities: List[tuple]
+    ) -> Dict[tuple, tuple]:
+        """
+        Get names and summaries for many entities, one query per entity type.
+
+        Args:
+            entities: (entity_type, entity_id) pairs
+
+        Returns:
+            Mapping of (entity_type, entity_id) -> (name, summary); entities
+            that no longer exist map to ("Unknown", None)
+        """
+        names: Dict[tuple, tuple] = {}
+        ids_by_type: Dict[KnowledgeEntityType, set] = {}
+        for entity_type, entity_id in entities:
+            names[(entity_type, entity_id)] = ("Unknown", None)
+            ids_by_type.setdefault(entity_type, set()).add(str(entity_id))
+
+        for entity_type, ids in ids_by_type.items():
+            query = ENTITY_NAME_QUERIES.get(entity_type)
+            if query is None:
+                continue
+            for row in self.db.execute_query_dict(query, (sorted(ids),)):
+                key = (entity_type, UUID(str(row["id"])))
+                if entity_type == KnowledgeEntityType.COST_ITEM:
+                    names[key] = (row["item_name"], f"Code: {row['item_code']}")
+                elif entity_type == KnowledgeEntityType.RULE:
+                    names[key] = (row["rule_name"], row.get("description"))
+                else:
+                    desc = row["issue_description"]
+                    summary = desc[:200] + "..." if len(desc) > 200 else desc
+                    names[key] = (row["title"], summary)
+
+        return names
 
     def find_paths(
         self,
@@ -362,7 +325,8 @@ class KnowledgeRelationshipService:
         """
         Find paths between two entities in the knowledge graph.
 
-        Uses breadth-first search with depth limit.
+        Uses breadth-first search with depth limit over the in-memory graph
+        index; entity names are fetched once for the whole response.
 
         Args:
             request: Path finding request
@@ -370,151 +334,103 @@ class KnowledgeRelationshipService:
         Returns:
             Found paths
         """
-        paths = []
-
-        # BFS to find paths
-        visited = set()
-        queue = [(
-            [(request.start_type, request.start_id)],
-            []  # edges
-        )]
-
-        while queue and len(paths) < 10:  # Limit to 10 paths
-            current_path, current_edges = queue.pop(0)
-            current_type, current_id = current_path[-1]
-
-            if len(current_path) > request.max_depth + 1:
-                continue
+        index = self.get_graph_index()
+        start = (request.start_type, request.start_id)
+        end = (request.end_type, request.end_id)
+
+        found = index.find_paths(
+            start,
+            end,
+            max_depth=request.max_depth,
+            relationship_types=request.relationship_types,
+            max_paths=10  # Limit to 10 paths
+        )
 
-            # Check if we reached the target
-            if current_type == request.end_type and current_id == request.end_id:
-                if len(current_path) > 1:  # Don't include trivial path
-                    path_nodes = []
-                    for node_type, node_id in current_path:
-                        name, _ = self._get_entity_name_and_summary(node_type, node_id)
-                        path_nodes.append(GraphPathNode(
-                            entity_type=node_type,
-                            entity_id=node_id,
-                            entity_name=name
-                        ))
-
-                    # Calculate total strength
-                    total_strength = Decimal("1.0")
-                    for edge in current_edges:
-                        total_strength *= edge.strength
-
-                    paths.append(GraphPath(
-                        nodes=path_nodes,
-                        edges=current_edges,
-                        total_strength=total_strength,
-                        path_length=len(current_path) - 1
-                    ))
-                continue
+        path_entities = [entity for nodes, _ in found for entity in nodes]
+        names = self._get_entity_names([start, end] + path_entities)
 
-            # Skip if already visited at this depth
-            visit_key = (current_type, current_id, len(current_path))
-            if visit_key in visited:
-                continue
-            visited.add(visit_key)
+        paths = []
+        for nodes, path_edges in found:
+            path_nodes = []
+            for node_type, node_id in nodes:
+                path_nodes.append(GraphPathNode(
+                    entity_type=node_type,
+                    entity_id=node_id,
+                    entity_name=names[(node_type, node_id)][0]
+                ))
 
-            # Get neighbors
-            neighbors = self._get_neighbors(
-                current_type,
-                current_id,
-                request.relationship_types
-            )
+            edges = []
+            total_strength = Decimal("1.0")
+            for edge, direction in path_edges:
+                edges.append(GraphPathEdge(
+                    relationship_type=edge.relationship_type,
+                    strength=edge.strength,
+                    direction=direction
+                ))
+                total_strength *= edge.strength
 
-            for neighbor_type, neighbor_id, rel_type, strength, direction in neighbors:
-                if (neighbor_type, neighbor_id) not in [(n[0], n[1]) for n in current_path]:
-                    new_path = current_path + [(neighbor_type, neighbor_id)]
-                    new_edges = current_edges + [GraphPathEdge(
-                        relationship_type=rel_type,
-                        strength=strength,
-                        direction=direction
-                    )]
-                    queue.append((new_path, new_edges))
-
-        # Get start and end entity names
-        start_name, _ = self._get_entity_name_and_summary(
-            request.start_type,
-            request.start_id
-        )
-        end_name, _ = self._get_entity_name_and_summary(
-            request.end_type,
-            request.end_id
-        )
+            paths.append(GraphPath(
+                nodes=path_nodes,
+                edges=edges,
+                total_strength=total_strength,
+                path_length=len(nodes) - 1
+            ))
 
         return GraphPathResponse(
             start_entity=GraphPathNode(
                 entity_type=request.start_type,
                 entity_id=request.start_id,
-                entity_name=start_name
+                entity_name=names[start][0]
             ),
             end_entity=GraphPathNode(
                 entity_type=request.end_type,
                 entity_id=request.end_id,
-                entity_name=end_name
+                entity_name=names[end][0]
             ),
             paths_found=len(paths),
             paths=sorted(paths, key=lambda p: (-p.total_strength, p.path_length))
         )
 
-    def _get_neighbors(
+    def get_neighborhood(
         self,
-        entity_type: KnowledgeEntityType,
-        entity_id: UUID,
-        relationship_types: Optional[List[RelationshipType]]
-    ) -> List[tuple]:
-        """Get neighbors of an entity in the graph."""
-        neighbors = []
-
-        # Outgoing
-        query = """
-        SELECT target_type, target_id, relationship_type, strength
-        FROM knowledge_relationships
-        WHERE source_type = %s AND source_id = %s
+        request: NeighborhoodRequest
+    ) -> NeighborhoodResponse:
         """
-        params: List[Any] = [entity_type.value, str(entity_id)]
-
-        if relationship_types:
-            placeholders = ','.join(['%s'] * len(relationship_types))
-            query += f" AND relationship_type IN ({placeholders})"
-            params.extend([rt.value for rt in relationship_types])
-
-        result = self.db.execute_query_dict(query, tuple(params))
-        for row in result:
-            neighbors.append((
-                KnowledgeEntityType(row["target_type"]),
-                UUID(row["target_id"]),
-                RelationshipType(row["relationship_type"]),
-                Decimal(str(row["strength"])),
-                "forward"
-            ))
+        Get every entity within k hops of an entity (either direction).
 
-        # Incoming
-        query = """
-        SELECT source_type, source_id, relationship_type, strength
-        FROM knowledge_relationships
-        WHERE target_type = %s AND target_id = %s
+        Args:
+            request: Neighborhood request
+
+        Returns:
+            Entities ordered by distance, nearest first
         """
-        params = [entity_type.value, str(entity_id)]
-
-        if relationship_types:
-            placeholders = ','.join(['%s'] * len(relationship_types))
-            query += f" AND relationship_type IN ({placeholders})"
-            params.extend([rt.value for rt in relationship_types])
-
-        result = self.db.execute_query_dict(query, tuple(params))
-        for row in result:
-            neighbors.append((
-                KnowledgeEntityType(row["source_type"]),
-                UUID(row["source_id"]),
-                RelationshipType(row["relationship_type"]),
-                Decimal(str(row["strength"])),
-                "reverse"
+        index = self.get_graph_index()
+        entity = (request.entity_type, request.entity_id)
+        distances = index.neighborhood(entity, request.hops, request.relationship_types)
+
+        # Already nearest first
+        nearest = list(distances.items())[:request.limit]
+        names = self._get_entity_names([entity] + [neighbor for neighbor, _ in nearest])
+
+        entities = []
+        for (entity_type, entity_id), distance in nearest:
+            entities.append(NeighborhoodEntity(
+                entity_type=entity_type,
+                entity_id=entity_id,
+                entity_name=names[(entity_type, entity_id)][0],
+                distance=distance
             ))
 
-        return neighbors
+        return NeighborhoodResponse(
+            entity=GraphPathNode(
+                entity_type=request.entity_type,
+                entity_id=request.entity_id,
+                entity_name=names[entity][0]
+            ),
+            hops=request.hops,
+            total_entities=len(distances),
+            entities=entities
+        )
 
     # =========================================================================
     # STATISTICS
@@ -570,12 +486,13 @@ class KnowledgeRelationshipService:
         LIMIT 10
         """
         most_connected_result = self.db.execute_query_dict(most_connected_query)
+        names = self._get_entity_names([
+            (KnowledgeEntityType(row["entity_type"]), UUID(str(row["entity_id"])))
+            for row in most_connected_result
+        ])
         most_connected = []
         for row in most_connected_result:
-            name, _ = self._get_entity_name_and_summary(
-                KnowledgeEntityType(row["entity_type"]),
-                UUID(row["entity_id"])
-            )
+            name, _ = names[(KnowledgeEntityType(row["entity_type"]), UUID(str(row["entity_id"])))]
             most_connected.append({
                 "entity_type": row["entity_type"],
                 "entity_id": str(row["entity_id"]),
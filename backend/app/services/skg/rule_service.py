@@ -10,14 +10,17 @@ Provides functionality for:
 
 import json
 import logging
-import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
+from psycopg2.extras import execute_values
+
 from app.core.database import DatabaseConfig
 from app.schemas.skg.rule_models import (
     ConstructabilityRule,
+    RuleBatchEvaluationRequest,
+    RuleBatchEvaluationResponse,
     RuleCategory,
     RuleCategoryCreate,
     RuleCreate,
@@ -33,9 +36,19 @@ from app.schemas.skg.rule_models import (
     RuleType,
     RuleUpdate,
 )
+from app.services.skg.rule_set import CompiledRuleSet, build_rule_set, get_rule_set_cache
 
 logger = logging.getLogger(__name__)
 
+INSERT_RULE_EVALUATIONS_SQL = """
+INSERT INTO rule_evaluations (
+    id, rule_id, execution_id, input_context, was_triggered,
+    evaluation_result, evaluated_by, evaluated_at
+) VALUES %s
+"""
+
+RULE_EVALUATION_INSERT_PAGE_SIZE = 500
+
 
 class ConstructabilityRuleService:
     """Service for managing constructability rules in the Strategic Knowledge Graph."""
@@ -165,6 +178,7 @@ class ConstructabilityRuleService:
 
         result = self.db.execute_query_dict(query, params)
         rule = ConstructabilityRule(**result[0])
+        self.invalidate_rule_set()
 
         # Generate embedding for semantic search
         if generate_embedding:
@@ -362,6 +376,7 @@ class ConstructabilityRuleService:
 
         if result:
             updated_rule = ConstructabilityRule(**result[0])
+            self.invalidate_rule_set()
 
             # Update embedding
             self._create_rule_embedding(updated_rule)
@@ -382,6 +397,14 @@ class ConstructabilityRuleService:
     # RULE EVALUATION
     # =========================================================================
 
+    def get_rule_set(self) -> CompiledRuleSet:
+        """Get the compiled rule set, loading it with one query when stale."""
+        return get_rule_set_cache().get(lambda: build_rule_set(self.db))
+
+    def invalidate_rule_set(self) -> None:
+        """Drop the compiled rule set after a rule write."""
+        get_rule_set_cache().invalidate()
+
     def evaluate_rules(
         self,
         request: RuleEvaluationRequest,
@@ -397,62 +420,15 @@ class ConstructabilityRuleService:
         Returns:
             Evaluation response with triggered rules
         """
-        # Get applicable rules
-        rules = self._get_applicable_rules(
+        rules_evaluated, responses = self._evaluate_records(
+            input_records=[request.input_data],
             discipline=request.discipline,
-            workflow_type=request.workflow_type
+            workflow_type=request.workflow_type,
+            include_info=request.include_info,
+            execution_id=request.execution_id,
+            user_id=user_id
         )
-
-        results = []
-        severity_counts = {
-            "critical": 0,
-            "high": 0,
-            "medium": 0,
-            "low": 0,
-            "info": 0
-        }
-        has_blockers = False
-
-        for rule in rules:
-            # Skip info-level rules if not requested
-            if rule.severity == RuleSeverity.INFO and not request.include_info:
-                continue
-
-            # Evaluate the rule
-            was_triggered, eval_details = self._evaluate_condition(
-                rule.condition_expression,
-                request.input_data
-            )
-
-            if was_triggered:
-                severity_counts[rule.severity.value] += 1
-
-                if rule.is_mandatory or rule.severity == RuleSeverity.CRITICAL:
-                    has_blockers = True
-
-                results.append(RuleEvaluationResult(
-                    rule_id=rule.id,
-                    rule_code=rule.rule_code,
-                    rule_name=rule.rule_name,
-                    was_triggered=True,
-                    severity=rule.severity,
-                    recommendation=rule.recommendation,
-                    recommendation_details=rule.recommendation_details,
-                    source_code=rule.source_code,
-                    source_clause=rule.source_clause,
-                    is_mandatory=rule.is_mandatory,
-                    evaluation_details=eval_details
-                ))
-
-                # Log evaluation
-                self._log_rule_evaluation(
-                    rule_id=rule.id,
-                    execution_id=request.execution_id,
-                    input_context=request.input_data,
-                    was_triggered=True,
-                    evaluation_result=eval_details,
-                    evaluated_by=user_id
-                )
+        response = responses[0]
 
         # Log audit
         self.db.log_audit(
@@ -461,207 +437,161 @@ class ConstructabilityRuleService:
             entity_type="rule_evaluation",
             entity_id=str(request.execution_id) if request.execution_id else "manual",
             details={
-                "rules_evaluated": len(rules),
-                "rules_triggered": len(results),
-                "has_blockers": has_blockers
+                "rules_evaluated": rules_evaluated,
+                "rules_triggered": response.rules_triggered,
+                "has_blockers": response.has_blockers
             }
         )
 
-        return RuleEvaluationResponse(
-            total_rules_evaluated=len(rules),
-            rules_triggered=len(results),
-            critical_count=severity_counts["critical"],
-            high_count=severity_counts["high"],
-            medium_count=severity_counts["medium"],
-            low_count=severity_counts["low"],
-            info_count=severity_counts["info"],
-            has_blockers=has_blockers,
-            results=results,
-            evaluation_timestamp=datetime.now()
-        )
+        return response
 
-    def _get_applicable_rules(
+    def evaluate_rules_batch(
         self,
-        discipline: Optional[RuleDiscipline],
-        workflow_type: Optional[str]
-    ) -> List[ConstructabilityRule]:
-        """Get rules applicable to the given context."""
-        query = "SELECT * FROM get_applicable_rules(%s, %s)"
-        params = (
-            workflow_type,
-            discipline.value if discipline else None
-        )
-
-        result = self.db.execute_query_dict(query, params)
-
-        # Convert to full rule objects
-        rules = []
-        for row in result:
-            full_rule = self.get_rule(UUID(row["rule_id"]))
-            if full_rule:
-                rules.append(full_rule)
-
-        return rules
-
-    def _evaluate_condition(
-        self,
-        condition: str,
-        input_data: Dict[str, Any]
-    ) -> tuple[bool, Dict[str, Any]]:
+        request: RuleBatchEvaluationRequest,
+        user_id: str
+    ) -> RuleBatchEvaluationResponse:
         """
-        Evaluate a condition expression against input data.
+        Evaluate applicable rules against many input records in one call.
 
-        Supports expressions like:
-        - $input.rebar_spacing < 75
-        - $input.load > 500 AND $input.depth < 2
-        - $input.concrete_grade == 'M25'
+        The applicable rules are selected once for the whole batch and the
+        triggered evaluations of every record are logged in one transaction.
 
         Args:
-            condition: Condition expression
-            input_data: Input data to evaluate against
+            request: Batch evaluation request with input records
+            user_id: User performing the evaluation
 
         Returns:
-            Tuple of (triggered, evaluation_details)
+            One evaluation response per input record
         """
-        try:
-            # Build evaluation context
-            context = {
-                "input": input_data,
-                "step": {},  # For future workflow step integration
-                "context": {}
-            }
-
-            # Parse and evaluate the condition
-            result = self._safe_eval_condition(condition, context)
+        rules_evaluated, responses = self._evaluate_records(
+            input_records=request.input_records,
+            discipline=request.discipline,
+            workflow_type=request.workflow_type,
+            include_info=request.include_info,
+            execution_id=request.execution_id,
+            user_id=user_id
+        )
+        has_blockers = any(response.has_blockers for response in responses)
 
-            return result, {
-                "condition": condition,
-                "result": result,
-                "evaluated_values": self._extract_evaluated_values(condition, context)
+        self.db.log_audit(
+            user_id=user_id,
+            action="evaluate_rules_batch",
+            entity_type="rule_evaluation",
+            entity_id=str(request.execution_id) if request.execution_id else "manual",
+            details={
+                "records": len(responses),
+                "rules_evaluated": rules_evaluated,
+                "rules_triggered": sum(response.rules_triggered for response in responses),
+                "has_blockers": has_blockers
             }
+        )
 
-        except Exception as e:
-            logger.warning(f"Failed to evaluate condition '{condition}': {e}")
-            return False, {"error": str(e), "condition": condition}
+        return RuleBatchEvaluationResponse(
+            total_records=len(responses),
+            records_with_triggers=sum(1 for response in responses if response.rules_triggered),
+            has_blockers=has_blockers,
+            evaluations=responses
+        )
 
-    def _safe_eval_condition(
+    def _evaluate_records(
         self,
-        condition: str,
-        context: Dict[str, Any]
-    ) -> bool:
+        input_records: List[Dict[str, Any]],
+        discipline: Optional[RuleDiscipline],
+        workflow_type: Optional[str],
+        include_info: bool,
+        execution_id: Optional[UUID],
+        user_id: str
+    ) -> Tuple[int, List[RuleEvaluationResponse]]:
         """
-        Safely evaluate a condition expression.
+        Evaluate the applicable rules against each input record.
 
-        This uses a simple parser instead of eval() for security.
+        Returns:
+            Tuple of (number of applicable rules, one response per record)
         """
-        # Replace variable references with actual values
-        processed = condition
-
-        # Find all variable references ($input.field, $step.field, etc.)
-        var_pattern = r'\$(\w+)\.(\w+(?:\.\w+)*)'
-        matches = re.findall(var_pattern, condition)
-
-        for prefix, path in matches:
-            full_var = f"${prefix}.{path}"
-            value = self._resolve_variable(prefix, path, context)
-
-            if value is None:
-                # Variable not found - condition fails
-                return False
-
-            # Replace with actual value (properly formatted)
-            if isinstance(value, str):
-                processed = processed.replace(full_var, f"'{value}'")
-            elif isinstance(value, bool):
-                processed = processed.replace(full_var, str(value).lower())
-            else:
-                processed = processed.replace(full_var, str(value))
-
-        # Now evaluate the processed expression
-        # Support: <, >, <=, >=, ==, !=, AND, OR, NOT, parentheses
-        try:
-            # Convert to Python-compatible syntax
-            processed = processed.replace(" AND ", " and ")
-            processed = processed.replace(" OR ", " or ")
-            processed = processed.replace(" NOT ", " not ")
+        rule_set = self.get_rule_set()
+        selection = rule_set.select(discipline.value if discipline else None, workflow_type)
+        evaluations = rule_set.evaluate(selection, input_records, include_info)
+
+        responses = []
+        evaluation_rows = []
+        evaluated_at = datetime.now()
+
+        for input_data, evaluation in zip(input_records, evaluations):
+            results = []
+            severity_counts = {
+                "critical": 0,
+                "high": 0,
+                "medium": 0,
+                "low": 0,
+                "info": 0
+            }
+            has_blockers = False
 
-            # Use a restricted eval
-            result = eval(processed, {"__builtins__": {}}, {})
-            return bool(result)
+            for compiled, eval_details in evaluation.triggered:
+                rule = compiled.rule
+                severity_counts[rule.severity.value] += 1
 
-        except Exception as e:
-            logger.warning(f"Condition evaluation failed: {e}")
-            return False
+                if rule.is_mandatory or rule.severity == RuleSeverity.CRITICAL:
+                    has_blockers = True
 
-    def _resolve_variable(
-        self,
-        prefix: str,
-        path: str,
-        context: Dict[str, Any]
-    ) -> Any:
-        """Resolve a variable reference to its value."""
-        if prefix not in context:
-            return None
-
-        obj = context[prefix]
-        for part in path.split('.'):
-            if isinstance(obj, dict):
-                obj = obj.get(part)
-            else:
-                obj = getattr(obj, part, None)
-
-            if obj is None:
-                return None
-
-        return obj
-
-    def _extract_evaluated_values(
-        self,
-        condition: str,
-        context: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Extract the actual values used in condition evaluation."""
-        values = {}
-        var_pattern = r'\$(\w+)\.(\w+(?:\.\w+)*)'
-        matches = re.findall(var_pattern, condition)
+                results.append(RuleEvaluationResult(
+                    rule_id=rule.id,
+                    rule_code=rule.rule_code,
+                    rule_name=rule.rule_name,
+                    was_triggered=True,
+                    severity=rule.severity,
+                    recommendation=rule.recommendation,
+                    recommendation_details=rule.recommendation_details,
+                    source_code=rule.source_code,
+                    source_clause=rule.source_clause,
+                    is_mandatory=rule.is_mandatory,
+                    evaluation_details=eval_details
+                ))
 
-        for prefix, path in matches:
-            full_var = f"${prefix}.{path}"
-            values[full_var] = self._resolve_variable(prefix, path, context)
+                evaluation_rows.append((
+                    str(uuid4()),
+                    str(rule.id),
+                    str(execution_id) if execution_id else None,
+                    json.dumps(input_data, default=str),
+                    True,
+                    json.dumps(eval_details, default=str),
+                    user_id
+                ))
 
-        return values
+            responses.append(RuleEvaluationResponse(
+                total_rules_evaluated=evaluation.rules_evaluated,
+                rules_triggered=len(results),
+                critical_count=severity_counts["critical"],
+                high_count=severity_counts["high"],
+                medium_count=severity_counts["medium"],
+                low_count=severity_counts["low"],
+                info_count=severity_counts["info"],
+                has_blockers=has_blockers,
+                results=results,
+                evaluation_timestamp=evaluated_at
+            ))
 
-    def _log_rule_evaluation(
-        self,
-        rule_id: UUID,
-        execution_id: Optional[UUID],
-        input_context: Dict[str, Any],
-        was_triggered: bool,
-        evaluation_result: Dict[str, Any],
-        evaluated_by: str
-    ) -> None:
-        """Log a rule evaluation to the database."""
-        query = """
-        INSERT INTO rule_evaluations (
-            id, rule_id, execution_id, input_context, was_triggered,
-            evaluation_result, evaluated_by, evaluated_at
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, NOW())
-        """
+        self._log_rule_evaluations(evaluation_rows)
+        return len(selection), responses
 
-        params = (
-            str(uuid4()),
-            str(rule_id),
-            str(execution_id) if execution_id else None,
-            json.dumps(input_context),
-            was_triggered,
-            json.dumps(evaluation_result),
-            evaluated_by
-        )
+    def _log_rule_evaluations(self, rows: List[Tuple[Any, ...]]) -> None:
+        """Log triggered rule evaluations with multi-row INSERTs in one transaction."""
+        if not rows:
+            return
 
         try:
-            self.db.execute_query_dict(query, params)
+            with self.db.connection() as conn:
+                with conn.cursor() as cursor:
+                    execute_values(
+                        cursor,
+                        INSERT_RULE_EVALUATIONS_SQL,
+                        rows,
+                        template="(%s, %s, %s, %s, %s, %s, %s, NOW())",
+                        page_size=RULE_EVALUATION_INSERT_PAGE_SIZE
+                    )
+                conn.commit()
         except Exception as e:
-            logger.error(f"Failed to log rule evaluation: {e}")
+            logger.error(f"Failed to log {len(rows)} rule evaluations: {e}")
 
     # =========================================================================
     # SEMANTIC SEARCH
@@ -0,0 +1,309 @@
+"""
+CSA AIaaS Platform - Compiled Constructability Rule Set
+Performance: Pre-compiled, indexed rule evaluation
+
+evaluate_rules used to call get_applicable_rules() and then get_rule() once
+per returned row, and re-substituted and re-parsed every condition_expression
+on every request. This module loads the enabled rules once, compiles each
+condition into a code object and indexes the rules so a request only touches
+the rules that can fire.
+
+Features:
+- One query loads every enabled rule; conditions compiled once per load
+- Rules indexed by discipline and by applicable workflow type (same matching
+  as the get_applicable_rules() SQL function), selections memoized
+- Rules indexed by referenced $input fields: a rule whose fields are absent
+  from an input record is skipped without evaluating it
+- Batch evaluation of many input records against one selection
+- Process-wide IndexCache (index_cache.py); ConstructabilityRuleService
+  invalidates it on every rule write
+"""
+
+import ast
+import logging
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.schemas.skg.rule_models import ConstructabilityRule, RuleSeverity
+from app.services.skg.index_cache import IndexCache
+
+logger = logging.getLogger(__name__)
+
+RULE_SET_SQL = """
+SELECT * FROM constructability_rules
+WHERE is_enabled = true
+"""
+
+_VARIABLE_PATTERN = re.compile(r"\$(\w+)\.(\w+(?:\.\w+)*)")
+
+# Same order as get_applicable_rules(): severity, then mandatory rules first
+_SEVERITY_RANK = {"critical": 1, "high": 2, "medium": 3, "low": 4}
+
+# Only $input is populated when rules are evaluated ($step / $context are
+# reserved for workflow integration and always empty)
+_EVALUATION_PREFIXES = ("input",)
+
+_LITERALS = {"true": True, "false": False, "null": None}
+
+
+# ============================================================================
+# COMPILED RULES
+# ============================================================================
+
+@dataclass
+class CompiledRule:
+    """A rule with its condition compiled to a code object."""
+    rule: ConstructabilityRule
+    code: Optional[Any]  # None when the condition cannot be compiled
+    variables: Tuple[Tuple[str, str, str], ...]  # (local name, "$prefix.path", prefix)
+    paths: Tuple[Tuple[str, ...], ...]  # path parts after the prefix, per variable
+    input_fields: FrozenSet[str]
+    never_fires: bool = False
+    error: Optional[str] = None
+
+    def evaluate(self, input_data: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Evaluate the condition against one input record.
+
+        Matches the legacy evaluator: a missing variable means the rule does
+        not fire, and evaluation errors are logged and treated as not fired.
+        """
+        if self.code is None:
+            return False, {"error": self.error, "condition": self.rule.condition_expression}
+
+        names: Dict[str, Any] = dict(_LITERALS)
+        evaluated_values: Dict[str, Any] = {}
+        for (local_name, full_var, prefix), path in zip(self.variables, self.paths):
+            value = _resolve(input_data, path) if prefix == "input" else None
+            evaluated_values[full_var] = value
+            if value is None:
+                return False, {
+                    "condition": self.rule.condition_expression,
+                    "result": False,
+                    "evaluated_values": evaluated_values,
+                }
+            names[local_name] = value
+
+        try:
+            result = bool(eval(self.code, {"__builtins__": {}}, names))
+        except Exception as e:
+            logger.warning(f"Condition evaluation failed: {e}")
+            result = False
+
+        return result, {
+            "condition": self.rule.condition_expression,
+            "result": result,
+            "evaluated_values": evaluated_values,
+        }
+
+
+def _resolve(input_data: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+    obj: Any = input_data
+    for part in path:
+        if isinstance(obj, dict):
+            obj = obj.get(part)
+        else:
+            obj = getattr(obj, part, None)
+        if obj is None:
+            return None
+    return obj
+
+
+def _check_expression(tree: ast.AST) -> None:
+    """Reject private/dunder attribute and name access in conditions."""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Attribute) and node.attr.startswith("_"):
+            raise ValueError(f"attribute '{node.attr}' is not allowed in conditions")
+        if isinstance(node, ast.Name) and node.id.startswith("__"):
+            raise ValueError(f"name '{node.id}' is not allowed in conditions")
+
+
+def compile_rule(rule: ConstructabilityRule) -> CompiledRule:
+    """Compile a rule's condition_expression once."""
+    condition = rule.condition_expression
+    variables: List[Tuple[str, str, str]] = []
+    paths: List[Tuple[str, ...]] = []
+    local_names: Dict[str, str] = {}
+
+    def substitute(match: "re.Match[str]") -> str:
+        full_var = match.group(0)
+        if full_var not in local_names:
+            local_names[full_var] = f"_v{len(local_names)}"
+            variables.append((local_names[full_var], full_var, match.group(1)))
+            paths.append(tuple(match.group(2).split(".")))
+        return local_names[full_var]
+
+    # One regex pass, so "$input.load" never rewrites part of "$input.load_factor"
+    expression = _VARIABLE_PATTERN.sub(substitute, condition)
+    expression = expression.replace(" AND ", " and ").replace(" OR ", " or ").replace(" NOT ", " not ")
+
+    input_fields = frozenset(path[0] for (_, _, prefix), path in zip(variables, paths) if prefix == "input")
+    never_fires = any(prefix not in _EVALUATION_PREFIXES for _, _, prefix in variables)
+
+    try:
+        for path in paths:
+            if any(part.startswith("_") for part in path):
+                raise ValueError(f"variable path '{'.'.join(path)}' is not allowed in conditions")
+        tree = ast.parse(expression.strip(), mode="eval")
+        _check_expression(tree)
+        code = compile(tree, f"<rule {rule.rule_code}>", "eval")
+        error = None
+    except (SyntaxError, ValueError) as e:
+        logger.warning(f"Failed to compile condition for rule {rule.rule_code} '{condition}': {e}")
+        code, error = None, str(e)
+
+    return CompiledRule(
+        rule=rule,
+        code=code,
+        variables=tuple(variables),
+        paths=tuple(paths),
+        input_fields=input_fields,
+        never_fires=never_fires or code is None,
+        error=error,
+    )
+
+
+# ============================================================================
+# RULE SET
+# ============================================================================
+
+@dataclass
+class RecordEvaluation:
+    """Triggered rules for one input record."""
+    rules_evaluated: int
+    triggered: List[Tuple[CompiledRule, Dict[str, Any]]] = field(default_factory=list)
+
+
+class CompiledRuleSet:
+    """
+    The enabled rules, compiled and indexed.
+
+    ``select()`` reproduces get_applicable_rules(discipline, workflow_type);
+    ``evaluate()`` runs a selection against input records, visiting only the
+    rules whose $input fields are all present in a record.
+    """
+
+    def __init__(self, rows: Iterable[Dict[str, Any]]):
+        self.rules: List[CompiledRule] = []
+        self._by_discipline: Dict[str, List[int]] = {}
+        self._by_workflow: Dict[str, List[int]] = {}
+        self._universal: List[int] = []  # empty applicable_to: every workflow type
+        self._by_anchor_field: Dict[str, List[int]] = {}
+        self._fieldless: List[int] = []
+        self._selections: Dict[Tuple[Optional[str], Optional[str]], Dict[int, int]] = {}
+        self._lock = threading.Lock()
+
+        for row in rows:
+            self._add(compile_rule(ConstructabilityRule(**row)))
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def _add(self, compiled: CompiledRule) -> None:
+        position = len(self.rules)
+        self.rules.append(compiled)
+        rule = compiled.rule
+
+        self._by_discipline.setdefault(rule.discipline.value, []).append(position)
+        if not rule.applicable_to:
+            self._universal.append(position)
+        else:
+            for workflow_type in set(rule.applicable_to):
+                self._by_workflow.setdefault(workflow_type, []).append(position)
+
+        if compiled.never_fires:
+            return
+        if compiled.input_fields:
+            # Indexed under one of its fields; the full field set is checked on lookup
+            anchor = min(compiled.input_fields)
+            self._by_anchor_field.setdefault(anchor, []).append(position)
+        else:
+            self._fieldless.append(position)
+
+    def select(self, discipline: Optional[str], workflow_type: Optional[str]) -> Dict[int, int]:
+        """
+        Rules applicable to a discipline/workflow type, in evaluation order.
+
+        Returns:
+            Mapping of rule position -> evaluation order
+        """
+        key = (discipline, workflow_type)
+        with self._lock:
+            selection = self._selections.get(key)
+            if selection is not None:
+                return selection
+
+        by_workflow = set(self._universal)
+        if workflow_type is not None:
+            by_workflow.update(self._by_workflow.get(workflow_type, ()))
+        if discipline is not None:
+            by_discipline = set(self._by_discipline.get(discipline, ()))
+            by_discipline.update(self._by_discipline.get("general", ()))
+            by_workflow &= by_discipline
+
+        ordered = sorted(by_workflow, key=lambda position: (
+            _SEVERITY_RANK.get(self.rules[position].rule.severity.value, 5),
+            not self.rules[position].rule.is_mandatory,
+            self.rules[position].rule.rule_code,
+        ))
+        selection = {position: order for order, position in enumerate(ordered)}
+        with self._lock:
+            self._selections[key] = selection
+        return selection
+
+    def evaluate(
+        self,
+        selection: Dict[int, int],
+        input_records: List[Dict[str, Any]],
+        include_info: bool = False
+    ) -> List[RecordEvaluation]:
+        """Evaluate one rule selection against each input record."""
+        evaluations = []
+        for input_data in input_records:
+            present = {name for name, value in input_data.items() if value is not None}
+
+            candidates = [position for position in self._fieldless if position in selection]
+            for name in present:
+                for position in self._by_anchor_field.get(name, ()):
+                    if position in selection and self.rules[position].input_fields <= present:
+                        candidates.append(position)
+            candidates.sort(key=selection.__getitem__)
+
+            evaluation = RecordEvaluation(rules_evaluated=len(selection))
+            for position in candidates:
+                compiled = self.rules[position]
+                if compiled.rule.severity == RuleSeverity.INFO and not include_info:
+                    continue
+                was_triggered, details = compiled.evaluate(input_data)
+                if was_triggered:
+                    evaluation.triggered.append((compiled, details))
+            evaluations.append(evaluation)
+        return evaluations
+
+
+# ============================================================================
+# PROCESS-WIDE CACHE
+# ============================================================================
+
+_global_rule_set_cache: Optional[IndexCache[CompiledRuleSet]] = None
+_global_lock = threading.Lock()
+
+
+def get_rule_set_cache() -> IndexCache[CompiledRuleSet]:
+    """Get the process-wide compiled rule set cache."""
+    global _global_rule_set_cache
+    with _global_lock:
+        if _global_rule_set_cache is None:
+            _global_rule_set_cache = IndexCache(
+                "constructability rule set", "rules", ttl_seconds=settings.RULE_SET_TTL_SECONDS
+            )
+    return _global_rule_set_cache
+
+
+def build_rule_set(db: Any) -> CompiledRuleSet:
+    """Load and compile every enabled rule with one query."""
+    rows: List[Dict[str, Any]] = db.execute_query_dict(RULE_SET_SQL) or []
+    return CompiledRuleSet(rows)
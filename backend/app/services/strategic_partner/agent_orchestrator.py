@@ -8,6 +8,9 @@ Handles parallel execution of multiple analysis agents:
 - What-If Cost Engine
 - QAP Generator
 - Strategic Knowledge Graph queries
+
+CPU-bound engines run in the engine process pool (EngineRegistry execution
+tiers), so concurrent reviews use every core instead of sharing one GIL.
 """
 
 import asyncio
@@ -25,14 +28,11 @@ from app.schemas.strategic_partner.models import (
     CostInsight,
     QAPInsight,
 )
-from app.engines.constructability.constructability_analyzer import (
-    analyze_constructability,
-    generate_red_flag_report,
-)
+from app.engines.registry import engine_registry
+from app.engines.process_pool import get_engine_process_pool
 from app.engines.cost.boq_generator import generate_boq_from_design
 from app.engines.cost.cost_estimator import estimate_costs
 from app.engines.cost.duration_estimator import estimate_duration
-from app.engines.qap.qap_generator import generate_qap
 
 logger = logging.getLogger(__name__)
 
@@ -292,26 +292,23 @@ class AgentOrchestrator:
         site_constraints: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Run the Constructability Agent."""
-        # Run in executor to not block event loop
-        loop = asyncio.get_event_loop()
-
         analysis_input = {
             "design_outputs": design_data,
             "site_constraints": site_constraints,
             "analysis_depth": "standard",
         }
 
-        # Run analysis
-        analysis = await loop.run_in_executor(
-            None,
-            analyze_constructability,
+        # Run analysis (engine process pool)
+        analysis = await engine_registry.invoke_async(
+            "structural_constructability_analyzer_v1",
+            "analyze_constructability",
             analysis_input
         )
 
         # Generate red flag report
-        report = await loop.run_in_executor(
-            None,
-            generate_red_flag_report,
+        report = await engine_registry.invoke_async(
+            "structural_constructability_analyzer_v1",
+            "generate_red_flag_report",
             analysis
         )
 
@@ -368,8 +365,6 @@ class AgentOrchestrator:
         design_variables: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Run the What-If Cost Engine."""
-        loop = asyncio.get_event_loop()
-
         # Default complexity factors
         complexity_factors = {
             "formwork_multiplier": 1.0,
@@ -378,34 +373,31 @@ class AgentOrchestrator:
         }
 
         # Generate BOQ
-        boq_items, boq_summary = await loop.run_in_executor(
-            None,
-            lambda: generate_boq_from_design(
-                design_data,
-                design_variables,
-                design_type,
-                complexity_factors
-            )
+        boq_items, boq_summary = await self._run_cpu_bound(
+            "cost.generate_boq_from_design",
+            generate_boq_from_design,
+            design_data,
+            design_variables,
+            design_type,
+            complexity_factors
         )
 
         # Estimate costs
-        cost_estimation = await loop.run_in_executor(
-            None,
-            lambda: estimate_costs(boq_items, {})
+        cost_estimation = await self._run_cpu_bound(
+            "cost.estimate_costs", estimate_costs, boq_items, {}
         )
 
         # Extract material quantities
         material_quantities = self._extract_material_quantities(design_data, design_type)
 
         # Estimate duration
-        duration_estimation = await loop.run_in_executor(
-            None,
-            lambda: estimate_duration(
-                material_quantities,
-                design_type,
-                {},
-                design_variables
-            )
+        duration_estimation = await self._run_cpu_bound(
+            "cost.estimate_duration",
+            estimate_duration,
+            material_quantities,
+            design_type,
+            {},
+            design_variables
         )
 
         # Calculate efficiency metrics
@@ -445,8 +437,6 @@ class AgentOrchestrator:
         design_type: str
     ) -> Dict[str, Any]:
         """Run the QAP Generator."""
-        loop = asyncio.get_event_loop()
-
         # Prepare QAP input
         qap_input = {
             "project_scope": f"{design_type.title()} Construction",
@@ -456,9 +446,9 @@ class AgentOrchestrator:
         }
 
         # Generate QAP
-        qap_result = await loop.run_in_executor(
-            None,
-            generate_qap,
+        qap_result = await engine_registry.invoke_async(
+            "qap_generator_v1",
+            "generate_qap",
             qap_input
         )
 
@@ -517,6 +507,13 @@ class AgentOrchestrator:
             "cost_benchmarks": {},
         }
 
+    async def _run_cpu_bound(self, name: str, func, *args) -> Any:
+        """Run an unregistered CPU-bound engine function in the engine process pool."""
+        pool = get_engine_process_pool()
+        if pool is None:
+            return await asyncio.to_thread(func, *args)
+        return await pool.run_async(name, func, *args)
+
     def _extract_material_quantities(
         self,
         design_data: Dict[str, Any],
@@ -6,9 +6,12 @@ Services for Schema Version Control and A/B Testing
 from app.services.versioning.version_control import VersionControlService
 from app.services.versioning.experiment_service import ExperimentService
 from app.services.versioning.performance_analyzer import PerformanceAnalyzer
+from app.services.versioning.performance_rollups import PerformanceRollupStore, RollupStats
 
 __all__ = [
     'VersionControlService',
     'ExperimentService',
-    'PerformanceAnalyzer'
+    'PerformanceAnalyzer',
+    'PerformanceRollupStore',
+    'RollupStats'
 ]
@@ -8,6 +8,9 @@ This module provides:
 3. Confidence interval calculation
 4. Effect size computation (Cohen's d)
 5. Performance trend analysis
+
+Execution statistics are read from csa.execution_rollups (see
+performance_rollups.py), not by scanning csa.workflow_executions.
 """
 
 from typing import Dict, Any, List, Optional, Tuple
@@ -26,6 +29,7 @@ from app.schemas.versioning.models import (
     MetricComparison
 )
 from app.core.database import DatabaseConfig
+from app.services.versioning.performance_rollups import PerformanceRollupStore, RollupStats
 
 
 @dataclass
@@ -52,6 +56,7 @@ class PerformanceAnalyzer:
     def __init__(self):
         """Initialize analyzer with database connection."""
         self.db = DatabaseConfig()
+        self.rollups = PerformanceRollupStore(self.db)
 
     # ========================================================================
     # VERSION COMPARISON
@@ -169,55 +174,24 @@ class PerformanceAnalyzer:
         period_end: datetime
     ) -> Dict[str, Any]:
         """Get execution statistics for a version/variant."""
-        variant_condition = "AND variant_id = %s" if variant_id else "AND variant_id IS NULL"
-        params = [schema_id, period_start, period_end]
-        if variant_id:
-            params.append(variant_id)
-
-        query = f"""
-            SELECT
-                COUNT(*) as total,
-                COUNT(*) FILTER (WHERE execution_status IN ('completed', 'approved')) as successful,
-                COUNT(*) FILTER (WHERE execution_status = 'failed') as failed,
-                AVG(execution_time_ms) as avg_time,
-                STDDEV(execution_time_ms) as std_time,
-                AVG(risk_score) as avg_risk,
-                STDDEV(risk_score) as std_risk,
-                ARRAY_AGG(execution_time_ms) FILTER (WHERE execution_time_ms IS NOT NULL) as times,
-                ARRAY_AGG(risk_score) FILTER (WHERE risk_score IS NOT NULL) as risks
-            FROM csa.workflow_executions
-            WHERE schema_id = %s
-              AND created_at >= %s
-              AND created_at < %s
-              {variant_condition};
-        """
-
-        result = self.db.execute_query_dict(query, tuple(params))
-
-        if not result or not result[0]:
-            return {
-                'total': 0,
-                'successful': 0,
-                'failed': 0,
-                'avg_time': 0,
-                'std_time': 0,
-                'avg_risk': 0,
-                'std_risk': 0,
-                'times': [],
-                'risks': []
-            }
-
-        row = result[0]
+        stats = self.rollups.window(
+            schema_id,
+            period_start,
+            period_end,
+            version=version,
+            variant_id=variant_id,
+            base_variant_only=True
+        )
         return {
-            'total': row.get('total', 0) or 0,
-            'successful': row.get('successful', 0) or 0,
-            'failed': row.get('failed', 0) or 0,
-            'avg_time': float(row['avg_time']) if row.get('avg_time') else 0,
-            'std_time': float(row['std_time']) if row.get('std_time') else 0,
-            'avg_risk': float(row['avg_risk']) if row.get('avg_risk') else 0,
-            'std_risk': float(row['std_risk']) if row.get('std_risk') else 0,
-            'times': row.get('times', []) or [],
-            'risks': row.get('risks', []) or []
+            'total': stats.total,
+            'successful': stats.successful,
+            'failed': stats.failed,
+            'avg_time': stats.avg_time or 0,
+            'std_time': stats.std_time or 0,
+            'avg_risk': stats.avg_risk or 0,
+            'std_risk': stats.std_risk or 0,
+            'p50_time': stats.time_percentile(0.50),
+            'p95_time': stats.time_percentile(0.95)
         }
 
     def _analyze_metric(
@@ -537,18 +511,7 @@ class PerformanceAnalyzer:
         schema = schema_result[0]
 
         # Get overall stats
-        stats_query = """
-            SELECT
-                COUNT(*) as total,
-                COUNT(*) FILTER (WHERE execution_status IN ('completed', 'approved')) as successful,
-                COUNT(*) FILTER (WHERE execution_status = 'failed') as failed,
-                AVG(execution_time_ms) as avg_time,
-                AVG(risk_score) as avg_risk
-            FROM csa.workflow_executions
-            WHERE schema_id = %s;
-        """
-        stats_result = self.db.execute_query_dict(stats_query, (schema_id,))
-        stats = stats_result[0] if stats_result else {}
+        stats = self.rollups.window(schema_id)
 
         # Get variant/experiment counts
         variant_query = """
@@ -584,9 +547,6 @@ class PerformanceAnalyzer:
             elif avg_second < avg_first * 0.9:
                 execution_trend = "down"
 
-        total = stats.get('total', 0) or 0
-        successful = stats.get('successful', 0) or 0
-
         return SchemaPerformanceSummary(
             schema_id=schema['id'],
             deliverable_type=schema['deliverable_type'],
@@ -594,12 +554,12 @@ class PerformanceAnalyzer:
             discipline=schema['discipline'],
             current_version=schema['version'],
             status=schema['status'],
-            total_executions=total,
-            successful_executions=successful,
-            failed_executions=stats.get('failed', 0) or 0,
-            avg_execution_time_ms=float(stats['avg_time']) if stats.get('avg_time') else None,
-            avg_risk_score=float(stats['avg_risk']) if stats.get('avg_risk') else None,
-            success_rate=successful / total if total > 0 else None,
+            total_executions=stats.total,
+            successful_executions=stats.successful,
+            failed_executions=stats.failed,
+            avg_execution_time_ms=stats.avg_time,
+            avg_risk_score=stats.avg_risk,
+            success_rate=stats.success_rate,
             active_variants=active_variants,
             active_experiments=active_experiments,
             execution_trend=execution_trend,
@@ -624,45 +584,37 @@ class PerformanceAnalyzer:
         Returns:
             List of PerformanceTrend by day
         """
-        variant_condition = "AND variant_id = %s" if variant_id else ""
-        params = [schema_id, days]
-        if variant_id:
-            params.append(variant_id)
-
-        query = f"""
-            SELECT
-                DATE(created_at) as period,
-                COUNT(*) as total,
-                COUNT(*) FILTER (WHERE execution_status IN ('completed', 'approved')) as successful,
-                COUNT(*) FILTER (WHERE execution_status = 'failed') as failed,
-                AVG(execution_time_ms) as avg_time,
-                AVG(risk_score) as avg_risk
-            FROM csa.workflow_executions
-            WHERE schema_id = %s
-              AND created_at >= NOW() - (%s || ' days')::INTERVAL
-              {variant_condition}
-            GROUP BY DATE(created_at)
-            ORDER BY period DESC;
-        """
-
-        result = self.db.execute_query_dict(query, tuple(params))
+        return [
+            PerformanceTrend(
+                period=period.isoformat() if hasattr(period, 'isoformat') else str(period),
+                total_executions=stats.total,
+                successful_executions=stats.successful,
+                failed_executions=stats.failed,
+                avg_execution_time_ms=stats.avg_time,
+                avg_risk_score=stats.avg_risk,
+                success_rate=stats.success_rate
+            )
+            for period, stats in self.rollups.daily(schema_id, days, variant_id)
+        ]
 
-        trends = []
-        for row in result:
-            total = row.get('total', 0) or 0
-            successful = row.get('successful', 0) or 0
+    def backfill_rollups(
+        self,
+        schema_id: Optional[UUID] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> int:
+        """
+        Rebuild execution rollups from csa.workflow_executions.
 
-            trends.append(PerformanceTrend(
-                period=row['period'].isoformat() if hasattr(row['period'], 'isoformat') else str(row['period']),
-                total_executions=total,
-                successful_executions=successful,
-                failed_executions=row.get('failed', 0) or 0,
-                avg_execution_time_ms=float(row['avg_time']) if row.get('avg_time') else None,
-                avg_risk_score=float(row['avg_risk']) if row.get('avg_risk') else None,
-                success_rate=successful / total if total > 0 else None
-            ))
+        Args:
+            schema_id: Schema to rebuild (None: all schemas)
+            start: Start of the range (None: all history)
+            end: End of the range (None: now)
 
-        return trends
+        Returns:
+            Number of rollup rows written
+        """
+        return self.rollups.backfill(schema_id, start, end)
 
     def get_metric_comparison(
         self,
@@ -730,40 +682,25 @@ class PerformanceAnalyzer:
         schema_id: UUID,
         start: datetime,
         end: datetime
-    ) -> Dict[str, Any]:
+    ) -> RollupStats:
         """Get stats for a specific time period."""
-        query = """
-            SELECT
-                COUNT(*) as total,
-                COUNT(*) FILTER (WHERE execution_status IN ('completed', 'approved')) as successful,
-                AVG(execution_time_ms) as avg_time,
-                AVG(risk_score) as avg_risk
-            FROM csa.workflow_executions
-            WHERE schema_id = %s
-              AND created_at >= %s
-              AND created_at < %s;
-        """
-
-        result = self.db.execute_query_dict(query, (schema_id, start, end))
-        return result[0] if result else {}
+        return self.rollups.window(schema_id, start, end)
 
     def _extract_metric(
         self,
-        stats: Dict[str, Any],
+        stats: RollupStats,
         metric: str
     ) -> Optional[float]:
         """Extract metric value from stats."""
-        if not stats:
+        if not stats.total:
             return None
 
         if metric == "success_rate":
-            total = stats.get('total', 0) or 0
-            successful = stats.get('successful', 0) or 0
-            return successful / total if total > 0 else None
+            return stats.success_rate
         elif metric == "execution_time":
-            return float(stats['avg_time']) if stats.get('avg_time') else None
+            return stats.avg_time
         elif metric == "risk_score":
-            return float(stats['avg_risk']) if stats.get('avg_risk') else None
+            return stats.avg_risk
 
         return None
 
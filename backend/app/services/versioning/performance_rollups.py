@@ -0,0 +1,259 @@
+"""
+CSA AIaaS Platform - Execution Performance Rollups
+Performance: Version/variant analytics from incremental rollup tables
+
+Version comparisons and dashboards used to scan csa.workflow_executions for
+every request (and pull every execution time / risk score of the window into
+Python). csa.execution_rollups (init_performance_rollups.sql) holds one row
+per (schema, version, variant, hour) instead, maintained by trigger as
+executions are written and finalized, so each read aggregates a few hundred
+rollup rows server-side.
+
+Features:
+- Counts, sums and sums of squares per bucket: mean and sample standard
+  deviation match AVG/STDDEV over the raw executions
+- Fixed-bucket histograms of execution time and risk score for percentiles
+- Window, all-time and daily reads aggregated in SQL (one row / one row per day)
+- Backfill of a schema or time range from the executions table
+
+Windows are resolved at hour granularity: a window starting mid-hour
+includes that whole hour.
+"""
+
+import math
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from app.core.database import DatabaseConfig
+
+# Histogram bucket lower bounds; keep in sync with csa.rollup_time_bounds()
+# and csa.rollup_risk_bounds() in init_performance_rollups.sql
+TIME_HISTOGRAM_BOUNDS_MS = [50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000, 250000, 600000]
+RISK_HISTOGRAM_BOUNDS = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9]
+
+_AGGREGATE_COLUMNS = """
+    COALESCE(SUM(total_executions), 0) AS total,
+    COALESCE(SUM(successful_executions), 0) AS successful,
+    COALESCE(SUM(failed_executions), 0) AS failed,
+    COALESCE(SUM(pending_approval), 0) AS pending,
+    COALESCE(SUM(hitl_required_count), 0) AS hitl,
+    COALESCE(SUM(time_count), 0) AS time_count,
+    COALESCE(SUM(time_sum), 0) AS time_sum,
+    COALESCE(SUM(time_sum_sq), 0) AS time_sum_sq,
+    MIN(time_min) AS time_min,
+    MAX(time_max) AS time_max,
+    csa.sum_histogram(time_histogram) AS time_histogram,
+    COALESCE(SUM(risk_count), 0) AS risk_count,
+    COALESCE(SUM(risk_sum), 0) AS risk_sum,
+    COALESCE(SUM(risk_sum_sq), 0) AS risk_sum_sq,
+    MIN(risk_min) AS risk_min,
+    MAX(risk_max) AS risk_max,
+    csa.sum_histogram(risk_histogram) AS risk_histogram
+"""
+
+
+# ============================================================================
+# ROLLUP STATISTICS
+# ============================================================================
+
+def _sample_std(count: int, total: float, total_sq: float) -> Optional[float]:
+    """Sample standard deviation from count/sum/sum of squares (like STDDEV)."""
+    if count < 2:
+        return None
+    variance = (total_sq - total * total / count) / (count - 1)
+    return math.sqrt(max(variance, 0.0))
+
+
+def histogram_quantile(
+    counts: List[int],
+    bounds: List[float],
+    low: Optional[float],
+    high: Optional[float],
+    q: float
+) -> Optional[float]:
+    """Quantile estimated from a histogram (linear within the bucket holding it)."""
+    total = sum(counts)
+    if total <= 0 or low is None or high is None:
+        return None
+    rank = q * total
+    seen = 0
+    for i, count in enumerate(counts):
+        if count > 0 and seen + count >= rank:
+            lower = max(bounds[i - 1] if i > 0 else low, low)
+            upper = min(bounds[i] if i < len(bounds) else high, high)
+            return lower + (upper - lower) * max(rank - seen, 0) / count
+        seen += count
+    return high
+
+
+@dataclass
+class RollupStats:
+    """Execution statistics aggregated over rollup buckets."""
+
+    total: int = 0
+    successful: int = 0
+    failed: int = 0
+    pending: int = 0
+    hitl: int = 0
+    time_count: int = 0
+    time_sum: float = 0.0
+    time_sum_sq: float = 0.0
+    time_min: Optional[float] = None
+    time_max: Optional[float] = None
+    time_histogram: List[int] = field(default_factory=lambda: [0] * (len(TIME_HISTOGRAM_BOUNDS_MS) + 1))
+    risk_count: int = 0
+    risk_sum: float = 0.0
+    risk_sum_sq: float = 0.0
+    risk_min: Optional[float] = None
+    risk_max: Optional[float] = None
+    risk_histogram: List[int] = field(default_factory=lambda: [0] * (len(RISK_HISTOGRAM_BOUNDS) + 1))
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "RollupStats":
+        stats = cls()
+        for name in ("total", "successful", "failed", "pending", "hitl", "time_count", "risk_count"):
+            setattr(stats, name, int(row.get(name) or 0))
+        for name in ("time_sum", "time_sum_sq", "risk_sum", "risk_sum_sq"):
+            setattr(stats, name, float(row.get(name) or 0))
+        for name in ("time_min", "time_max", "risk_min", "risk_max"):
+            setattr(stats, name, float(row[name]) if row.get(name) is not None else None)
+        if row.get("time_histogram"):
+            stats.time_histogram = [int(c) for c in row["time_histogram"]]
+        if row.get("risk_histogram"):
+            stats.risk_histogram = [int(c) for c in row["risk_histogram"]]
+        return stats
+
+    @property
+    def avg_time(self) -> Optional[float]:
+        return self.time_sum / self.time_count if self.time_count else None
+
+    @property
+    def std_time(self) -> Optional[float]:
+        return _sample_std(self.time_count, self.time_sum, self.time_sum_sq)
+
+    @property
+    def avg_risk(self) -> Optional[float]:
+        return self.risk_sum / self.risk_count if self.risk_count else None
+
+    @property
+    def std_risk(self) -> Optional[float]:
+        return _sample_std(self.risk_count, self.risk_sum, self.risk_sum_sq)
+
+    @property
+    def success_rate(self) -> Optional[float]:
+        return self.successful / self.total if self.total else None
+
+    def time_percentile(self, q: float) -> Optional[float]:
+        return histogram_quantile(self.time_histogram, TIME_HISTOGRAM_BOUNDS_MS, self.time_min, self.time_max, q)
+
+    def risk_percentile(self, q: float) -> Optional[float]:
+        return histogram_quantile(self.risk_histogram, RISK_HISTOGRAM_BOUNDS, self.risk_min, self.risk_max, q)
+
+
+# ============================================================================
+# ROLLUP STORE
+# ============================================================================
+
+class PerformanceRollupStore:
+    """Reads (and backfills) csa.execution_rollups."""
+
+    def __init__(self, db: Optional[DatabaseConfig] = None):
+        self.db = db or DatabaseConfig()
+
+    def window(
+        self,
+        schema_id: UUID,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        version: Optional[int] = None,
+        variant_id: Optional[UUID] = None,
+        base_variant_only: bool = False
+    ) -> RollupStats:
+        """
+        Statistics of a schema's executions created in [start, end).
+
+        Args:
+            schema_id: Schema
+            start: Window start (None: all history), rounded down to the hour
+            end: Window end (None: now)
+            version: Only this schema version (executions with no recorded
+                     version count towards every version)
+            variant_id: Only this variant
+            base_variant_only: Only executions without a variant
+                               (ignored when variant_id is given)
+        """
+        conditions, params = self._filters(schema_id, version, variant_id, base_variant_only)
+        if start is not None:
+            conditions.append("bucket_start >= date_trunc('hour', %s::timestamp)")
+            params.append(start)
+        if end is not None:
+            conditions.append("bucket_start < %s")
+            params.append(end)
+
+        query = f"""
+            SELECT {_AGGREGATE_COLUMNS}
+            FROM csa.execution_rollups
+            WHERE {' AND '.join(conditions)};
+        """
+        result = self.db.execute_query_dict(query, tuple(params))
+        return RollupStats.from_row(result[0]) if result else RollupStats()
+
+    def daily(
+        self,
+        schema_id: UUID,
+        days: int,
+        variant_id: Optional[UUID] = None
+    ) -> List[Tuple[date, RollupStats]]:
+        """Per-day statistics of the last `days` days, newest first."""
+        conditions, params = self._filters(schema_id, None, variant_id, False)
+        conditions.append("bucket_start >= date_trunc('hour', NOW()::timestamp - (%s || ' days')::INTERVAL)")
+        params.append(days)
+
+        query = f"""
+            SELECT DATE(bucket_start) AS period, {_AGGREGATE_COLUMNS}
+            FROM csa.execution_rollups
+            WHERE {' AND '.join(conditions)}
+            GROUP BY DATE(bucket_start)
+            ORDER BY period DESC;
+        """
+        result = self.db.execute_query_dict(query, tuple(params))
+        return [(row["period"], RollupStats.from_row(row)) for row in result]
+
+    def backfill(
+        self,
+        schema_id: Optional[UUID] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> int:
+        """
+        Rebuild rollups from csa.workflow_executions (whole hours in [start, end)).
+
+        Returns:
+            Number of rollup rows written
+        """
+        result = self.db.execute_query(
+            "SELECT csa.backfill_execution_rollups(%s, %s, %s);",
+            (schema_id, start, end)
+        )
+        return result[0][0] if result else 0
+
+    @staticmethod
+    def _filters(
+        schema_id: UUID,
+        version: Optional[int],
+        variant_id: Optional[UUID],
+        base_variant_only: bool
+    ) -> Tuple[List[str], List[Any]]:
+        conditions = ["schema_id = %s"]
+        params: List[Any] = [schema_id]
+        if version is not None:
+            conditions.append("(schema_version = %s OR schema_version IS NULL)")
+            params.append(version)
+        if variant_id is not None:
+            conditions.append("variant_id = %s")
+            params.append(variant_id)
+        elif base_variant_only:
+            conditions.append("variant_id IS NULL")
+        return conditions, params
@@ -5,7 +5,7 @@ Version Control Service - Schema Variant Management
 This service provides:
 1. CRUD operations for schema variants
 2. Traffic allocation management
-3. Variant selection for execution
+3. Variant selection for execution (in-process, from cached allocation tables)
 4. Version performance tracking
 """
 
@@ -24,6 +24,11 @@ from app.schemas.versioning.models import (
     VersionControlStats
 )
 from app.core.database import DatabaseConfig
+from app.services.schema_cache import (
+    get_schema_cache,
+    publish_invalidation,
+    select_weighted_variant
+)
 
 
 class VersionControlService:
@@ -40,6 +45,7 @@ class VersionControlService:
     def __init__(self):
         """Initialize service with database connection."""
         self.db = DatabaseConfig()
+        self.cache = get_schema_cache()
 
     # ========================================================================
     # VARIANT CRUD
@@ -113,6 +119,8 @@ class VersionControlService:
         if not result:
             raise RuntimeError("Failed to create variant")
 
+        self._invalidate_cache(variant_data.schema_id)
+
         # Log audit
         self.db.log_audit(
             user_id=created_by,
@@ -128,8 +136,13 @@ class VersionControlService:
 
         return self._row_to_variant(result[0])
 
-    def get_variant(self, variant_id: UUID) -> Optional[SchemaVariant]:
-        """Get variant by ID."""
+    def get_variant(self, variant_id: UUID, use_cache: bool = True) -> Optional[SchemaVariant]:
+        """Get variant by ID (active variants are served from the allocation cache)."""
+        if use_cache:
+            cached = self.cache.find_variant(variant_id)
+            if cached is not None:
+                return cached
+
         query = "SELECT * FROM csa.schema_variants WHERE id = %s;"
         result = self.db.execute_query_dict(query, (variant_id,))
         return self._row_to_variant(result[0]) if result else None
@@ -211,7 +224,7 @@ class VersionControlService:
         Raises:
             ValueError: If variant not found
         """
-        existing = self.get_variant(variant_id)
+        existing = self.get_variant(variant_id, use_cache=False)
         if not existing:
             raise ValueError(f"Variant {variant_id} not found")
 
@@ -268,6 +281,8 @@ class VersionControlService:
         if not result:
             raise RuntimeError("Failed to update variant")
 
+        self._invalidate_cache(existing.schema_id)
+
         # Log audit
         self.db.log_audit(
             user_id=updated_by,
@@ -290,7 +305,7 @@ class VersionControlService:
         Returns:
             True if deleted
         """
-        existing = self.get_variant(variant_id)
+        existing = self.get_variant(variant_id, use_cache=False)
         if not existing:
             return False
 
@@ -301,6 +316,7 @@ class VersionControlService:
         """
 
         self.db.execute_query(query, (datetime.utcnow(), deleted_by, variant_id), fetch=False)
+        self._invalidate_cache(existing.schema_id)
 
         self.db.log_audit(
             user_id=deleted_by,
@@ -361,6 +377,8 @@ class VersionControlService:
             if result:
                 updated_variants.append(self._row_to_variant(result[0]))
 
+        self._invalidate_cache(schema_id)
+
         # Log audit
         self.db.log_audit(
             user_id=updated_by,
@@ -375,23 +393,73 @@ class VersionControlService:
 
         return updated_variants
 
+    def get_active_variants(self, schema_id: UUID, schema_version: int) -> List[SchemaVariant]:
+        """
+        Get the allocation table for a schema: active variants with traffic.
+
+        Cached per schema_id + schema version and invalidated whenever a
+        variant or its traffic allocation changes.
+
+        Args:
+            schema_id: Schema UUID
+            schema_version: Current schema version (part of the cache key)
+
+        Returns:
+            Active variants with traffic_allocation > 0, ordered by variant_key
+        """
+        cached = self.cache.get_variants(schema_id, schema_version)
+        if cached is not None:
+            return cached
+        generation = self.cache.generation
+
+        query = """
+            SELECT * FROM csa.schema_variants
+            WHERE schema_id = %s
+              AND status = 'active'
+              AND traffic_allocation > 0
+            ORDER BY variant_key;
+        """
+
+        result = self.db.execute_query_dict(query, (schema_id,))
+        variants = [self._row_to_variant(row) for row in result]
+        self.cache.put_variants(schema_id, schema_version, variants, generation)
+        return variants
+
     def select_variant_for_execution(
         self,
         schema_id: UUID,
-        experiment_id: Optional[UUID] = None
+        experiment_id: Optional[UUID] = None,
+        schema_version: Optional[int] = None
     ) -> VariantSelectionResult:
         """
         Select a variant for execution based on traffic allocation.
 
-        Uses weighted random selection based on traffic percentages.
+        Uses weighted random selection based on traffic percentages. When
+        the schema version is known and no experiment is given, selection
+        happens in process from the cached allocation table; experiment
+        allocations still use csa.select_variant_for_execution.
 
         Args:
             schema_id: Schema being executed
             experiment_id: Optional experiment context
+            schema_version: Current schema version (enables the cached path)
 
         Returns:
             VariantSelectionResult with selected variant (or None for base)
         """
+        if experiment_id is None and schema_version is not None:
+            variant = select_weighted_variant(
+                self.get_active_variants(schema_id, schema_version)
+            )
+            if variant is None:
+                return VariantSelectionResult(use_base_version=True)
+            return VariantSelectionResult(
+                variant_id=variant.id,
+                variant_key=variant.variant_key,
+                traffic_percentage=variant.traffic_allocation,
+                use_base_version=False
+            )
+
         # Use database function for selection
         query = """
             SELECT variant_id, variant_key, traffic_percentage
@@ -454,6 +522,10 @@ class VersionControlService:
         """
         Trigger metrics aggregation for a version/variant.
 
+        csa.aggregate_version_metrics reads the hourly execution rollups
+        (init_performance_rollups.sql), so the cost does not grow with the
+        number of executions in the period.
+
         Args:
             schema_id: Schema UUID
             version: Version number
@@ -522,6 +594,11 @@ class VersionControlService:
     # HELPERS
     # ========================================================================
 
+    def _invalidate_cache(self, schema_id: UUID) -> None:
+        """Drop cached allocation tables for a schema here and in other processes."""
+        self.cache.invalidate_variants(schema_id)
+        publish_invalidation(self.db, "variants", str(schema_id))
+
     def _row_to_variant(self, row: dict) -> SchemaVariant:
         """Convert database row to SchemaVariant."""
         return SchemaVariant(
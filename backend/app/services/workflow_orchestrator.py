@@ -12,18 +12,23 @@ Variable Substitution Syntax:
 
 Key Features:
 - Load workflow schema from database
-- Execute steps sequentially with dependency resolution
+- Execute steps concurrently with dataflow dependency resolution
 - Variable substitution and data passing between steps
-- Error handling per step configuration
+- Error handling per step configuration: retries with jittered backoff,
+  step timeouts and a workflow deadline, per-engine circuit breakers
 - Risk assessment and HITL decision-making
 - Execution audit trail
+- Incremental re-runs: reuse stored step results not affected by input changes
+- Steps compiled once per schema version (accessors, bound engines, dependency graph)
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from uuid import UUID, uuid4
 from datetime import datetime
-import re
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import json
+import logging
 
 from app.schemas.workflow.schema_models import (
     DeliverableSchema,
@@ -33,8 +38,20 @@ from app.schemas.workflow.schema_models import (
     WorkflowExecutionCreate
 )
 from app.services.schema_service import SchemaService
-from app.engines.registry import invoke_engine
 from app.core.database import DatabaseConfig
+from app.execution.parallel_executor import ParallelExecutor, ExecutionContext
+from app.execution.validation_engine import ValidationEngine
+from app.execution.rerun_planner import RerunPlan, RerunSource
+from app.execution.execution_plan import CompiledStep, compile_condition, compile_reference, get_execution_plan
+from app.execution.retry_manager import ErrorType, RetryConfig, RetryManager
+from app.execution.step_threads import StepCapacityError, get_step_thread_pool
+from app.execution.timeout_manager import Deadline, DeadlineExceeded, run_with_deadline
+from app.execution.circuit_breaker import CircuitOpenError, get_circuit_breaker, is_dependency_failure
+from app.engines.process_pool import EngineProcessCrashedError, EngineProcessPoolBusyError
+from app.engines.registry import engine_registry
+from app.engines.sandbox import EngineMemoryLimitError, EngineSandboxError, EngineWorkerCrashedError
+from app.core.config import settings
+from app.risk.historical_stats import record_execution
 
 # Import streaming for real-time updates
 try:
@@ -43,6 +60,8 @@ try:
 except ImportError:
     STREAMING_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
 
 # ============================================================================
 # WORKFLOW ORCHESTRATOR
@@ -60,6 +79,8 @@ class WorkflowOrchestrator:
         """Initialize orchestrator with services."""
         self.schema_service = SchemaService()
         self.db = DatabaseConfig()
+        self.validation_engine = ValidationEngine()
+        self.retry_manager = RetryManager()
 
     # ========================================================================
     # WORKFLOW EXECUTION
@@ -71,7 +92,9 @@ class WorkflowOrchestrator:
         input_data: Dict[str, Any],
         user_id: str,
         project_id: Optional[UUID] = None,
-        experiment_id: Optional[UUID] = None
+        experiment_id: Optional[UUID] = None,
+        execution_id: Optional[UUID] = None,
+        rerun_source: Optional[RerunSource] = None
     ) -> WorkflowExecution:
         """
         Execute a workflow based on its schema.
@@ -82,6 +105,10 @@ class WorkflowOrchestrator:
             user_id: User executing the workflow
             project_id: Optional project association
             experiment_id: Optional experiment context for A/B testing
+            execution_id: Optional pre-assigned execution ID (used when the
+                          ID is handed to the client before execution starts)
+            rerun_source: Optional earlier execution whose step results are
+                          reused where unaffected (see rerun_workflow)
 
         Returns:
             WorkflowExecution record with results
@@ -113,7 +140,7 @@ class WorkflowOrchestrator:
             raise ValueError(f"Schema '{deliverable_type}' is {schema.status}, cannot execute")
 
         # Validate input data against schema
-        self._validate_input(input_data, schema.input_schema)
+        self._validate_input(input_data, schema.input_schema, schema_key=(schema.id, schema.version, "input"))
 
         # Select variant for A/B testing (if applicable)
         variant_id = None
@@ -125,7 +152,8 @@ class WorkflowOrchestrator:
             version_service = VersionControlService()
             variant_selection = version_service.select_variant_for_execution(
                 schema.id,
-                experiment_id
+                experiment_id,
+                schema_version=schema.version
             )
 
             if not variant_selection.use_base_version:
@@ -135,9 +163,12 @@ class WorkflowOrchestrator:
                 # Apply variant overrides if present
                 variant = version_service.get_variant(variant_id)
                 if variant and variant.risk_config_override:
-                    # Override risk config for this execution
+                    # Override risk config for this execution only (the
+                    # cached schema is shared across executions)
                     from app.schemas.workflow.schema_models import RiskConfig
-                    schema.risk_config = RiskConfig(**variant.risk_config_override)
+                    schema = schema.model_copy(update={
+                        "risk_config": RiskConfig(**variant.risk_config_override)
+                    })
         except ImportError:
             # Version control not available, use base version
             pass
@@ -146,7 +177,7 @@ class WorkflowOrchestrator:
             print(f"Warning: Variant selection failed: {e}")
 
         # Create execution record
-        execution_id = uuid4()
+        execution_id = execution_id or uuid4()
         started_at = datetime.utcnow()
 
         execution = self._create_execution_record(
@@ -193,88 +224,35 @@ class WorkflowOrchestrator:
                 }
             }
 
-            step_results: List[StepResult] = []
+            rerun_plan = self._plan_rerun(rerun_source, schema, execution_context)
 
-            for step in schema.workflow_steps:
-                # Check if step should be executed (conditional execution)
-                if step.condition and not self._evaluate_condition(step.condition, execution_context):
-                    # Skip this step
-                    step_result = StepResult(
-                        step_number=step.step_number,
-                        step_name=step.step_name,
-                        status="skipped",
-                        execution_time_ms=0
-                    )
-                    step_results.append(step_result)
-                    continue
-
-                # Emit step started event
-                if STREAMING_AVAILABLE:
-                    try:
-                        from app.execution import StreamEventType
-                        streaming_manager.emit(str(execution_id), StreamEvent(
-                            event_type=StreamEventType.STEP_STARTED,
-                            execution_id=str(execution_id),
-                            timestamp=datetime.utcnow().isoformat(),
-                            data={
-                                "step_number": step.step_number,
-                                "step_name": step.step_name,
-                                "function": step.function_to_call
-                            }
-                        ))
-                    except Exception as e:
-                        print(f"Warning: Failed to emit step_started event: {e}")
-
-                # Execute step
-                step_result = self._execute_step(step, execution_context, schema)
-                step_results.append(step_result)
-
-                # Emit step completed/failed event
-                if STREAMING_AVAILABLE:
-                    try:
-                        from app.execution import StreamEventType
-                        event_type_enum = StreamEventType.STEP_COMPLETED if step_result.status == "completed" else StreamEventType.STEP_FAILED
-                        streaming_manager.emit(str(execution_id), StreamEvent(
-                            event_type=event_type_enum,
-                            execution_id=str(execution_id),
-                            timestamp=datetime.utcnow().isoformat(),
-                            data={
-                                "step_number": step.step_number,
-                                "step_name": step.step_name,
-                                "status": step_result.status,
-                                "execution_time_ms": step_result.execution_time_ms,
-                                "error_message": step_result.error_message if step_result.status == "failed" else None,
-                                "progress": int((len(step_results) / len(schema.workflow_steps)) * 100)
-                            }
-                        ))
-                    except Exception as e:
-                        print(f"Warning: Failed to emit step completion event: {e}")
-
-                # Store step output in context
-                if step_result.status == "completed" and step_result.output_data:
-                    execution_context["steps"][step.output_variable] = step_result.output_data
-
-                # Handle step failure
-                if step_result.status == "failed":
-                    if step.error_handling.on_error == "fail":
-                        # Stop workflow
-                        execution = self._finalize_execution(
-                            execution_id=execution_id,
-                            status="failed",
-                            step_results=step_results,
-                            user_id=user_id,
-                            error_message=step_result.error_message,
-                            error_step=step.step_number,
-                            started_at=started_at
-                        )
-                        return execution
-                    elif step.error_handling.on_error == "skip":
-                        # Skip step and continue
-                        continue
-                    elif step.error_handling.on_error == "continue":
-                        # Use fallback value and continue
-                        if step.error_handling.fallback_value is not None:
-                            execution_context["steps"][step.output_variable] = step.error_handling.fallback_value
+            # Independent steps run concurrently (dataflow scheduling)
+            step_results, schedule_stats = self._execute_steps(
+                schema, execution_context, execution_id, rerun_plan
+            )
+
+            # Handle critical step failure (on_error == "fail" stops the workflow)
+            step_map = {step.step_number: step for step in schema.workflow_steps}
+            failed_critical = next(
+                (
+                    r for r in step_results
+                    if r.status == "failed"
+                    and step_map[r.step_number].error_handling.on_error == "fail"
+                ),
+                None
+            )
+            if failed_critical:
+                execution = self._finalize_execution(
+                    execution_id=execution_id,
+                    status="failed",
+                    step_results=step_results,
+                    user_id=user_id,
+                    error_message=failed_critical.error_message,
+                    error_step=failed_critical.step_number,
+                    started_at=started_at
+                )
+                execution.execution_stats = schedule_stats
+                return execution
 
             # All steps completed successfully
             # Determine final output (last step's output or aggregated result)
@@ -299,6 +277,7 @@ class WorkflowOrchestrator:
                 requires_approval=requires_approval,
                 started_at=started_at
             )
+            execution.execution_stats = schedule_stats
 
             # Emit execution completed event
             if STREAMING_AVAILABLE:
@@ -314,6 +293,7 @@ class WorkflowOrchestrator:
                             "requires_approval": requires_approval,
                             "total_steps": len(step_results),
                             "successful_steps": len([s for s in step_results if s.status == "completed"]),
+                            "measured_speedup": schedule_stats.get("measured_speedup"),
                             "progress": 100
                         }
                     ))
@@ -337,6 +317,7 @@ class WorkflowOrchestrator:
             if STREAMING_AVAILABLE:
                 try:
                     from app.execution import StreamEventType
+                    streaming_manager = get_streaming_manager()
                     streaming_manager.emit(str(execution_id), StreamEvent(
                         event_type=StreamEventType.EXECUTION_FAILED,
                         execution_id=str(execution_id),
@@ -351,79 +332,475 @@ class WorkflowOrchestrator:
 
             return execution
 
+    # ========================================================================
+    # INCREMENTAL RE-EXECUTION
+    # ========================================================================
+
+    def rerun_workflow(
+        self,
+        source_execution_id: UUID,
+        input_changes: Dict[str, Any],
+        user_id: str,
+        project_id: Optional[UUID] = None,
+        execution_id: Optional[UUID] = None
+    ) -> WorkflowExecution:
+        """
+        Re-run an execution with changed inputs, recomputing only affected steps.
+
+        The new execution gets the source's input with input_changes applied.
+        Steps that neither read a changed input nor depend on a recomputed
+        step whose output changed reuse their stored result
+        (StepResult.reused); execution_stats["rerun"] lists reused and
+        recomputed steps. If the schema has changed version since the
+        source execution, every step runs.
+
+        Args:
+            source_execution_id: Execution to start from
+            input_changes: Input fields to change (others keep their source value)
+            user_id: User executing the workflow
+            project_id: Optional project association (defaults to the source's)
+            execution_id: Optional pre-assigned execution ID
+
+        Returns:
+            WorkflowExecution record of the new execution
+
+        Raises:
+            ValueError: If the source execution is not found, or as execute_workflow
+
+        Example:
+            >>> result = orchestrator.rerun_workflow(
+            ...     previous.id, {"safe_bearing_capacity": 250.0}, "user123"
+            ... )
+            >>> result.execution_stats["rerun"]["reused_steps"]
+        """
+        source = self._load_rerun_source(source_execution_id)
+
+        return self.execute_workflow(
+            source.deliverable_type,
+            {**source.input_data, **input_changes},
+            user_id,
+            project_id=project_id or source.context["project_id"],
+            execution_id=execution_id,
+            rerun_source=source
+        )
+
+    def _load_rerun_source(self, execution_id: UUID) -> RerunSource:
+        """Load the stored input and step results of an execution."""
+        query = """
+            SELECT id, schema_id, schema_version, deliverable_type, input_data,
+                   intermediate_results, user_id, project_id
+            FROM csa.workflow_executions
+            WHERE id = %s;
+        """
+        result = self.db.execute_query_dict(query, (execution_id,))
+        if not result:
+            raise ValueError(f"Execution '{execution_id}' not found")
+        return RerunSource.from_row(result[0])
+
+    def _plan_rerun(
+        self,
+        source: Optional[RerunSource],
+        schema: DeliverableSchema,
+        execution_context: Dict[str, Any]
+    ) -> Optional[RerunPlan]:
+        """Build the reuse plan, or None when stored results cannot be trusted."""
+        if source is None:
+            return None
+
+        if source.schema_id != schema.id or source.schema_version != schema.version:
+            print(
+                f"Re-run of {source.execution_id}: schema {schema.deliverable_type} changed "
+                f"(v{source.schema_version} -> v{schema.version}), recomputing all steps"
+            )
+            return None
+
+        return RerunPlan(
+            schema.workflow_steps,
+            source,
+            execution_context["input"],
+            execution_context["context"],
+            graph=get_execution_plan(schema).graph
+        )
+
     # ========================================================================
     # STEP EXECUTION
     # ========================================================================
 
+    def _execute_steps(
+        self,
+        schema: DeliverableSchema,
+        execution_context: Dict[str, Any],
+        execution_id: UUID,
+        rerun_plan: Optional[RerunPlan] = None
+    ) -> Tuple[List[StepResult], Dict[str, Any]]:
+        """
+        Execute all workflow steps with dataflow scheduling.
+
+        Steps are handed to ParallelExecutor, which starts each step as soon
+        as the steps it references via $stepN have finished. Engine calls run
+        on worker threads so independent branches overlap. All steps share
+        one workflow deadline (settings.WORKFLOW_DEADLINE_SECONDS).
+
+        Args:
+            schema: Workflow schema
+            execution_context: Execution context (step outputs are added to it)
+            execution_id: Execution ID (for streaming events)
+            rerun_plan: Re-run plan; steps it can reuse are not executed
+
+        Returns:
+            Tuple of (step results ordered by step number, scheduling stats)
+        """
+        total_steps = len(schema.workflow_steps)
+        finished = {"count": 0}
+        plan = get_execution_plan(schema)
+        workflow_deadline = Deadline.after(settings.WORKFLOW_DEADLINE_SECONDS)
+
+        context = ExecutionContext(
+            input=execution_context["input"],
+            steps=execution_context["steps"],
+            context=execution_context["context"],
+            total_steps=total_steps
+        )
+
+        async def run_step(step: WorkflowStep, ctx: ExecutionContext) -> StepResult:
+            context_dict = ctx.to_dict()
+
+            if rerun_plan is not None:
+                reused = rerun_plan.reuse(
+                    step, context_dict, self._resolve_input_mapping, self._evaluate_condition
+                )
+                if reused is not None:
+                    finished["count"] += 1
+                    self._emit_step_event(execution_id, "step_completed", {
+                        "step_number": step.step_number,
+                        "step_name": step.step_name,
+                        "status": reused.status,
+                        "reused": True,
+                        "progress": int((finished["count"] / total_steps) * 100)
+                    })
+                    return reused
+
+            compiled = plan.get(step)
+
+            # Check if step should be executed (conditional execution)
+            if compiled.condition and not compiled.condition(context_dict):
+                finished["count"] += 1
+                return StepResult(
+                    step_number=step.step_number,
+                    step_name=step.step_name,
+                    status="skipped",
+                    execution_time_ms=0
+                )
+
+            self._emit_step_event(execution_id, "step_started", {
+                "step_number": step.step_number,
+                "step_name": step.step_name,
+                "function": step.function_to_call
+            })
+
+            step_result = await self._execute_step_with_policy(
+                step, context_dict, schema, compiled, workflow_deadline
+            )
+            finished["count"] += 1
+
+            self._emit_step_event(
+                execution_id,
+                "step_completed" if step_result.status == "completed" else "step_failed",
+                {
+                    "step_number": step.step_number,
+                    "step_name": step.step_name,
+                    "status": step_result.status,
+                    "execution_time_ms": step_result.execution_time_ms,
+                    "retry_count": step_result.retry_count,
+                    "error_type": step_result.error_type,
+                    "error_message": step_result.error_message if step_result.status == "failed" else None,
+                    "progress": int((finished["count"] / total_steps) * 100)
+                }
+            )
+
+            # Use fallback value and continue
+            if (
+                step_result.status == "failed"
+                and step.error_handling.on_error == "continue"
+                and step.error_handling.fallback_value is not None
+            ):
+                ctx.steps[step.output_variable] = step.error_handling.fallback_value
+
+            return step_result
+
+        # No retry_manager: _execute_step_with_policy is the only retry layer
+        executor = ParallelExecutor(step_executor=run_step)
+        result = _run_coroutine_sync(executor.execute_workflow(
+            schema.workflow_steps,
+            execution_context["input"],
+            execution_context=context,
+            plan=plan
+        ))
+
+        if not result.step_results and result.error_message:
+            # Dependency analysis failed (e.g. circular $stepN references)
+            raise ValueError(result.error_message)
+
+        schedule_stats = {
+            "scheduling": "dataflow",
+            "wall_time_ms": round(result.total_time_ms, 2),
+            "sequential_time_ms": round(result.sequential_time_ms, 2),
+            "measured_speedup": round(result.measured_speedup, 2),
+            "estimated_speedup": round(result.parallel_speedup, 2),
+        }
+        if rerun_plan is not None:
+            schedule_stats["rerun"] = rerun_plan.get_stats(result.step_results)
+        logger.debug(
+            "Workflow %s: %d steps in %sms (speedup vs sequential: %sx)",
+            schema.deliverable_type, len(result.step_results),
+            schedule_stats["wall_time_ms"], schedule_stats["measured_speedup"]
+        )
+
+        return result.step_results, schedule_stats
+
+    def _emit_step_event(self, execution_id: UUID, event_type: str, data: Dict[str, Any]) -> None:
+        """Emit a step-level streaming event (best effort)."""
+        if not STREAMING_AVAILABLE:
+            return
+        try:
+            from app.execution import StreamEventType
+            get_streaming_manager().emit(str(execution_id), StreamEvent(
+                event_type=StreamEventType(event_type),
+                execution_id=str(execution_id),
+                timestamp=datetime.utcnow().isoformat(),
+                data=data
+            ))
+        except Exception as e:
+            print(f"Warning: Failed to emit {event_type} event: {e}")
+
     def _execute_step(
         self,
         step: WorkflowStep,
         execution_context: Dict[str, Any],
-        schema: DeliverableSchema
+        schema: DeliverableSchema,
+        compiled: Optional[CompiledStep] = None
     ) -> StepResult:
         """
-        Execute a single workflow step.
+        Execute a single workflow step (synchronously) under its error_handling policy.
 
         Args:
             step: Step configuration
             execution_context: Current execution context with variables
             schema: Parent workflow schema
+            compiled: Compiled step (looked up in the schema's execution plan
+                      when not given)
 
         Returns:
             StepResult with execution outcome
         """
-        step_started_at = datetime.utcnow()
+        return _run_coroutine_sync(
+            self._execute_step_with_policy(step, execution_context, schema, compiled)
+        )
 
-        try:
-            # Resolve input mapping (substitute variables)
-            resolved_input = self._resolve_input_mapping(step.input_mapping, execution_context)
-
-            # Parse function_to_call (format: "tool_name.function_name")
-            parts = step.function_to_call.split(".")
-            if len(parts) != 2:
-                raise ValueError(
-                    f"Invalid function_to_call format: '{step.function_to_call}'. "
-                    f"Expected 'tool_name.function_name'"
-                )
+    async def _execute_step_with_policy(
+        self,
+        step: WorkflowStep,
+        execution_context: Dict[str, Any],
+        schema: DeliverableSchema,
+        compiled: Optional[CompiledStep] = None,
+        workflow_deadline: Optional[Deadline] = None
+    ) -> StepResult:
+        """
+        Execute a single workflow step, enforcing step.error_handling.
+
+        - Each attempt runs on a bounded step thread (see step_threads.py)
+          and is abandoned after step.timeout_seconds (or when the workflow
+          deadline passes). The attempt's Deadline is then cancelled so
+          engines that check it (check_deadline / remaining_seconds) can
+          stop; an inline engine that doesn't keeps its thread. Steps with
+          error_handling.sandbox run their engine in a sandboxed worker
+          killed at the step timeout instead.
+        - Transient errors are retried up to retry_count times with
+          jittered exponential backoff (base/max_delay_seconds). Engine
+          errors such as invalid input are not retried unless
+          retry_on_transient_only is False; no retry outlives the deadline.
+          Timeouts are retried only with retry_on_timeout, and only for
+          sandboxed engines: the timed-out attempt of an inline engine may
+          still be running, and another copy would pile onto it.
+        - With circuit_breaker enabled, calls go through the engine's
+          breaker ("engine:<function_to_call>"): while it is open the step
+          fails immediately instead of waiting on a dependency that is down.
+          Step timeouts, sandbox limit breaches and waits for a busy sandbox
+          worker or process pool slot don't count against the breaker; worker crashes and
+          dependency errors raised by the engine do.
+        - Sandboxed engines that hit their memory limit fail without retry.
+
+        A failed StepResult carries error_type ("timeout", "memory_limit",
+        "worker_crashed", "circuit_open", "capacity" or "error").
 
-            tool_name, function_name = parts
+        Args:
+            step: Step configuration
+            execution_context: Current execution context with variables
+            schema: Parent workflow schema
+            compiled: Compiled step (looked up in the schema's execution plan
+                      when not given)
+            workflow_deadline: Deadline of the whole execution
 
-            # Invoke calculation engine
-            output_data = invoke_engine(tool_name, function_name, resolved_input)
+        Returns:
+            StepResult with execution outcome (retry_count = retries performed)
+        """
+        step_started_at = datetime.utcnow()
+        compiled = compiled or get_execution_plan(schema).get(step)
+        handling = step.error_handling
+        retry_config = RetryConfig(
+            retry_count=handling.retry_count,
+            base_delay_seconds=handling.base_delay_seconds,
+            max_delay_seconds=handling.max_delay_seconds,
+            retry_on_timeout=handling.retry_on_timeout,
+            retry_on_transient_only=handling.retry_on_transient_only
+        )
+        breaker = get_circuit_breaker(f"engine:{step.function_to_call}") if handling.circuit_breaker else None
+        killable = compiled.sandboxed and engine_registry.sandbox is not None
+        step_threads = get_step_thread_pool()
+
+        attempt = 0
+        while True:
+            attempt += 1
+            deadline = Deadline.after(step.timeout_seconds, parent=workflow_deadline)
+            try:
+                if workflow_deadline is not None and workflow_deadline.expired:
+                    raise DeadlineExceeded(
+                        f"Workflow deadline exceeded ({settings.WORKFLOW_DEADLINE_SECONDS:g}s)"
+                    )
+                if breaker is not None:
+                    breaker.before_call()
+                try:
+                    attempt_future = step_threads.submit(
+                        run_with_deadline, deadline, self._invoke_step, compiled, execution_context,
+                        sandboxed=killable
+                    )
+                except StepCapacityError:
+                    if breaker is not None:
+                        breaker.release()
+                    raise
+                try:
+                    output_data = await asyncio.wait_for(
+                        asyncio.wrap_future(attempt_future),
+                        timeout=deadline.remaining()
+                    )
+                except EngineSandboxError as e:
+                    # Wall-clock/memory breaches and waits for a busy worker come from
+                    # the input or from load, not an unhealthy engine: only crashes count
+                    if breaker is not None:
+                        if isinstance(e, EngineWorkerCrashedError):
+                            breaker.record_failure()
+                        else:
+                            breaker.release()
+                    raise
+                except EngineProcessPoolBusyError:
+                    if breaker is not None:
+                        breaker.release()
+                    raise
+                except asyncio.TimeoutError as e:
+                    deadline.cancel()
+                    step_threads.abandon(attempt_future)
+                    # A slow input is not an unhealthy engine (dependency timeouts
+                    # raised by the engine itself go through the branch below)
+                    if breaker is not None:
+                        breaker.release()
+                    if workflow_deadline is not None and deadline.expires_at == workflow_deadline.expires_at:
+                        raise DeadlineExceeded(
+                            f"Workflow deadline exceeded ({settings.WORKFLOW_DEADLINE_SECONDS:g}s)"
+                        ) from e
+                    raise DeadlineExceeded(f"Step timed out after {step.timeout_seconds}s") from e
+                except Exception as e:
+                    if breaker is not None:
+                        if is_dependency_failure(e):
+                            breaker.record_failure()
+                        else:
+                            breaker.release()
+                    raise
+
+                if breaker is not None:
+                    breaker.record_success()
+                step_completed_at = datetime.utcnow()
+                return StepResult(
+                    step_number=step.step_number,
+                    step_name=step.step_name,
+                    status="completed",
+                    output_data=output_data,
+                    execution_time_ms=int((step_completed_at - step_started_at).total_seconds() * 1000),
+                    started_at=step_started_at,
+                    completed_at=step_completed_at,
+                    retry_count=attempt - 1
+                )
 
-            # Calculate execution time
-            step_completed_at = datetime.utcnow()
-            execution_time_ms = int((step_completed_at - step_started_at).total_seconds() * 1000)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, retry_config, workflow_deadline, killable)
+                if delay is None:
+                    step_completed_at = datetime.utcnow()
+                    return StepResult(
+                        step_number=step.step_number,
+                        step_name=step.step_name,
+                        status="failed",
+                        error_message=str(e),
+                        error_type=self._error_type(e),
+                        execution_time_ms=int((step_completed_at - step_started_at).total_seconds() * 1000),
+                        started_at=step_started_at,
+                        completed_at=step_completed_at,
+                        retry_count=attempt - 1
+                    )
 
-            return StepResult(
-                step_number=step.step_number,
-                step_name=step.step_name,
-                status="completed",
-                output_data=output_data,
-                execution_time_ms=execution_time_ms,
-                started_at=step_started_at,
-                completed_at=step_completed_at
-            )
+                print(
+                    f"Step {step.step_number} ({step.step_name}) attempt {attempt} failed: {e}; "
+                    f"retrying in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
 
-        except Exception as e:
-            # Step failed
-            step_completed_at = datetime.utcnow()
-            execution_time_ms = int((step_completed_at - step_started_at).total_seconds() * 1000)
-
-            # Check if retry configured
-            if step.error_handling.retry_count > 0:
-                # TODO: Implement retry logic
-                pass
-
-            return StepResult(
-                step_number=step.step_number,
-                step_name=step.step_name,
-                status="failed",
-                error_message=str(e),
-                execution_time_ms=execution_time_ms,
-                started_at=step_started_at,
-                completed_at=step_completed_at
-            )
+    def _retry_delay(
+        self,
+        error: Exception,
+        attempt: int,
+        retry_config: RetryConfig,
+        workflow_deadline: Optional[Deadline],
+        killable: bool = False
+    ) -> Optional[float]:
+        """
+        Backoff before the next attempt, or None if the step should fail now.
+
+        killable: the step's engine runs in a sandboxed worker, so a timed-out
+        attempt is no longer running and the timeout may be retried.
+        """
+        if isinstance(error, (CircuitOpenError, StepCapacityError, EngineMemoryLimitError)):
+            return None
+        if attempt > retry_config.retry_count:
+            return None
+        if workflow_deadline is not None and workflow_deadline.expired:
+            return None
+
+        error_type = self.retry_manager.classify_error(error)
+        if error_type == ErrorType.TIMEOUT and not killable:
+            return None
+        if not self.retry_manager.should_retry(error, attempt, retry_config, error_type):
+            return None
+
+        delay = self.retry_manager.calculate_backoff_delay(attempt, retry_config)
+        remaining = workflow_deadline.remaining() if workflow_deadline is not None else None
+        if remaining is not None and delay >= remaining:
+            return None
+        return delay
+
+    @staticmethod
+    def _error_type(error: Exception) -> str:
+        """Failure kind recorded on a failed StepResult."""
+        if isinstance(error, (EngineSandboxError, EngineProcessCrashedError, EngineProcessPoolBusyError,
+                              StepCapacityError)):
+            return error.error_type
+        if isinstance(error, CircuitOpenError):
+            return "circuit_open"
+        if isinstance(error, (TimeoutError, asyncio.TimeoutError)):
+            return "timeout"
+        return "error"
+
+    @staticmethod
+    def _invoke_step(compiled: CompiledStep, execution_context: Dict[str, Any]) -> Dict[str, Any]:
+        """One attempt: resolve inputs (precompiled accessors) and call the bound engine."""
+        return compiled.engine(compiled.resolve_inputs(execution_context))
 
     # ========================================================================
     # VARIABLE SUBSTITUTION
@@ -490,61 +867,9 @@ class WorkflowOrchestrator:
             # Not a variable reference, return as-is
             return variable_ref
 
-        if not variable_ref.startswith("$"):
-            # Not a variable reference, return as-is
-            return variable_ref
-
-        # Parse variable reference
-        # Format: $source.path.to.field
-        parts = variable_ref[1:].split(".")  # Remove $ and split
-        source = parts[0]
-        path = parts[1:]
-
-        if source == "input":
-            data = execution_context.get("input", {})
-            # If path is empty, return entire input
-            if not path:
-                return data
-        elif source == "context":
-            data = execution_context.get("context", {})
-            if not path:
-                return data
-        elif source.startswith("step"):
-            # Extract step output variable name
-            # Format: $step1.output_var or $stepN.output_var.nested.field
-            if not path:
-                raise ValueError(f"Invalid step reference: {variable_ref}. Must specify output variable name.")
-            var_name = path[0]
-            data = execution_context.get("steps", {}).get(var_name)
-            if data is None:
-                # Try to get the entire steps dict for debugging
-                available_vars = list(execution_context.get("steps", {}).keys())
-                raise ValueError(
-                    f"Step output variable '{var_name}' not found. "
-                    f"Available variables: {available_vars}"
-                )
-            path = path[1:]  # Remove variable name from path
-        else:
-            raise ValueError(f"Unknown variable source: '{source}' in {variable_ref}")
-
-        # Traverse path for nested access
-        for key in path:
-            if isinstance(data, dict):
-                if key not in data:
-                    raise ValueError(f"Key '{key}' not found in path for {variable_ref}")
-                data = data.get(key)
-            elif isinstance(data, list) and key.isdigit():
-                # Support array indexing like $step1.output_var.0
-                idx = int(key)
-                if idx < len(data):
-                    data = data[idx]
-                else:
-                    raise ValueError(f"Index {idx} out of range in {variable_ref}")
-            else:
-                raise ValueError(f"Cannot access key '{key}' in {variable_ref} - data is not a dict")
-
-        # Allow None values to pass through (field exists but is null)
-        return data
+        # Parsed once per reference string (see app/execution/execution_plan.py);
+        # None values pass through (field exists but is null)
+        return compile_reference(variable_ref)(execution_context)
 
     # ========================================================================
     # CONDITIONAL EXECUTION
@@ -562,58 +887,14 @@ class WorkflowOrchestrator:
             execution_context: Current execution context
 
         Returns:
-            True if condition is met, False otherwise
+            True if condition is met (or cannot be parsed), False otherwise
+            (including when the variable cannot be resolved)
 
         TODO: Implement full expression parser for complex conditions
         """
-        # Simple regex-based parser for basic conditions
-        # Supports: ==, !=, <, >, <=, >=
-
-        pattern = r"\$[\w.]+\s*(==|!=|<|>|<=|>=)\s*(\S+)"
-        match = re.match(pattern, condition)
-
-        if not match:
-            # Cannot parse condition, default to True
-            return True
-
-        variable_ref = condition.split()[0]
-        operator = match.group(1)
-        value_str = match.group(2)
-
-        # Resolve variable
-        try:
-            variable_value = self._resolve_variable(variable_ref, execution_context)
-        except ValueError:
-            return False
-
-        # Convert value_str to appropriate type
-        if value_str.lower() == "true":
-            value = True
-        elif value_str.lower() == "false":
-            value = False
-        elif value_str.isdigit():
-            value = int(value_str)
-        elif value_str.replace(".", "").isdigit():
-            value = float(value_str)
-        else:
-            # String value (remove quotes if present)
-            value = value_str.strip("'\"")
-
-        # Evaluate condition
-        if operator == "==":
-            return variable_value == value
-        elif operator == "!=":
-            return variable_value != value
-        elif operator == "<":
-            return variable_value < value
-        elif operator == ">":
-            return variable_value > value
-        elif operator == "<=":
-            return variable_value <= value
-        elif operator == ">=":
-            return variable_value >= value
-
-        return True
+        # Simple regex-based parser for basic conditions, compiled once per
+        # condition string. Supports: ==, !=, <, >, <=, >=
+        return compile_condition(condition)(execution_context)
 
     # ========================================================================
     # OUTPUT BUILDING
@@ -724,26 +1005,34 @@ class WorkflowOrchestrator:
     # INPUT VALIDATION
     # ========================================================================
 
-    def _validate_input(self, input_data: Dict[str, Any], input_schema: Dict[str, Any]) -> None:
+    def _validate_input(
+        self,
+        input_data: Dict[str, Any],
+        input_schema: Dict[str, Any],
+        schema_key: Optional[Tuple[Any, ...]] = None
+    ) -> None:
         """
         Validate input data against JSON schema.
 
         Args:
             input_data: User-provided input
             input_schema: JSON Schema definition
+            schema_key: (schema_id, version, "input") so the compiled
+                        validator is reused across executions
 
         Raises:
             ValueError: If validation fails
-
-        TODO: Implement full JSON Schema validation
         """
-        # Simplified validation - check required fields
         required_fields = input_schema.get("required", [])
 
         for field in required_fields:
             if field not in input_data:
                 raise ValueError(f"Required field missing: {field}")
 
+        result = self.validation_engine.validate_input(input_data, input_schema, schema_key=schema_key)
+        if not result.valid:
+            raise ValueError(f"Input validation failed: {'; '.join(result.error_messages)}")
+
     # ========================================================================
     # EXECUTION RECORD MANAGEMENT
     # ========================================================================
@@ -845,7 +1134,10 @@ class WorkflowOrchestrator:
                 "status": sr.status,
                 "output_data": sr.output_data,
                 "error_message": sr.error_message,
-                "execution_time_ms": sr.execution_time_ms
+                "execution_time_ms": sr.execution_time_ms,
+                "reused": sr.reused,
+                "retry_count": sr.retry_count,
+                "error_type": sr.error_type
             }
             for sr in step_results
         ]
@@ -881,6 +1173,11 @@ class WorkflowOrchestrator:
 
         # Build WorkflowExecution object from result row (dictionary)
         row = result[0]
+
+        # Completed designs feed the running baselines used for anomaly risk
+        if status == "completed":
+            record_execution(row['deliverable_type'], output_data, completed_at)
+
         return WorkflowExecution(
             id=row['id'],
             schema_id=row['schema_id'],
@@ -909,12 +1206,30 @@ class WorkflowOrchestrator:
 # CONVENIENCE FUNCTIONS
 # ============================================================================
 
+def _run_coroutine_sync(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Uses asyncio.run() directly when no event loop is running in this
+    thread; otherwise runs it on a short-lived helper thread so callers
+    inside async code (e.g. chat agents) don't hit "loop already running".
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
 def execute_workflow(
     deliverable_type: str,
     input_data: Dict[str, Any],
     user_id: str,
     project_id: Optional[UUID] = None,
-    experiment_id: Optional[UUID] = None
+    experiment_id: Optional[UUID] = None,
+    execution_id: Optional[UUID] = None
 ) -> WorkflowExecution:
     """
     Convenience function to execute a workflow.
@@ -925,11 +1240,12 @@ def execute_workflow(
         user_id: User ID
         project_id: Optional project ID
         experiment_id: Optional experiment ID for A/B testing
+        execution_id: Optional pre-assigned execution ID
 
     Returns:
         WorkflowExecution result
     """
     orchestrator = WorkflowOrchestrator()
     return orchestrator.execute_workflow(
-        deliverable_type, input_data, user_id, project_id, experiment_id
+        deliverable_type, input_data, user_id, project_id, experiment_id, execution_id
     )
@@ -0,0 +1,386 @@
+"""
+CSA AIaaS Platform - Workflow Runner
+Non-blocking workflow execution for the FastAPI event loop
+
+WorkflowOrchestrator.execute_workflow is synchronous: it performs blocking
+psycopg2 I/O and CPU-bound engine calls. Calling it directly from an
+``async def`` route stalls every other request on the worker (including
+WebSocket streams). The runner moves executions onto a bounded thread pool
+and applies backpressure when the pool and its queue are full.
+
+Two modes:
+- ``await runner.run(...)``: execute off the event loop and await the result
+  (``await runner.rerun(...)`` for incremental re-runs of an execution)
+- ``runner.submit(...)``: schedule the execution and return its execution_id
+  immediately; clients follow progress via ``/workflows/stream/{execution_id}``
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+from uuid import UUID, uuid4
+
+from app.core.config import settings
+from app.schemas.workflow.schema_models import WorkflowExecution
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionCapacityError(RuntimeError):
+    """Raised when the runner has no free worker or queue slot."""
+    pass
+
+
+class WorkflowRunner:
+    """
+    Bounded executor for workflow executions.
+
+    At most ``max_workers`` executions run concurrently; up to ``max_queue``
+    more wait for a worker. Further requests are rejected with
+    ExecutionCapacityError so callers can return 429 instead of piling up.
+    """
+
+    # Finished jobs beyond this count are forgotten (oldest first)
+    MAX_TRACKED_JOBS = 1000
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_queue: int = 16,
+        orchestrator_factory: Optional[Callable[[], Any]] = None,
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            max_workers: Concurrent workflow executions
+            max_queue: Executions allowed to wait for a worker
+            orchestrator_factory: Builds the orchestrator used per execution
+                                  (defaults to WorkflowOrchestrator)
+        """
+        if max_workers < 1 or max_queue < 0:
+            raise ValueError(
+                f"Invalid runner limits: max_workers={max_workers}, max_queue={max_queue}"
+            )
+
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._orchestrator_factory = orchestrator_factory
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="workflow-exec"
+        )
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._lock = threading.Lock()
+        self._running = 0
+        self._background_tasks: set = set()
+
+        # Status of submitted executions: execution_id -> status dict
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+
+        self.stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+        }
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    async def run(
+        self,
+        deliverable_type: str,
+        input_data: Dict[str, Any],
+        user_id: str,
+        project_id: Optional[UUID] = None,
+        experiment_id: Optional[UUID] = None,
+        execution_id: Optional[UUID] = None,
+    ) -> WorkflowExecution:
+        """
+        Execute a workflow on the worker pool and await its result.
+
+        Raises:
+            ExecutionCapacityError: If the pool and queue are full
+            ValueError: Propagated from the orchestrator (schema/input errors)
+        """
+        self._acquire_slot()
+        return await self._schedule(
+            self._execute,
+            deliverable_type,
+            input_data,
+            user_id,
+            project_id,
+            experiment_id,
+            execution_id,
+        )
+
+    async def rerun(
+        self,
+        source_execution_id: UUID,
+        input_changes: Dict[str, Any],
+        user_id: str,
+        project_id: Optional[UUID] = None,
+    ) -> WorkflowExecution:
+        """
+        Re-run an execution with changed inputs on the worker pool.
+
+        Only steps affected by the changes are recomputed
+        (see WorkflowOrchestrator.rerun_workflow).
+
+        Raises:
+            ExecutionCapacityError: If the pool and queue are full
+            ValueError: If the source execution is not found (or schema/input errors)
+        """
+        self._acquire_slot()
+        return await self._schedule(
+            self._execute,
+            None,
+            input_changes,
+            user_id,
+            project_id,
+            None,
+            None,
+            source_execution_id,
+        )
+
+    def submit(
+        self,
+        deliverable_type: str,
+        input_data: Dict[str, Any],
+        user_id: str,
+        project_id: Optional[UUID] = None,
+        experiment_id: Optional[UUID] = None,
+    ) -> UUID:
+        """
+        Schedule a workflow execution and return its execution_id immediately.
+
+        Must be called from within a running event loop.
+
+        Raises:
+            ExecutionCapacityError: If the pool and queue are full
+        """
+        execution_id = uuid4()
+        self._acquire_slot()
+
+        self._prune_jobs()
+        self.jobs[str(execution_id)] = {
+            "execution_id": str(execution_id),
+            "deliverable_type": deliverable_type,
+            "status": "queued",
+            "submitted_at": datetime.utcnow().isoformat(),
+            "completed_at": None,
+            "error_message": None,
+        }
+
+        try:
+            future = self._schedule(
+                self._execute_submitted,
+                deliverable_type,
+                input_data,
+                user_id,
+                project_id,
+                experiment_id,
+                execution_id,
+            )
+        except BaseException:
+            self.jobs.pop(str(execution_id), None)
+            raise
+        # Keep a reference so the future isn't garbage-collected early
+        self._background_tasks.add(future)
+        future.add_done_callback(self._background_tasks.discard)
+
+        return execution_id
+
+    def get_job(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        """Get the in-memory status of a submitted execution."""
+        job = self.jobs.get(execution_id)
+        return dict(job) if job else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get runner statistics."""
+        with self._lock:
+            running = self._running
+            stats = dict(self.stats)
+        return {
+            **stats,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "running": running,
+            "pending": len(self._background_tasks),
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work and optionally wait for running executions."""
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    # =========================================================================
+    # INTERNALS
+    # =========================================================================
+
+    def _acquire_slot(self) -> None:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.stats["rejected"] += 1
+            raise ExecutionCapacityError(
+                f"Workflow execution capacity exhausted "
+                f"({self.max_workers} running, {self.max_queue} queued). Retry later."
+            )
+
+    def _schedule(self, func: Callable[..., Any], *args: Any) -> "asyncio.Future":
+        """
+        Hand a job whose slot is already held to the pool.
+
+        The slot is released if scheduling fails (e.g. RuntimeError after
+        shutdown()); otherwise the job releases it when it finishes.
+        """
+        try:
+            future = asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self.stats["submitted"] += 1
+        return future
+
+    def _execute(
+        self,
+        deliverable_type: Optional[str],
+        input_data: Dict[str, Any],
+        user_id: str,
+        project_id: Optional[UUID],
+        experiment_id: Optional[UUID],
+        execution_id: Optional[UUID],
+        rerun_of: Optional[UUID] = None,
+    ) -> WorkflowExecution:
+        """
+        Run one execution on a worker thread, releasing its slot afterwards.
+
+        With rerun_of, input_data holds the input changes applied to that
+        execution and deliverable_type is taken from it.
+        """
+        with self._lock:
+            self._running += 1
+        try:
+            orchestrator = self._create_orchestrator()
+            if rerun_of is not None:
+                result = orchestrator.rerun_workflow(
+                    rerun_of, input_data, user_id, project_id, execution_id
+                )
+            else:
+                result = orchestrator.execute_workflow(
+                    deliverable_type,
+                    input_data,
+                    user_id,
+                    project_id,
+                    experiment_id,
+                    execution_id,
+                )
+            with self._lock:
+                self.stats["completed"] += 1
+            return result
+        except Exception:
+            with self._lock:
+                self.stats["failed"] += 1
+            raise
+        finally:
+            with self._lock:
+                self._running -= 1
+            self._slots.release()
+
+    def _execute_submitted(
+        self,
+        deliverable_type: str,
+        input_data: Dict[str, Any],
+        user_id: str,
+        project_id: Optional[UUID],
+        experiment_id: Optional[UUID],
+        execution_id: UUID,
+    ) -> None:
+        """Background variant of _execute that records status instead of raising."""
+        job = self.jobs[str(execution_id)]
+        job["status"] = "running"
+
+        try:
+            result = self._execute(
+                deliverable_type, input_data, user_id,
+                project_id, experiment_id, execution_id
+            )
+            job["status"] = result.execution_status
+            job["error_message"] = result.error_message
+        except Exception as e:
+            logger.error(f"Submitted execution {execution_id} failed: {e}")
+            job["status"] = "failed"
+            job["error_message"] = str(e)
+            self._emit_failure(str(execution_id), str(e))
+        finally:
+            job["completed_at"] = datetime.utcnow().isoformat()
+
+    def _prune_jobs(self) -> None:
+        excess = len(self.jobs) - self.MAX_TRACKED_JOBS
+        if excess < 0:
+            return
+        finished = [
+            job_id for job_id, job in self.jobs.items()
+            if job["completed_at"] is not None
+        ]
+        for job_id in finished[:excess + 1]:
+            self.jobs.pop(job_id, None)
+
+    def _create_orchestrator(self):
+        if self._orchestrator_factory is not None:
+            return self._orchestrator_factory()
+        from app.services.workflow_orchestrator import WorkflowOrchestrator
+        return WorkflowOrchestrator()
+
+    @staticmethod
+    def _emit_failure(execution_id: str, error_message: str) -> None:
+        """
+        Emit execution_failed for errors raised before the orchestrator
+        started streaming (e.g. unknown schema, invalid input).
+        """
+        try:
+            from app.execution import get_streaming_manager, StreamEvent, StreamEventType
+            get_streaming_manager().emit(execution_id, StreamEvent(
+                event_type=StreamEventType.EXECUTION_FAILED,
+                execution_id=execution_id,
+                timestamp=datetime.utcnow().isoformat(),
+                data={
+                    "error_message": error_message,
+                    "progress": 0
+                }
+            ))
+        except Exception as e:
+            logger.warning(f"Failed to emit execution_failed event: {e}")
+
+
+# Global runner instance
+_global_workflow_runner: Optional[WorkflowRunner] = None
+
+
+def get_workflow_runner() -> WorkflowRunner:
+    """
+    Get global workflow runner instance
+
+    Returns:
+        WorkflowRunner singleton
+    """
+    global _global_workflow_runner
+    if _global_workflow_runner is None:
+        _global_workflow_runner = WorkflowRunner(
+            max_workers=settings.WORKFLOW_EXECUTION_MAX_WORKERS,
+            max_queue=settings.WORKFLOW_EXECUTION_MAX_QUEUE,
+        )
+    return _global_workflow_runner
+
+
+def shutdown_workflow_runner(wait: bool = True) -> None:
+    """Shut down the global workflow runner if it was created."""
+    global _global_workflow_runner
+    if _global_workflow_runner is not None:
+        _global_workflow_runner.shutdown(wait=wait)
+        _global_workflow_runner = None
@@ -13,7 +13,8 @@ from app.utils.llm_utils import (
     get_llm,
     get_ambiguity_detection_llm,
     get_chat_llm,
-    get_embeddings_client
+    get_embeddings_client,
+    clear_llm_clients
 )
 
 from app.utils.context_utils import (
@@ -28,6 +29,7 @@ __all__ = [
     'get_ambiguity_detection_llm',
     'get_chat_llm',
     'get_embeddings_client',
+    'clear_llm_clients',
 
     # Context utilities
     'assemble_context',
@@ -1,9 +1,13 @@
 """
 CSA AIaaS Platform - LLM Utilities
 Centralized LLM initialization and helper functions.
+
+Chat clients are shared process-wide, so every agent reuses one HTTP
+connection pool per (model, temperature) instead of opening its own.
 """
 
-from typing import Optional
+import threading
+from typing import Any, Dict, Optional, Tuple
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from app.core.config import settings
 from app.core.constants import (
@@ -17,6 +21,10 @@ from app.core.constants import (
 )
 
 
+_llm_clients: Dict[Tuple[str, float, str], ChatOpenAI] = {}
+_llm_clients_lock = threading.Lock()
+
+
 def get_llm(
     model: Optional[str] = None,
     temperature: float = CHAT_TEMPERATURE,
@@ -25,10 +33,13 @@ def get_llm(
     """
     Get a configured ChatOpenAI instance.
 
+    Clients without extra kwargs are shared: repeated calls with the same
+    model and temperature return the same (thread-safe) client.
+
     Args:
         model: Model name (defaults to settings.OPENROUTER_MODEL)
         temperature: Temperature for generation (0.0 - 1.0)
-        **kwargs: Additional arguments to pass to ChatOpenAI
+        **kwargs: Additional arguments to pass to ChatOpenAI (creates a new client)
 
     Returns:
         Configured ChatOpenAI instance
@@ -41,6 +52,24 @@ def get_llm(
             "No OpenRouter API key found. Set OPENROUTER_API_KEY in .env"
         )
 
+    if kwargs:
+        return _create_llm(model, temperature, **kwargs)
+
+    key = (model or settings.OPENROUTER_MODEL, temperature, settings.OPENROUTER_API_KEY)
+    with _llm_clients_lock:
+        client = _llm_clients.get(key)
+        if client is None:
+            client = _llm_clients[key] = _create_llm(model, temperature)
+    return client
+
+
+def clear_llm_clients() -> None:
+    """Drop the shared chat clients (e.g. after rotating the API key)."""
+    with _llm_clients_lock:
+        _llm_clients.clear()
+
+
+def _create_llm(model: Optional[str], temperature: float, **kwargs: Any) -> ChatOpenAI:
     return ChatOpenAI(
         model=model or settings.OPENROUTER_MODEL,
         temperature=temperature,
@@ -0,0 +1,6 @@
+"""
+CSA AIaaS Platform - Performance Benchmarks
+
+Standalone benchmark scripts. Run from the backend directory, e.g.:
+    python -m benchmarks.condition_cache_benchmark
+"""
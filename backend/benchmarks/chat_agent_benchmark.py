@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+CSA AIaaS Platform - Chat Agent Per-Message Overhead Benchmark
+
+Measures what a chat message costs besides the LLM calls themselves:
+
+- per-message: build a new agent for every message (new chat client,
+  DatabaseConfig, WorkflowOrchestrator, CLL integration, LangGraph compile),
+  which is what chat() did before the long-lived runtime
+- shared:      get_enhanced_agent() / get_rag_agent(), built once per process
+
+The LLM and database are replaced by instant fakes after the agent is built,
+so the timings are pure framework overhead (time-to-first-byte minus LLM time).
+No network access or API key is needed.
+
+Run with: python -m benchmarks.chat_agent_benchmark [--messages N]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import statistics
+import time
+from types import SimpleNamespace
+from typing import Callable, List
+from uuid import uuid4
+
+from app.chat import enhanced_agent, rag_agent
+from app.chat.enhanced_agent import EnhancedConversationalAgent, get_enhanced_agent
+from app.chat.rag_agent import ConversationalRAGAgent, get_rag_agent
+from app.core.config import settings
+from app.utils.llm_utils import clear_llm_clients
+
+
+class InstantLLM:
+    """Returns canned agent responses without a network call."""
+
+    def invoke(self, messages):
+        prompt = messages[0].content
+        if "Classify the intent" in prompt:
+            return SimpleNamespace(content=json.dumps({"intent": "chat", "task_type": None}))
+        if "Extract technical parameters" in prompt:
+            return SimpleNamespace(content=json.dumps({"entities": {"axial_load_dead": 600}}))
+        if "Decide if you should" in prompt:
+            return SimpleNamespace(content=json.dumps({"action": "ask_parameters"}))
+        return SimpleNamespace(content="Please share the column size and SBC.")
+
+
+class InstantDB:
+    def execute_query(self, query, params=None):
+        return [(0,)]
+
+    def execute_query_dict(self, query, params=None):
+        return []
+
+
+def stub_io(agent: EnhancedConversationalAgent) -> EnhancedConversationalAgent:
+    agent.llm = InstantLLM()
+    agent.db = InstantDB()
+    agent.cll = None  # CLL nodes become pass-throughs (they call the LLM)
+    return agent
+
+
+def new_enhanced_agent() -> EnhancedConversationalAgent:
+    clear_llm_clients()  # the old path created a fresh HTTP client per message
+    return stub_io(EnhancedConversationalAgent())
+
+
+def shared_enhanced_agent() -> EnhancedConversationalAgent:
+    return get_enhanced_agent()
+
+
+def time_messages(get_agent: Callable[[], EnhancedConversationalAgent], messages: int) -> List[float]:
+    session_id = uuid4()
+    samples = []
+    for i in range(messages):
+        start = time.perf_counter()
+        agent = get_agent()
+        agent.chat(f"Design a footing for 600 kN dead load (message {i})", session_id, "bench")
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def time_acquire(get_agent: Callable[[], object], count: int) -> List[float]:
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        get_agent()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(label: str, samples: List[float]) -> float:
+    median = statistics.median(samples)
+    p95 = sorted(samples)[int(len(samples) * 0.95) - 1]
+    print(f"  {label:<36} median {median:>9.3f} ms   p95 {p95:>9.3f} ms")
+    return median
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--messages", type=int, default=100)
+    args = arg_parser.parse_args()
+
+    if not settings.OPENROUTER_API_KEY:
+        settings.OPENROUTER_API_KEY = "benchmark-placeholder"  # clients are built, never called
+
+    print("=" * 80)
+    print(f"  CHAT AGENT PER-MESSAGE OVERHEAD ({args.messages} messages, LLM/DB stubbed)")
+    print("=" * 80)
+
+    # DatabaseConfig prints a warning per construction without Supabase credentials
+    with contextlib.redirect_stdout(io.StringIO()):
+        enhanced_agent._global_agents.clear()
+        stub_io(get_enhanced_agent())  # startup warm-up (main.py lifespan)
+        time_messages(new_enhanced_agent, 3)  # import/JIT warm-up for the old path
+
+        before = time_messages(new_enhanced_agent, args.messages)
+        after = time_messages(shared_enhanced_agent, args.messages)
+
+        rag_agent._global_rag_agents.clear()
+        get_rag_agent()
+
+        def new_rag_agent():
+            clear_llm_clients()
+            return ConversationalRAGAgent()
+
+        rag_before = time_acquire(new_rag_agent, args.messages)
+        rag_after = time_acquire(get_rag_agent, args.messages)
+
+    print("  EnhancedConversationalAgent (full graph run)")
+    before_ms = report("per-message agent", before)
+    after_ms = report("shared agent", after)
+    print(f"  {'overhead removed per message':<36} {before_ms - after_ms:>16.3f} ms"
+          f"   ({before_ms / after_ms:.1f}x)")
+    print()
+    print("  ConversationalRAGAgent (agent acquisition)")
+    report("per-message agent", rag_before)
+    report("shared agent", rag_after)
+
+
+if __name__ == "__main__":
+    main()
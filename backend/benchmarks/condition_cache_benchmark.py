@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+CSA AIaaS Platform - Condition Compilation Benchmark
+
+Measures rule evaluations/sec with and without the compiled condition
+cache, across the seeded foundation_design risk rules
+(init_phase3_sprint2.sql).
+
+- uncached: parse with pyparsing and compile on every evaluation
+  (the cost every evaluation paid before compiled conditions were cached)
+- cached:   compile once, then call the cached closure
+
+Run with: python -m benchmarks.condition_cache_benchmark [--iterations N]
+"""
+
+import argparse
+import gc
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from app.execution.condition_parser import (
+    ConditionEvaluator,
+    _compile_node,
+    get_condition_cache_stats
+)
+from app.risk.rule_parser import RiskRuleParser, get_rule_cache_stats
+
+SEED_FILE = Path(__file__).resolve().parent.parent / "init_phase3_sprint2.sql"
+
+CONTEXT: Dict[str, Any] = {
+    "input": {
+        "axial_load_dead": 1500.0,
+        "axial_load_live": 700.0,
+        "safe_bearing_capacity": 180.0,
+    },
+    "steps": {
+        "initial_design_data": {
+            "footing_length_required": 4.2,
+            "footing_depth": 1.2,
+            "reinforcement_ratio": 0.9,
+        },
+        "final_design_data": {
+            "material_quantities": {"estimated_cost": 420000},
+        },
+    },
+    "context": {"user_seniority": 2},
+}
+
+ASSESSMENT = {"technical_risk": 0.8, "safety_risk": 0.75, "compliance_risk": 0.3}
+
+
+def load_seed_conditions() -> List[str]:
+    """Extract every rule condition from the risk_rules seed in the SQL file."""
+    sql = SEED_FILE.read_text()
+    match = re.search(r"SET risk_rules = '(.*?)'::jsonb", sql, re.S)
+    if not match:
+        raise RuntimeError(f"risk_rules seed not found in {SEED_FILE}")
+
+    rules = json.loads(match.group(1))
+    return [
+        rule["condition"]
+        for key in ("global_rules", "step_rules", "exception_rules", "escalation_rules")
+        for rule in rules.get(key, [])
+    ]
+
+
+def measure(label: str, fn: Callable[[], None], evaluations: int) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    rate = evaluations / elapsed
+    print(f"  {label:<34} {rate:>12,.0f} evals/sec   ({elapsed * 1000:,.1f} ms)")
+    return rate
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--iterations", type=int, default=200)
+    args = arg_parser.parse_args()
+
+    conditions = load_seed_conditions()
+    evaluator = ConditionEvaluator()
+    rule_parser = RiskRuleParser()
+    context = {**CONTEXT, "assessment": ASSESSMENT}
+    evaluations = len(conditions) * args.iterations
+
+    print("=" * 80)
+    print(f"  CONDITION EVALUATION: {len(conditions)} seeded rules x {args.iterations} iterations")
+    print("=" * 80)
+
+    def uncached():
+        for _ in range(args.iterations):
+            for condition in conditions:
+                _compile_node(evaluator.parse(condition)[0])(context)
+
+    def cached():
+        for _ in range(args.iterations):
+            for condition in conditions:
+                evaluator.evaluate(condition, context)
+
+    def rule_parser_cached():
+        for _ in range(args.iterations):
+            for condition in conditions:
+                rule_parser.evaluate(condition, CONTEXT, ASSESSMENT)
+
+    def warm_up():
+        for condition in conditions:
+            evaluator.compile(condition)
+            rule_parser.evaluate(condition, CONTEXT, ASSESSMENT)
+
+    before = measure("ConditionEvaluator (uncached)", uncached, evaluations)
+    measure("compile all rules once", warm_up, len(conditions))
+    after = measure("ConditionEvaluator (cached)", cached, evaluations)
+    measure("RiskRuleParser.evaluate (cached)", rule_parser_cached, evaluations)
+
+    print()
+    print(f"  Speedup (cached / uncached): {after / before:,.1f}x")
+    print(f"  Condition cache: {get_condition_cache_stats()}")
+    print(f"  Rule cache:      {get_rule_cache_stats()}")
+
+
+if __name__ == "__main__":
+    main()
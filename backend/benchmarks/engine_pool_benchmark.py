@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+CSA AIaaS Platform - Engine Process Pool Benchmark
+
+Measures throughput of concurrent design requests running a CPU-bound engine
+(retaining wall stability + reinforcement design) through EngineRegistry:
+
+- thread tier:  engines run on worker threads (one GIL shared by all)
+- process tier: engines run in the warm engine process pool
+
+Memoization is bypassed (every request has a distinct wall height) so each
+call does the full calculation. Speedup grows with the number of cores.
+
+Run with: python -m benchmarks.engine_pool_benchmark [--requests N] [--concurrency C] [--workers W]
+"""
+
+import argparse
+import asyncio
+import gc
+import os
+import time
+from typing import Any, Callable, Dict
+
+from app.engines.civil.retaining_wall_designer import (
+    analyze_retaining_wall,
+    design_retaining_wall_reinforcement,
+)
+from app.engines.process_pool import EngineProcessPool
+from app.engines.registry import EngineRegistry
+
+
+def design_wall(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Analysis followed by reinforcement design, repeated to make a heavier request."""
+    result = {}
+    for _ in range(input_data.get("repeat", 1)):
+        analysis = analyze_retaining_wall(input_data["wall"])
+        result = design_retaining_wall_reinforcement(analysis)
+    return result
+
+
+def make_registry(execution: str, pool: EngineProcessPool) -> EngineRegistry:
+    registry = EngineRegistry(process_pool=pool)
+    registry.register_tool("bench", "design_wall", design_wall, execution=execution)
+    return registry
+
+
+def requests(count: int, repeat: int):
+    return [
+        {"wall": {"wall_height": 3.0 + (i % 400) * 0.01, "safe_bearing_capacity": 180.0}, "repeat": repeat}
+        for i in range(count)
+    ]
+
+
+def measure(label: str, fn: Callable[[], None], count: int) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<36} {elapsed * 1000:>10,.1f} ms  ({count / elapsed:>8,.1f} requests/s)")
+    return elapsed
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--requests", type=int, default=200)
+    arg_parser.add_argument("--concurrency", type=int, default=os.cpu_count() or 1)
+    arg_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    arg_parser.add_argument("--repeat", type=int, default=20, help="engine passes per request")
+    args = arg_parser.parse_args()
+
+    pool = EngineProcessPool(max_workers=args.workers)
+    pool.warm_up()
+    payloads = requests(args.requests, args.repeat)
+
+    def run(registry: EngineRegistry) -> Callable[[], None]:
+        async def serve():
+            limit = asyncio.Semaphore(args.concurrency)
+
+            async def one(payload):
+                async with limit:
+                    await registry.invoke_async("bench", "design_wall", payload, use_cache=False)
+
+            await asyncio.gather(*(one(p) for p in payloads))
+
+        return lambda: asyncio.run(serve())
+
+    print("=" * 80)
+    print(
+        f"  ENGINE TIERS: {args.requests} requests, concurrency {args.concurrency}, "
+        f"{args.workers} workers, {os.cpu_count()} cores"
+    )
+    print("=" * 80)
+    before = measure("thread tier", run(make_registry("thread", pool)), args.requests)
+    after = measure("process tier", run(make_registry("process", pool)), args.requests)
+    print(f"\n  Throughput speedup: {before / after:,.2f}x")
+    print(f"  Pool: {pool.get_stats()['functions']}")
+    pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+CSA AIaaS Platform - Execution Plan Benchmark
+
+Measures per-execution orchestration overhead of a 10-step workflow whose
+engines do no work, so what is timed is everything except the engine math.
+
+- per execution: dependency graph, references, conditions and engine
+  lookups prepared on every execution (before plans were cached)
+- cached plan:   ExecutionPlan compiled once and kept on the schema
+
+Run with: python -m benchmarks.execution_plan_benchmark [--executions N]
+"""
+
+import argparse
+import gc
+import time
+from types import SimpleNamespace
+from typing import Callable
+from uuid import uuid4
+
+from app.engines.registry import engine_registry
+from app.execution.execution_plan import compile_condition, compile_reference, get_execution_plan
+from app.schemas.workflow.schema_models import WorkflowStep
+from app.services.workflow_orchestrator import WorkflowOrchestrator
+
+BRANCHES = 4
+
+
+def build_steps():
+    """Load takedown, then four footing branches of design -> check, then a BOQ."""
+    steps = [WorkflowStep(
+        step_number=1, step_name="loads", function_to_call="bench.loads",
+        input_mapping={"dead": "$input.axial_load_dead", "live": "$input.axial_load_live"},
+        output_variable="loads",
+    )]
+    for branch in range(BRANCHES):
+        design, check = 2 + 2 * branch, 3 + 2 * branch
+        steps.append(WorkflowStep(
+            step_number=design, step_name=f"design_{branch}", function_to_call="bench.design",
+            input_mapping={
+                "load": "$step1.loads.factored",
+                "sbc": "$input.safe_bearing_capacity",
+                "grade": "$input.concrete_grade",
+            },
+            output_variable=f"design_{branch}",
+        ))
+        steps.append(WorkflowStep(
+            step_number=check, step_name=f"check_{branch}", function_to_call="bench.check",
+            input_mapping={"area": f"$step{design}.design_{branch}.sizes.0", "load": "$step1.loads.factored"},
+            output_variable=f"check_{branch}",
+            condition="$input.run_checks == True",
+        ))
+    steps.append(WorkflowStep(
+        step_number=2 + 2 * BRANCHES, step_name="boq", function_to_call="bench.boq",
+        input_mapping={f"b{b}": f"$step{3 + 2 * b}.check_{b}.ok" for b in range(BRANCHES)},
+        output_variable="boq",
+    ))
+    return steps
+
+
+def register_engines() -> None:
+    engine_registry.register_tool("bench", "loads", lambda d: {"factored": 1.5 * (d["dead"] + d["live"])})
+    engine_registry.register_tool("bench", "design", lambda d: {"sizes": [d["load"] / d["sbc"], 0.5]})
+    engine_registry.register_tool("bench", "check", lambda d: {"ok": d["area"] > 0})
+    engine_registry.register_tool("bench", "boq", lambda d: {"items": len(d)})
+
+
+def measure(label: str, fn: Callable[[], None], executions: int) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    fn()
+    elapsed = (time.perf_counter() - start) / executions
+    print(f"  {label:<36} {elapsed * 1e6:>10,.1f} us/execution")
+    return elapsed
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--executions", type=int, default=500)
+    args = arg_parser.parse_args()
+
+    register_engines()
+    steps = build_steps()
+    orchestrator = WorkflowOrchestrator()
+    input_data = {
+        "axial_load_dead": 600.0, "axial_load_live": 400.0,
+        "safe_bearing_capacity": 200.0, "concrete_grade": "M25", "run_checks": True,
+    }
+
+    def new_schema():
+        return SimpleNamespace(id=uuid4(), version=1, deliverable_type="bench", workflow_steps=steps)
+
+    def execute(schema):
+        context = {"input": input_data, "steps": {}, "context": {"execution_id": "bench"}}
+        orchestrator._execute_steps(schema, context, uuid4())
+
+    def prepare_uncached():
+        for _ in range(args.executions):
+            compile_reference.cache_clear()
+            compile_condition.cache_clear()
+            get_execution_plan(new_schema())
+
+    cached_schema = new_schema()
+
+    def prepare_cached():
+        for _ in range(args.executions):
+            get_execution_plan(cached_schema)
+
+    def execute_uncached():
+        for _ in range(args.executions):
+            compile_reference.cache_clear()
+            compile_condition.cache_clear()
+            execute(new_schema())
+
+    def execute_cached():
+        for _ in range(args.executions):
+            execute(cached_schema)
+
+    print("=" * 80)
+    print(f"  EXECUTION PLAN: {len(steps)} steps, {args.executions} executions")
+    print("=" * 80)
+    before = measure("prepare per execution", prepare_uncached, args.executions)
+    after = measure("prepare (cached plan)", prepare_cached, args.executions)
+    print(f"\n  Preparation speedup: {before / after:,.0f}x\n")
+
+    before = measure("full execution, plan per execution", execute_uncached, args.executions)
+    after = measure("full execution, cached plan", execute_cached, args.executions)
+    print(f"\n  Per-execution overhead saved: {(before - after) * 1e6:,.1f} us ({before / after:,.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
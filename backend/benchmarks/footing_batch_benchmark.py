@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+CSA AIaaS Platform - Batched Footing Design Benchmark
+
+Measures footings/sec for a whole-project foundation schedule:
+
+- scalar: design_isolated_footing() once per column (the registry loop)
+- batch:  design_isolated_footings_batch() over the columnar schedule
+
+Run with: python -m benchmarks.footing_batch_benchmark [--columns N] [--scalar-sample N]
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import random
+import time
+from typing import Any, Dict, List
+
+from app.engines.foundation.design_isolated_footing import design_isolated_footing
+from app.engines.foundation.design_isolated_footing_batch import design_isolated_footings_batch
+
+
+def build_schedule(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Synthetic column schedule with mixed loads, grades and footing types."""
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(count):
+        footing_type = rng.choice(["square", "rectangular"])
+        rows.append({
+            "axial_load_dead": round(rng.uniform(200, 3500), 1),
+            "axial_load_live": round(rng.uniform(100, 1500), 1),
+            "column_width": rng.choice([0.3, 0.4, 0.45, 0.6]),
+            "column_depth": rng.choice([0.3, 0.4, 0.5, 0.6]),
+            "safe_bearing_capacity": rng.choice([100.0, 150.0, 200.0, 250.0, 300.0]),
+            "concrete_grade": rng.choice(["M20", "M25", "M30"]),
+            "steel_grade": rng.choice(["Fe415", "Fe500"]),
+            "footing_type": footing_type,
+            "aspect_ratio": 1.5 if footing_type == "rectangular" else None,
+        })
+    return rows
+
+
+def to_columns(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    columns = {key: [row[key] for row in rows] for key in rows[0] if key != "aspect_ratio"}
+    columns["aspect_ratio"] = [row["aspect_ratio"] or 1.5 for row in rows]
+    return columns
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--columns", type=int, default=10_000)
+    arg_parser.add_argument("--scalar-sample", type=int, default=1_000,
+                            help="columns timed through the scalar engine (extrapolated)")
+    args = arg_parser.parse_args()
+
+    rows = build_schedule(args.columns)
+    columns = to_columns(rows)
+    sample = [
+        {key: value for key, value in row.items() if value is not None}
+        for row in rows[:args.scalar_sample]
+    ]
+
+    print("=" * 80)
+    print(f"  ISOLATED FOOTING DESIGN: {args.columns:,} columns")
+    print("=" * 80)
+
+    # The scalar engine prints a debug dump per call; keep it out of the timing output
+    gc.collect()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for row in sample:
+            design_isolated_footing(row)
+    scalar_elapsed = time.perf_counter() - start
+    scalar_rate = len(sample) / scalar_elapsed
+    print(f"  {'scalar (per column)':<28} {scalar_rate:>12,.0f} footings/sec"
+          f"   (~{args.columns / scalar_rate:,.2f} s for {args.columns:,})")
+
+    gc.collect()
+    start = time.perf_counter()
+    result = design_isolated_footings_batch(columns)
+    batch_elapsed = time.perf_counter() - start
+    batch_rate = result["count"] / batch_elapsed
+    print(f"  {'batch (vectorized)':<28} {batch_rate:>12,.0f} footings/sec"
+          f"   ({batch_elapsed * 1000:,.1f} ms)")
+
+    print()
+    print(f"  Speedup (batch / scalar): {batch_rate / scalar_rate:,.1f}x")
+    print(f"  Designs OK: {sum(result['design_ok']):,} / {result['count']:,}")
+
+
+if __name__ == "__main__":
+    main()
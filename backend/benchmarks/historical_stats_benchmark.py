@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+CSA AIaaS Platform - Historical Risk Statistics Benchmark
+
+Measures the historical part of a risk assessment (anomaly risk plus the
+historical baseline) as the number of past designs grows.
+
+- raw history: the calculators re-extract parameters from the list of past
+  designs and recompute numpy mean/std on every assessment (before)
+- statistics store: the engine reads O(1) running summaries from
+  HistoricalStatsStore, updated once per finalized execution (after)
+
+Run with: python -m benchmarks.historical_stats_benchmark [--assessments N]
+"""
+
+import argparse
+import gc
+import random
+import time
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from app.risk.calculators import AnomalyRiskCalculator
+from app.risk.engine import RiskAssessmentEngine
+from app.risk.historical_stats import HistoricalStatsStore
+
+DELIVERABLE_TYPE = "foundation_design"
+ANOMALY_PARAMETERS = [
+    "footing_length_final",
+    "footing_width_final",
+    "footing_depth_final",
+    ("material_quantities", "steel_weight_total"),
+    ("material_quantities", "concrete_volume_m3"),
+]
+
+
+def make_design(rng: random.Random) -> Dict[str, Any]:
+    length = rng.uniform(1.5, 3.5)
+    depth = rng.uniform(0.4, 0.9)
+    return {
+        "footing_length_final": length,
+        "footing_width_final": length,
+        "footing_depth_final": depth,
+        "material_quantities": {
+            "steel_weight_total": rng.uniform(60, 240),
+            "concrete_volume_m3": length * length * depth,
+        },
+    }
+
+
+def raw_history_assessment(design: Dict[str, Any], history: List[Dict[str, Any]]) -> None:
+    """What anomaly detection and the baseline did per assessment before the store."""
+    for param in ANOMALY_PARAMETERS:
+        if isinstance(param, tuple):
+            values = [h.get(param[0], {}).get(param[1]) for h in history]
+        else:
+            values = [h.get(param) for h in history]
+        values = [v for v in values if v is not None]
+        mean, std = np.mean(values), np.std(values)
+        current = design.get(param[0], {}).get(param[1]) if isinstance(param, tuple) else design.get(param)
+        abs((current - mean) / std)
+    for param in ANOMALY_PARAMETERS[:3]:
+        values = [d.get(param) for d in history if d.get(param) is not None]
+        np.mean(values), np.std(values), np.min(values), np.max(values)
+
+
+def measure(label: str, fn: Callable[[], None], assessments: int) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    fn()
+    elapsed = (time.perf_counter() - start) / assessments
+    print(f"  {label:<28} {elapsed * 1e6:>12,.1f} us/assessment")
+    return elapsed
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--assessments", type=int, default=200)
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 50_000])
+    args = arg_parser.parse_args()
+
+    rng = random.Random(42)
+    design = make_design(rng)
+    anomaly = AnomalyRiskCalculator()
+
+    for size in args.sizes:
+        history = [make_design(rng) for _ in range(size)]
+        store = HistoricalStatsStore()
+        start = time.perf_counter()
+        for past in history:
+            store.record(DELIVERABLE_TYPE, past)
+        record_us = (time.perf_counter() - start) / size * 1e6
+        engine = RiskAssessmentEngine(stats_store=store)
+
+        print("=" * 80)
+        print(f"  HISTORY: {size:,} past designs ({record_us:,.1f} us to record each)")
+        print("=" * 80)
+
+        def before():
+            for _ in range(args.assessments):
+                raw_history_assessment(design, history)
+
+        def after():
+            for _ in range(args.assessments):
+                summary = engine._historical_summary(None, DELIVERABLE_TYPE)
+                anomaly.calculate(design, {"historical_summary": summary})
+                engine._calculate_historical_baseline(design, summary)
+
+        raw = measure("raw history (numpy)", before, args.assessments)
+        summarized = measure("statistics store", after, args.assessments)
+        print(f"\n  Speedup: {raw / summarized:,.1f}x\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+CSA AIaaS Platform - Scenario Persistence Benchmark
+
+Measures scenario creation (storage) latency for BOQs of 50 to 500 items:
+
+- row-by-row: scenario INSERT, SELECT id, then one INSERT + commit per BOQ
+  item (how ScenarioService stored scenarios before bulk persistence)
+- bulk:       ScenarioService._store_scenario(): one transaction, RETURNING id,
+  multi-row BOQ INSERTs
+
+By default the database is simulated: every statement and commit costs one
+network round trip (--rtt-ms). With --live the benchmark writes to the
+PostgreSQL database at DATABASE_URL and deletes its rows afterwards.
+
+Run with: python -m benchmarks.scenario_persistence_benchmark [--rtt-ms MS] [--live]
+"""
+
+import argparse
+import statistics
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List
+from uuid import uuid4
+
+from app.services.scenario.scenario_service import (
+    INSERT_BOQ_ITEMS_SQL,
+    INSERT_SCENARIO_SQL,
+    ScenarioService
+)
+
+BOQ_SIZES = [50, 100, 200, 500]
+
+INSERT_BOQ_ITEM_SQL = INSERT_BOQ_ITEMS_SQL.replace(
+    "VALUES %s", "VALUES (" + ", ".join(["%s"] * 16) + ")"
+)
+
+
+# ============================================================================
+# SIMULATED DATABASE
+# ============================================================================
+
+class SimulatedCursor:
+    """Cursor that charges one round trip per statement."""
+
+    def __init__(self, conn: "SimulatedConnection"):
+        self.connection = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql: Any, params: Any = None) -> None:
+        self.connection.round_trip()
+
+    def mogrify(self, template: Any, args: Any) -> bytes:
+        return ("(" + ",".join(repr(arg) for arg in args) + ")").encode()
+
+    def fetchone(self):
+        return (str(uuid4()),)
+
+
+class SimulatedConnection:
+    encoding = "UTF8"
+
+    def __init__(self, rtt_seconds: float):
+        self.rtt_seconds = rtt_seconds
+        self.round_trips = 0
+
+    def round_trip(self) -> None:
+        self.round_trips += 1
+        time.sleep(self.rtt_seconds)
+
+    def cursor(self) -> SimulatedCursor:
+        return SimulatedCursor(self)
+
+    def commit(self) -> None:
+        self.round_trip()
+
+
+class SimulatedDB:
+    def __init__(self, rtt_seconds: float):
+        self.conn = SimulatedConnection(rtt_seconds)
+
+    @contextmanager
+    def connection(self):
+        yield self.conn
+
+
+# ============================================================================
+# WORKLOAD
+# ============================================================================
+
+def build_scenario(boq_size: int) -> Dict[str, Any]:
+    tag = uuid4().hex[:8].upper()
+    boq_items = [
+        {
+            "boq_id": f"BENCH-{tag}-{i:04d}",
+            "item_number": i + 1,
+            "item_code": f"CON-M{25 + i % 4 * 5}",
+            "item_description": "RCC in beam using standard grade concrete",
+            "category": ["concrete", "steel", "formwork", "labor"][i % 4],
+            "quantity": 1.25 + i,
+            "unit": "cum",
+            "base_rate": 6200.0,
+            "complexity_multiplier": 1.1,
+            "regional_multiplier": 1.0,
+            "adjusted_rate": 6820.0,
+            "amount": 6820.0 * (1.25 + i),
+            "design_parameter": "concrete_grade",
+            "calculation_basis": "Width x Depth x Span",
+            "notes": None,
+        }
+        for i in range(boq_size)
+    ]
+    scenario = {
+        "scenario_id": f"BENCH-{tag}",
+        "scenario_name": f"Benchmark scenario ({boq_size} items)",
+        "scenario_type": "beam",
+        "design_variables": {"concrete_grade": "M30", "steel_grade": "Fe500"},
+        "design_output": {"beam_width": 0.3, "beam_depth": 0.6},
+        "material_quantities": {"concrete_volume": 12.5},
+        "cost_estimation": {"total_amount": 1_250_000},
+        "total_cost": 1_250_000,
+        "created_by": "benchmark",
+    }
+    return {"scenario": scenario, "boq_items": boq_items}
+
+
+def store_row_by_row(db: Any, scenario: Dict[str, Any], boq_items: List[Dict[str, Any]]) -> None:
+    """The pre-bulk storage pattern: one statement and one commit per row."""
+    with db.connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(INSERT_SCENARIO_SQL, ScenarioService._scenario_params(scenario))
+        conn.commit()
+
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT id FROM design_scenarios WHERE scenario_id = %s", (scenario["scenario_id"],))
+            scenario_uuid = cursor.fetchone()[0]
+        conn.commit()
+
+        for item in boq_items:
+            with conn.cursor() as cursor:
+                cursor.execute(INSERT_BOQ_ITEM_SQL, (
+                    item["boq_id"], str(scenario_uuid), item["item_number"], item["item_code"],
+                    item["item_description"], item["category"], item["quantity"], item["unit"],
+                    item["base_rate"], item["complexity_multiplier"], item["regional_multiplier"],
+                    item["adjusted_rate"], item["amount"], item["design_parameter"],
+                    item["calculation_basis"], item["notes"],
+                ))
+            conn.commit()
+
+
+def time_ms(fn, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--rtt-ms", type=float, default=0.5,
+                            help="simulated round-trip time per statement/commit")
+    arg_parser.add_argument("--repeats", type=int, default=5)
+    arg_parser.add_argument("--live", action="store_true",
+                            help="write to the DATABASE_URL database instead of simulating")
+    args = arg_parser.parse_args()
+
+    service = ScenarioService.__new__(ScenarioService)
+    if args.live:
+        from app.core.database import DatabaseConfig
+        service.db = DatabaseConfig()
+        mode = "live PostgreSQL (DATABASE_URL)"
+    else:
+        service.db = SimulatedDB(args.rtt_ms / 1000)
+        mode = f"simulated, {args.rtt_ms} ms per round trip"
+
+    print("=" * 80)
+    print(f"  SCENARIO PERSISTENCE LATENCY ({mode})")
+    print("=" * 80)
+    print(f"  {'BOQ items':>10} {'row-by-row':>14} {'bulk':>12} {'speedup':>10}")
+
+    try:
+        for size in BOQ_SIZES:
+            def row_by_row():
+                workload = build_scenario(size)
+                store_row_by_row(service.db, workload["scenario"], workload["boq_items"])
+
+            def bulk():
+                workload = build_scenario(size)
+                if service._store_scenario(workload["scenario"], workload["boq_items"]) is None:
+                    raise RuntimeError("bulk scenario storage failed (see log)")
+
+            legacy_ms = time_ms(row_by_row, args.repeats)
+            bulk_ms = time_ms(bulk, args.repeats)
+            print(f"  {size:>10} {legacy_ms:>11,.1f} ms {bulk_ms:>9,.1f} ms {legacy_ms / bulk_ms:>9,.1f}x")
+    finally:
+        if args.live:
+            service.db.execute_query(
+                "DELETE FROM design_scenarios WHERE scenario_id LIKE 'BENCH-%'", fetch=False
+            )
+
+
+if __name__ == "__main__":
+    main()
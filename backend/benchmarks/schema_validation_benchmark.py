@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+CSA AIaaS Platform - JSON Schema Validation Benchmark
+
+Measures input validations/sec against the seeded deliverable input schemas
+(init_phase2_sprint2.sql, init_phase3_sprint3.sql).
+
+- per-call compile: check_schema + Draft7Validator on every call (what
+  ValidationEngine did before validators were cached)
+- cached (id, version): ValidatorCache keyed like the orchestrators key it
+- cached (content hash): ValidatorCache keyed by a hash of the schema
+- required keys only: the check WorkflowOrchestrator._validate_input used
+  to do, for reference
+
+Run with: python -m benchmarks.schema_validation_benchmark [--iterations N]
+"""
+
+import argparse
+import gc
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+from uuid import uuid4
+
+from jsonschema import Draft7Validator
+
+from app.execution.validation_engine import ValidationEngine, ValidatorCache
+
+SEED_FILES = [
+    Path(__file__).resolve().parent.parent / "init_phase2_sprint2.sql",
+    Path(__file__).resolve().parent.parent / "init_phase3_sprint3.sql",
+]
+
+_INSERT = re.compile(r"INSERT INTO csa\.deliverable_schemas \(.*?\) VALUES \(\s*(?:gen_random_uuid\(\),\s*)?'(\w+)'(.*?)ON CONFLICT", re.S)
+_JSONB = re.compile(r"'((?:[^']|'')*)'::jsonb", re.S)
+
+
+def load_seed_schemas() -> List[Tuple[str, Dict[str, Any]]]:
+    """(deliverable_type, input_schema) for every seeded deliverable."""
+    schemas = []
+    for path in SEED_FILES:
+        for deliverable_type, values in _INSERT.findall(path.read_text()):
+            literals = _JSONB.findall(values)
+            # workflow_steps, then input_schema
+            schemas.append((deliverable_type, json.loads(literals[1].replace("''", "'"))))
+    if not schemas:
+        raise RuntimeError("No deliverable schemas found in the seed files")
+    return schemas
+
+
+def sample_value(prop: Dict[str, Any]) -> Any:
+    """A valid value for one property schema."""
+    if "default" in prop:
+        return prop["default"]
+    if "enum" in prop:
+        return prop["enum"][0]
+    kind = prop.get("type")
+    if kind in ("number", "integer"):
+        low, high = prop.get("minimum", 1), prop.get("maximum")
+        value = (low + high) / 2 if high is not None else low + 1
+        return int(value) if kind == "integer" else float(value)
+    if kind == "string":
+        return "x" * max(prop.get("minLength", 0), 6)
+    if kind == "boolean":
+        return True
+    if kind == "array":
+        return [sample_value(prop.get("items", {}))] * prop.get("minItems", 0)
+    if kind == "object":
+        return sample_input(prop)
+    return None
+
+
+def sample_input(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """A valid input for a deliverable schema, every documented property filled in."""
+    return {name: sample_value(prop) for name, prop in schema.get("properties", {}).items()}
+
+
+def measure(label: str, fn: Callable[[], None], validations: int) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    rate = validations / elapsed
+    print(f"  {label:<34} {rate:>12,.0f} validations/sec   ({elapsed / validations * 1e6:,.1f} us each)")
+    return rate
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--iterations", type=int, default=500)
+    args = arg_parser.parse_args()
+
+    cases = [
+        (deliverable_type, schema, sample_input(schema), (uuid4(), 1, "input"))
+        for deliverable_type, schema in load_seed_schemas()
+    ]
+    for deliverable_type, schema, data, _ in cases:
+        if not Draft7Validator(schema).is_valid(data):
+            raise RuntimeError(f"Generated input for {deliverable_type} does not validate")
+
+    validations = len(cases) * args.iterations
+    engine = ValidationEngine(validation_cache=ValidatorCache())
+
+    print("=" * 80)
+    print(f"  INPUT VALIDATION: {len(cases)} seeded deliverable schemas x {args.iterations} iterations")
+    print(f"  ({', '.join(case[0] for case in cases)})")
+    print("=" * 80)
+
+    def per_call_compile():
+        for _ in range(args.iterations):
+            for _, schema, data, _ in cases:
+                Draft7Validator.check_schema(schema)
+                list(Draft7Validator(schema).iter_errors(data))
+
+    def cached_by_key():
+        for _ in range(args.iterations):
+            for _, schema, data, key in cases:
+                engine.validate_input(data, schema, schema_key=key)
+
+    def cached_by_content():
+        for _ in range(args.iterations):
+            for _, schema, data, _ in cases:
+                engine.validate_input(data, schema)
+
+    def required_only():
+        for _ in range(args.iterations):
+            for _, schema, data, _ in cases:
+                for field in schema.get("required", []):
+                    if field not in data:
+                        raise ValueError(field)
+
+    before = measure("per-call compile", per_call_compile, validations)
+    after = measure("cached (id, version)", cached_by_key, validations)
+    measure("cached (content hash)", cached_by_content, validations)
+    measure("required keys only (old check)", required_only, validations)
+
+    print()
+    print(f"  Speedup (cached / per-call compile): {after / before:,.1f}x")
+    print(f"  Validator cache: {engine.validation_cache.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
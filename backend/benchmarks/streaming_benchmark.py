@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+CSA AIaaS Platform - Execution Event Streaming Benchmark
+
+Measures fan-out of execution events to many concurrent stream subscribers
+(one asyncio event loop, like a uvicorn worker) while a worker thread emits
+events, the way WorkflowRunner executions do.
+
+- callbacks: one async callback per subscriber, each scheduled with
+  run_coroutine_threadsafe (how the WebSocket endpoint subscribed before)
+- iterators: stream_events() subscribers, fed with one thread-safe wakeup
+  per event loop per event
+
+Latency is emit() -> the last subscriber holding the event. Also compares
+history trimming by list slicing with the deque ring buffer.
+
+Run with: python -m benchmarks.streaming_benchmark [--subscribers N] [--events N]
+"""
+
+import argparse
+import asyncio
+import gc
+import statistics
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Callable, Dict, List
+
+from app.execution.streaming_manager import StreamEvent, StreamEventType, StreamingManager
+
+EXECUTION_ID = "benchmark-execution"
+
+
+def make_event(event_type: StreamEventType = StreamEventType.PROGRESS_UPDATE, **data) -> StreamEvent:
+    return StreamEvent(
+        event_type=event_type,
+        execution_id=EXECUTION_ID,
+        timestamp=datetime.utcnow().isoformat(),
+        data=data,
+    )
+
+
+def report(label: str, samples: List[float]) -> float:
+    median = statistics.median(samples)
+    p95 = sorted(samples)[int(len(samples) * 0.95) - 1]
+    print(f"  {label:<36} median {median:>9.3f} ms   p95 {p95:>9.3f} ms")
+    return median
+
+
+def emit_from_worker(manager: StreamingManager, events: int, emitted_at: Dict[int, float], interval: float) -> None:
+    for step in range(events):
+        emitted_at[step] = time.perf_counter()
+        manager.emit(EXECUTION_ID, make_event(step=step))
+        time.sleep(interval)
+    manager.emit(EXECUTION_ID, make_event(StreamEventType.EXECUTION_COMPLETED))
+
+
+async def run_callbacks(subscribers: int, events: int, interval: float) -> List[float]:
+    manager = StreamingManager()
+    await manager.create_stream(EXECUTION_ID)
+    last_received: Dict[int, float] = {}
+    done = asyncio.Event()
+    remaining = [subscribers]
+
+    def make_callback():
+        async def callback(event: StreamEvent):
+            if event.event_type == StreamEventType.EXECUTION_COMPLETED:
+                remaining[0] -= 1
+                if not remaining[0]:
+                    done.set()
+                return
+            last_received[event.data["step"]] = time.perf_counter()
+        return callback
+
+    for _ in range(subscribers):
+        manager.subscribe(EXECUTION_ID, make_callback())
+
+    emitted_at: Dict[int, float] = {}
+    worker = threading.Thread(target=emit_from_worker, args=(manager, events, emitted_at, interval))
+    worker.start()
+    await done.wait()
+    worker.join()
+    return [(last_received[step] - emitted_at[step]) * 1000 for step in range(events)]
+
+
+async def run_iterators(subscribers: int, events: int, interval: float) -> List[float]:
+    manager = StreamingManager()
+    await manager.create_stream(EXECUTION_ID)
+    last_received: Dict[int, float] = {}
+
+    async def consume():
+        async for event in manager.stream_events(EXECUTION_ID):
+            if event.event_type != StreamEventType.EXECUTION_COMPLETED:
+                last_received[event.data["step"]] = time.perf_counter()
+
+    consumers = [asyncio.create_task(consume()) for _ in range(subscribers)]
+    await asyncio.sleep(0.1)  # every iterator subscribed
+
+    emitted_at: Dict[int, float] = {}
+    worker = threading.Thread(target=emit_from_worker, args=(manager, events, emitted_at, interval))
+    worker.start()
+    await asyncio.gather(*consumers)
+    worker.join()
+    return [(last_received[step] - emitted_at[step]) * 1000 for step in range(events)]
+
+
+def measure_history(label: str, append: Callable[[int], None], events: int) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    for i in range(events):
+        append(i)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<36} {elapsed / events * 1e6:>9.3f} us/event")
+    return elapsed
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--subscribers", type=int, default=1000)
+    arg_parser.add_argument("--events", type=int, default=200)
+    arg_parser.add_argument("--interval-ms", type=float, default=5.0, help="Pause between emitted events")
+    arg_parser.add_argument("--history", type=int, default=1000)
+    args = arg_parser.parse_args()
+    interval = args.interval_ms / 1000
+
+    print("=" * 80)
+    print(f"  FAN-OUT: {args.subscribers} subscribers x {args.events} events (emitted from a worker thread)")
+    print("=" * 80)
+
+    before = report("async callbacks (per subscriber)", asyncio.run(run_callbacks(args.subscribers, args.events, interval)))
+    after = report("stream_events() iterators", asyncio.run(run_iterators(args.subscribers, args.events, interval)))
+    print(f"\n  Fan-out latency improvement: {before / after:,.1f}x")
+
+    print()
+    print("=" * 80)
+    print(f"  HISTORY: {args.events * 50} events into a {args.history}-event buffer")
+    print("=" * 80)
+
+    history_list: List[int] = []
+
+    def append_list(i: int) -> None:
+        nonlocal history_list
+        history_list.append(i)
+        if len(history_list) > args.history:
+            history_list = history_list[-args.history:]
+
+    history_deque: deque = deque(maxlen=args.history)
+    list_time = measure_history("list append + slice trim", append_list, args.events * 50)
+    deque_time = measure_history("deque(maxlen) append", history_deque.append, args.events * 50)
+    print(f"\n  History append speedup: {list_time / deque_time:,.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+-- ============================================================================
+-- EMBEDDING CACHE
+-- Persistent content-hash cache for text embeddings
+-- ============================================================================
+--
+-- Backing store for app/services/embedding_cache.py when
+-- EMBEDDING_CACHE_BACKEND=postgres. Rows are keyed by
+-- SHA-256(model, dimensions, normalized text); vectors are stored as
+-- float32 blobs (4 bytes per dimension).
+--
+-- ============================================================================
+
+CREATE SCHEMA IF NOT EXISTS csa;
+
+CREATE TABLE IF NOT EXISTS csa.embedding_cache (
+    key CHAR(64) PRIMARY KEY,
+    model VARCHAR(100) NOT NULL,
+    dimensions INTEGER NOT NULL,
+    embedding BYTEA NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_embedding_cache_model
+    ON csa.embedding_cache(model, dimensions);
+
+COMMENT ON TABLE csa.embedding_cache IS 'Content-hash cache of text embeddings (float32 blobs)';
@@ -0,0 +1,428 @@
+-- ============================================================================
+-- EXECUTION PERFORMANCE ROLLUPS
+-- Incremental per-(schema, version, variant, hour) execution statistics
+-- ============================================================================
+--
+-- Backing tables for app/services/versioning/performance_rollups.py.
+-- Version comparisons, performance summaries/trends and variant metrics read
+-- these rollups instead of scanning csa.workflow_executions.
+--
+-- - One row per (schema_id, schema_version, variant_id, hour bucket) with
+--   counts, sums and sums of squares of execution time and risk score, and
+--   fixed-bucket histograms for percentiles
+-- - Maintained by trigger on every insert/update/delete of an execution
+--   (a status change moves the execution's contribution, e.g. when an
+--   approval moves awaiting_approval -> approved)
+-- - csa.backfill_execution_rollups() rebuilds a schema / time range from
+--   the executions table (run once after applying this file)
+--
+-- Requires init_phase2_sprint2.sql and init_phase3_sprint4.sql.
+--
+-- min/max are only ever widened: removing an execution's contribution does
+-- not shrink them (backfill recomputes them exactly).
+--
+-- ============================================================================
+
+CREATE SCHEMA IF NOT EXISTS csa;
+
+-- ============================================================================
+-- HISTOGRAM HELPERS
+-- Keep the bounds in sync with app/services/versioning/performance_rollups.py
+-- ============================================================================
+
+-- Execution time histogram bucket lower bounds (ms); 14 buckets, the first
+-- holds everything below 50 ms and the last everything from 600 s
+CREATE OR REPLACE FUNCTION csa.rollup_time_bounds() RETURNS DOUBLE PRECISION[] AS $$
+    SELECT ARRAY[50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000,
+                 100000, 250000, 600000]::DOUBLE PRECISION[];
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Risk score histogram bucket lower bounds; 10 buckets of width 0.1
+CREATE OR REPLACE FUNCTION csa.rollup_risk_bounds() RETURNS DOUBLE PRECISION[] AS $$
+    SELECT ARRAY[0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9]::DOUBLE PRECISION[];
+$$ LANGUAGE sql IMMUTABLE;
+
+-- One-hot histogram for a single value (all zeros for NULL), scaled by p_weight
+CREATE OR REPLACE FUNCTION csa.histogram_point(
+    p_value DOUBLE PRECISION,
+    p_bounds DOUBLE PRECISION[],
+    p_weight BIGINT DEFAULT 1
+) RETURNS BIGINT[] AS $$
+    SELECT ARRAY(
+        SELECT CASE WHEN i = width_bucket(p_value, p_bounds) + 1 THEN p_weight ELSE 0 END
+        FROM generate_series(1, array_length(p_bounds, 1) + 1) AS i
+    );
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Element-wise sum of two histograms (NULL is the empty histogram)
+CREATE OR REPLACE FUNCTION csa.histogram_add(a BIGINT[], b BIGINT[]) RETURNS BIGINT[] AS $$
+    SELECT CASE
+        WHEN a IS NULL THEN b
+        WHEN b IS NULL THEN a
+        ELSE ARRAY(SELECT x + y FROM unnest(a, b) AS t(x, y))
+    END;
+$$ LANGUAGE sql IMMUTABLE;
+
+DROP AGGREGATE IF EXISTS csa.sum_histogram(BIGINT[]);
+CREATE AGGREGATE csa.sum_histogram(BIGINT[]) (
+    SFUNC = csa.histogram_add,
+    STYPE = BIGINT[]
+);
+
+-- Quantile estimated from a histogram (linear within the bucket holding it)
+CREATE OR REPLACE FUNCTION csa.histogram_quantile(
+    p_counts BIGINT[],
+    p_bounds DOUBLE PRECISION[],
+    p_min DOUBLE PRECISION,
+    p_max DOUBLE PRECISION,
+    p_q DOUBLE PRECISION
+) RETURNS DOUBLE PRECISION AS $$
+DECLARE
+    v_total BIGINT;
+    v_rank DOUBLE PRECISION;
+    v_seen BIGINT := 0;
+    v_lower DOUBLE PRECISION;
+    v_upper DOUBLE PRECISION;
+BEGIN
+    SELECT SUM(c) INTO v_total FROM unnest(p_counts) AS c;
+    IF v_total IS NULL OR v_total <= 0 THEN
+        RETURN NULL;
+    END IF;
+    v_rank := p_q * v_total;
+
+    FOR i IN 1 .. array_length(p_counts, 1) LOOP
+        IF p_counts[i] > 0 AND v_seen + p_counts[i] >= v_rank THEN
+            v_lower := GREATEST(COALESCE(p_bounds[i - 1], p_min), p_min);
+            v_upper := LEAST(COALESCE(p_bounds[i], p_max), p_max);
+            RETURN v_lower + (v_upper - v_lower) * GREATEST(v_rank - v_seen, 0) / p_counts[i];
+        END IF;
+        v_seen := v_seen + p_counts[i];
+    END LOOP;
+    RETURN p_max;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+-- ============================================================================
+-- TABLE: EXECUTION ROLLUPS
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS csa.execution_rollups (
+    schema_id UUID NOT NULL,
+    schema_version INTEGER,
+    variant_id UUID,
+    bucket_start TIMESTAMP NOT NULL,  -- date_trunc('hour', created_at)
+
+    -- Outcome counts
+    total_executions BIGINT NOT NULL DEFAULT 0,
+    successful_executions BIGINT NOT NULL DEFAULT 0,  -- completed / approved
+    failed_executions BIGINT NOT NULL DEFAULT 0,
+    pending_approval BIGINT NOT NULL DEFAULT 0,
+    hitl_required_count BIGINT NOT NULL DEFAULT 0,
+
+    -- Execution time (ms)
+    time_count BIGINT NOT NULL DEFAULT 0,
+    time_sum NUMERIC NOT NULL DEFAULT 0,
+    time_sum_sq NUMERIC NOT NULL DEFAULT 0,
+    time_min DOUBLE PRECISION,
+    time_max DOUBLE PRECISION,
+    time_histogram BIGINT[] NOT NULL DEFAULT array_fill(0::BIGINT, ARRAY[14]),
+
+    -- Risk score
+    risk_count BIGINT NOT NULL DEFAULT 0,
+    risk_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    risk_sum_sq DOUBLE PRECISION NOT NULL DEFAULT 0,
+    risk_min DOUBLE PRECISION,
+    risk_max DOUBLE PRECISION,
+    risk_histogram BIGINT[] NOT NULL DEFAULT array_fill(0::BIGINT, ARRAY[10]),
+
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_execution_rollups_key ON csa.execution_rollups (
+    schema_id,
+    (COALESCE(schema_version, 0)),
+    (COALESCE(variant_id, '00000000-0000-0000-0000-000000000000'::UUID)),
+    bucket_start
+);
+CREATE INDEX IF NOT EXISTS idx_execution_rollups_schema_time ON csa.execution_rollups(schema_id, bucket_start);
+CREATE INDEX IF NOT EXISTS idx_execution_rollups_variant ON csa.execution_rollups(variant_id, bucket_start);
+
+COMMENT ON TABLE csa.execution_rollups IS 'Hourly execution statistics per schema version/variant (maintained by trigger)';
+
+-- ============================================================================
+-- MAINTENANCE
+-- ============================================================================
+
+-- Add (p_sign = 1) or remove (p_sign = -1) one execution's contribution
+CREATE OR REPLACE FUNCTION csa.rollup_execution(
+    r csa.workflow_executions,
+    p_sign INTEGER
+) RETURNS VOID AS $$
+BEGIN
+    IF r.schema_id IS NULL THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO csa.execution_rollups AS er (
+        schema_id, schema_version, variant_id, bucket_start,
+        total_executions, successful_executions, failed_executions,
+        pending_approval, hitl_required_count,
+        time_count, time_sum, time_sum_sq, time_min, time_max, time_histogram,
+        risk_count, risk_sum, risk_sum_sq, risk_min, risk_max, risk_histogram
+    ) VALUES (
+        r.schema_id, r.schema_version, r.variant_id,
+        date_trunc('hour', COALESCE(r.created_at, NOW()::TIMESTAMP)),
+        p_sign,
+        CASE WHEN r.execution_status IN ('completed', 'approved') THEN p_sign ELSE 0 END,
+        CASE WHEN r.execution_status = 'failed' THEN p_sign ELSE 0 END,
+        CASE WHEN r.execution_status = 'awaiting_approval' THEN p_sign ELSE 0 END,
+        CASE WHEN r.requires_approval THEN p_sign ELSE 0 END,
+        CASE WHEN r.execution_time_ms IS NOT NULL THEN p_sign ELSE 0 END,
+        p_sign * COALESCE(r.execution_time_ms, 0)::NUMERIC,
+        p_sign * COALESCE(r.execution_time_ms, 0)::NUMERIC ^ 2,
+        CASE WHEN p_sign > 0 THEN r.execution_time_ms END,
+        CASE WHEN p_sign > 0 THEN r.execution_time_ms END,
+        csa.histogram_point(r.execution_time_ms, csa.rollup_time_bounds(), p_sign),
+        CASE WHEN r.risk_score IS NOT NULL THEN p_sign ELSE 0 END,
+        p_sign * COALESCE(r.risk_score, 0),
+        p_sign * COALESCE(r.risk_score, 0) ^ 2,
+        CASE WHEN p_sign > 0 THEN r.risk_score END,
+        CASE WHEN p_sign > 0 THEN r.risk_score END,
+        csa.histogram_point(r.risk_score, csa.rollup_risk_bounds(), p_sign)
+    )
+    ON CONFLICT (
+        schema_id,
+        (COALESCE(schema_version, 0)),
+        (COALESCE(variant_id, '00000000-0000-0000-0000-000000000000'::UUID)),
+        bucket_start
+    )
+    DO UPDATE SET
+        total_executions = er.total_executions + EXCLUDED.total_executions,
+        successful_executions = er.successful_executions + EXCLUDED.successful_executions,
+        failed_executions = er.failed_executions + EXCLUDED.failed_executions,
+        pending_approval = er.pending_approval + EXCLUDED.pending_approval,
+        hitl_required_count = er.hitl_required_count + EXCLUDED.hitl_required_count,
+        time_count = er.time_count + EXCLUDED.time_count,
+        time_sum = er.time_sum + EXCLUDED.time_sum,
+        time_sum_sq = er.time_sum_sq + EXCLUDED.time_sum_sq,
+        time_min = LEAST(er.time_min, EXCLUDED.time_min),
+        time_max = GREATEST(er.time_max, EXCLUDED.time_max),
+        time_histogram = csa.histogram_add(er.time_histogram, EXCLUDED.time_histogram),
+        risk_count = er.risk_count + EXCLUDED.risk_count,
+        risk_sum = er.risk_sum + EXCLUDED.risk_sum,
+        risk_sum_sq = er.risk_sum_sq + EXCLUDED.risk_sum_sq,
+        risk_min = LEAST(er.risk_min, EXCLUDED.risk_min),
+        risk_max = GREATEST(er.risk_max, EXCLUDED.risk_max),
+        risk_histogram = csa.histogram_add(er.risk_histogram, EXCLUDED.risk_histogram),
+        updated_at = NOW();
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION csa.trigger_execution_rollups() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND (
+        OLD.execution_status, OLD.execution_time_ms, OLD.risk_score, OLD.requires_approval,
+        OLD.schema_id, OLD.schema_version, OLD.variant_id, OLD.created_at
+    ) IS NOT DISTINCT FROM (
+        NEW.execution_status, NEW.execution_time_ms, NEW.risk_score, NEW.requires_approval,
+        NEW.schema_id, NEW.schema_version, NEW.variant_id, NEW.created_at
+    ) THEN
+        RETURN NEW;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM csa.rollup_execution(OLD, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM csa.rollup_execution(NEW, 1);
+        RETURN NEW;
+    END IF;
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Named to fire before trg_update_variant_metrics (triggers run in name order)
+DROP TRIGGER IF EXISTS trg_execution_rollups ON csa.workflow_executions;
+CREATE TRIGGER trg_execution_rollups
+    AFTER INSERT OR UPDATE OR DELETE ON csa.workflow_executions
+    FOR EACH ROW
+    EXECUTE FUNCTION csa.trigger_execution_rollups();
+
+-- Rebuild the rollups of a schema (NULL: all) over whole hours in [p_start, p_end)
+CREATE OR REPLACE FUNCTION csa.backfill_execution_rollups(
+    p_schema_id UUID DEFAULT NULL,
+    p_start TIMESTAMP DEFAULT NULL,
+    p_end TIMESTAMP DEFAULT NULL
+) RETURNS INTEGER AS $$
+DECLARE
+    v_start TIMESTAMP := date_trunc('hour', p_start);
+    v_end TIMESTAMP := date_trunc('hour', p_end) + CASE WHEN p_end > date_trunc('hour', p_end) THEN INTERVAL '1 hour' ELSE INTERVAL '0' END;
+    v_rows INTEGER;
+BEGIN
+    -- Block execution writes for the rebuild so the trigger cannot interleave
+    LOCK TABLE csa.workflow_executions IN SHARE MODE;
+
+    DELETE FROM csa.execution_rollups
+    WHERE (p_schema_id IS NULL OR schema_id = p_schema_id)
+      AND (v_start IS NULL OR bucket_start >= v_start)
+      AND (v_end IS NULL OR bucket_start < v_end);
+
+    INSERT INTO csa.execution_rollups (
+        schema_id, schema_version, variant_id, bucket_start,
+        total_executions, successful_executions, failed_executions,
+        pending_approval, hitl_required_count,
+        time_count, time_sum, time_sum_sq, time_min, time_max, time_histogram,
+        risk_count, risk_sum, risk_sum_sq, risk_min, risk_max, risk_histogram
+    )
+    SELECT
+        schema_id, schema_version, variant_id, date_trunc('hour', created_at),
+        COUNT(*),
+        COUNT(*) FILTER (WHERE execution_status IN ('completed', 'approved')),
+        COUNT(*) FILTER (WHERE execution_status = 'failed'),
+        COUNT(*) FILTER (WHERE execution_status = 'awaiting_approval'),
+        COUNT(*) FILTER (WHERE requires_approval),
+        COUNT(execution_time_ms),
+        COALESCE(SUM(execution_time_ms::NUMERIC), 0),
+        COALESCE(SUM(execution_time_ms::NUMERIC ^ 2), 0),
+        MIN(execution_time_ms),
+        MAX(execution_time_ms),
+        csa.sum_histogram(csa.histogram_point(execution_time_ms, csa.rollup_time_bounds())),
+        COUNT(risk_score),
+        COALESCE(SUM(risk_score), 0),
+        COALESCE(SUM(risk_score ^ 2), 0),
+        MIN(risk_score),
+        MAX(risk_score),
+        csa.sum_histogram(csa.histogram_point(risk_score, csa.rollup_risk_bounds()))
+    FROM csa.workflow_executions
+    WHERE schema_id IS NOT NULL
+      AND (p_schema_id IS NULL OR schema_id = p_schema_id)
+      AND (v_start IS NULL OR created_at >= v_start)
+      AND (v_end IS NULL OR created_at < v_end)
+    GROUP BY schema_id, schema_version, variant_id, date_trunc('hour', created_at);
+
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    RETURN v_rows;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- VERSION / VARIANT METRICS FROM ROLLUPS
+-- Replace the full-scan versions from init_phase3_sprint4.sql
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION csa.aggregate_version_metrics(
+    p_schema_id UUID,
+    p_version INTEGER,
+    p_variant_id UUID,
+    p_period_start TIMESTAMP WITH TIME ZONE,
+    p_period_end TIMESTAMP WITH TIME ZONE
+) RETURNS UUID AS $$
+DECLARE
+    v_metrics_id UUID;
+    v_metrics RECORD;
+BEGIN
+    SELECT
+        SUM(total_executions) AS total,
+        SUM(successful_executions) AS successful,
+        SUM(failed_executions) AS failed,
+        SUM(pending_approval) AS pending,
+        SUM(time_sum) / NULLIF(SUM(time_count), 0) AS avg_time,
+        MIN(time_min) AS min_time,
+        MAX(time_max) AS max_time,
+        csa.sum_histogram(time_histogram) AS time_histogram,
+        SUM(risk_sum) / NULLIF(SUM(risk_count), 0) AS avg_risk,
+        MIN(risk_min) AS min_risk,
+        MAX(risk_max) AS max_risk,
+        SUM(hitl_required_count) AS hitl_count
+    INTO v_metrics
+    FROM csa.execution_rollups
+    WHERE schema_id = p_schema_id
+      AND (schema_version = p_version OR schema_version IS NULL)
+      AND (variant_id = p_variant_id OR (p_variant_id IS NULL AND variant_id IS NULL))
+      AND bucket_start >= date_trunc('hour', p_period_start::TIMESTAMP)
+      AND bucket_start < p_period_end::TIMESTAMP;
+
+    INSERT INTO csa.version_performance_metrics (
+        schema_id, version, variant_id,
+        period_type, period_start, period_end,
+        total_executions, successful_executions, failed_executions,
+        pending_approval, avg_execution_time_ms, min_execution_time_ms, max_execution_time_ms,
+        p50_execution_time_ms, p95_execution_time_ms, p99_execution_time_ms,
+        avg_risk_score, min_risk_score, max_risk_score, hitl_required_count,
+        success_rate, failure_rate
+    ) VALUES (
+        p_schema_id, p_version, p_variant_id,
+        'daily', p_period_start, p_period_end,
+        COALESCE(v_metrics.total, 0),
+        COALESCE(v_metrics.successful, 0),
+        COALESCE(v_metrics.failed, 0),
+        COALESCE(v_metrics.pending, 0),
+        v_metrics.avg_time,
+        v_metrics.min_time,
+        v_metrics.max_time,
+        csa.histogram_quantile(v_metrics.time_histogram, csa.rollup_time_bounds(), v_metrics.min_time, v_metrics.max_time, 0.50),
+        csa.histogram_quantile(v_metrics.time_histogram, csa.rollup_time_bounds(), v_metrics.min_time, v_metrics.max_time, 0.95),
+        csa.histogram_quantile(v_metrics.time_histogram, csa.rollup_time_bounds(), v_metrics.min_time, v_metrics.max_time, 0.99),
+        v_metrics.avg_risk,
+        v_metrics.min_risk,
+        v_metrics.max_risk,
+        COALESCE(v_metrics.hitl_count, 0),
+        CASE WHEN v_metrics.total > 0 THEN v_metrics.successful::NUMERIC / v_metrics.total ELSE NULL END,
+        CASE WHEN v_metrics.total > 0 THEN v_metrics.failed::NUMERIC / v_metrics.total ELSE NULL END
+    )
+    ON CONFLICT (schema_id, version, variant_id, period_type, period_start)
+    DO UPDATE SET
+        total_executions = EXCLUDED.total_executions,
+        successful_executions = EXCLUDED.successful_executions,
+        failed_executions = EXCLUDED.failed_executions,
+        pending_approval = EXCLUDED.pending_approval,
+        avg_execution_time_ms = EXCLUDED.avg_execution_time_ms,
+        min_execution_time_ms = EXCLUDED.min_execution_time_ms,
+        max_execution_time_ms = EXCLUDED.max_execution_time_ms,
+        p50_execution_time_ms = EXCLUDED.p50_execution_time_ms,
+        p95_execution_time_ms = EXCLUDED.p95_execution_time_ms,
+        p99_execution_time_ms = EXCLUDED.p99_execution_time_ms,
+        avg_risk_score = EXCLUDED.avg_risk_score,
+        min_risk_score = EXCLUDED.min_risk_score,
+        max_risk_score = EXCLUDED.max_risk_score,
+        hitl_required_count = EXCLUDED.hitl_required_count,
+        success_rate = EXCLUDED.success_rate,
+        failure_rate = EXCLUDED.failure_rate,
+        updated_at = NOW()
+    RETURNING id INTO v_metrics_id;
+
+    RETURN v_metrics_id;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Variant cached metrics (trg_update_variant_metrics) from the variant's rollups
+CREATE OR REPLACE FUNCTION csa.update_variant_metrics(p_variant_id UUID) RETURNS VOID AS $$
+BEGIN
+    UPDATE csa.schema_variants sv
+    SET
+        total_executions = m.total,
+        successful_executions = m.successful,
+        failed_executions = m.failed,
+        avg_execution_time_ms = m.avg_time,
+        avg_risk_score = m.avg_risk,
+        conversion_rate = CASE WHEN m.total > 0 THEN m.successful::NUMERIC / m.total ELSE NULL END,
+        updated_at = NOW()
+    FROM (
+        SELECT
+            COALESCE(SUM(total_executions), 0) AS total,
+            COALESCE(SUM(successful_executions), 0) AS successful,
+            COALESCE(SUM(failed_executions), 0) AS failed,
+            SUM(time_sum) / NULLIF(SUM(time_count), 0) AS avg_time,
+            SUM(risk_sum) / NULLIF(SUM(risk_count), 0) AS avg_risk
+        FROM csa.execution_rollups
+        WHERE variant_id = p_variant_id
+    ) m
+    WHERE sv.id = p_variant_id;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- INITIAL BACKFILL
+-- ============================================================================
+
+SELECT csa.backfill_execution_rollups();
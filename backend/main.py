@@ -11,16 +11,34 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from pydantic import BaseModel, Field
 from typing import Dict, Any, Optional
+import asyncio
 import uvicorn
 from pathlib import Path
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
 from app.graph.main_graph import run_workflow
-from app.core.database import log_audit_entry
+from app.core.database import log_audit_entry, close_connection_pools, get_pool_metrics
+from app.core.audit_writer import get_audit_writer, shutdown_audit_writer
+from app.core.async_database import get_async_db
 from app.api.chat_routes import router as chat_router
 from app.api.enhanced_chat_routes import router as enhanced_chat_router
 from app.api.workflow_routes import router as workflow_router
+from app.chat.enhanced_agent import get_enhanced_agent
+from app.chat.rag_agent import get_rag_agent
+from app.services.workflow_runner import shutdown_workflow_runner
+from app.execution.streaming_manager import get_streaming_manager, shutdown_streaming_manager
+from app.execution.step_threads import get_step_thread_pool
+from app.services.embedding_cache import get_embedding_cache
+from app.engines.result_cache import get_engine_result_cache
+from app.engines.process_pool import get_engine_process_pool, shutdown_engine_process_pool
+from app.engines.sandbox import get_engine_sandbox, shutdown_engine_sandbox
+from app.risk.historical_stats import get_historical_stats_store
+from app.services.schema_cache import (
+    get_schema_cache,
+    start_schema_cache_listener,
+    stop_schema_cache_listener
+)
 from app.api.approval_routes import approval_router
 from app.api.learning_routes import learning_router
 from app.api.risk_rules_routes import risk_rules_router  # Phase 3 Sprint 2: Dynamic Risk Rules
@@ -64,10 +82,55 @@ async def lifespan(app: FastAPI):
         print(f"✗ Configuration validation failed: {e}")
         print("  Please check your .env file")
 
+    if start_schema_cache_listener():
+        print("✓ Schema cache invalidation listener started")
+
+    # Start the execution event broker before any stream is opened
+    streaming_manager = get_streaming_manager()
+    print(f"✓ Execution event streaming started ({streaming_manager.broker.name} broker)")
+    # Drop the history of ended executions (every worker keeps remote ones too)
+    stream_cleanup = asyncio.create_task(
+        streaming_manager.run_cleanup(settings.STREAM_CLEANUP_INTERVAL_SECONDS)
+    )
+
+    # Start the engine worker processes so the first CPU-bound request doesn't pay for it
+    engine_pool = get_engine_process_pool()
+    if engine_pool is not None:
+        workers = await asyncio.to_thread(engine_pool.warm_up)
+        if workers:
+            print(f"✓ Engine process pool started ({workers} workers)")
+        else:
+            print("✗ Engine process pool unavailable, CPU-bound engines run inline")
+
+    engine_sandbox = get_engine_sandbox()
+    if engine_sandbox is not None:
+        workers = await asyncio.to_thread(engine_sandbox.warm_up)
+        if workers:
+            print(f"✓ Engine sandbox started ({workers} workers, {engine_sandbox.timeout_seconds:g}s limit)")
+        else:
+            print("✗ Engine sandbox unavailable, sandboxed engines run inline")
+
+    # Build the shared chat agents now so the first message doesn't pay for it
+    try:
+        get_enhanced_agent()
+        get_rag_agent()
+        print("✓ Chat agents initialized (graph compiled)")
+    except Exception as e:
+        print(f"✗ Chat agent warm-up skipped: {e}")
+
     yield
 
     # Shutdown
     print(f"Shutting down {settings.APP_NAME}")
+    stream_cleanup.cancel()
+    shutdown_workflow_runner()
+    shutdown_engine_process_pool()
+    shutdown_engine_sandbox()
+    stop_schema_cache_listener()
+    shutdown_streaming_manager()
+    shutdown_audit_writer()  # flush buffered audit rows while the pool is still open
+    close_connection_pools()
+    await get_async_db().close()
 
 
 # Initialize FastAPI app
@@ -202,10 +265,27 @@ async def health_check():
         config_valid = False
         config_error = str(e)
 
+    embedding_cache = get_embedding_cache()
+    engine_result_cache = get_engine_result_cache()
+    engine_pool = get_engine_process_pool()
+    engine_sandbox = get_engine_sandbox()
+    historical_stats = get_historical_stats_store()
+    audit_writer = get_audit_writer()
+
     return {
         "status": "healthy" if config_valid else "unhealthy",
         "configuration": "valid" if config_valid else "invalid",
-        "error": None if config_valid else config_error
+        "error": None if config_valid else config_error,
+        "database_pool": get_pool_metrics(),
+        "schema_cache": get_schema_cache().get_stats(),
+        "embedding_cache": embedding_cache.get_stats() if embedding_cache else None,
+        "engine_result_cache": engine_result_cache.get_stats() if engine_result_cache else None,
+        "engine_process_pool": engine_pool.get_stats() if engine_pool else None,
+        "engine_sandbox": engine_sandbox.get_stats() if engine_sandbox else None,
+        "workflow_step_threads": get_step_thread_pool().get_stats(),
+        "historical_risk_stats": historical_stats.get_stats() if historical_stats else None,
+        "audit_writer": audit_writer.get_stats() if audit_writer else None,
+        "streaming": get_streaming_manager().get_stats()
     }
 
 
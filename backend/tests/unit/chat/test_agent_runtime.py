@@ -0,0 +1,146 @@
+"""
+Unit Tests for the Long-Lived Chat Agent Runtime
+
+Tests cover:
+- Shared chat LLM clients per (model, temperature)
+- One EnhancedConversationalAgent / ConversationalRAGAgent per process
+- Concurrent sessions on one compiled graph keeping their state separate
+"""
+
+import json
+import threading
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.chat import enhanced_agent, rag_agent
+from app.chat.enhanced_agent import EnhancedConversationalAgent
+from app.core.config import settings
+from app.utils import llm_utils
+
+
+# ============================================================================
+# FAKES
+# ============================================================================
+
+class FakeLLM:
+    """Answers each agent prompt instantly, echoing the user's message."""
+
+    def invoke(self, messages):
+        prompt = messages[0].content
+        if "Classify the intent" in prompt:
+            content = {"intent": "chat", "task_type": None, "confidence": 0.9}
+        elif "Extract technical parameters" in prompt:
+            message = prompt.split('User message: "')[1].split('"')[0]
+            content = {"entities": {"last_message": message}}
+        elif "Decide if you should" in prompt:
+            content = {"action": "ask_parameters", "missing_parameters": []}
+        else:
+            return SimpleNamespace(content=f"reply to: {messages[-1].content}")
+        return SimpleNamespace(content=json.dumps(content))
+
+
+class FakeDB:
+    def __init__(self):
+        self.saved = []
+        self._lock = threading.Lock()
+
+    def execute_query(self, query, params=None):
+        with self._lock:
+            if "INSERT INTO csa.chat_messages" in query:
+                self.saved.append((params[0], params[1], params[2]))
+            return [(0,)]
+
+    def execute_query_dict(self, query, params=None):
+        return []
+
+
+def make_agent():
+    agent = EnhancedConversationalAgent.__new__(EnhancedConversationalAgent)
+    agent.llm = FakeLLM()
+    agent.db = FakeDB()
+    agent.workflow_orchestrator = None
+    agent.enable_cll = False
+    agent.cll = None
+    agent.graph = agent._build_graph()
+    return agent
+
+
+@pytest.fixture(autouse=True)
+def fresh_runtime(monkeypatch):
+    monkeypatch.setattr(settings, "OPENROUTER_API_KEY", "test-key")
+    monkeypatch.setattr(enhanced_agent, "_global_agents", {})
+    monkeypatch.setattr(rag_agent, "_global_rag_agents", {})
+    llm_utils.clear_llm_clients()
+    yield
+    llm_utils.clear_llm_clients()
+
+
+# ============================================================================
+# SHARED CLIENTS AND AGENTS
+# ============================================================================
+
+def test_chat_llm_clients_are_shared():
+    client = llm_utils.get_chat_llm()
+
+    assert llm_utils.get_chat_llm() is client
+    assert llm_utils.get_ambiguity_detection_llm() is not client
+    assert llm_utils.get_llm(max_tokens=64) is not client
+
+
+def test_convenience_chat_reuses_one_agent(monkeypatch):
+    built = []
+
+    class CountingAgent:
+        def __init__(self, enable_cll=True):
+            built.append(enable_cll)
+
+        def chat(self, message, session_id, user_id):
+            return f"echo {message}", {"session_id": "s-1"}
+
+    monkeypatch.setattr(enhanced_agent, "EnhancedConversationalAgent", CountingAgent)
+
+    for i in range(3):
+        result = enhanced_agent.chat(f"message {i}")
+
+    assert result["response"] == "echo message 2"
+    assert built == [True]
+    assert enhanced_agent.get_enhanced_agent() is enhanced_agent.get_enhanced_agent()
+
+
+def test_rag_agent_is_shared_per_model():
+    agent = rag_agent.get_rag_agent()
+
+    assert rag_agent.get_rag_agent() is agent
+    assert rag_agent.get_rag_agent(model="other/model") is not agent
+
+
+# ============================================================================
+# PER-REQUEST STATE
+# ============================================================================
+
+def test_concurrent_sessions_share_graph_without_sharing_state():
+    agent = make_agent()
+    graph = agent.graph
+    sessions = {f"user-{i}": uuid4() for i in range(8)}
+    results = {}
+
+    def run(user_id, session_id):
+        results[user_id] = agent.chat(f"hello from {user_id}", session_id, user_id)
+
+    threads = [threading.Thread(target=run, args=item) for item in sessions.items()]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert agent.graph is graph
+    for user_id, session_id in sessions.items():
+        response, metadata = results[user_id]
+        assert response == f"reply to: hello from {user_id}"
+        assert metadata["session_id"] == str(session_id)
+
+    saved = {(session_id, role): content for session_id, role, content in agent.db.saved}
+    for user_id, session_id in sessions.items():
+        assert saved[(session_id, "user")] == f"hello from {user_id}"
@@ -0,0 +1,116 @@
+"""
+Shared fixtures for unit tests
+
+Provides fake_db: an in-memory stand-in for DatabaseConfig, so services are
+constructed normally (SchemaService(), CostDatabaseService(), ...) while
+their queries are answered by canned rows and recorded for assertions.
+"""
+
+import sys
+from contextlib import contextmanager
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+import pytest
+
+from app.core.database import DatabaseConfig
+
+
+class FakeCursor:
+    """Cursor recording executed SQL on its connection."""
+
+    def __init__(self, conn: "FakeConnection"):
+        self.conn = conn
+        self.connection = conn  # execute_values reads connection.encoding
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        if isinstance(sql, bytes):
+            sql = sql.decode()
+        self.conn.statements.append(sql)
+
+    def mogrify(self, template, args):
+        return ("(" + ",".join(repr(arg) for arg in args) + ")").encode()
+
+
+class FakeConnection:
+    """Connection yielded by FakeDB.connection(); records statements and commits."""
+
+    encoding = "UTF8"
+
+    def __init__(self):
+        self.statements: List[str] = []
+        self.commits = 0
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+class FakeDB:
+    """
+    In-memory DatabaseConfig
+
+    Queries are answered by the first route whose fragments all occur in the
+    SQL (see on()); unmatched queries return no rows.
+    """
+
+    def __init__(self):
+        self.routes: List[Tuple[Tuple[str, ...], Any]] = []
+        self.queries: List[str] = []
+        self.writes: List[str] = []
+        self.audits: List[dict] = []
+        self.conn = FakeConnection()
+
+    def on(self, fragments: Union[str, Tuple[str, ...]], result: Union[list, Callable[..., list]]) -> None:
+        """
+        Answer queries containing fragments
+
+        Args:
+            fragments: SQL fragment, or tuple of fragments that must all occur
+            result: Rows to return, or callable(params) returning them
+        """
+        if isinstance(fragments, str):
+            fragments = (fragments,)
+        self.routes.append((fragments, result))
+
+    def count(self, fragment: str) -> int:
+        """Number of dict queries containing fragment"""
+        return sum(fragment in query for query in self.queries)
+
+    def execute_query_dict(self, query: str, params: Optional[tuple] = None) -> list:
+        self.queries.append(query)
+        for fragments, result in self.routes:
+            if all(fragment in query for fragment in fragments):
+                return result(params) if callable(result) else list(result)
+        return []
+
+    def execute_query(self, query: str, params: Optional[tuple] = None, fetch: bool = True) -> list:
+        self.writes.append(query)
+        return []
+
+    @contextmanager
+    def connection(self):
+        yield self.conn
+
+    def log_audit(self, **kwargs):
+        self.audits.append(kwargs)
+
+
+@pytest.fixture
+def fake_db(monkeypatch) -> FakeDB:
+    """Replace DatabaseConfig in every loaded app module with one shared FakeDB."""
+    db = FakeDB()
+    for name, module in list(sys.modules.items()):
+        if name.startswith("app.") and getattr(module, "DatabaseConfig", None) is DatabaseConfig:
+            monkeypatch.setattr(module, "DatabaseConfig", lambda *args, **kwargs: db)
+    return db
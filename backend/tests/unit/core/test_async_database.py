@@ -0,0 +1,240 @@
+"""
+Unit Tests for the Async Database Layer
+
+Tests cover:
+- fetch_all / fetch_one / fetch_val rows as dicts and typed models
+- Transactions committing together or rolling back together
+- One pool per event loop, opened once for concurrent first callers
+- Failed pool opens retried on the next call
+- Learning services reading through the async API
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime
+
+import pytest
+
+from app.core.async_database import AsyncDatabase
+from app.core.config import settings
+from app.services.learning.correction_learner import CorrectionLearner
+
+
+# ============================================================================
+# FAKES
+# ============================================================================
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.description = None
+        self.rowcount = -1
+        self._rows = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, query, params=None):
+        await asyncio.sleep(0)  # yield like a real network round trip
+        self.conn.statements.append((query, params))
+        if "fail" in query:
+            raise RuntimeError("statement failed")
+        if query.lstrip().startswith("SELECT"):
+            columns, self._rows = self.conn.results.get(query, (["?column?"], []))
+            self.description = [(name,) for name in columns]
+        self.rowcount = len(self._rows) if self.description else 1
+
+    async def executemany(self, query, params_seq):
+        for params in params_seq:
+            await self.execute(query, params)
+        self.rowcount = len(params_seq)
+
+    async def fetchall(self):
+        return list(self._rows)
+
+    async def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+
+class FakeConnection:
+    def __init__(self, results=None):
+        self.results = results if results is not None else {}
+        self.statements = []
+        self.transactions = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    @asynccontextmanager
+    async def transaction(self):
+        try:
+            yield
+        except Exception:
+            self.transactions.append("rollback")
+            raise
+        self.transactions.append("commit")
+
+
+class FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+        self.closed = False
+
+    @asynccontextmanager
+    async def connection(self):
+        yield self.conn
+
+
+class PoolOpener:
+    """Counts pool opens; the first ``failures`` opens raise."""
+
+    def __init__(self, conn, failures=0):
+        self.conn = conn
+        self.failures = failures
+        self.opened = []
+
+    async def __call__(self, connection_string):
+        await asyncio.sleep(0)
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("could not connect to server")
+        pool = FakePool(self.conn)
+        self.opened.append(pool)
+        return pool
+
+
+def make_db(results=None, failures=0):
+    conn = FakeConnection(results)
+    opener = PoolOpener(conn, failures)
+    return AsyncDatabase("postgresql://test@localhost/test", pool_opener=opener), conn, opener
+
+
+PREFS_SQL = "SELECT preference_key, preference_value FROM csa.user_preferences WHERE user_id = %s"
+PREFS = (["preference_key", "preference_value"], [("units", "SI"), ("length", "brief")])
+
+
+@dataclass
+class Preference:
+    preference_key: str
+    preference_value: str
+
+
+# ============================================================================
+# QUERIES
+# ============================================================================
+
+def test_fetch_methods_return_dict_rows_and_models():
+    db, conn, _ = make_db({PREFS_SQL: PREFS})
+
+    async def run():
+        return (
+            await db.fetch_all(PREFS_SQL, ("u-1",)),
+            await db.fetch_all(PREFS_SQL, ("u-1",), model=Preference),
+            await db.fetch_one(PREFS_SQL, ("u-1",), model=Preference),
+            await db.fetch_val(PREFS_SQL, ("u-1",)),
+            await db.fetch_one("SELECT * FROM csa.user_preferences WHERE false"),
+        )
+
+    rows, models, first, value, missing = asyncio.run(run())
+
+    assert rows == [
+        {"preference_key": "units", "preference_value": "SI"},
+        {"preference_key": "length", "preference_value": "brief"},
+    ]
+    assert models[1] == Preference("length", "brief")
+    assert first == Preference("units", "SI")
+    assert value == "units"
+    assert missing is None
+    assert conn.statements[0] == (PREFS_SQL, ("u-1",))
+
+
+def test_transaction_commits_or_rolls_back_together():
+    db, conn, _ = make_db()
+
+    async def run():
+        async with db.transaction() as tx:
+            await tx.execute("UPDATE csa.user_preferences SET is_active = FALSE WHERE user_id = %s", ("u-1",))
+            await tx.executemany("INSERT INTO csa.preference_applications VALUES (%s)", [(1,), (2,)])
+
+        with pytest.raises(RuntimeError):
+            async with db.transaction() as tx:
+                await tx.execute("UPDATE csa.user_preferences SET priority = 1")
+                await tx.execute("fail")
+
+    asyncio.run(run())
+
+    assert conn.transactions == ["commit", "rollback"]
+    assert len(conn.statements) == 5
+
+
+# ============================================================================
+# POOL LIFECYCLE
+# ============================================================================
+
+def test_pool_opened_once_per_event_loop():
+    db, _, opener = make_db({PREFS_SQL: PREFS})
+
+    async def burst():
+        await asyncio.gather(*(db.fetch_all(PREFS_SQL, ("u-1",)) for _ in range(20)))
+        await db.execute("UPDATE csa.user_preferences SET priority = 1")
+
+    asyncio.run(burst())
+    assert len(opener.opened) == 1
+
+    # A different loop (e.g. the CLL chat loop) gets a pool of its own
+    asyncio.run(burst())
+    assert len(opener.opened) == 2
+
+
+def test_failed_pool_open_is_retried():
+    db, _, opener = make_db(failures=1)
+
+    async def run():
+        with pytest.raises(ConnectionError):
+            await db.fetch_val("SELECT 1")
+        await db.fetch_val("SELECT 1")
+
+    asyncio.run(run())
+    assert len(opener.opened) == 1
+
+
+def test_missing_database_url_raises(monkeypatch):
+    monkeypatch.setattr(settings, "DATABASE_URL", None)
+    db = AsyncDatabase(pool_opener=PoolOpener(FakeConnection()))
+
+    with pytest.raises(ValueError, match="DATABASE_URL"):
+        asyncio.run(db.fetch_all("SELECT 1"))
+
+
+# ============================================================================
+# SERVICES
+# ============================================================================
+
+def test_correction_learner_reads_through_async_api():
+    patterns_sql_rows = (
+        ["correction_type", "occurrence_count", "latest_correction", "preference_created", "correction_ids"],
+        [("units", 3, datetime(2026, 3, 1, 12, 0), False, ["c-3", "c-2", "c-1"])],
+    )
+
+    class PatternResults(dict):
+        def get(self, query, default=None):
+            return patterns_sql_rows if "FROM csa.correction_memory" in query else default
+
+    db, conn, _ = make_db(PatternResults())
+    learner = CorrectionLearner.__new__(CorrectionLearner)
+    learner.db_config = db
+
+    patterns = asyncio.run(learner.get_correction_patterns("u-1", days=14))
+
+    assert patterns == [{
+        "correction_type": "units",
+        "occurrence_count": 3,
+        "latest_correction": "2026-03-01T12:00:00",
+        "preference_created": False,
+        "correction_ids": ["c-3", "c-2", "c-1"],
+    }]
+    assert conn.statements[0][1] == ("u-1", 14, 2)
@@ -0,0 +1,238 @@
+"""
+Unit Tests for the Buffered Audit Writer
+
+Tests cover:
+- Rows batched into one multi-row write per table
+- Size-triggered flushing by the background flusher
+- Database outage: rows retried, queue overflow replayed from the WAL
+- WAL segments deleted once written; crashed-process segments replayed
+- Rejected rows isolated into the dead-letter file
+- SafetyAuditLogger serializing one context snapshot per workflow evaluation
+- DatabaseConfig.log_audit falling back to a direct insert when the writer fails
+"""
+
+import json
+import time
+from uuid import uuid4
+
+import pytest
+
+from app.core import database as database_module
+from app.core.audit_writer import (
+    DEAD_LETTER_FILE,
+    AuditSinkUnavailable,
+    AuditTable,
+    AuditWriter,
+    PostgresAuditSink,
+    register_audit_table,
+)
+from app.risk.safety_audit import SafetyAuditLogger
+from app.schemas.risk.models import (
+    RiskRuleType,
+    RuleEvaluationResult,
+    StepEvaluationResult,
+    WorkflowEvaluationResult,
+)
+
+TABLE = register_audit_table(AuditTable(
+    name="test_audit",
+    sql="INSERT INTO test_audit (id, action) VALUES %s ON CONFLICT (id) DO NOTHING",
+    template="(%s, %s)",
+))
+
+
+class FakeSink:
+    """Records written batches; can simulate an outage or reject rows."""
+
+    def __init__(self):
+        self.batches = []
+        self.available = True
+        self.reject = set()
+
+    def write(self, table, rows):
+        if not self.available:
+            raise AuditSinkUnavailable("could not connect to server")
+        if any(row[1] in self.reject for row in rows):
+            raise ValueError("violates check constraint")
+        self.batches.append((table.name, list(rows)))
+
+    def rows(self):
+        return [row for _, rows in self.batches for row in rows]
+
+
+def make_writer(tmp_path, sink=None, **kwargs):
+    kwargs.setdefault("flush_interval", 60)
+    return AuditWriter(sink or FakeSink(), wal_dir=str(tmp_path), **kwargs)
+
+
+def wal_files(tmp_path):
+    return sorted(tmp_path.glob("*.wal"))
+
+
+# ============================================================================
+# BATCHING
+# ============================================================================
+
+def test_rows_written_in_one_batch_and_wal_removed(tmp_path):
+    writer = make_writer(tmp_path)
+    for i in range(5):
+        writer.submit("test_audit", (i, f"action-{i}"))
+    writer.submit("audit_log", (str(uuid4()), "u-1", "login", None, None, "{}", "2026-01-01T00:00:00+00:00"))
+
+    assert len(wal_files(tmp_path)) == 1
+    assert writer.pending() == 6
+
+    assert writer.flush()
+    assert [(name, len(rows)) for name, rows in writer.sink.batches] == [("test_audit", 5), ("audit_log", 1)]
+    assert writer.pending() == 0
+    assert wal_files(tmp_path) == []
+
+
+def test_unknown_table_rejected_at_submit(tmp_path):
+    writer = make_writer(tmp_path)
+    with pytest.raises(ValueError, match="Unknown audit table"):
+        writer.submit("no_such_table", (1,))
+
+
+def test_background_flusher_triggered_by_batch_size(tmp_path):
+    writer = make_writer(tmp_path, batch_size=3)
+    writer.start()
+    try:
+        for i in range(3):
+            writer.submit("test_audit", (i, "evaluate"))
+        deadline = time.time() + 5
+        while writer.pending() and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        writer.close()
+
+    assert len(writer.sink.batches) == 1
+    assert writer.pending() == 0
+
+
+# ============================================================================
+# OUTAGES AND RECOVERY
+# ============================================================================
+
+def test_outage_keeps_rows_and_replays_queue_overflow(tmp_path):
+    sink = FakeSink()
+    sink.available = False
+    writer = make_writer(tmp_path, sink=sink, queue_size=2, batch_size=10)
+
+    for i in range(5):
+        writer.submit("test_audit", (i, "evaluate"))
+    assert writer.get_stats()["spilled"] == 3
+
+    assert not writer.flush()
+    assert writer.pending() == 5
+    assert len(wal_files(tmp_path)) == 1
+
+    sink.available = True
+    assert writer.flush()
+    assert sorted(row[0] for row in sink.rows()) == [0, 1, 2, 3, 4]
+    assert wal_files(tmp_path) == []
+
+
+def test_segments_of_crashed_process_replayed(tmp_path):
+    sink = FakeSink()
+    sink.available = False
+    crashed = make_writer(tmp_path, sink=sink)
+    for i in range(3):
+        crashed.submit("test_audit", (i, "evaluate"))
+    crashed._file.close()  # process dies without close()
+
+    # Pretend the segment was written by a process that no longer exists
+    segment = wal_files(tmp_path)[0]
+    segment.rename(tmp_path / segment.name.replace(f"audit-{segment.name.split('-')[1]}-", "audit-999999999-"))
+    with open(wal_files(tmp_path)[0], "a", encoding="utf-8") as f:
+        f.write('{"table": "test_audit", "ro')  # torn final line
+
+    restarted = make_writer(tmp_path)
+    assert restarted.pending() == 4
+    assert restarted.flush()
+
+    assert sorted(row[0] for row in restarted.sink.rows()) == [0, 1, 2]
+    assert wal_files(tmp_path) == []
+
+
+def test_rejected_row_dead_lettered_rest_written(tmp_path):
+    sink = FakeSink()
+    sink.reject = {"bad"}
+    writer = make_writer(tmp_path, sink=sink)
+
+    writer.submit("test_audit", (1, "ok"))
+    writer.submit("test_audit", (2, "bad"))
+    writer.submit("test_audit", (3, "ok"))
+
+    assert writer.flush()
+    assert [row[0] for row in sink.rows()] == [1, 3]
+    dead = [json.loads(line) for line in (tmp_path / DEAD_LETTER_FILE).read_text().splitlines()]
+    assert [record["row"] for record in dead] == [[2, "bad"]]
+    assert writer.pending() == 0
+
+
+# ============================================================================
+# SAFETY AUDIT LOGGER
+# ============================================================================
+
+def test_safety_audit_logger_buffers_rule_evaluations(tmp_path, monkeypatch):
+    writer = make_writer(tmp_path)
+    audit_logger = SafetyAuditLogger(db=object(), audit_writer=writer)
+
+    serialized = []
+    original = audit_logger._serialize_context
+    monkeypatch.setattr(audit_logger, "_serialize_context", lambda ctx: serialized.append(1) or original(ctx))
+
+    rules = [
+        RuleEvaluationResult(rule_id=f"R{i}", rule_type=RiskRuleType.STEP, step_name="design",
+                             condition="$input.span > 10", condition_result=True)
+        for i in range(4)
+    ]
+    result = WorkflowEvaluationResult(
+        execution_id=uuid4(),
+        deliverable_type="beam_design",
+        step_evaluations={"design": StepEvaluationResult(
+            step_number=2, step_name="design", rules_evaluated=4, rules_triggered=4,
+            aggregate_risk_factor=0.4, triggered_rules=rules
+        )},
+    )
+    context = {"input": {"span": 12, "drawing": b"\x00" * 64}}
+
+    audit_ids = audit_logger.log_workflow_evaluation(result, context, user_id="u-1")
+
+    assert len(audit_ids) == 4
+    assert len(serialized) == 1
+    assert context["input"]["drawing"] == b"\x00" * 64  # caller's context untouched
+    assert writer.flush()
+    (table, rows), = writer.sink.batches
+    assert table == "risk_rules_audit"
+    assert [row[0] for row in rows] == [str(audit_id) for audit_id in audit_ids]
+    assert rows[0][3:5] == (2, "design")
+    assert json.loads(rows[0][8]) == {"input": {"span": 12, "drawing": "<bytes:64>"}}
+
+
+# ============================================================================
+# DATABASECONFIG
+# ============================================================================
+
+def disk_full(*args):
+    raise OSError(28, "No space left on device")
+
+
+def test_log_audit_falls_back_when_writer_fails(tmp_path, monkeypatch):
+    writer = make_writer(tmp_path)
+    monkeypatch.setattr(writer, "_append_wal", disk_full)
+    monkeypatch.setattr(database_module, "get_audit_writer", lambda: writer)
+    written = []
+    monkeypatch.setattr(PostgresAuditSink, "write", lambda sink, table, rows: written.append((table.name, rows)))
+    db = database_module.DatabaseConfig()
+
+    db.log_audit("u-1", "create_relationship", "relationship", str(uuid4()), {"strength": 0.7})
+
+    (table, (row,)), = written
+    assert table == "audit_log"
+    assert row[1:4] == ("u-1", "create_relationship", "relationship")
+
+    # Neither the writer nor the direct insert failing reaches the caller
+    monkeypatch.setattr(PostgresAuditSink, "write", disk_full)
+    db.log_audit("u-1", "create_relationship", "relationship", None, {})
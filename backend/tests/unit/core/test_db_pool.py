@@ -0,0 +1,240 @@
+"""
+Unit Tests for the PostgreSQL Connection Pool
+
+Tests cover:
+- Connection reuse and lazy creation
+- Max size enforcement and checkout timeout
+- Health checks on checkout (a connection being checked counts as checked out)
+- Discarding broken connections; keeping connections whose statement timed out
+- Metrics
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import psycopg2
+import pytest
+
+from app.core.database import DatabaseConfig
+from app.core.db_pool import ConnectionPool, PoolTimeoutError
+
+
+# ============================================================================
+# FAKES
+# ============================================================================
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, query, params=None):
+        if self.conn.broken:
+            raise psycopg2.OperationalError("server closed the connection")
+        self.conn.queries.append(query)
+
+    def fetchone(self):
+        return (1,)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.broken = False
+        self.queries = []
+        self.rollbacks = 0
+
+    def cursor(self, *args, **kwargs):
+        return FakeCursor(self)
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def created():
+    return []
+
+
+@pytest.fixture
+def pool(created):
+    def connect():
+        conn = FakeConnection()
+        created.append(conn)
+        return conn
+
+    return ConnectionPool(connect=connect, min_size=1, max_size=2, checkout_timeout=0.2)
+
+
+# ============================================================================
+# TESTS
+# ============================================================================
+
+def test_connection_is_reused(pool, created):
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+
+    assert first is second
+    assert len(created) == 1
+
+
+def test_concurrent_checkouts_get_distinct_connections(pool, created):
+    with pool.connection() as a:
+        with pool.connection() as b:
+            assert a is not b
+    assert len(created) == 2
+
+
+def test_checkout_times_out_when_exhausted(pool):
+    a = pool.getconn()
+    b = pool.getconn()
+
+    with pytest.raises(PoolTimeoutError):
+        pool.getconn()
+
+    pool.putconn(a)
+    pool.putconn(b)
+    assert pool.get_metrics()["timeouts"] == 1
+
+
+def test_waiter_receives_returned_connection(pool):
+    a = pool.getconn()
+    b = pool.getconn()
+    pool.checkout_timeout = 2.0
+    received = []
+
+    def waiter():
+        received.append(pool.getconn())
+
+    thread = threading.Thread(target=waiter)
+    thread.start()
+    time.sleep(0.05)
+    pool.putconn(a)
+    thread.join(timeout=2)
+
+    assert received == [a]
+    pool.putconn(b)
+    pool.putconn(a)
+
+
+def test_operational_error_discards_connection(pool, created):
+    with pytest.raises(psycopg2.OperationalError):
+        with pool.connection() as conn:
+            raise psycopg2.OperationalError("connection lost")
+
+    assert conn.closed
+    with pool.connection() as fresh:
+        assert fresh is not conn
+    assert len(created) == 2
+
+
+def test_statement_timeout_keeps_connection(pool, created):
+    with pytest.raises(psycopg2.errors.QueryCanceled):
+        with pool.connection() as conn:
+            raise psycopg2.errors.QueryCanceled("canceling statement due to statement timeout")
+
+    assert not conn.closed
+    assert conn.rollbacks >= 1
+    with pool.connection() as reused:
+        assert reused is conn
+    assert len(created) == 1
+
+
+def test_statement_timeout_is_not_retried(pool, created):
+    calls = []
+
+    def slow_query(conn):
+        calls.append(conn)
+        raise psycopg2.errors.QueryCanceled("canceling statement due to statement timeout")
+
+    db = SimpleNamespace(connection=pool.connection)
+    with pytest.raises(psycopg2.errors.QueryCanceled):
+        DatabaseConfig._run_with_retry(db, slow_query)
+
+    assert len(calls) == 1
+    assert pool.get_metrics()["connections_discarded"] == 0
+
+
+def test_unhealthy_idle_connection_is_replaced(pool, created):
+    pool.health_check_interval = 0
+    with pool.connection() as conn:
+        pass
+    conn.broken = True
+
+    with pool.connection() as fresh:
+        assert fresh is not conn
+
+    metrics = pool.get_metrics()
+    assert metrics["health_check_failures"] == 1
+    assert metrics["connections_created"] == 2
+
+
+def test_connection_under_health_check_counts_against_max_size(pool, created):
+    pool.health_check_interval = 0
+    held = pool.getconn()
+    with pool.connection():
+        pass  # second connection, now idle
+    checking = threading.Event()
+    release = threading.Event()
+    original = pool._is_healthy
+
+    def slow_health_check(conn, last_used):
+        checking.set()
+        release.wait(1)
+        return original(conn, last_used)
+
+    pool._is_healthy = slow_health_check
+    checker = threading.Thread(target=pool.getconn)
+    checker.start()
+    checking.wait(1)
+
+    # One connection held, one being health-checked: the pool is full
+    with pytest.raises(PoolTimeoutError):
+        pool.getconn()
+    assert len(created) == 2
+
+    release.set()
+    checker.join()
+    pool.putconn(held)
+
+
+def test_returned_connection_is_rolled_back(pool):
+    with pool.connection() as conn:
+        pass
+    assert conn.rollbacks >= 1
+
+
+def test_metrics(pool):
+    with pool.connection():
+        metrics = pool.get_metrics()
+        assert metrics["in_use"] == 1
+        assert metrics["idle"] == 0
+
+    metrics = pool.get_metrics()
+    assert metrics["in_use"] == 0
+    assert metrics["idle"] == 1
+    assert metrics["total_checkouts"] == 1
+    assert metrics["checkouts_per_sec"] > 0
+
+
+def test_close_refuses_checkouts(pool):
+    with pool.connection() as conn:
+        pass
+    pool.close()
+
+    assert conn.closed
+    with pytest.raises(ConnectionError):
+        pool.getconn()
+
+
+def test_invalid_sizes_rejected():
+    with pytest.raises(ValueError):
+        ConnectionPool(connect=FakeConnection, min_size=5, max_size=2)
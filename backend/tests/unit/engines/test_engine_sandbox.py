@@ -0,0 +1,199 @@
+"""
+Unit Tests for Sandboxed Engine Workers
+
+Tests cover:
+- Runaway engines killed at the wall-clock limit, worker replaced and reusable
+- Waiting for a busy worker bounded by the call's limit and the step deadline
+- Memory limit breaches raising EngineMemoryLimitError; engine errors propagated
+- invoke_engine(..., sandbox=True) and execution="sandbox" registration
+- Orchestrator returning a failed StepResult with error_type "timeout", without retry
+  and without counting against the engine's circuit breaker
+- Steps with error_handling.sandbox killed at the step timeout; their timeouts retryable
+"""
+
+import os
+import threading
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.engines import registry as registry_module
+from app.engines.registry import EngineRegistry, engine_registry, invoke_engine
+from app.engines.sandbox import (
+    EngineMemoryLimitError,
+    EngineSandbox,
+    EngineTimeoutError,
+)
+from app.execution.circuit_breaker import get_circuit_breaker, reset_circuit_breakers
+from app.execution.timeout_manager import Deadline, run_with_deadline
+from app.schemas.workflow.schema_models import ErrorHandling, WorkflowStep
+from app.services.workflow_orchestrator import WorkflowOrchestrator
+
+
+def size_plate(input_data):
+    """Module-level (picklable) engine; grows the plate until it bears the load."""
+    if input_data["load"] < 0:
+        raise ValueError("load must be positive")
+    side = 100
+    while side * side * 0.45 < input_data["load"]:
+        side += 10
+    return {"side": side, "pid": os.getpid()}
+
+
+def hog_memory(input_data):
+    return {"size": len(bytearray(input_data["gib"] * 1024 ** 3))}
+
+
+@pytest.fixture(scope="module")
+def sandbox():
+    sandbox = EngineSandbox(max_workers=1, timeout_seconds=10, memory_limit_mb=1024)
+    assert sandbox.warm_up() == 1
+    yield sandbox
+    sandbox.shutdown()
+
+
+@pytest.fixture
+def registry(sandbox):
+    registry = EngineRegistry(sandbox=sandbox)
+    registry.register_tool("plate", "size", size_plate, execution="sandbox")
+    registry.register_tool("plate", "hog", hog_memory, execution="sandbox")
+    return registry
+
+
+def wait_for_idle_worker(sandbox, timeout=30.0):
+    stop = time.monotonic() + timeout
+    while sandbox.get_stats()["idle_workers"] == 0 and time.monotonic() < stop:
+        time.sleep(0.05)
+
+
+def test_runaway_engine_killed_and_worker_replaced(registry, sandbox):
+    assert registry.invoke("plate", "size", {"load": 1000})["pid"] != os.getpid()
+    recycled = sandbox.get_stats()["workers_recycled"]
+
+    started = time.monotonic()
+    with pytest.raises(EngineTimeoutError, match="1s wall-clock limit; worker killed") as error:
+        # Load beyond any plate: the growth loop would run for hours
+        registry.invoke("plate", "size", {"load": 1e30}, timeout_seconds=1.0)
+    assert time.monotonic() - started < 5
+    assert error.value.error_type == "timeout"
+
+    stats = sandbox.get_stats()
+    assert stats["timeouts"] == 1
+    assert stats["workers_recycled"] == recycled + 1
+
+    wait_for_idle_worker(sandbox)
+    assert registry.invoke("plate", "size", {"load": 4500})["side"] == 100
+
+
+def test_wait_for_busy_worker_respects_deadline(registry, sandbox):
+    wait_for_idle_worker(sandbox)
+    busy = threading.Thread(
+        target=lambda: pytest.raises(
+            EngineTimeoutError, registry.invoke, "plate", "size", {"load": 1e30}, timeout_seconds=3.0
+        )
+    )
+    busy.start()
+    time.sleep(0.2)
+
+    started = time.monotonic()
+    with pytest.raises(EngineTimeoutError, match="waited 0.5s for a free sandbox worker"):
+        registry.invoke("plate", "size", {"load": 1000}, timeout_seconds=0.5)
+    with pytest.raises(EngineTimeoutError, match="for a free sandbox worker"):
+        # Default 10s limit, but the step deadline ends first
+        run_with_deadline(Deadline.after(0.5), registry.invoke, "plate", "size", {"load": 1000})
+    assert time.monotonic() - started < 2
+    assert sandbox.get_stats()["slot_timeouts"] == 2
+
+    busy.join()
+    wait_for_idle_worker(sandbox)
+
+
+def test_memory_limit_and_engine_errors(registry, sandbox):
+    with pytest.raises(EngineMemoryLimitError, match="1024 MB memory limit") as error:
+        registry.invoke("plate", "hog", {"gib": 4})
+    assert error.value.error_type == "memory_limit"
+    assert sandbox.get_stats()["memory_breaches"] == 1
+
+    wait_for_idle_worker(sandbox)
+    with pytest.raises(ValueError, match="load must be positive"):
+        registry.invoke("plate", "size", {"load": -1})
+    assert sandbox.get_stats()["engine_errors"] >= 1
+
+
+def test_invoke_engine_sandbox_option(sandbox, monkeypatch):
+    registry = EngineRegistry(sandbox=sandbox)
+    registry.register_tool("plate", "size", size_plate)
+    monkeypatch.setattr(registry_module, "engine_registry", registry)
+
+    assert invoke_engine("plate", "size", {"load": 1000})["pid"] == os.getpid()
+    assert invoke_engine("plate", "size", {"load": 1000}, sandbox=True)["pid"] != os.getpid()
+
+    with pytest.raises(ValueError, match="must be a module-level function"):
+        registry.register_tool("plate", "lambda", lambda data: data, execution="sandbox")
+
+
+def test_orchestrator_step_timeout_result(sandbox, monkeypatch):
+    wait_for_idle_worker(sandbox)
+    monkeypatch.setitem(engine_registry._registry, "tool", {})
+    monkeypatch.setattr(engine_registry, "_sandbox", sandbox)
+    monkeypatch.setattr(sandbox, "timeout_seconds", 1.0)
+    engine_registry.register_tool("tool", "size", size_plate, execution="sandbox")
+    reset_circuit_breakers()
+
+    step = WorkflowStep(
+        step_number=1,
+        step_name="size",
+        function_to_call="tool.size",
+        input_mapping={"load": "$input.load"},
+        output_variable="plate",
+        error_handling=ErrorHandling(retry_count=2),
+        timeout_seconds=30
+    )
+    schema = SimpleNamespace(id=uuid4(), version=1, deliverable_type="sandbox_test", workflow_steps=[step])
+    context = {"input": {"load": 1e30}, "steps": {}, "context": {"execution_id": "test"}}
+
+    result = WorkflowOrchestrator()._execute_step(step, context, schema)
+    breaker = get_circuit_breaker("engine:tool.size").get_stats()
+    reset_circuit_breakers()
+
+    assert result.status == "failed"
+    assert result.error_type == "timeout"
+    assert "wall-clock limit" in result.error_message
+    assert result.retry_count == 0
+    assert sandbox.get_stats()["timeouts"] >= 1
+    # A pathological input is not an unhealthy engine
+    assert breaker["failures"] == 0
+
+
+def test_sandboxed_step_timeout_is_retried(sandbox, monkeypatch):
+    wait_for_idle_worker(sandbox)
+    monkeypatch.setitem(engine_registry._registry, "tool", {})
+    monkeypatch.setattr(engine_registry, "_sandbox", sandbox)
+    engine_registry.register_tool("tool", "size", size_plate)  # inline tier
+    reset_circuit_breakers()
+
+    step = WorkflowStep(
+        step_number=1,
+        step_name="size",
+        function_to_call="tool.size",
+        input_mapping={"load": "$input.load"},
+        output_variable="plate",
+        error_handling=ErrorHandling(retry_count=1, retry_on_timeout=True, sandbox=True, base_delay_seconds=0.1),
+        timeout_seconds=1
+    )
+    schema = SimpleNamespace(id=uuid4(), version=1, deliverable_type="sandbox_test", workflow_steps=[step])
+    timeouts = sandbox.get_stats()["timeouts"]
+
+    result = WorkflowOrchestrator()._execute_step(
+        step, {"input": {"load": 1e30}, "steps": {}, "context": {"execution_id": "test"}}, schema
+    )
+    reset_circuit_breakers()
+
+    # The worker was killed each time, so the timeout could be retried
+    assert result.status == "failed"
+    assert result.error_type == "timeout"
+    assert result.retry_count == 1
+    wait_for_idle_worker(sandbox)
+    assert sandbox.get_stats()["timeouts"] + sandbox.get_stats()["slot_timeouts"] > timeouts
@@ -0,0 +1,152 @@
+"""
+Unit Tests for the Batched Isolated Footing Designer
+
+Tests cover:
+- Row-for-row parity with design_isolated_footing() across a varied schedule
+- Scalar broadcasting and defaults
+- Input validation mirroring FoundationInput
+- Registry integration
+"""
+
+import random
+
+import pytest
+
+from app.engines.foundation.design_isolated_footing import design_isolated_footing
+from app.engines.foundation.design_isolated_footing_batch import (
+    batch_result_to_records,
+    design_isolated_footings_batch
+)
+from app.engines.registry import engine_registry
+
+
+def build_schedule(count: int, seed: int = 7) -> list:
+    """Random column schedule covering every grade, footing type and branch."""
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(count):
+        row = {
+            "axial_load_dead": round(rng.uniform(50, 4000), 1),
+            "axial_load_live": round(rng.uniform(20, 2000), 1),
+            "column_width": rng.choice([0.23, 0.3, 0.4, 0.45, 0.6, 0.9]),
+            "column_depth": rng.choice([0.23, 0.3, 0.4, 0.5, 0.75]),
+            "safe_bearing_capacity": rng.choice([60.0, 100.0, 150.0, 200.0, 300.0, 450.0]),
+            "concrete_grade": rng.choice(["M20", "M25", "M30", "M35", "M40"]),
+            "steel_grade": rng.choice(["Fe415", "Fe500", "Fe550"]),
+            "footing_type": rng.choice(["square", "rectangular"]),
+        }
+        if row["footing_type"] == "rectangular":
+            row["aspect_ratio"] = rng.choice([1.2, 1.5, 2.0])
+        rows.append(row)
+    return rows
+
+
+def to_columns(rows: list) -> dict:
+    keys = [key for key in rows[0] if key != "aspect_ratio"]
+    columns = {key: [row[key] for row in rows] for key in keys}
+    columns["aspect_ratio"] = [row.get("aspect_ratio", 1.5) for row in rows]
+    return columns
+
+
+# ============================================================================
+# PARITY
+# ============================================================================
+
+def test_batch_matches_scalar_engine_exactly(capsys):
+    rows = build_schedule(300)
+    # Edge cases: tiny loads (minimum depth, no one-way shear) and SBC overflow
+    rows.append({"axial_load_dead": 1.0, "axial_load_live": 1.0, "column_width": 0.3,
+                 "column_depth": 0.3, "safe_bearing_capacity": 450.0})
+    rows.append({"axial_load_dead": 9000.0, "axial_load_live": 4000.0, "column_width": 1.2,
+                 "column_depth": 0.3, "safe_bearing_capacity": 40.0,
+                 "footing_type": "rectangular", "aspect_ratio": 2.5})
+    for row in rows:
+        row.setdefault("footing_type", "square")
+        row.setdefault("concrete_grade", "M25")
+        row.setdefault("steel_grade", "Fe415")
+
+    records = batch_result_to_records(design_isolated_footings_batch(to_columns(rows)))
+
+    assert len(records) == len(rows)
+    for row, record in zip(rows, records):
+        expected = design_isolated_footing(row)
+        for field, value in record.items():
+            if field == "calculation_timestamp":
+                continue
+            assert value == expected[field], (field, row)
+            assert type(value) is type(expected[field]), field
+    capsys.readouterr()  # scalar engine prints debug output
+
+
+def test_parity_schedule_exercises_every_branch():
+    result = design_isolated_footings_batch(to_columns(build_schedule(300)))
+    warnings = [w for row in result["warnings"] for w in row]
+
+    assert any(w.startswith("Footing size increased") for w in warnings)
+    assert any(w.startswith("Depth increased") for w in warnings)
+    assert any(w.startswith("Development length") for w in warnings)
+    assert len(set(result["bar_dia_x"] + result["bar_dia_y"])) > 2
+
+
+# ============================================================================
+# INPUT HANDLING
+# ============================================================================
+
+def test_scalars_are_broadcast_and_ids_echoed():
+    result = design_isolated_footings_batch({
+        "column_ids": ["C1", "C2", "C3"],
+        "axial_load_dead": [600.0, 900.0, 1200.0],
+        "axial_load_live": [400.0, 450.0, 500.0],
+        "column_width": 0.4,
+        "column_depth": 0.4,
+        "safe_bearing_capacity": 200.0,
+    })
+
+    assert result["count"] == 3
+    assert result["column_ids"] == ["C1", "C2", "C3"]
+    assert result["design_code_used"] == ["IS456:2000"] * 3
+    assert result["footing_length"] == result["footing_width"]
+    assert result["footing_length"][0] < result["footing_length"][2]
+
+
+@pytest.mark.parametrize("override,message", [
+    ({"axial_load_dead": [600.0, -1.0]}, "axial_load_dead"),
+    ({"concrete_grade": ["M25", "M60"]}, "concrete_grade"),
+    ({"aspect_ratio": [1.5, 1.0]}, "aspect_ratio"),
+    ({"axial_load_live": [400.0]}, "different lengths"),
+])
+def test_invalid_rows_are_rejected(override, message):
+    data = {
+        "axial_load_dead": [600.0, 700.0],
+        "axial_load_live": [400.0, 400.0],
+        "column_width": 0.4,
+        "column_depth": 0.4,
+        "safe_bearing_capacity": 200.0,
+    }
+    data.update(override)
+
+    with pytest.raises(ValueError, match=message):
+        design_isolated_footings_batch(data)
+
+
+def test_missing_required_column():
+    with pytest.raises(ValueError, match="safe_bearing_capacity"):
+        design_isolated_footings_batch({
+            "axial_load_dead": [600.0],
+            "axial_load_live": [400.0],
+            "column_width": 0.4,
+            "column_depth": 0.4,
+        })
+
+
+# ============================================================================
+# REGISTRY
+# ============================================================================
+
+def test_batch_engine_is_registered():
+    result = engine_registry.invoke(
+        "civil_foundation_designer_v1",
+        "design_isolated_footings_batch",
+        to_columns(build_schedule(5))
+    )
+    assert result["count"] == 5
@@ -0,0 +1,150 @@
+"""
+Unit Tests for the Engine Process Pool Execution Tier
+
+Tests cover:
+- Registration: execution tiers validated, process engines must be picklable
+- Process engines computed in worker processes, with memoization kept in the caller
+- Engine errors propagated from workers; per-function pool metrics
+- Inline fallbacks: unpicklable input, pool that cannot start
+- Calls that kill their worker: retried once on a rebuilt pool, never inline
+- Waits for a pool slot bounded by the slot timeout and the step deadline
+- invoke_async for thread and process tiers
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from app.engines import process_pool as pool_module
+from app.engines.process_pool import EngineProcessCrashedError, EngineProcessPool, EngineProcessPoolBusyError
+from app.engines.registry import EngineRegistry
+from app.engines.result_cache import EngineResultCache
+from app.execution.timeout_manager import Deadline, run_with_deadline
+
+
+def stability_check(input_data):
+    """Module-level (picklable) engine reporting the process it ran in."""
+    if input_data["width"] <= 0:
+        raise ValueError("width must be positive")
+    return {"fos_sliding": round(1.2 * input_data["width"], 3), "pid": os.getpid()}
+
+
+def kill_worker(input_data):
+    """Dies like a worker killed by the OS; would end the test run if run inline."""
+    os._exit(1)
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = EngineProcessPool(max_workers=1)
+    assert pool.warm_up() == 1
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def registry(pool):
+    registry = EngineRegistry(result_cache=EngineResultCache(max_entries=16), process_pool=pool)
+    registry.register_tool("wall", "stability", stability_check, pure=True, execution="process")
+    registry.register_tool("wall", "stability_thread", stability_check, execution="thread")
+    return registry
+
+
+def test_registration_validates_execution_tier():
+    registry = EngineRegistry()
+    with pytest.raises(ValueError, match="execution must be one of"):
+        registry.register_tool("wall", "stability", stability_check, execution="gpu")
+    with pytest.raises(ValueError, match="must be a module-level function"):
+        registry.register_tool("wall", "lambda", lambda data: data, execution="process")
+
+    registry.register_tool("wall", "stability", stability_check)
+    summary = registry.get_registry_summary()["tools"]["wall"]["functions"][0]
+    assert summary["execution"] == "inline"
+
+
+def test_process_engines_run_in_workers_and_stay_memoized(registry, pool):
+    submitted = pool.get_stats()["submitted"]
+
+    result = registry.invoke("wall", "stability", {"width": 2.5})
+    assert result["fos_sliding"] == 3.0
+    assert result["pid"] != os.getpid()
+
+    assert registry.invoke("wall", "stability", {"width": 2.5}) == result
+    stats = pool.get_stats()
+    assert stats["submitted"] == submitted + 1
+    assert stats["functions"]["wall.stability"]["calls"] >= 1
+    assert stats["in_flight"] == 0
+
+
+def test_worker_errors_propagate(registry, pool):
+    failed = pool.get_stats()["failed"]
+    with pytest.raises(ValueError, match="width must be positive"):
+        registry.invoke("wall", "stability", {"width": -1.0})
+    assert pool.get_stats()["failed"] == failed + 1
+    assert pool.get_stats()["functions"]["wall.stability"]["errors"] >= 1
+
+
+def test_inline_fallbacks(pool, monkeypatch):
+    fallbacks = pool.get_stats()["inline_fallbacks"]
+    result = pool.run("wall.stability", stability_check, {"width": 1.0, "callback": lambda: None})
+    assert result["pid"] == os.getpid()
+    assert pool.get_stats()["unpicklable_inputs"] >= 1
+    assert pool.get_stats()["inline_fallbacks"] == fallbacks + 1
+
+    broken = EngineProcessPool(max_workers=1, start_method="no-such-method")
+    assert broken.warm_up() == 0
+    assert broken.run("wall.stability", stability_check, {"width": 1.0})["pid"] == os.getpid()
+    assert broken.get_stats()["inline_fallbacks"] == 1
+
+    # Inside a worker, process engines never start a nested pool
+    monkeypatch.setattr(pool_module, "_in_worker", True)
+    assert pool_module.get_engine_process_pool() is None
+
+
+def test_worker_crash_is_not_rerun_inline(registry, pool):
+    registry.register_tool("wall", "crash", kill_worker, execution="process")
+    crashes = pool.get_stats()["worker_crashes"]
+
+    with pytest.raises(EngineProcessCrashedError, match="wall.crash worker process died"):
+        registry.invoke("wall", "crash", {"width": 1.0})
+    assert pool.get_stats()["worker_crashes"] == crashes + 2
+
+    with pytest.raises(EngineProcessCrashedError):
+        asyncio.run(registry.invoke_async("wall", "crash", {"width": 1.0}))
+
+    # The pool is rebuilt for the next call
+    assert registry.invoke("wall", "stability", {"width": 5.0})["pid"] != os.getpid()
+
+
+def test_slot_wait_bounded_by_timeout_and_deadline():
+    busy = EngineProcessPool(max_workers=1, max_pending=1, slot_timeout_seconds=0.05)
+    busy._slots.acquire()  # the only slot is taken by a call that never finishes
+    try:
+        with pytest.raises(EngineProcessPoolBusyError, match="waited 0.05s for a free process pool slot"):
+            busy.run("wall.stability", stability_check, {"width": 1.0})
+
+        busy.slot_timeout_seconds = 60
+        started = time.monotonic()
+        with pytest.raises(EngineProcessPoolBusyError):
+            run_with_deadline(Deadline.after(0.1), busy.run, "wall.stability", stability_check, {"width": 1.0})
+        assert time.monotonic() - started < 5
+        assert busy.get_stats()["slot_timeouts"] == 2
+        assert busy.get_stats()["submitted"] == 0
+    finally:
+        busy._slots.release()
+        busy.shutdown()
+
+
+def test_invoke_async_tiers(registry):
+    async def run():
+        return await asyncio.gather(
+            registry.invoke_async("wall", "stability", {"width": 4.0}),
+            registry.invoke_async("wall", "stability_thread", {"width": 4.0}),
+        )
+
+    in_process, in_thread = asyncio.run(run())
+    assert in_process["fos_sliding"] == in_thread["fos_sliding"] == 4.8
+    assert in_process["pid"] != os.getpid()
+    assert in_thread["pid"] == os.getpid()
@@ -0,0 +1,171 @@
+"""
+Unit Tests for Engine Result Memoization
+
+Tests cover:
+- Canonical input hashing (key order, pydantic/enum/date values)
+- Pure engines computed once per input; impure engines always recomputed
+- Cache hits returning independent copies
+- Version change invalidating memory and SQLite entries
+- Per-function hit-rate metrics and LRU eviction
+- Volatile timestamps restamped on hits (memory and SQLite), keeping the engine's clock
+- Registered engines: repeated footing design served from the cache
+"""
+
+import time
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum
+
+from pydantic import BaseModel
+
+from app.engines.registry import EngineRegistry, engine_registry
+from app.engines.result_cache import EngineResultCache, SQLiteResultStore, canonical_input_hash
+
+
+class Grade(str, Enum):
+    M25 = "M25"
+
+
+class Geometry(BaseModel):
+    width: float
+    depth: float
+
+
+class CountingEngine:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, input_data):
+        self.calls += 1
+        return {"area": input_data["width"] * input_data["depth"], "checks": {"ok": True}}
+
+
+def make_registry(cache=None, pure=True, version="1.0.0"):
+    registry = EngineRegistry(result_cache=cache or EngineResultCache(max_entries=16))
+    engine = CountingEngine()
+    registry.register_tool("test_tool_v1", "area", engine, pure=pure, version=version)
+    return registry, engine
+
+
+# ============================================================================
+# KEYS
+# ============================================================================
+
+def test_canonical_hash_ignores_key_order_and_normalizes_values():
+    first = {"width": 1.5, "depth": 2, "grade": Grade.M25, "cast_on": date(2026, 1, 5),
+             "geometry": Geometry(width=1.0, depth=2.0)}
+    second = {"geometry": {"width": 1.0, "depth": 2.0}, "cast_on": "2026-01-05",
+              "grade": "M25", "depth": 2, "width": 1.5}
+
+    assert canonical_input_hash(first) == canonical_input_hash(second)
+    assert canonical_input_hash({"width": 1.5}) != canonical_input_hash({"width": 1.6})
+
+
+# ============================================================================
+# MEMOIZATION
+# ============================================================================
+
+def test_pure_engine_memoized_and_hits_are_copies():
+    registry, engine = make_registry()
+
+    first = registry.invoke("test_tool_v1", "area", {"width": 2, "depth": 3})
+    first["checks"]["ok"] = False  # caller mutates its result
+    second = registry.invoke("test_tool_v1", "area", {"depth": 3, "width": 2})
+    registry.invoke("test_tool_v1", "area", {"width": 2, "depth": 4})
+
+    assert engine.calls == 2
+    assert second == {"area": 6, "checks": {"ok": True}}
+    stats = registry.result_cache.get_stats()
+    assert stats["functions"]["test_tool_v1.area"] == {"hits": 1, "misses": 2, "hit_rate": 0.3333}
+
+
+def test_impure_engine_and_uncacheable_input_recomputed():
+    registry, engine = make_registry(pure=False)
+    registry.invoke("test_tool_v1", "area", {"width": 2, "depth": 3})
+    registry.invoke("test_tool_v1", "area", {"width": 2, "depth": 3})
+    assert engine.calls == 2
+
+    registry, engine = make_registry()
+    registry.invoke("test_tool_v1", "area", {"width": 2, "depth": 3, "raw": object()})
+    registry.invoke("test_tool_v1", "area", {"width": 2, "depth": 3}, use_cache=False)
+    assert engine.calls == 2
+    assert registry.result_cache.get_stats()["uncacheable"] == 1
+
+
+def test_version_change_invalidates_memory_and_disk_entries(tmp_path):
+    store = SQLiteResultStore(str(tmp_path / "engine_results.sqlite3"))
+    cache = EngineResultCache(max_entries=16, store=store)
+    registry, engine = make_registry(cache=cache)
+    registry.invoke("test_tool_v1", "area", {"width": 2, "depth": 3})
+
+    # A restarted worker (empty memory tier) reuses the disk tier
+    cache.clear()
+    registry.invoke("test_tool_v1", "area", {"width": 2, "depth": 3})
+    assert engine.calls == 1
+    assert cache.get_stats()["store_hits"] == 1
+
+    fixed = CountingEngine()
+    registry.register_tool("test_tool_v1", "area", fixed, pure=True, version="1.0.1")
+    registry.invoke("test_tool_v1", "area", {"width": 2, "depth": 3})
+
+    assert fixed.calls == 1
+    rows = store._connect().execute("SELECT version FROM engine_results_v2").fetchall()
+    assert rows == [("1.0.1",)]
+    assert all(key[2] == "1.0.1" for key in cache._entries)
+
+
+def test_lru_evicts_least_recently_used():
+    registry, engine = make_registry(cache=EngineResultCache(max_entries=2))
+    for width in (1, 2, 1, 3, 1):
+        registry.invoke("test_tool_v1", "area", {"width": width, "depth": 1})
+
+    assert engine.calls == 3  # width=1 stays cached; width=2 evicted by width=3
+    assert registry.result_cache.get_stats()["evictions"] == 1
+
+
+def test_hits_restamp_volatile_timestamps(tmp_path):
+    cache = EngineResultCache(max_entries=16, store=SQLiteResultStore(str(tmp_path / "results.sqlite3")))
+    key = ("test_tool_v1", "report", "1.0.0", "hash")
+    ist = timedelta(hours=5, minutes=30)  # engine stamping in another clock than local time
+    calculated = datetime.now() + ist
+    cache.put(key, {
+        "calculation_timestamp": calculated.isoformat(),
+        "sections": [{"analysis_timestamp": datetime(2026, 1, 5, tzinfo=timezone.utc).isoformat()}],
+        "design_code": "IS 456:2000",
+    })
+
+    for tier in ("memory", "disk"):
+        time.sleep(0.01)
+        if tier == "disk":
+            cache.clear()
+        hit = cache.get(key)
+        restamped = datetime.fromisoformat(hit["calculation_timestamp"])
+        assert calculated < restamped < datetime.now() + ist
+        analysed = datetime.fromisoformat(hit["sections"][0]["analysis_timestamp"])
+        assert analysed.tzinfo is not None and analysed.date() == datetime.now(timezone.utc).date()
+        assert hit["design_code"] == "IS 456:2000"
+    assert cache.get_stats()["store_hits"] == 1
+
+
+# ============================================================================
+# REGISTERED ENGINES
+# ============================================================================
+
+def test_registered_footing_designer_memoized():
+    footing = {
+        "axial_load_dead": 610.0,
+        "axial_load_live": 390.0,
+        "column_width": 0.4,
+        "column_depth": 0.4,
+        "safe_bearing_capacity": 200.0,
+    }
+    info = engine_registry.get_tool_info("civil_foundation_designer_v1")["design_isolated_footing"]
+    assert info["pure"]
+    assert not engine_registry.get_tool_info("qap_generator_v1")["assemble_qap"]["pure"]
+
+    before = engine_registry.result_cache.get_stats()["memory_hits"]
+    first = engine_registry.invoke("civil_foundation_designer_v1", "design_isolated_footing", footing)
+    second = engine_registry.invoke("civil_foundation_designer_v1", "design_isolated_footing", footing)
+
+    assert first.pop("calculation_timestamp") <= second.pop("calculation_timestamp")
+    assert first == second
+    assert engine_registry.result_cache.get_stats()["memory_hits"] == before + 1
@@ -0,0 +1,204 @@
+"""
+Unit Tests for Pipelined Document Ingestion
+
+Tests cover:
+- Directory ingestion through the bounded extract/embed/store pipeline
+- One bulk chunk insert per document
+- Rate-limit backoff and adaptive embedding concurrency
+- Per-document failure isolation and per-stage throughput
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.etl.document_processor import DocumentProcessor
+from app.etl.pipeline import ETLPipeline
+from app.etl.pipelined_ingestion import (
+    AdaptiveConcurrencyLimiter,
+    PipelinedIngestion,
+    RateLimitedEmbedder
+)
+from app.utils.text_chunker import TextChunker
+
+
+# ============================================================================
+# FAKES
+# ============================================================================
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class FakeEmbeddingsClient:
+    """Returns one-dimensional embeddings; fails on request."""
+
+    def __init__(self, rate_limit_first=0, fail_on=None):
+        self.calls = 0
+        self.rate_limit_first = rate_limit_first
+        self.fail_on = fail_on
+        self._lock = threading.Lock()
+
+    def embed_documents(self, texts):
+        with self._lock:
+            self.calls += 1
+            if self.calls <= self.rate_limit_first:
+                raise RateLimitError("Rate limit exceeded")
+        if self.fail_on and any(self.fail_on in text for text in texts):
+            raise RuntimeError("embedding backend unavailable")
+        return [[float(len(text))] for text in texts]
+
+
+class FakeTable:
+    def __init__(self, db, name):
+        self.db = db
+        self.name = name
+
+    def insert(self, payload):
+        self.db.inserts.append((self.name, payload))
+        return self
+
+    def update(self, payload):
+        return self
+
+    def eq(self, *args):
+        return self
+
+    def execute(self):
+        return SimpleNamespace(data=[])
+
+
+class FakeSupabase:
+    def __init__(self):
+        self.inserts = []
+
+    def table(self, name):
+        return FakeTable(self, name)
+
+
+def make_pipeline(client, batch_size=2):
+    pipeline = ETLPipeline.__new__(ETLPipeline)
+    pipeline.document_processor = DocumentProcessor()
+    pipeline.text_chunker = TextChunker(target_chunk_size=20, min_chunk_size=5, max_chunk_size=30)
+    pipeline.embedding_service = SimpleNamespace(embeddings_client=client, batch_size=batch_size)
+    pipeline.db = FakeSupabase()
+    pipeline.stats = {
+        'documents_processed': 0,
+        'chunks_created': 0,
+        'embeddings_generated': 0,
+        'db_inserts': 0,
+        'errors': []
+    }
+    return pipeline
+
+
+def write_documents(directory, count, marker=""):
+    for i in range(count):
+        paragraphs = [
+            f"Clause {i}.{p} {marker} " + " ".join(["reinforcement"] * 25)
+            for p in range(4)
+        ]
+        (directory / f"code_{i}.txt").write_text("\n\n".join(paragraphs))
+
+
+@pytest.fixture(autouse=True)
+def supabase_only(monkeypatch):
+    monkeypatch.setattr(settings, "DATABASE_URL", None)
+
+
+# ============================================================================
+# PIPELINE
+# ============================================================================
+
+def test_pipelined_directory_ingestion(tmp_path):
+    write_documents(tmp_path, 5)
+    pipeline = make_pipeline(FakeEmbeddingsClient())
+
+    ingestion = PipelinedIngestion(pipeline, extract_workers=0, document_workers=2, queue_size=1)
+    result = ingestion.run(sorted(tmp_path.glob("*.txt")), document_type="DESIGN_CODE")
+
+    assert result['successful'] == 5
+    assert [r['file_path'] for r in result['results']] == sorted(str(p) for p in tmp_path.glob("*.txt"))
+
+    chunk_inserts = [payload for name, payload in pipeline.db.inserts if name == "knowledge_chunks"]
+    assert len(chunk_inserts) == 5  # one bulk insert per document
+    assert all(isinstance(payload, list) and len(payload) > 1 for payload in chunk_inserts)
+    assert pipeline.stats['db_inserts'] == sum(len(payload) for payload in chunk_inserts)
+
+    throughput = result['throughput']
+    assert throughput['extract']['documents'] == 5
+    assert throughput['embed']['embeddings'] == pipeline.stats['embeddings_generated']
+    assert throughput['store']['rows_per_sec'] > 0
+
+
+def test_ingest_directory_pipelined_flag(tmp_path, monkeypatch):
+    write_documents(tmp_path, 2)
+    pipeline = make_pipeline(FakeEmbeddingsClient())
+    monkeypatch.setattr(settings, "ETL_EXTRACT_WORKERS", 0)
+
+    result = pipeline.ingest_directory(str(tmp_path), pipelined=True)
+
+    assert result['successful'] == 2
+    assert 'throughput' in result
+
+
+def test_failed_document_does_not_stop_pipeline(tmp_path):
+    write_documents(tmp_path, 3)
+    (tmp_path / "code_1.txt").write_text("BROKEN " + " ".join(["clause"] * 30))
+    pipeline = make_pipeline(FakeEmbeddingsClient(fail_on="BROKEN"))
+
+    result = PipelinedIngestion(pipeline, extract_workers=0).run(sorted(tmp_path.glob("*.txt")))
+
+    assert result['successful'] == 2
+    failed = [r for r in result['results'] if not r['success']]
+    assert len(failed) == 1
+    assert "embedding backend unavailable" in failed[0]['error']
+    assert len(pipeline.stats['errors']) == 1
+
+
+# ============================================================================
+# RATE LIMITING
+# ============================================================================
+
+def test_embedder_retries_rate_limited_batches_in_order():
+    client = FakeEmbeddingsClient(rate_limit_first=2)
+    sleeps = []
+    embedder = RateLimitedEmbedder(
+        SimpleNamespace(embeddings_client=client, batch_size=2),
+        max_concurrency=1,
+        sleep=sleeps.append
+    )
+
+    embeddings = embedder.embed(["a", "bb", "ccc", "dddd", "eeeee"])
+    embedder.close()
+
+    assert embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert len(sleeps) == 2 and sleeps[1] > sleeps[0]
+    assert embedder.limiter.rate_limited == 2
+
+
+def test_embedder_gives_up_after_max_retries():
+    embedder = RateLimitedEmbedder(
+        SimpleNamespace(embeddings_client=FakeEmbeddingsClient(rate_limit_first=10), batch_size=2),
+        max_retries=2,
+        sleep=lambda seconds: None
+    )
+
+    with pytest.raises(RateLimitError):
+        embedder.embed(["a"])
+    embedder.close()
+
+
+def test_limiter_halves_on_rate_limit_and_recovers():
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=8, increase_after=2)
+
+    limiter.acquire()
+    limiter.release(rate_limited=True)
+    assert limiter.limit == 4
+
+    for _ in range(4):
+        limiter.acquire()
+        limiter.release()
+    assert limiter.limit == 6
@@ -0,0 +1,58 @@
+"""
+Shared fixtures for workflow execution tests
+
+Provides make_step / make_schema factories so every execution test builds
+its WorkflowSteps and DeliverableSchemas the same way.
+"""
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from app.schemas.workflow.schema_models import DeliverableSchema, ErrorHandling, WorkflowStep
+
+
+@pytest.fixture
+def make_step():
+    """Provide a WorkflowStep factory: step N calls tool.<function> and writes out<N>."""
+
+    def make_step(number, mapping=None, function="calc", output=None, condition=None,
+                  timeout_seconds=300, **error_handling):
+        return WorkflowStep(
+            step_number=number,
+            step_name=f"step{number}",
+            function_to_call=f"tool.{function}",
+            input_mapping={"x": "$input.x"} if mapping is None else mapping,
+            output_variable=output or f"out{number}",
+            condition=condition,
+            error_handling=ErrorHandling(**error_handling),
+            timeout_seconds=timeout_seconds
+        )
+
+    return make_step
+
+
+@pytest.fixture
+def make_schema():
+    """Provide a DeliverableSchema factory for a list of steps (fields overridable)."""
+
+    def make_schema(steps, **fields):
+        now = datetime.utcnow()
+        values = {
+            "id": uuid4(),
+            "version": 1,
+            "created_at": now,
+            "updated_at": now,
+            "created_by": "tester",
+            "updated_by": "tester",
+            "deliverable_type": "execution_test",
+            "display_name": "Execution test",
+            "discipline": "civil",
+            "workflow_steps": steps,
+            "input_schema": {"type": "object"},
+        }
+        values.update(fields)
+        return DeliverableSchema(**values)
+
+    return make_schema
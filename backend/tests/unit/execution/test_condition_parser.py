@@ -0,0 +1,106 @@
+"""
+Unit Tests for the Condition Parser
+
+Tests cover:
+- Logical, comparison, arithmetic and ternary expressions
+- Compiled condition caching (LRU)
+- RiskRuleParser reuse of compiled rules
+"""
+
+import pytest
+
+from app.execution.condition_parser import (
+    CompiledCache,
+    ConditionEvaluator,
+    get_condition_cache_stats
+)
+from app.risk.rule_parser import RiskRuleParser, get_rule_cache_stats
+
+
+@pytest.fixture
+def evaluator():
+    return ConditionEvaluator()
+
+
+@pytest.fixture
+def context():
+    return {
+        "input": {"load": 1200, "live": 300, "discipline": "civil", "override": False},
+        "steps": {"design": {"ok": True, "checks": {"depth": 1.5}}},
+        "context": {"seniority": 3},
+    }
+
+
+# ============================================================================
+# EVALUATION
+# ============================================================================
+
+@pytest.mark.parametrize("condition,expected", [
+    ("$input.load > 1000 AND $step1.design.ok == true", True),
+    ("$input.load > 1000 AND $input.live > 500", False),
+    ("$input.load > 5000 OR $context.seniority >= 3", True),
+    ("NOT ($input.load >= 1000 OR $input.override == true)", False),
+    ("$input.discipline IN ['civil', 'structural']", True),
+    ("$input.discipline NOT IN ['civil', 'structural']", False),
+    ("$step1.design.checks.depth < 2.0", True),
+    ("($input.load + $input.live) > 1400", True),
+    ("$input.load * 2 / 4 == 600", True),
+    ("(($input.load > 1000 ? 1 : 0) + ($input.live > 1000 ? 1 : 0)) >= 2", False),
+])
+def test_evaluate_expressions(evaluator, context, condition, expected):
+    assert evaluator.evaluate(condition, context) is expected
+
+
+def test_ternary_counts_unresolvable_condition_as_false(evaluator, context):
+    condition = "(($input.missing > 1 ? 1 : 0) + ($input.load > 1 ? 1 : 0)) == 1"
+    assert evaluator.evaluate(condition, context) is True
+
+
+def test_ordering_comparison_requires_numbers(evaluator, context):
+    with pytest.raises(TypeError):
+        evaluator.evaluate("$input.discipline > 5", context)
+
+
+def test_invalid_syntax_raises_value_error(evaluator, context):
+    with pytest.raises(ValueError):
+        evaluator.evaluate("$input.load >>> 5", context)
+
+
+# ============================================================================
+# CACHING
+# ============================================================================
+
+def test_compiled_conditions_are_reused(evaluator, context):
+    condition = "$input.load > 999 AND $input.live < 301"
+    first = evaluator.compile(condition)
+    hits = get_condition_cache_stats()["hits"]
+
+    assert ConditionEvaluator().compile(condition) is first
+    assert get_condition_cache_stats()["hits"] == hits + 1
+    assert first(context) is True
+
+
+def test_compiled_cache_evicts_least_recently_used():
+    cache = CompiledCache(maxsize=2)
+    cache.get_or_compile("a", lambda: 1)
+    cache.get_or_compile("b", lambda: 2)
+    cache.get_or_compile("a", lambda: 0)  # "b" becomes least recently used
+    cache.get_or_compile("c", lambda: 3)
+
+    assert cache.get_or_compile("a", lambda: -1) == 1
+    assert cache.get_or_compile("b", lambda: -2) == -2
+    assert cache.get_stats()["evictions"] == 2
+
+
+def test_rule_parser_reuses_compiled_rule(context):
+    parser = RiskRuleParser()
+    condition = "$assessment.safety_risk > 0.5 AND $input.load > 1000"
+
+    parser.evaluate(condition, context, {"safety_risk": 0.9})
+    hits = get_rule_cache_stats()["hits"]
+    result = parser.evaluate(condition, context, {"safety_risk": 0.2})
+
+    assert result.success
+    assert result.result is False
+    assert result.variables_resolved["$assessment.safety_risk"] == 0.2
+    assert get_rule_cache_stats()["hits"] == hits + 1
@@ -0,0 +1,141 @@
+"""
+Unit Tests for Compiled Workflow Execution Plans
+
+Tests cover:
+- Compiled variable accessors: values and error messages of $input/$stepN/$context references
+- Compiled simple conditions (typed literals, unresolvable references)
+- Plans compiled once per schema object and shared by variant copies
+- Engines bound from the registry (memoization of pure engines kept)
+- ParallelExecutor using the plan's dependency analysis
+"""
+
+import asyncio
+
+import pytest
+
+from app.engines.registry import EngineRegistry
+from app.engines.result_cache import EngineResultCache
+from app.execution import execution_plan as plan_module
+from app.execution.dependency_graph import DependencyAnalyzer
+from app.execution.execution_plan import (
+    CompiledStep,
+    compile_condition,
+    compile_reference,
+    get_execution_plan,
+)
+from app.execution.parallel_executor import ParallelExecutor
+from app.schemas.workflow.schema_models import RiskConfig, StepResult
+
+CONTEXT = {
+    "input": {"load": 600.0, "grade": "M25", "use_piles": True},
+    "steps": {"design": {"size": {"length": 2.4}, "bars": [12, 16], "ok": True}},
+    "context": {"user_id": "engineer"},
+}
+
+
+# ============================================================================
+# ACCESSORS AND CONDITIONS
+# ============================================================================
+
+@pytest.mark.parametrize("reference, expected", [
+    ("$input.load", 600.0),
+    ("$input", CONTEXT["input"]),
+    ("$step1.design.size.length", 2.4),
+    ("$step9.design.bars.1", 16),
+    ("$context.user_id", "engineer"),
+    ("literal text", "literal text"),
+])
+def test_compiled_reference_values(reference, expected):
+    assert compile_reference(reference)(CONTEXT) == expected
+
+
+@pytest.mark.parametrize("reference, message", [
+    ("$input.missing", "Key 'missing' not found in path for $input.missing"),
+    ("$step1.absent", "Step output variable 'absent' not found. Available variables: ['design']"),
+    ("$step1", "Invalid step reference: $step1. Must specify output variable name."),
+    ("$design.size", "Unknown variable source: 'design' in $design.size"),
+    ("$step1.design.bars.5", "Index 5 out of range in $step1.design.bars.5"),
+    ("$step1.design.ok.flag", "Cannot access key 'flag' in $step1.design.ok.flag - data is not a dict"),
+])
+def test_compiled_reference_errors(reference, message):
+    with pytest.raises(ValueError) as exc_info:
+        compile_reference(reference)(CONTEXT)
+    assert str(exc_info.value) == message
+
+
+def test_compiled_conditions():
+    assert compile_condition("$input.use_piles == True")(CONTEXT) is True
+    assert compile_condition("$input.load > 500")(CONTEXT) is True
+    assert compile_condition("$input.grade != 'M25'")(CONTEXT) is False
+    assert compile_condition("$step1.missing.flag == True")(CONTEXT) is False
+    assert compile_condition("not a condition")(CONTEXT) is True
+    assert compile_condition("$input.load > 500") is compile_condition("$input.load > 500")
+
+
+# ============================================================================
+# PLANS
+# ============================================================================
+
+def test_plan_compiled_once_and_shared_by_copies(monkeypatch, make_step, make_schema):
+    compiled = []
+    original = plan_module.ExecutionPlan
+
+    class CountingPlan(original):
+        def __init__(self, steps, registry=None):
+            compiled.append(len(steps))
+            super().__init__(steps, registry)
+
+    monkeypatch.setattr(plan_module, "ExecutionPlan", CountingPlan)
+    schema = make_schema([
+        make_step(1, {"x": "$input.load"}),
+        make_step(2, {"x": "$input.load"}),
+        make_step(3, {"a": "$step1.out1", "b": "$step2.out2"}),
+    ])
+
+    plan = get_execution_plan(schema)
+    variant_copy = schema.model_copy(update={"risk_config": RiskConfig(require_hitl_threshold=0.95)})
+
+    assert get_execution_plan(schema) is plan
+    assert get_execution_plan(variant_copy) is plan
+    assert compiled == [3]
+    assert plan.execution_order == [[1, 2], [3]]
+    assert len(plan.critical_path) == 2
+    assert plan.stats.max_width == 2
+    assert "_execution_plan" not in schema.model_dump()
+
+    edited = schema.model_copy(update={"workflow_steps": schema.workflow_steps[:2]})
+    assert get_execution_plan(edited) is not plan
+    assert compiled == [3, 2]
+
+
+def test_bound_engines_keep_memoization(make_step):
+    calls = []
+    registry = EngineRegistry(result_cache=EngineResultCache(max_entries=16))
+    registry.register_tool("tool", "calc", lambda data: calls.append(1) or {"y": data["x"] * 2}, pure=True)
+
+    step = CompiledStep.compile(make_step(1, {"x": "$input.load"}), registry)
+    assert step.engine(step.resolve_inputs(CONTEXT)) == {"y": 1200.0}
+    assert step.engine({"x": 600.0}) == {"y": 1200.0}
+    assert len(calls) == 1
+
+    missing = CompiledStep.compile(make_step(1, {}, function="unknown"), registry)
+    with pytest.raises(ValueError, match="Function 'unknown' not found in tool 'tool'"):
+        missing.engine({})
+
+
+def test_parallel_executor_uses_plan_analysis(monkeypatch, make_step, make_schema):
+    steps = [make_step(1, {"x": "$input.load"}), make_step(2, {"x": "$step1.out1"})]
+    plan = get_execution_plan(make_schema(steps))
+
+    def no_analysis(steps):
+        raise AssertionError("dependency analysis repeated")
+
+    monkeypatch.setattr(DependencyAnalyzer, "analyze", no_analysis)
+
+    async def run_step(step, context):
+        return StepResult(step_number=step.step_number, step_name=step.step_name,
+                          status="completed", output_data={"v": step.step_number})
+
+    result = asyncio.run(ParallelExecutor(step_executor=run_step).execute_workflow(steps, {}, plan=plan))
+    assert [r.step_number for r in result.step_results] == [1, 2]
+    assert result.execution_context.steps == {"out1": {"v": 1}, "out2": {"v": 2}}
@@ -0,0 +1,177 @@
+"""
+Unit Tests for Parallel Executor
+
+Tests:
+- Dataflow scheduling starts steps as soon as their own dependencies finish
+- Generation (barrier) scheduling for comparison
+- Critical failures stop scheduling of further steps
+- Measured speedup reporting
+- Retries applied only with a retry manager (the step executor owns them otherwise)
+"""
+
+import asyncio
+import time
+
+import pytest
+from app.execution.parallel_executor import ParallelExecutor, ExecutionStatus
+from app.execution.retry_manager import RetryManager
+from app.schemas.workflow.schema_models import StepResult
+
+
+def make_step_executor(durations, failing=()):
+    """Build an async step executor that sleeps for the configured duration."""
+    started = {}
+
+    async def execute_step(step, context):
+        started[step.step_number] = time.perf_counter()
+        await asyncio.sleep(durations[step.step_number])
+        if step.step_number in failing:
+            return StepResult(
+                step_number=step.step_number,
+                step_name=step.step_name,
+                status="failed",
+                error_message="boom",
+                execution_time_ms=int(durations[step.step_number] * 1000)
+            )
+        return StepResult(
+            step_number=step.step_number,
+            step_name=step.step_name,
+            status="completed",
+            output_data={"value": step.step_number},
+            execution_time_ms=int(durations[step.step_number] * 1000)
+        )
+
+    return execute_step, started
+
+
+UNEVEN_DURATIONS = {1: 0.3, 2: 0.05, 3: 0.25}
+
+
+@pytest.fixture
+def uneven_steps(make_step):
+    """Step 1 is slow; step 3 only needs fast step 2."""
+    return [
+        make_step(1, {"x": "$input.value"}),
+        make_step(2, {"x": "$input.value"}),
+        make_step(3, {"x": "$step2.out2"}),
+    ]
+
+
+class TestDataflowScheduling:
+    """Test ready-queue scheduling"""
+
+    def test_step_starts_when_own_dependencies_finish(self, uneven_steps):
+        """Step 3 must not wait for unrelated slow step 1"""
+        step_executor, started = make_step_executor(UNEVEN_DURATIONS)
+        executor = ParallelExecutor(step_executor=step_executor)
+
+        t0 = time.perf_counter()
+        result = asyncio.run(executor.execute_workflow(uneven_steps, {"value": 1}))
+        elapsed = time.perf_counter() - t0
+
+        assert result.status == ExecutionStatus.COMPLETED
+        assert started[3] - t0 < 0.2
+        # Critical path is max(0.3, 0.05 + 0.25) = 0.3s, not 0.3 + 0.25
+        assert elapsed < 0.45
+
+    def test_generation_scheduling_waits_for_barrier(self, uneven_steps):
+        step_executor, started = make_step_executor(UNEVEN_DURATIONS)
+        executor = ParallelExecutor(step_executor=step_executor)
+
+        t0 = time.perf_counter()
+        asyncio.run(executor.execute_workflow(
+            uneven_steps, {"value": 1}, scheduling="generations"
+        ))
+
+        assert started[3] - t0 >= 0.29
+
+    def test_outputs_available_to_dependents(self, uneven_steps):
+        seen = {}
+
+        async def step_executor(step, context):
+            if step.step_number == 3:
+                seen.update(context.steps)
+            return StepResult(
+                step_number=step.step_number,
+                step_name=step.step_name,
+                status="completed",
+                output_data={"value": step.step_number}
+            )
+
+        executor = ParallelExecutor(step_executor=step_executor)
+        asyncio.run(executor.execute_workflow(uneven_steps, {"value": 1}))
+
+        assert seen["out2"] == {"value": 2}
+
+    def test_results_ordered_by_step_number(self, uneven_steps):
+        step_executor, _ = make_step_executor(UNEVEN_DURATIONS)
+        executor = ParallelExecutor(step_executor=step_executor)
+
+        result = asyncio.run(executor.execute_workflow(uneven_steps, {"value": 1}))
+
+        assert [r.step_number for r in result.step_results] == [1, 2, 3]
+
+    def test_critical_failure_stops_dependents(self, make_step):
+        steps = [
+            make_step(1, {"x": "$input.value"}),
+            make_step(2, {"x": "$input.value"}),
+            make_step(3, {"x": "$step2.out2"}),
+        ]
+        step_executor, started = make_step_executor(
+            {1: 0.1, 2: 0.01, 3: 0.01}, failing={2}
+        )
+        executor = ParallelExecutor(step_executor=step_executor)
+
+        result = asyncio.run(executor.execute_workflow(steps, {"value": 1}))
+
+        assert result.status == ExecutionStatus.FAILED
+        assert 3 not in started
+        # In-flight step 1 still finishes and is recorded
+        assert [r.step_number for r in result.step_results] == [1, 2]
+
+    def test_non_critical_failure_continues(self, make_step):
+        steps = [
+            make_step(1, {"x": "$input.value"}),
+            make_step(2, {"x": "$input.value"}, on_error="skip"),
+            make_step(3, {"x": "$step2.out2"}),
+        ]
+        step_executor, started = make_step_executor(
+            {1: 0.01, 2: 0.01, 3: 0.01}, failing={2}
+        )
+        executor = ParallelExecutor(step_executor=step_executor)
+
+        asyncio.run(executor.execute_workflow(steps, {"value": 1}))
+
+        assert 3 in started
+
+    def test_measured_speedup_reported(self, make_step):
+        steps = [make_step(n, {"x": "$input.value"}) for n in (1, 2, 3, 4)]
+        step_executor, _ = make_step_executor({n: 0.1 for n in (1, 2, 3, 4)})
+        executor = ParallelExecutor(step_executor=step_executor)
+
+        result = asyncio.run(executor.execute_workflow(steps, {"value": 1}))
+
+        assert result.sequential_time_ms == pytest.approx(400, abs=5)
+        assert result.measured_speedup > 2.5
+
+
+class TestRetries:
+    """Test which layer retries a failing step"""
+
+    def test_step_executor_owns_retries_by_default(self, make_step):
+        """Without a retry manager a step runs once, whatever its retry_count"""
+        calls = []
+
+        async def flaky(step, context):
+            calls.append(step.step_number)
+            raise ConnectionError("connection reset by peer")
+
+        steps = [make_step(1, {"x": "$input.value"}, retry_count=2, base_delay_seconds=0.1)]
+        result = asyncio.run(ParallelExecutor(step_executor=flaky).execute_workflow(steps, {"value": 1}))
+        assert calls == [1]
+        assert result.step_results[0].status == "failed"
+
+        calls.clear()
+        retrying = ParallelExecutor(step_executor=flaky, retry_manager=RetryManager())
+        asyncio.run(retrying.execute_workflow(steps, {"value": 1}))
+        assert calls == [1, 1, 1]
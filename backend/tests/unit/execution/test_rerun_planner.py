@@ -0,0 +1,176 @@
+"""
+Unit Tests for Incremental Re-execution
+
+Tests cover:
+- Affected steps from changed $input / $context references (DependencyGraph)
+- Re-runs invoking engines only for affected steps, with the same output as a full run
+- Early cutoff: recomputed steps with unchanged output keep dependents reused
+- Failed source steps recomputed; schema version changes disable reuse
+"""
+
+import json
+from uuid import uuid4
+
+import pytest
+
+from app.engines.registry import engine_registry
+from app.execution.dependency_graph import DependencyGraph
+from app.execution.rerun_planner import RerunSource
+from app.services.workflow_orchestrator import WorkflowOrchestrator
+
+
+@pytest.fixture
+def steps(make_step):
+    return [
+        make_step(1, {"sbc": "$input.safe_bearing_capacity"}, function="site", output="site"),
+        make_step(2, {"dead": "$input.axial_load_dead", "live": "$input.axial_load_live"}, function="loads", output="loads"),
+        make_step(3, {"load": "$step2.loads.total", "sbc": "$step1.site.sbc"}, function="size", output="footing"),
+        make_step(4, {"area": "$step3.footing.area"}, function="boq", output="boq"),
+        make_step(5, {"load": "$step2.loads.total"}, function="piles", output="piles",
+                  condition="$input.use_piles == True"),
+    ]
+
+
+ENGINES = {
+    # Bearing capacity is capped at 300 kPa: changes above it do not change the output
+    "site": lambda i: {"sbc": min(i["sbc"], 300.0)},
+    "loads": lambda i: {"total": 1.5 * (i["dead"] + i["live"])},
+    "size": lambda i: {"area": round(i["load"] / i["sbc"], 3)},
+    "boq": lambda i: {"concrete_m3": round(i["area"] * 0.6, 3)},
+    "piles": lambda i: {"count": int(i["load"] // 500) + 1},
+}
+
+INPUT = {
+    "safe_bearing_capacity": 200.0,
+    "axial_load_dead": 600.0,
+    "axial_load_live": 400.0,
+    "use_piles": False,
+}
+
+
+SCHEMA_ID = uuid4()
+
+
+@pytest.fixture
+def engine_calls(monkeypatch):
+    calls = []
+    monkeypatch.setitem(engine_registry._registry, "tool", {})
+
+    for name, engine in ENGINES.items():
+        def counted(input_data, name=name, engine=engine):
+            calls.append(name)
+            return engine(input_data)
+        engine_registry.register_tool("tool", name, counted)
+
+    return calls
+
+
+@pytest.fixture
+def orchestrator(engine_calls, steps, make_schema):
+    orchestrator = WorkflowOrchestrator()
+    # Fresh schema object per test: its execution plan binds this test's engines
+    orchestrator.schema = make_schema(steps, id=SCHEMA_ID, version=3, deliverable_type="foundation_design")
+    return orchestrator
+
+
+def run(orchestrator, input_data, source=None):
+    execution_id = uuid4()
+    context = {
+        "input": input_data,
+        "steps": {},
+        "context": {"user_id": "engineer", "project_id": None, "execution_id": str(execution_id)},
+    }
+    plan = orchestrator._plan_rerun(source, orchestrator.schema, context)
+    results, stats = orchestrator._execute_steps(orchestrator.schema, context, execution_id, plan)
+    return results, stats, context["steps"], execution_id
+
+
+def stored_source(input_data, results, execution_id, schema_version=3):
+    """RerunSource as loaded back from csa.workflow_executions (JSONB round trip)."""
+    intermediate = json.loads(json.dumps([
+        {"step_number": r.step_number, "step_name": r.step_name, "status": r.status, "output_data": r.output_data}
+        for r in results
+    ]))
+    return RerunSource.from_row({
+        "id": execution_id, "schema_id": SCHEMA_ID, "schema_version": schema_version,
+        "deliverable_type": "foundation_design", "input_data": dict(input_data),
+        "intermediate_results": intermediate, "user_id": "engineer", "project_id": None,
+    })
+
+
+# ============================================================================
+# AFFECTED STEPS
+# ============================================================================
+
+def test_affected_steps_follow_references_and_dependents(steps, make_step):
+    graph = DependencyGraph(steps + [
+        make_step(6, {"all": "$input", "who": "$context.user_id"}, function="report", output="report"),
+    ])
+
+    assert graph.get_affected_steps({"input.safe_bearing_capacity"}) == {1, 3, 4, 6}
+    assert graph.get_affected_steps({"input.axial_load_live"}) == {2, 3, 4, 5, 6}
+    assert graph.get_affected_steps({"input.use_piles"}) == {5, 6}
+    assert graph.get_affected_steps({"context.execution_id"}) == set()
+    assert graph.get_affected_steps({"context.user_id"}) == {6}
+    assert graph.get_affected_steps(set()) == set()
+
+
+# ============================================================================
+# RE-RUNS
+# ============================================================================
+
+def test_rerun_recomputes_only_affected_steps(orchestrator, engine_calls):
+    results, _, _, source_id = run(orchestrator, INPUT)
+    assert engine_calls == ["site", "loads", "size", "boq"]
+
+    changed = {**INPUT, "safe_bearing_capacity": 250.0}
+    engine_calls.clear()
+    rerun_results, stats, outputs, _ = run(orchestrator, changed, stored_source(INPUT, results, source_id))
+
+    assert sorted(engine_calls) == ["boq", "site", "size"]
+    assert stats["rerun"]["reused_steps"] == [2, 5]
+    assert stats["rerun"]["recomputed_steps"] == [1, 3, 4]
+    assert stats["rerun"]["changed"] == ["context.execution_id", "input.safe_bearing_capacity"]
+    assert [r.reused for r in rerun_results] == [False, True, False, False, True]
+    assert rerun_results[4].status == "skipped"
+
+    engine_calls.clear()
+    _, _, full_outputs, _ = run(orchestrator, changed)
+    assert outputs == full_outputs
+    assert len(engine_calls) == 4
+
+
+def test_rerun_early_cutoff_when_recomputed_output_unchanged(orchestrator, engine_calls):
+    capped = {**INPUT, "safe_bearing_capacity": 350.0}
+    results, _, outputs, source_id = run(orchestrator, capped)
+
+    engine_calls.clear()
+    rerun_results, stats, rerun_outputs, _ = run(
+        orchestrator, {**capped, "safe_bearing_capacity": 400.0}, stored_source(capped, results, source_id)
+    )
+
+    # Step 1 reruns but still yields the 300 kPa cap, so sizing and BOQ are reused
+    assert engine_calls == ["site"]
+    assert stats["rerun"]["affected_steps"] == [1, 3, 4]
+    assert stats["rerun"]["reused_steps"] == [2, 3, 4, 5]
+    assert rerun_outputs == outputs
+
+    # Switching on piles runs the conditional step that was skipped before
+    engine_calls.clear()
+    run(orchestrator, {**capped, "use_piles": True}, stored_source(capped, results, source_id))
+    assert engine_calls == ["piles"]
+
+
+def test_failed_steps_rerun_and_schema_change_disables_reuse(orchestrator, engine_calls):
+    results, _, _, source_id = run(orchestrator, INPUT)
+    results[3] = results[3].model_copy(update={"status": "failed", "output_data": None})
+
+    engine_calls.clear()
+    _, stats, _, _ = run(orchestrator, INPUT, stored_source(INPUT, results, source_id))
+    assert engine_calls == ["boq"]
+    assert stats["rerun"]["recomputed_steps"] == [4]
+
+    engine_calls.clear()
+    _, stats, _, _ = run(orchestrator, INPUT, stored_source(INPUT, results, source_id, schema_version=2))
+    assert len(engine_calls) == 4
+    assert "rerun" not in stats
@@ -0,0 +1,249 @@
+"""
+Unit Tests for Step Retry, Deadline and Circuit-Breaker Policies
+
+Tests cover:
+- Transient failures retried with backoff; engine errors not retried unless configured
+- Step timeouts cancelling the engine cooperatively (check_deadline / remaining_seconds),
+  including the base plate engine's plate-growth loop;
+  timeouts not counted against the engine's circuit breaker
+- Workflow deadline failing in-flight and not-yet-started steps
+- Hung inline engines: timeouts not retried, bounded abandoned attempts failing fast
+- Circuit breakers: opening after consecutive dependency failures, half-open probe,
+  steps failing fast while their engine's breaker is open
+"""
+
+import threading
+import time
+from uuid import uuid4
+
+import pytest
+
+from app.core.config import settings
+from app.engines.registry import engine_registry
+from app.engines.structural.base_plate_designer import analyze_base_plate
+from app.execution.step_threads import StepThreadPool
+from app.execution.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    get_circuit_breaker,
+    reset_circuit_breakers,
+)
+from app.execution.timeout_manager import (
+    Deadline,
+    DeadlineExceeded,
+    check_deadline,
+    remaining_seconds,
+    run_with_deadline,
+)
+from app.services import workflow_orchestrator
+from app.services.workflow_orchestrator import WorkflowOrchestrator
+
+
+def context():
+    return {"input": {"x": 1}, "steps": {}, "context": {"execution_id": "test"}}
+
+
+@pytest.fixture
+def register(monkeypatch):
+    monkeypatch.setitem(engine_registry._registry, "tool", {})
+    reset_circuit_breakers()
+    yield lambda name, fn: engine_registry.register_tool("tool", name, fn)
+    reset_circuit_breakers()
+
+
+@pytest.fixture
+def orchestrator(monkeypatch):
+    orchestrator = WorkflowOrchestrator()
+    monkeypatch.setattr(orchestrator.retry_manager, "calculate_backoff_delay", lambda attempt, config: 0.0)
+    return orchestrator
+
+
+def failing(times, message):
+    calls = []
+
+    def engine(data):
+        calls.append(1)
+        if len(calls) <= times:
+            raise ConnectionError(message) if "connection" in message else ValueError(message)
+        return {"ok": True, "attempt": len(calls)}
+
+    return engine, calls
+
+
+# ============================================================================
+# RETRIES
+# ============================================================================
+
+def test_transient_failures_retried(register, orchestrator, make_step, make_schema):
+    engine, calls = failing(2, "LLM API error: 503 Service Unavailable")
+    register("flaky", engine)
+    step = make_step(1, function="flaky", retry_count=2, circuit_breaker=False)
+
+    result = orchestrator._execute_step(step, context(), make_schema([step]))
+
+    assert result.status == "completed"
+    assert result.output_data == {"ok": True, "attempt": 3}
+    assert result.retry_count == 2
+
+    engine, calls = failing(5, "connection refused")
+    register("down", engine)
+    step = make_step(1, function="down", retry_count=1, circuit_breaker=False)
+    result = orchestrator._execute_step(step, context(), make_schema([step]))
+    assert result.status == "failed"
+    assert len(calls) == 2 and result.retry_count == 1
+
+
+def test_engine_errors_retried_only_when_configured(register, orchestrator, make_step, make_schema):
+    engine, calls = failing(1, "footing width must be positive")
+    register("calc", engine)
+    step = make_step(1, function="calc", retry_count=3)
+
+    result = orchestrator._execute_step(step, context(), make_schema([step]))
+    assert result.status == "failed"
+    assert result.error_message == "footing width must be positive"
+    assert len(calls) == 1 and result.retry_count == 0
+
+    calls.clear()
+    step = make_step(1, function="calc", retry_count=3, retry_on_transient_only=False)
+    result = orchestrator._execute_step(step, context(), make_schema([step]))
+    assert result.status == "completed" and result.retry_count == 1
+
+
+# ============================================================================
+# DEADLINES
+# ============================================================================
+
+def test_step_timeout_cancels_engine_cooperatively(register, orchestrator, make_step, make_schema):
+    stopped = threading.Event()
+    budgets = []
+
+    def hung(data):
+        budgets.append(remaining_seconds(120.0))
+        try:
+            while True:
+                check_deadline()
+                time.sleep(0.01)
+        finally:
+            stopped.set()
+
+    register("hung", hung)
+    step = make_step(1, function="hung", timeout_seconds=1)
+
+    started = time.monotonic()
+    result = orchestrator._execute_step(step, context(), make_schema([step]))
+
+    assert result.status == "failed"
+    assert result.error_message == "Step timed out after 1s"
+    assert time.monotonic() - started < 5
+    assert budgets[0] <= 1.0
+    assert stopped.wait(2), "engine thread kept running after the step timed out"
+    # A slow input is not an unhealthy engine
+    assert get_circuit_breaker("engine:tool.hung").get_stats()["failures"] == 0
+
+
+def test_plate_growth_loops_check_deadline():
+    base_plate = {"column_section": "ISHB 150", "axial_load": 1e30}
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        run_with_deadline(Deadline.after(0.2), analyze_base_plate, base_plate)
+    assert time.monotonic() - started < 2
+
+
+def test_workflow_deadline_fails_remaining_steps(register, orchestrator, monkeypatch, make_step, make_schema):
+    monkeypatch.setattr(settings, "WORKFLOW_DEADLINE_SECONDS", 0.3)
+    register("slow", lambda data: (time.sleep(0.5), {"done": True})[1])
+    register("next", lambda data: {"done": True})
+    steps = [
+        make_step(1, function="slow", retry_count=3, on_error="continue", fallback_value={"done": False}),
+        make_step(2, {"prev": "$step1.out1.done"}, function="next"),
+    ]
+
+    results, _ = orchestrator._execute_steps(make_schema(steps), context(), uuid4())
+
+    assert [r.status for r in results] == ["failed", "failed"]
+    assert results[0].error_message == "Workflow deadline exceeded (0.3s)"
+    assert results[0].retry_count == 0
+    assert results[1].error_message == "Workflow deadline exceeded (0.3s)"
+
+
+def test_hung_inline_engine_not_retried_and_bounded(register, orchestrator, monkeypatch, make_step, make_schema):
+    threads = StepThreadPool(max_threads=2, max_abandoned=1)
+    monkeypatch.setattr(workflow_orchestrator, "get_step_thread_pool", lambda: threads)
+    release = threading.Event()
+    calls = []
+    register("stuck", lambda data: (calls.append(1), release.wait(10), {"done": True})[2])
+    register("quick", lambda data: {"done": True})
+
+    stuck = make_step(1, function="stuck", timeout_seconds=1, retry_count=2, retry_on_timeout=True, circuit_breaker=False)
+    result = orchestrator._execute_step(stuck, context(), make_schema([stuck]))
+
+    # The timed-out attempt still holds its thread: no second copy is started
+    assert result.status == "failed" and result.error_type == "timeout"
+    assert len(calls) == 1 and result.retry_count == 0
+    assert threads.get_stats()["abandoned"] == 1
+
+    quick = make_step(1, function="quick", circuit_breaker=False)
+    started = time.monotonic()
+    result = orchestrator._execute_step(quick, context(), make_schema([quick]))
+    assert result.status == "failed" and result.error_type == "capacity"
+    assert "timed-out step attempts are still running" in result.error_message
+    assert time.monotonic() - started < 0.5
+
+    release.set()
+    stop = time.monotonic() + 2
+    while threads.get_stats()["abandoned"] and time.monotonic() < stop:
+        time.sleep(0.01)
+    assert threads.get_stats()["running"] == 0
+    assert orchestrator._execute_step(quick, context(), make_schema([quick])).status == "completed"
+
+
+# ============================================================================
+# CIRCUIT BREAKERS
+# ============================================================================
+
+def test_circuit_breaker_opens_and_probes():
+    now = [0.0]
+    breaker = CircuitBreaker("llm:test", failure_threshold=2, recovery_seconds=30, clock=lambda: now[0])
+
+    def down():
+        raise ConnectionError("connection refused")
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            breaker.call(down)
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: "not called")
+
+    # Invalid input does not count against the dependency
+    closed = CircuitBreaker("engine:test", failure_threshold=1)
+    with pytest.raises(ValueError):
+        closed.call(lambda: (_ for _ in ()).throw(ValueError("invalid input")))
+    assert closed.state == "closed"
+
+    now[0] = 31.0
+    assert breaker.state == "half_open"
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # only one probe at a time
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.get_stats()["opened"] == 1
+
+
+def test_open_engine_breaker_fails_steps_fast(register, orchestrator, monkeypatch, make_step, make_schema):
+    monkeypatch.setattr(settings, "CIRCUIT_BREAKER_FAILURE_THRESHOLD", 2)
+    engine, calls = failing(100, "connection refused")
+    register("remote", engine)
+    step = make_step(1, function="remote")
+    schema = make_schema([step])
+
+    for _ in range(2):
+        assert orchestrator._execute_step(step, context(), schema).status == "failed"
+    result = orchestrator._execute_step(step, context(), schema)
+
+    assert len(calls) == 2
+    assert result.status == "failed"
+    assert result.error_message.startswith("Circuit breaker 'engine:tool.remote' is open")
+    assert get_circuit_breaker("engine:tool.remote").get_stats()["rejected"] == 1
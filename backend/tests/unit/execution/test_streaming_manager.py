@@ -0,0 +1,251 @@
+"""
+Unit Tests for Execution Event Streaming
+
+Tests cover:
+- Ring-buffer history with per-execution sequence numbers
+- Every concurrent stream_events() iterator receiving every event
+- Resuming after a Last-Event-ID; iterators ending on completion or close
+- Cross-worker fan-out through a broker, duplicates ignored
+- Cleanup of ended local and remote executions after the TTL
+- PostgresStreamBroker payload handling (own origin, NOTIFY size limit)
+- SSE endpoint resuming from the Last-Event-ID header
+"""
+
+import asyncio
+import json
+import threading
+from datetime import datetime
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.workflow_routes import router as workflow_router
+from app.execution import (
+    PostgresStreamBroker,
+    StreamBroker,
+    StreamEvent,
+    StreamEventType,
+    StreamingManager,
+    get_streaming_manager,
+)
+from app.execution.stream_broker import MAX_NOTIFY_PAYLOAD_BYTES
+
+
+def make_event(execution_id, event_type=StreamEventType.PROGRESS_UPDATE, **data):
+    return StreamEvent(
+        event_type=event_type,
+        execution_id=execution_id,
+        timestamp=datetime.utcnow().isoformat(),
+        data=data,
+    )
+
+
+class LinkedBroker(StreamBroker):
+    """Delivers published events to the other linked managers, like LISTEN/NOTIFY."""
+
+    name = "linked"
+
+    def __init__(self, peers):
+        self.peers = peers
+        self.handler = None
+
+    def start(self, on_remote_event):
+        self.handler = on_remote_event
+        self.peers.append(self)
+
+    def publish(self, payload):
+        for peer in self.peers:
+            if peer is not self:
+                peer.handler(json.loads(json.dumps(payload)))
+
+    def close(self):
+        self.peers.remove(self)
+
+
+# ============================================================================
+# HISTORY AND ITERATORS
+# ============================================================================
+
+def test_history_is_ring_buffer_with_sequences():
+    manager = StreamingManager(max_history=3)
+    for i in range(5):
+        manager.emit("exec-1", make_event("exec-1", step=i))
+    manager.emit("exec-2", make_event("exec-2"))
+
+    history = manager.get_event_history("exec-1")
+    assert [event.sequence for event in history] == [3, 4, 5]
+    assert [event.data["step"] for event in history] == [2, 3, 4]
+    assert [event.sequence for event in manager.get_event_history("exec-1", after_sequence=4)] == [5]
+    assert manager.get_event_history("exec-2")[0].sequence == 1
+    assert json.loads(history[0].to_json())["sequence"] == 3
+
+
+def test_concurrent_iterators_each_receive_every_event():
+    manager = StreamingManager()
+
+    async def consume():
+        return [event.sequence async for event in manager.stream_events("exec-1")]
+
+    async def scenario():
+        await manager.create_stream("exec-1")
+        consumers = [asyncio.create_task(consume()) for _ in range(3)]
+        await asyncio.sleep(0.01)
+
+        def run_execution():
+            for i in range(4):
+                manager.emit("exec-1", make_event("exec-1", step=i))
+            manager.emit("exec-1", make_event("exec-1", StreamEventType.EXECUTION_COMPLETED))
+
+        worker = threading.Thread(target=run_execution)
+        worker.start()
+        results = await asyncio.wait_for(asyncio.gather(*consumers), timeout=2)
+        worker.join()
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert results == [[1, 2, 3, 4, 5]] * 3
+    assert manager.stream_metadata["exec-1"]["status"] == "completed"
+    assert manager.get_stats()["active_subscribers"] == 0
+
+
+def test_resume_after_last_event_id_and_close_ends_iterator():
+    manager = StreamingManager()
+
+    async def scenario():
+        await manager.create_stream("exec-1")
+        for i in range(3):
+            manager.emit("exec-1", make_event("exec-1", step=i))
+
+        resumed = []
+
+        async def consume():
+            async for event in manager.stream_events("exec-1", last_event_id=2):
+                resumed.append(event.sequence)
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0.01)
+        manager.emit("exec-1", make_event("exec-1", step=3))
+        await asyncio.sleep(0.01)
+        await manager.close_stream("exec-1")
+        await asyncio.wait_for(consumer, timeout=2)
+
+        # A closed stream only replays its history
+        replay = [event.sequence async for event in manager.stream_events("exec-1")]
+        return resumed, replay
+
+    resumed, replay = asyncio.run(scenario())
+
+    assert resumed == [3, 4]
+    assert replay == [1, 2, 3, 4]
+
+
+# ============================================================================
+# BROKERS
+# ============================================================================
+
+def test_events_fan_out_to_other_workers_once():
+    peers = []
+    runner, streamer = StreamingManager(broker=LinkedBroker(peers)), StreamingManager(broker=LinkedBroker(peers))
+    runner.start()
+    streamer.start()
+
+    async def scenario():
+        consumer = asyncio.create_task(_collect(streamer.stream_events("exec-1")))
+        await asyncio.sleep(0.01)
+        runner.emit("exec-1", make_event("exec-1", step=0))
+        duplicate = runner.get_event_history("exec-1")[0].to_dict()
+        streamer._receive_remote(duplicate)  # redelivered notification
+        runner.emit("exec-1", make_event("exec-1", StreamEventType.EXECUTION_FAILED, error_message="boom"))
+        return await asyncio.wait_for(consumer, timeout=2)
+
+    received = asyncio.run(scenario())
+
+    assert [(event.sequence, event.event_type) for event in received] == [
+        (1, StreamEventType.PROGRESS_UPDATE), (2, StreamEventType.EXECUTION_FAILED)
+    ]
+    assert [event.sequence for event in streamer.get_event_history("exec-1")] == [1, 2]
+    assert streamer.get_stats()["remote_events"] == 2
+
+
+async def _collect(events):
+    return [event async for event in events]
+
+
+def test_cleanup_drops_ended_local_and_remote_executions():
+    manager = StreamingManager(cleanup_after_seconds=0)
+
+    async def scenario():
+        await manager.create_stream("local")
+        manager.emit("local", make_event("local", StreamEventType.EXECUTION_COMPLETED))
+        for sequence, event_type in ((1, StreamEventType.PROGRESS_UPDATE), (2, StreamEventType.EXECUTION_FAILED)):
+            remote = make_event("remote", event_type)
+            remote.sequence = sequence
+            manager._receive_remote(remote.to_dict())
+        manager.emit("running", make_event("running", step=1))
+        return await manager.cleanup_old_streams()
+
+    assert asyncio.run(scenario()) == 2
+    assert manager.get_event_history("local") == []
+    assert manager.get_event_history("remote") == []
+    assert "local" not in manager.stream_metadata
+    assert set(manager._sequences) == {"running"}
+    assert manager.get_stats()["streams_cleaned_up"] == 2
+
+    # Within the TTL nothing is removed
+    manager.cleanup_after_seconds = 3600
+    manager.emit("running", make_event("running", StreamEventType.EXECUTION_COMPLETED))
+    assert asyncio.run(manager.cleanup_old_streams()) == 0
+    assert len(manager.get_event_history("running")) == 2
+
+
+def test_postgres_broker_skips_own_notifications_and_fits_payload_limit():
+    received = []
+    broker = PostgresStreamBroker("postgresql://unused", db=object())
+    broker._on_remote_event = received.append
+
+    event = make_event("exec-1", StreamEventType.STEP_COMPLETED, step_number=2, output={"rows": "x" * 20000})
+    event.sequence = 7
+    message = broker.encode(event.to_dict())
+
+    assert len(message.encode("utf-8")) <= MAX_NOTIFY_PAYLOAD_BYTES
+    broker.handle_notification(message)
+    assert received == []  # published by this worker
+
+    other = PostgresStreamBroker("postgresql://unused", db=object())
+    other._on_remote_event = received.append
+    other.handle_notification(message)
+    other.handle_notification("not json")
+
+    assert len(received) == 1
+    assert received[0]["sequence"] == 7
+    assert received[0]["data"] == {"step_number": 2, "truncated": True}
+
+
+# ============================================================================
+# SSE ENDPOINT
+# ============================================================================
+
+def test_sse_endpoint_resumes_from_last_event_id():
+    app = FastAPI()
+    app.include_router(workflow_router)
+    execution_id = str(uuid4())
+
+    manager = get_streaming_manager()
+    for i in range(3):
+        manager.emit(execution_id, make_event(execution_id, step=i))
+    manager.emit(execution_id, make_event(execution_id, StreamEventType.EXECUTION_COMPLETED))
+
+    with TestClient(app) as client:
+        response = client.get(
+            f"/api/v1/workflows/stream/{execution_id}/events",
+            headers={"Last-Event-ID": "2"},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    messages = [block.splitlines() for block in response.text.strip().split("\n\n")]
+    assert [lines[0] for lines in messages] == ["id: 3", "id: 4"]
+    assert messages[1][1] == "event: execution_completed"
+    assert json.loads(messages[0][2][len("data: "):])["data"] == {"step": 2}
@@ -0,0 +1,138 @@
+"""
+Unit Tests for Compiled JSON Schema Validation
+
+Tests cover:
+- Validators compiled once per (schema id, version) key and per schema content
+- Invalid schemas cached and reported as validation issues
+- LRU eviction of compiled validators
+- SchemaService rejecting invalid input/output schemas before touching the database
+- WorkflowOrchestrator._validate_input running full JSON Schema validation
+"""
+
+import pytest
+from uuid import uuid4
+
+from app.execution.validation_engine import ValidationEngine, ValidatorCache, check_json_schema
+from app.schemas.workflow.schema_models import DeliverableSchemaCreate, WorkflowStep
+from app.services.schema_service import SchemaService
+from app.services.workflow_orchestrator import WorkflowOrchestrator
+
+
+FOOTING_INPUT_SCHEMA = {
+    "type": "object",
+    "required": ["axial_load_dead", "column_width"],
+    "properties": {
+        "axial_load_dead": {"type": "number", "minimum": 0, "maximum": 10000},
+        "column_width": {"type": "number", "minimum": 0.2},
+        "concrete_grade": {"type": "string", "enum": ["M20", "M25", "M30"]},
+    },
+}
+
+INVALID_SCHEMA = {"type": "object", "properties": {"load": {"type": "decimal"}}}
+
+
+@pytest.fixture
+def engine():
+    return ValidationEngine(validation_cache=ValidatorCache())
+
+
+# ============================================================================
+# VALIDATOR CACHE
+# ============================================================================
+
+def test_validator_compiled_once_per_key(engine):
+    key = (uuid4(), 3, "input")
+    for load in (100.0, 200.0, 300.0):
+        assert engine.validate_input({"axial_load_dead": load, "column_width": 0.4}, FOOTING_INPUT_SCHEMA, schema_key=key).valid
+
+    # Same content without an id/version: one more compile, then content-hash hits
+    engine.validate_input({"axial_load_dead": 1.0, "column_width": 0.4}, FOOTING_INPUT_SCHEMA)
+    engine.validate_input({"axial_load_dead": 2.0, "column_width": 0.4}, dict(FOOTING_INPUT_SCHEMA))
+
+    stats = engine.validation_cache.get_stats()
+    assert stats["compiles"] == 2
+    assert stats["hits"] == 3
+
+
+def test_invalid_schema_cached_and_reported(engine):
+    first = engine.validate_input({"load": 1}, INVALID_SCHEMA)
+    second = engine.validate_input({"load": 1}, INVALID_SCHEMA)
+
+    assert not first.valid and not second.valid
+    assert "Invalid JSON Schema" in second.error_messages[0]
+    stats = engine.validation_cache.get_stats()
+    assert stats["compiles"] == 1
+    assert stats["invalid_schemas"] == 1
+
+
+def test_validator_cache_evicts_least_recently_used():
+    cache = ValidatorCache(max_entries=2)
+    for key in ("a", "b", "a", "c"):
+        cache.get(FOOTING_INPUT_SCHEMA, key)
+
+    assert cache.get_stats()["evictions"] == 1
+    cache.get(FOOTING_INPUT_SCHEMA, "a")
+    assert cache.get_stats()["compiles"] == 3  # "a" survived, "b" was evicted
+
+
+# ============================================================================
+# SCHEMA SERVICE
+# ============================================================================
+
+class UnreachableDatabase:
+    def __getattr__(self, name):
+        raise AssertionError("Invalid schemas must be rejected before any database call")
+
+
+def test_check_json_schema_reports_location():
+    with pytest.raises(ValueError, match="Invalid input_schema at properties.load.type"):
+        check_json_schema(INVALID_SCHEMA, "input_schema")
+    check_json_schema(FOOTING_INPUT_SCHEMA, "input_schema")
+
+
+def test_create_schema_rejects_invalid_input_schema():
+    service = SchemaService.__new__(SchemaService)
+    service.db = UnreachableDatabase()
+    service.cache = UnreachableDatabase()
+
+    schema_data = DeliverableSchemaCreate(
+        deliverable_type="test_invalid_input_schema",
+        display_name="Invalid Input Schema",
+        discipline="civil",
+        workflow_steps=[
+            WorkflowStep(
+                step_number=1,
+                step_name="design",
+                function_to_call="civil_foundation_designer_v1.design_isolated_footing",
+                input_mapping={"load": "$input.load"},
+                output_variable="design_data",
+            )
+        ],
+        input_schema=INVALID_SCHEMA,
+    )
+
+    with pytest.raises(ValueError, match="Invalid input_schema"):
+        service.create_schema(schema_data, "test_user")
+
+
+# ============================================================================
+# WORKFLOW ORCHESTRATOR
+# ============================================================================
+
+def test_orchestrator_validate_input_is_full_validation():
+    orchestrator = WorkflowOrchestrator.__new__(WorkflowOrchestrator)
+    orchestrator.validation_engine = ValidationEngine(validation_cache=ValidatorCache())
+    key = (uuid4(), 1, "input")
+
+    with pytest.raises(ValueError, match="Required field missing: column_width"):
+        orchestrator._validate_input({"axial_load_dead": 600.0}, FOOTING_INPUT_SCHEMA, schema_key=key)
+
+    with pytest.raises(ValueError, match="Input validation failed"):
+        orchestrator._validate_input(
+            {"axial_load_dead": -5.0, "column_width": "wide", "concrete_grade": "M99"},
+            FOOTING_INPUT_SCHEMA,
+            schema_key=key
+        )
+
+    orchestrator._validate_input({"axial_load_dead": 600.0, "column_width": 0.4}, FOOTING_INPUT_SCHEMA, schema_key=key)
+    assert orchestrator.validation_engine.validation_cache.get_stats()["compiles"] == 1
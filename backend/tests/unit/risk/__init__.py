@@ -5,4 +5,5 @@ Unit Tests for Risk Module
 Test modules:
 - test_rule_parser.py: Tests for RiskRuleParser
 - test_dynamic_engine.py: Tests for DynamicRiskEngine
+- test_historical_stats.py: Tests for HistoricalStatsStore
 """
@@ -0,0 +1,188 @@
+"""
+Unit Tests for the Historical Statistics Store
+
+Tests cover:
+- Welford mean/std and merged buckets matching numpy
+- Quantile sketch within its relative accuracy
+- Sliding time windows over day buckets
+- Lazy rebuild from the execution history loader (no double counting)
+- Periodic refresh from the loader; totals kept within the bucket retention
+- AnomalyRiskCalculator and historical baseline read from store summaries
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.risk.calculators import AnomalyRiskCalculator
+from app.risk.engine import RiskAssessmentEngine
+from app.risk.historical_stats import HistoricalStatsStore, QuantileSketch, RunningStats
+
+DAY = 86400
+
+
+def footing(length, steel=120.0):
+    return {
+        "footing_length_final": length,
+        "footing_width_final": length,
+        "footing_depth_final": 0.5,
+        "material_quantities": {"steel_weight_total": steel, "concrete_volume_m3": length * length * 0.5},
+        "design_ok": True,
+    }
+
+
+HISTORY = [footing(2.0 + 0.05 * (i % 5)) for i in range(20)]
+
+
+# ============================================================================
+# RUNNING STATISTICS
+# ============================================================================
+
+def test_running_stats_match_numpy_when_merged():
+    rng = random.Random(7)
+    values = [rng.uniform(0.5, 4.0) for _ in range(500)]
+
+    first, second = RunningStats(), RunningStats()
+    for value in values[:200]:
+        first.add(value)
+    for value in values[200:]:
+        second.add(value)
+    first.merge(second)
+
+    assert first.count == 500
+    assert first.mean == pytest.approx(np.mean(values), rel=1e-12)
+    assert first.std == pytest.approx(np.std(values), rel=1e-9)
+    assert (first.min, first.max) == (min(values), max(values))
+
+
+def test_quantile_sketch_relative_accuracy():
+    rng = random.Random(3)
+    values = [rng.lognormvariate(0, 1) for _ in range(5000)] + [0.0, -2.5]
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+
+    for q in (0.5, 0.95):
+        exact = float(np.quantile(values, q, method="lower"))
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.011)
+    assert sketch.quantile(0.0) == pytest.approx(-2.5, rel=0.011)
+
+
+# ============================================================================
+# STORE
+# ============================================================================
+
+def test_store_sliding_window_and_totals():
+    store = HistoricalStatsStore(bucket_seconds=DAY)
+    now = datetime(2026, 6, 30, 12)
+    for days_ago, length in ((100, 9.0), (5, 2.0), (1, 3.0)):
+        store.record("foundation_design", footing(length), now - timedelta(days=days_ago))
+
+    epoch = now.timestamp()
+    all_time = store.snapshot("foundation_design", now=epoch)
+    recent = store.snapshot("foundation_design", ["footing_length_final"], window_seconds=30 * DAY, now=epoch)
+
+    assert all_time.sample_size == 3
+    assert all_time.get("footing_length_final").max == 9.0
+    assert "material_quantities.steel_weight_total" in all_time.parameters
+    assert "design_ok" not in all_time.parameters
+    assert recent.sample_size == 2
+    assert recent.get("footing_length_final").mean == pytest.approx(2.5)
+    assert list(recent.parameters) == ["footing_length_final"]
+    assert store.snapshot("unknown_type").sample_size == 0
+
+
+def test_store_lazy_rebuild_does_not_double_count():
+    calls = []
+
+    def loader(deliverable_type, since):
+        calls.append(deliverable_type)
+        return [("foundation_design", design, datetime.utcnow()) for design in HISTORY]
+
+    store = HistoricalStatsStore(loader=loader, retention_seconds=365 * DAY)
+    # First record for a type loads its committed history, which already holds this execution
+    store.record("foundation_design", HISTORY[-1])
+    store.record("foundation_design", footing(2.5))
+
+    summary = store.snapshot("foundation_design")
+    assert calls == ["foundation_design"]
+    assert summary.sample_size == len(HISTORY) + 1
+
+    assert store.rebuild() == len(HISTORY)
+    assert store.snapshot("foundation_design").sample_size == len(HISTORY)
+
+
+def test_store_refreshes_history_other_workers_finalized(monkeypatch):
+    committed = [("foundation_design", design, datetime.utcnow()) for design in HISTORY[:5]]
+    store = HistoricalStatsStore(loader=lambda deliverable_type, since: list(committed), refresh_seconds=600)
+    clock = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+
+    assert store.snapshot("foundation_design").sample_size == 5
+    committed.append(("foundation_design", footing(3.0), datetime.utcnow()))  # another worker
+    assert store.snapshot("foundation_design").sample_size == 5
+
+    clock[0] += 600
+    summary = store.snapshot("foundation_design")
+    assert summary.sample_size == 6
+    assert summary.get("footing_length_final").max == 3.0
+    assert store.get_stats()["rebuilds"] == 2
+
+
+def test_store_totals_follow_bucket_retention():
+    store = HistoricalStatsStore(bucket_seconds=DAY, retention_seconds=30 * DAY)
+    now = datetime.utcnow()
+    store.record("foundation_design", footing(2.0), now - timedelta(days=5))
+    store.record("foundation_design", footing(9.0), now - timedelta(days=29, hours=23))
+
+    assert store.snapshot("foundation_design").get("footing_length_final").max == 9.0
+    # A day later the 9.0 m footing is out of retention: totals drop it with its bucket
+    store.retention_seconds = 29 * DAY
+    summary = store.snapshot("foundation_design")
+    assert summary.sample_size == 1
+    assert summary.get("footing_length_final").max == 2.0
+
+
+# ============================================================================
+# RISK CALCULATORS
+# ============================================================================
+
+def test_anomaly_calculator_same_result_from_store_and_raw_history():
+    outlier = footing(3.5, steel=400.0)
+    raw_context = {"historical_data": HISTORY}
+    raw_risk = AnomalyRiskCalculator().calculate(outlier, raw_context)
+
+    store = HistoricalStatsStore()
+    for design in HISTORY:
+        store.record("foundation_design", design)
+    store_context = {"historical_summary": store.snapshot("foundation_design")}
+    store_risk = AnomalyRiskCalculator().calculate(outlier, store_context)
+
+    assert raw_risk == store_risk > 0
+    assert raw_context["anomalies_detected"] == store_context["anomalies_detected"]
+    assert AnomalyRiskCalculator().calculate(outlier, {"historical_data": HISTORY[:5]}) == 0.0
+
+
+def test_engine_baseline_reads_store_for_deliverable_type():
+    store = HistoricalStatsStore()
+    for design in HISTORY:
+        store.record("foundation_design", design)
+    engine = RiskAssessmentEngine(stats_store=store)
+
+    summary = engine._historical_summary(None, "foundation_design")
+    baseline = engine._calculate_historical_baseline(footing(2.1), summary)
+
+    lengths = [d["footing_length_final"] for d in HISTORY]
+    assert baseline["sample_size"] == len(HISTORY)
+    assert baseline["footing_length_final"]["mean"] == round(np.mean(lengths), 3)
+    assert baseline["footing_length_final"]["std"] == round(np.std(lengths), 3)
+    assert baseline["footing_length_final"]["median"] == pytest.approx(np.median(lengths), rel=0.01)
+    assert AnomalyRiskCalculator().calculate(footing(2.1), {"historical_summary": summary}) == 0.0
+
+    # Explicit history overrides the store
+    explicit = engine._historical_summary(HISTORY[:12], "foundation_design")
+    assert engine._calculate_historical_baseline({}, explicit)["sample_size"] == 12
+    assert engine._historical_summary(None, None) is None
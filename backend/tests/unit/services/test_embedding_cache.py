@@ -0,0 +1,150 @@
+"""
+Unit Tests for the Embedding Cache
+
+Tests cover:
+- Content-hash keys (model, dimensions, normalized text)
+- float32 blob round trip and LRU eviction
+- SQLite backing store persistence across cache instances
+- EmbeddingService sending only cache misses to the API
+"""
+
+from array import array
+
+from app.services.embedding_cache import (
+    EmbeddingCache,
+    SQLiteEmbeddingStore,
+    decode_vector,
+    embedding_cache_key,
+    encode_vector
+)
+from app.services.embedding_service import EmbeddingService
+
+
+class FakeEmbeddingsClient:
+    """Records every text sent to the API."""
+
+    def __init__(self):
+        self.sent = []
+
+    def embed_query(self, text):
+        self.sent.append(text)
+        return [float(len(text)), 0.5]
+
+    def embed_documents(self, texts):
+        self.sent.extend(texts)
+        return [[float(len(text)), 0.5] for text in texts]
+
+
+def make_service(cache, batch_size=2):
+    service = EmbeddingService.__new__(EmbeddingService)
+    service.model = "text-embedding-3-large"
+    service.dimensions = 1536
+    service.batch_size = batch_size
+    service.cache = cache
+    service.embeddings_client = FakeEmbeddingsClient()
+    return service
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+def test_key_normalizes_whitespace_but_not_model_or_dimensions():
+    key = embedding_cache_key("m", 1536, "concrete  M25\n")
+    assert key == embedding_cache_key("m", 1536, " concrete M25")
+    assert key != embedding_cache_key("m", 512, "concrete M25")
+    assert key != embedding_cache_key("other", 1536, "concrete M25")
+    assert key != embedding_cache_key("m", 1536, "Concrete M25")
+
+
+def test_vectors_are_stored_as_float32_blobs():
+    vector = [0.1, -2.5, 3.0]
+    blob = encode_vector(vector)
+
+    assert len(blob) == 4 * len(vector)
+    assert decode_vector(blob) == array("f", vector).tolist()
+
+
+def test_lru_eviction_and_stats():
+    cache = EmbeddingCache(max_entries=2)
+    cache.put("m", 2, "a", [1.0, 1.0])
+    cache.put("m", 2, "b", [2.0, 2.0])
+    cache.get("m", 2, "a")  # "b" becomes least recently used
+    cache.put("m", 2, "c", [3.0, 3.0])
+
+    assert cache.get("m", 2, "b") is None
+    assert cache.get("m", 2, "a") == [1.0, 1.0]
+
+    stats = cache.get_stats()
+    assert stats["evictions"] == 1
+    assert stats["memory_hits"] == 2
+    assert stats["misses"] == 1
+
+
+def test_sqlite_store_survives_new_cache_instance(tmp_path):
+    path = str(tmp_path / "embeddings.sqlite3")
+    first = EmbeddingCache(store=SQLiteEmbeddingStore(path))
+    first.put_many("m", 2, ["slab", "beam"], [[1.0, 2.0], [3.0, 4.0]])
+    first.store.close()
+
+    second = EmbeddingCache(store=SQLiteEmbeddingStore(path))
+    hits = second.get_many("m", 2, ["beam", "column", "slab"])
+
+    assert hits == {0: [3.0, 4.0], 2: [1.0, 2.0]}
+    assert second.get_stats()["store_hits"] == 2
+    # Store hits are promoted to the memory tier
+    second.get("m", 2, "slab")
+    assert second.get_stats()["memory_hits"] == 1
+
+
+def test_store_errors_do_not_fail_lookups():
+    class BrokenStore:
+        def get_many(self, keys):
+            raise OSError("disk unavailable")
+
+        def put_many(self, entries):
+            raise OSError("disk unavailable")
+
+    cache = EmbeddingCache(store=BrokenStore())
+    cache.put("m", 2, "a", [1.0, 1.0])
+
+    assert cache.get("m", 2, "a") == [1.0, 1.0]
+    assert cache.get("m", 2, "b") is None
+    assert cache.get_stats()["store_errors"] == 2
+
+
+# ============================================================================
+# EMBEDDING SERVICE
+# ============================================================================
+
+def test_generate_embedding_uses_cache():
+    service = make_service(EmbeddingCache())
+
+    first = service.generate_embedding("concrete M25")
+    second = service.generate_embedding("concrete  M25 ")
+
+    assert first == second
+    assert service.embeddings_client.sent == ["concrete M25"]
+
+
+def test_batch_sends_only_unique_misses():
+    service = make_service(EmbeddingCache())
+    service.generate_embedding("concrete M25")
+
+    texts = ["concrete M25", "steel Fe500", "formwork", "steel Fe500", "excavation"]
+    embeddings = service.generate_embeddings_batch(texts)
+
+    assert service.embeddings_client.sent == ["concrete M25", "steel Fe500", "formwork", "excavation"]
+    assert embeddings == [[float(len(t)), 0.5] for t in texts]
+
+    service.embeddings_client.sent.clear()
+    assert service.generate_embeddings_batch(texts) == embeddings
+    assert service.embeddings_client.sent == []
+
+
+def test_service_without_cache_always_calls_api():
+    service = make_service(None)
+    service.generate_embedding("formwork")
+    service.generate_embedding("formwork")
+
+    assert service.embeddings_client.sent == ["formwork", "formwork"]
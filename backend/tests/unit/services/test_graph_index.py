@@ -0,0 +1,257 @@
+"""
+Unit Tests for the SKG Graph Index
+
+Tests cover:
+- Path search from one index load (no per-node neighbor queries)
+- Entity names fetched once per entity type per response
+- Related entities and k-hop neighborhoods answered in memory
+- Incremental refresh on relationship create/delete, including compaction
+- Traversal results resolved before compaction can renumber edges
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.schemas.skg.relationship_models import (
+    GraphPathRequest,
+    KnowledgeEntityType,
+    KnowledgeRelationshipCreate,
+    NeighborhoodRequest,
+    RelatedEntityRequest,
+    RelationshipType,
+)
+from app.services.skg import graph_index as graph_index_module
+from app.services.skg.graph_index import GraphIndex, get_graph_index_cache
+from app.services.skg.relationship_service import KnowledgeRelationshipService
+
+COST = KnowledgeEntityType.COST_ITEM
+RULE = KnowledgeEntityType.RULE
+LESSON = KnowledgeEntityType.LESSON
+
+# rule_a --impacts--> cost_1 --related_to--> cost_2 <--caused_by-- lesson_x
+#    \---prevents--> lesson_x
+RULE_A, COST_1, COST_2, LESSON_X, COST_ISOLATED = (uuid4() for _ in range(5))
+
+NAMES = {
+    RULE_A: "Minimum cover rule",
+    COST_1: "M30 concrete",
+    COST_2: "Fe500 steel",
+    LESSON_X: "Honeycombing at column base",
+}
+
+
+def relationship(source, target, rel_type, strength):
+    return {
+        "id": str(uuid4()),
+        "source_type": source[0].value,
+        "source_id": str(source[1]),
+        "target_type": target[0].value,
+        "target_id": str(target[1]),
+        "relationship_type": rel_type.value,
+        "strength": Decimal(strength),
+        "description": None,
+        "metadata": {},
+        "created_by": "engineer",
+        "created_at": datetime(2026, 1, 1),
+    }
+
+
+ROWS = [
+    relationship((RULE, RULE_A), (COST, COST_1), RelationshipType.IMPACTS, "0.90"),
+    relationship((COST, COST_1), (COST, COST_2), RelationshipType.RELATED_TO, "0.50"),
+    relationship((LESSON, LESSON_X), (COST, COST_2), RelationshipType.CAUSED_BY, "0.80"),
+    relationship((RULE, RULE_A), (LESSON, LESSON_X), RelationshipType.PREVENTS, "0.60"),
+]
+
+
+def entity_names(params):
+    ids = set(params[0])
+    return [
+        {"id": str(entity_id), "item_name": name, "item_code": "X", "rule_name": name,
+         "description": None, "title": name, "issue_description": "Observed on site"}
+        for entity_id, name in NAMES.items() if str(entity_id) in ids
+    ]
+
+
+# ============================================================================
+# TRAVERSALS
+# ============================================================================
+
+class TestGraphTraversals:
+    """Tests for KnowledgeRelationshipService traversals on the shared graph index."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_graph_index(self):
+        """Start and end every test with an empty graph index cache."""
+        get_graph_index_cache().invalidate()
+        yield
+        get_graph_index_cache().invalidate()
+
+    @pytest.fixture
+    def rows(self):
+        """Provide a per-test copy of the relationship rows (writes modify it)."""
+        return [dict(row) for row in ROWS]
+
+    @pytest.fixture
+    def service(self, fake_db, rows) -> KnowledgeRelationshipService:
+        """Provide a KnowledgeRelationshipService over knowledge_relationships and entity names."""
+
+        def insert(params):
+            row = relationship(
+                (KnowledgeEntityType(params[1]), params[2]),
+                (KnowledgeEntityType(params[3]), params[4]),
+                RelationshipType(params[5]),
+                str(params[6]),
+            )
+            row["id"] = params[0]
+            rows.append(row)
+            return [row]
+
+        def delete(params):
+            found = [row for row in rows if row["id"] == params[0]]
+            rows[:] = [row for row in rows if row["id"] != params[0]]
+            return [{"id": row["id"]} for row in found]
+
+        fake_db.on("INSERT INTO knowledge_relationships", insert)
+        fake_db.on("DELETE FROM knowledge_relationships", delete)
+        fake_db.on("FROM knowledge_relationships", rows)
+        fake_db.on("ANY(%s::uuid[])", entity_names)
+        return KnowledgeRelationshipService()
+
+    def test_find_paths_uses_one_load_and_batched_names(self, service, fake_db):
+        """Test that path search uses one index load and one name query per entity type."""
+        request = GraphPathRequest(start_type=RULE, start_id=RULE_A, end_type=COST, end_id=COST_2, max_depth=3)
+
+        first = service.find_paths(request)
+        queries_after_first = len(fake_db.queries)
+        second = service.find_paths(request)
+
+        # One load, then at most one name query per entity type per response
+        assert queries_after_first == 1 + 3
+        assert len(fake_db.queries) - queries_after_first == 3
+        assert second == first
+
+        assert first.paths_found == 2
+        routes = [[node.entity_name for node in path.nodes] for path in first.paths]
+        assert routes == [
+            ["Minimum cover rule", "Honeycombing at column base", "Fe500 steel"],
+            ["Minimum cover rule", "M30 concrete", "Fe500 steel"],
+        ]
+        strongest = first.paths[0]
+        assert strongest.total_strength == Decimal("0.60") * Decimal("0.80")
+        assert [edge.direction for edge in strongest.edges] == ["forward", "forward"]
+        assert first.start_entity.entity_name == "Minimum cover rule"
+
+    def test_find_paths_respects_depth_and_relationship_filter(self, service):
+        """Test that max_depth and relationship_types limit the paths found."""
+        shallow = service.find_paths(GraphPathRequest(
+            start_type=COST, start_id=COST_1, end_type=LESSON, end_id=LESSON_X, max_depth=1
+        ))
+        filtered = service.find_paths(GraphPathRequest(
+            start_type=COST, start_id=COST_1, end_type=LESSON, end_id=LESSON_X, max_depth=3,
+            relationship_types=[RelationshipType.RELATED_TO, RelationshipType.CAUSED_BY]
+        ))
+
+        assert shallow.paths_found == 0
+        assert filtered.paths_found == 1
+        assert [edge.direction for edge in filtered.paths[0].edges] == ["forward", "reverse"]
+
+    def test_related_entities_strongest_first_with_filters(self, service):
+        """Test related entities ordering, strength and direction filters."""
+        response = service.get_related_entities(RelatedEntityRequest(
+            entity_type=COST, entity_id=COST_2, min_strength=Decimal("0.55")
+        ))
+
+        assert [(e.entity_id, e.relationship_direction) for e in response.related_entities] == [
+            (LESSON_X, "incoming")
+        ]
+        assert response.related_entities[0].entity_summary == "Observed on site"
+        assert response.source_name == "Fe500 steel"
+
+        outgoing_only = service.get_related_entities(RelatedEntityRequest(
+            entity_type=RULE, entity_id=RULE_A, include_reverse=False, target_types=[COST]
+        ))
+        assert [e.entity_id for e in outgoing_only.related_entities] == [COST_1]
+
+    def test_k_hop_neighborhood(self, service):
+        """Test that the neighborhood holds each entity at its hop distance."""
+        response = service.get_neighborhood(NeighborhoodRequest(entity_type=COST, entity_id=COST_1, hops=2))
+
+        distances = {e.entity_id: e.distance for e in response.entities}
+        assert distances == {RULE_A: 1, COST_2: 1, LESSON_X: 2}
+        assert [e.distance for e in response.entities] == sorted(distances.values())
+
+    def test_unknown_entity_has_no_paths_or_neighbors(self, service):
+        """Test that an entity without relationships has no paths or neighbors."""
+        paths = service.find_paths(GraphPathRequest(
+            start_type=COST, start_id=COST_ISOLATED, end_type=COST, end_id=COST_2
+        ))
+        neighborhood = service.get_neighborhood(NeighborhoodRequest(entity_type=COST, entity_id=COST_ISOLATED))
+
+        assert paths.paths_found == 0
+        assert paths.start_entity.entity_name == "Unknown"
+        assert neighborhood.total_entities == 0
+
+    def test_create_and_delete_update_loaded_index_in_place(self, service):
+        """Test that creating and deleting a relationship updates the loaded index without a reload."""
+        service.get_graph_index()
+        loads = get_graph_index_cache().get_stats()["loads"]
+
+        created = service.create_relationship(KnowledgeRelationshipCreate(
+            source_type=COST, source_id=COST_2, target_type=COST, target_id=COST_ISOLATED,
+            relationship_type=RelationshipType.RELATED_TO, strength=Decimal("0.7"), created_by="engineer"
+        ))
+        reach = service.get_neighborhood(NeighborhoodRequest(entity_type=COST, entity_id=COST_ISOLATED, hops=1))
+        assert [e.entity_id for e in reach.entities] == [COST_2]
+
+        assert service.delete_relationship(created.id, "engineer")
+        reach = service.get_neighborhood(NeighborhoodRequest(entity_type=COST, entity_id=COST_ISOLATED, hops=1))
+        assert reach.total_entities == 0
+
+        assert get_graph_index_cache().get_stats()["loads"] == loads
+
+
+# ============================================================================
+# INCREMENTAL REFRESH
+# ============================================================================
+
+class TestGraphIndexCompaction:
+    """Tests for GraphIndex compaction after incremental updates."""
+
+    def test_compaction_matches_fresh_build(self, monkeypatch):
+        """Test that a compacted index answers like one built from scratch."""
+        monkeypatch.setattr(graph_index_module, "MIN_COMPACTION_DELTA", 2)
+        index = GraphIndex(ROWS[:2])
+        for row in ROWS[2:]:
+            index.add_relationship(row)
+        index.remove_relationship(ROWS[1]["id"])
+        index.add_relationship(ROWS[1])  # re-added after removal
+
+        fresh = GraphIndex(ROWS)
+        start, end = (RULE, RULE_A), (COST, COST_2)
+
+        def routes(paths):
+            return sorted(nodes for nodes, _ in paths)
+
+        assert len(index) == len(fresh) == 4
+        assert routes(index.find_paths(start, end, 3)) == routes(fresh.find_paths(start, end, 3))
+
+    def test_traversal_results_survive_compaction(self, monkeypatch):
+        """Test that returned edges stay correct after a delete renumbers the index."""
+        monkeypatch.setattr(graph_index_module, "MIN_COMPACTION_DELTA", 1)
+        index = GraphIndex(ROWS)
+
+        paths = index.find_paths((RULE, RULE_A), (COST, COST_2), 3)
+        related = index.related((COST, COST_2))
+        index.remove_relationship(ROWS[0]["id"])  # compacts: every later edge moves down
+
+        assert [[edge.relationship_id for edge, _ in edges] for _, edges in paths] == [
+            [ROWS[0]["id"], ROWS[1]["id"]], [ROWS[3]["id"], ROWS[2]["id"]]
+        ]
+        assert paths[0][1][0][0].source == (RULE, RULE_A)
+        assert [(neighbor, edge.relationship_id) for neighbor, edge, _ in related] == [
+            ((LESSON, LESSON_X), ROWS[2]["id"]), ((COST, COST_1), ROWS[1]["id"])
+        ]
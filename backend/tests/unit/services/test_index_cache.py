@@ -0,0 +1,49 @@
+"""
+Unit Tests for the SKG Index Cache
+
+Tests cover:
+- Index loaded once and served until the TTL expires or it is invalidated
+- In-place updates applied only to a loaded index
+- Size reported under the index's own label
+"""
+
+import time
+
+from app.services.skg.index_cache import IndexCache
+
+
+class TestIndexCache:
+    """IndexCache loading, expiry and updates"""
+
+    def test_loads_once_until_ttl_or_invalidation(self, monkeypatch):
+        """Hits within the TTL reuse the index; expiry and invalidate() reload it."""
+        clock = [1000.0]
+        monkeypatch.setattr(time, "time", lambda: clock[0])
+        cache = IndexCache("test index", "rows", ttl_seconds=60)
+        loads = []
+
+        def loader():
+            loads.append(1)
+            return [len(loads)] * 3
+
+        assert cache.get(loader) == [1, 1, 1]
+        clock[0] += 59
+        assert cache.get(loader) == [1, 1, 1]
+        clock[0] += 1
+        assert cache.get(loader) == [2, 2, 2]
+        cache.invalidate()
+        assert cache.get(loader) == [3, 3, 3]
+
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["loads"], stats["invalidations"]) == (1, 3, 1)
+        assert stats["rows"] == 3
+
+    def test_apply_updates_only_a_loaded_index(self):
+        """apply() is a no-op before the first load and mutates the cached index after it."""
+        cache = IndexCache("test index", "rows")
+        cache.apply(lambda index: index.append("lost"))
+        index = cache.get(list)
+        cache.apply(lambda index: index.append("row"))
+
+        assert cache.get(list) is index and index == ["row"]
+        assert cache.get_stats()["updates"] == 1
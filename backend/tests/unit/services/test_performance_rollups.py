@@ -0,0 +1,158 @@
+"""
+Unit Tests for Execution Performance Rollups
+
+Tests cover:
+- Mean / sample std from rollup sums matching AVG / STDDEV over raw executions
+- Histogram percentiles and bounds kept in sync with init_performance_rollups.sql
+- PerformanceAnalyzer reading rollups: version comparison filters, trends,
+  period metrics (no scan of csa.workflow_executions)
+"""
+
+import random
+import re
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from app.schemas.versioning.models import VersionComparisonRequest
+from app.services.versioning.performance_analyzer import PerformanceAnalyzer
+from app.services.versioning.performance_rollups import (
+    RISK_HISTOGRAM_BOUNDS,
+    TIME_HISTOGRAM_BOUNDS_MS,
+    PerformanceRollupStore,
+    RollupStats,
+)
+
+ROLLUP_SQL = Path(__file__).resolve().parents[3] / "init_performance_rollups.sql"
+
+
+def rollup_row(times, risks, successful, failed=0):
+    """What SUM()ing the rollup buckets of these executions returns."""
+    time_histogram = [0] * (len(TIME_HISTOGRAM_BOUNDS_MS) + 1)
+    for t in times:
+        time_histogram[int(np.searchsorted(TIME_HISTOGRAM_BOUNDS_MS, t, side="right"))] += 1
+    return {
+        "total": len(times), "successful": successful, "failed": failed, "pending": 0, "hitl": 0,
+        "time_count": len(times), "time_sum": sum(times), "time_sum_sq": sum(t * t for t in times),
+        "time_min": min(times), "time_max": max(times), "time_histogram": time_histogram,
+        "risk_count": len(risks), "risk_sum": sum(risks), "risk_sum_sq": sum(r * r for r in risks),
+        "risk_min": min(risks), "risk_max": max(risks), "risk_histogram": None,
+    }
+
+
+class FakeRollupDB:
+    """Answers rollup queries with canned rows and records every query."""
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.queries = []
+
+    def execute_query_dict(self, query, params=None):
+        self.queries.append((query, params))
+        return [self.rows.pop(0)] if "GROUP BY" not in query else self.rows
+
+    def execute_query(self, query, params=None, fetch=True):
+        self.queries.append((query, params))
+        return [(7,)]
+
+
+def make_analyzer(db):
+    analyzer = PerformanceAnalyzer.__new__(PerformanceAnalyzer)
+    analyzer.db = db
+    analyzer.rollups = PerformanceRollupStore(db)
+    return analyzer
+
+
+# ============================================================================
+# ROLLUP STATISTICS
+# ============================================================================
+
+def test_rollup_mean_std_match_raw_aggregates():
+    rng = random.Random(11)
+    times = [rng.randint(200, 9000) for _ in range(400)]
+    risks = [rng.random() for _ in range(400)]
+    stats = RollupStats.from_row(rollup_row(times, risks, successful=380, failed=20))
+
+    assert stats.avg_time == pytest.approx(np.mean(times))
+    assert stats.std_time == pytest.approx(np.std(times, ddof=1), rel=1e-9)
+    assert stats.std_risk == pytest.approx(np.std(risks, ddof=1), rel=1e-9)
+    assert stats.success_rate == 0.95
+    assert stats.risk_percentile(0.5) is None  # no risk histogram in this row
+
+    p95 = stats.time_percentile(0.95)
+    exact = np.percentile(times, 95)
+    assert stats.time_min <= p95 <= stats.time_max
+    assert abs(p95 - exact) <= 2500  # within the 5000-10000 ms bucket
+
+
+def test_empty_rollup_has_no_averages():
+    stats = RollupStats.from_row({})
+    assert (stats.total, stats.avg_time, stats.std_time, stats.success_rate) == (0, None, None, None)
+    assert stats.time_percentile(0.5) is None
+
+
+def test_histogram_bounds_match_sql():
+    sql = ROLLUP_SQL.read_text()
+
+    def bounds(function):
+        body = re.search(rf"FUNCTION csa\.{function}\(\).*?ARRAY\[(.*?)\]", sql, re.S).group(1)
+        return [float(v) for v in body.replace("\n", " ").split(",")]
+
+    assert bounds("rollup_time_bounds") == [float(b) for b in TIME_HISTOGRAM_BOUNDS_MS]
+    assert bounds("rollup_risk_bounds") == RISK_HISTOGRAM_BOUNDS
+    assert "array_fill(0::BIGINT, ARRAY[14])" in sql and "array_fill(0::BIGINT, ARRAY[10])" in sql
+
+
+# ============================================================================
+# PERFORMANCE ANALYZER
+# ============================================================================
+
+def test_compare_versions_reads_rollups_with_version_filter(monkeypatch):
+    rng = random.Random(5)
+    baseline = rollup_row([rng.randint(900, 1100) for _ in range(150)], [0.3] * 150, successful=140)
+    faster = rollup_row([rng.randint(400, 600) for _ in range(150)], [0.3] * 150, successful=141)
+    db = FakeRollupDB([baseline, faster])
+    analyzer = make_analyzer(db)
+    monkeypatch.setattr(analyzer, "_store_comparison", lambda comparison: None)
+
+    schema_id = uuid4()
+    comparison = analyzer.compare_versions(
+        VersionComparisonRequest(
+            schema_id=schema_id,
+            baseline_version=1,
+            comparison_version=2,
+            metrics=["execution_time", "success_rate"],
+        ),
+        compared_by="analyst"
+    )
+
+    assert comparison.recommendation == "adopt_comparison"
+    assert comparison.primary_result.is_significant
+    for (query, params), version in zip(db.queries, (1, 2)):
+        assert "csa.execution_rollups" in query and "workflow_executions" not in query
+        assert "variant_id IS NULL" in query
+        assert params[0] == schema_id and params[1] == version
+
+
+def test_trends_and_period_metrics_from_rollups():
+    today = date(2026, 3, 2)
+    rows = [
+        {"period": today, **rollup_row([500, 700], [0.2, 0.4], successful=2)},
+        {"period": today - timedelta(days=1), **rollup_row([900], [0.5], successful=0, failed=1)},
+    ]
+    analyzer = make_analyzer(FakeRollupDB(rows))
+    trends = analyzer.get_performance_trends(uuid4(), days=7)
+
+    assert [t.period for t in trends] == ["2026-03-02", "2026-03-01"]
+    assert trends[0].avg_execution_time_ms == 600 and trends[0].success_rate == 1.0
+    assert trends[1].failed_executions == 1
+
+    analyzer = make_analyzer(FakeRollupDB([rollup_row([800], [0.2], 1), rollup_row([1000], [0.2], 1)]))
+    metric = analyzer.get_metric_comparison(uuid4(), "execution_time", days=7)
+    assert (metric.current_value, metric.previous_value, metric.trend) == (800, 1000, "down")
+    assert metric.is_improvement
+
+    assert make_analyzer(FakeRollupDB([])).backfill_rollups(start=datetime(2026, 1, 1)) == 7
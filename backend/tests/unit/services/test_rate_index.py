@@ -0,0 +1,190 @@
+"""
+Unit Tests for the SKG Rate Index
+
+Tests cover:
+- Exact, grade and sub-category lookups (never a different grade)
+- Category-specific regional factors preferred over all-category factors
+- BOQ generation resolving every rate from one index load (no per-line queries)
+- Semantic fallback only for unmatched keys, once per index load
+- Index invalidation on cost item writes
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.engines.cost.boq_generator import DEFAULT_RATES, BOQGenerator
+from app.schemas.skg.cost_models import CostItemUpdate, CostSearchResult
+from app.services.skg.cost_service import CostDatabaseService
+from app.services.skg.rate_index import RateIndex, get_rate_index_cache
+
+CATALOG_ID = str(uuid4())
+
+
+def cost_row(item_code, category, sub_category, base_cost, specifications=None, confidence=0.8):
+    return {
+        "id": str(uuid4()),
+        "catalog_id": CATALOG_ID,
+        "item_code": item_code,
+        "item_name": item_code.replace("-", " "),
+        "category": category,
+        "sub_category": sub_category,
+        "unit": "per_cum",
+        "base_cost": Decimal(str(base_cost)),
+        "specifications": specifications or {},
+        "confidence": confidence,
+        "created_at": datetime(2026, 1, 1),
+        "updated_at": datetime(2026, 1, 1),
+    }
+
+
+ITEMS = [
+    cost_row("CON-RCC-M25", "concrete", "rcc", 6400, {"grade": "M25"}),
+    cost_row("CON-RCC-M30", "concrete", "rcc", 7300),  # grade from the item code
+    cost_row("STL-TMT", "steel", "tmt", 78, {"grade": "Fe500"}),
+    cost_row("FW-BEAM-SIDES", "formwork", "Beam Sides", 470),
+]
+
+FACTORS = [
+    {"catalog_id": CATALOG_ID, "region_code": "IN-MH", "category": None, "adjustment_factor": 1.10},
+    {"catalog_id": CATALOG_ID, "region_code": "IN-MH", "category": "steel", "adjustment_factor": 1.20},
+]
+
+
+# ============================================================================
+# RATE INDEX
+# ============================================================================
+
+class TestRateIndex:
+    """Tests for RateIndex lookups and regional factors."""
+
+    def test_exact_grade_and_sub_category_lookups(self):
+        """Test exact, grade and sub-category matches; never another grade's rate."""
+        index = RateIndex(ITEMS, FACTORS)
+
+        assert index.lookup(("concrete", "rcc", "M25", None)).base_cost == Decimal("6400")
+        assert index.lookup(("concrete", "rcc", "m30", None)).match == "exact"
+        assert index.lookup(("concrete", "pcc", "M30", None)).match == "grade"
+        assert index.lookup(("formwork", "beam_sides", None, None)).base_cost == Decimal("470")
+        # A missing grade never falls back to another grade's rate
+        assert index.lookup(("concrete", "rcc", "M40", None)) is None
+
+    def test_category_specific_regional_factor_wins(self):
+        """Test that a category-specific regional factor beats the all-category one."""
+        index = RateIndex(ITEMS, FACTORS)
+
+        steel = index.lookup(("steel", "tmt", "Fe500", "IN-MH"))
+        concrete = index.lookup(("concrete", "rcc", "M25", "IN-MH"))
+
+        assert steel.adjustment_factor == Decimal("1.2")
+        assert steel.adjusted_cost == Decimal("78") * Decimal("1.2")
+        assert concrete.adjustment_factor == Decimal("1.1")
+        assert index.lookup(("concrete", "rcc", "M25", "IN-KA")).adjustment_factor == Decimal("1")
+
+    def test_highest_confidence_item_wins(self):
+        """Test that the most confident item is used when several match a key."""
+        items = ITEMS + [cost_row("CON-RCC-M25-B", "concrete", "rcc", 5900, {"grade": "M25"}, confidence=0.95)]
+        index = RateIndex(items, [])
+
+        assert index.lookup(("concrete", "rcc", "M25", None)).base_cost == Decimal("5900")
+
+
+# ============================================================================
+# BOQ RATE RESOLUTION
+# ============================================================================
+
+class TestRateResolution:
+    """Tests for CostDatabaseService rate resolution on the shared rate index."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_rate_index(self):
+        """Start and end every test with an empty rate index cache."""
+        get_rate_index_cache().invalidate()
+        yield
+        get_rate_index_cache().invalidate()
+
+    @pytest.fixture
+    def items(self):
+        """Provide a per-test copy of the cost items (updates modify it)."""
+        return [dict(row) for row in ITEMS]
+
+    @pytest.fixture
+    def search_results(self):
+        """Provide the semantic search results (none unless a test adds some)."""
+        return []
+
+    @pytest.fixture
+    def searches(self):
+        """Provide the list of semantic search queries issued."""
+        return []
+
+    @pytest.fixture
+    def cost_service(self, fake_db, items, search_results, searches, monkeypatch) -> CostDatabaseService:
+        """Provide a CostDatabaseService over the rate table, with semantic search stubbed."""
+
+        def update_item(params):
+            row = next(row for row in items if row["id"] == params[-1])
+            row["base_cost"] = Decimal(str(params[0]))
+            return [row]
+
+        fake_db.on("FROM regional_cost_factors", FACTORS)
+        fake_db.on(("FROM cost_items", "WHERE id"), lambda params: [row for row in items if row["id"] == params[0]])
+        fake_db.on("UPDATE cost_items", update_item)
+        fake_db.on("FROM cost_items", items)
+        fake_db.on("next_version", [{"next_version": 2}])
+
+        def search_costs(service, request, user_id):
+            searches.append(request.query)
+            return list(search_results)
+
+        monkeypatch.setattr(CostDatabaseService, "search_costs", search_costs)
+        monkeypatch.setattr(CostDatabaseService, "_create_cost_embedding", lambda service, item: None)
+        return CostDatabaseService()
+
+    def test_boq_rates_come_from_one_index_load(self, cost_service, fake_db, searches):
+        """Test that repeated BOQs resolve every rate from one index load."""
+        design_variables = {"concrete_grade": "M25", "steel_grade": "Fe500"}
+        design_output = {"concrete_volume": 1.0, "steel_weight": 100.0, "beam_width": 0.3, "beam_depth": 0.5}
+
+        for _ in range(20):
+            items, _ = BOQGenerator(cost_service).generate_boq(design_output, design_variables, "beam")
+
+        rates = {item["item_code"]: item["base_rate"] for item in items}
+        assert rates["CON-M25"] == 6400
+        assert rates["STL-Fe500"] == 78
+        assert rates["FW-BEAM-SIDE"] == 470
+        assert rates["FW-BEAM-BTM"] == DEFAULT_RATES["formwork"]["beam_bottom"]
+
+        assert len(fake_db.queries) == 2
+        # The one unmatched key was searched once, not once per BOQ
+        assert searches == ["formwork beam_bottom"]
+
+    def test_semantic_fallback_result_is_used_and_remembered(self, cost_service, search_results, searches):
+        """Test that a semantic match fills an unmatched key and is kept for later lookups."""
+        search_results.append(CostSearchResult(
+            cost_item_id=ITEMS[3]["id"], item_code="FW-BEAM-SIDES", item_name="Beam formwork",
+            category="formwork", base_cost=Decimal("470"), unit="per_sqm",
+            specifications={}, similarity=0.91, confidence=0.5
+        ))
+
+        first = cost_service.resolve_rates([("formwork", "beam_bottom", None, "IN-MH")])
+        second = cost_service.resolve_rates([("formwork", "beam_bottom", None, "IN-MH")])
+
+        rate = first[("formwork", "beam_bottom", None, "IN-MH")]
+        assert rate.match == "semantic"
+        assert rate.adjusted_cost == Decimal("470") * Decimal("1.1")
+        assert second == first
+        assert searches == ["formwork beam_bottom"]
+
+    def test_update_cost_item_invalidates_index(self, cost_service, fake_db):
+        """Test that updating a cost item reloads the index with the new rate."""
+        key = ("concrete", "rcc", "M25", None)
+        assert cost_service.resolve_rates([key])[key].base_cost == Decimal("6400")
+
+        update = CostItemUpdate(base_cost=Decimal("6600"), change_reason="Q3 rate revision")
+        cost_service.update_cost_item(ITEMS[0]["id"], update, "estimator")
+
+        assert cost_service.resolve_rates([key])[key].base_cost == Decimal("6600")
+        assert fake_db.count("FROM regional_cost_factors") == 2
@@ -0,0 +1,199 @@
+"""
+Unit Tests for the Compiled Constructability Rule Set
+
+Tests cover:
+- Rule selection matching get_applicable_rules() (workflow, discipline, order)
+- Rules skipped when their $input fields are absent from a record
+- Whole-variable substitution ($input.load vs $input.load_factor)
+- One rule load for many evaluations; reload after a rule update
+- Batch evaluation with triggered evaluations inserted in one transaction
+"""
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from app.schemas.skg.rule_models import (
+    ConstructabilityRule,
+    RuleBatchEvaluationRequest,
+    RuleDiscipline,
+    RuleEvaluationRequest,
+    RuleUpdate,
+)
+from app.services.skg.rule_service import ConstructabilityRuleService
+from app.services.skg.rule_set import CompiledRuleSet, compile_rule, get_rule_set_cache
+
+
+def rule_row(rule_code, condition, severity="medium", discipline="structural",
+             applicable_to=(), is_mandatory=False):
+    return {
+        "id": uuid4(),
+        "rule_code": rule_code,
+        "rule_name": rule_code.replace("_", " ").title(),
+        "description": None,
+        "category_id": None,
+        "discipline": discipline,
+        "rule_type": "spacing_rule",
+        "source_code": "IS 456:2000",
+        "source_clause": None,
+        "condition_expression": condition,
+        "condition_description": None,
+        "recommendation": f"Review {rule_code}",
+        "recommendation_details": {},
+        "severity": severity,
+        "applicable_to": list(applicable_to),
+        "parameters": {},
+        "metadata": {},
+        "is_enabled": True,
+        "is_mandatory": is_mandatory,
+        "version": 1,
+        "created_by": "engineer",
+        "created_at": datetime(2026, 1, 1),
+        "updated_at": datetime(2026, 1, 1),
+    }
+
+
+ROWS = [
+    rule_row("REBAR_SPACING_MIN", "$input.rebar_spacing < 75", severity="high",
+             applicable_to=["beam_design"]),
+    rule_row("COVER_MIN", "$input.cover < 25", severity="critical", discipline="general"),
+    rule_row("LOAD_FACTOR", "$input.load * $input.load_factor > 1000", severity="low"),
+    rule_row("DEEP_FOUNDATION", "$input.load > 500 AND $input.depth < 2", severity="high",
+             discipline="civil", is_mandatory=True),
+    rule_row("PRECAST", "$input.is_precast == true", severity="info"),
+    rule_row("STEP_ONLY", "$step.status == 'failed'"),
+]
+
+
+def codes(rule_set, selection):
+    return [rule_set.rules[position].rule.rule_code for position in sorted(selection, key=selection.get)]
+
+
+# ============================================================================
+# SELECTION AND COMPILATION
+# ============================================================================
+
+class TestCompiledRuleSet:
+    """Tests for rule compilation and selection."""
+
+    def test_selection_matches_get_applicable_rules(self):
+        """Test that selection matches get_applicable_rules() in workflow, discipline and order."""
+        rule_set = CompiledRuleSet(ROWS)
+
+        # Workflow-specific rules only match their workflow; NULL workflow matches universal rules
+        assert codes(rule_set, rule_set.select("structural", "beam_design")) == [
+            "COVER_MIN", "REBAR_SPACING_MIN", "STEP_ONLY", "LOAD_FACTOR", "PRECAST"
+        ]
+        assert "REBAR_SPACING_MIN" not in codes(rule_set, rule_set.select(None, None))
+        # Discipline filter keeps the discipline and 'general'; mandatory first within a severity
+        assert codes(rule_set, rule_set.select("civil", None)) == ["COVER_MIN", "DEEP_FOUNDATION"]
+        assert len(rule_set.select(None, "beam_design")) == len(ROWS)
+
+    def test_variables_substituted_whole_and_absent_fields_skipped(self):
+        """Test whole-variable substitution and skipping rules whose fields are absent."""
+        compiled = compile_rule(ConstructabilityRule(**ROWS[2]))
+        assert compiled.input_fields == {"load", "load_factor"}
+
+        triggered, details = compiled.evaluate({"load": 800, "load_factor": 1.5})
+        assert triggered
+        assert details["evaluated_values"] == {"$input.load": 800, "$input.load_factor": 1.5}
+
+        rule_set = CompiledRuleSet(ROWS)
+        selection = rule_set.select(None, "beam_design")
+        evaluations = rule_set.evaluate(selection, [
+            {"load": 800},                 # load_factor absent: LOAD_FACTOR never evaluated
+            {"is_precast": True},          # bool literal comparison; info rules excluded
+        ])
+        assert [e.triggered for e in evaluations] == [[], []]
+        assert rule_set.rules[5].never_fires  # $step is never populated for rule evaluation
+
+        with_info = rule_set.evaluate(selection, [{"is_precast": True}], include_info=True)
+        assert [c.rule.rule_code for c, _ in with_info[0].triggered] == ["PRECAST"]
+
+    def test_unsafe_condition_never_fires(self):
+        """Test that a condition rejected by the compiler never fires."""
+        compiled = compile_rule(ConstructabilityRule(**rule_row("ESCAPE", "$input.x.__class__ == 1")))
+
+        assert compiled.code is None
+        assert compiled.evaluate({"x": 1}) == (False, {"error": compiled.error, "condition": "$input.x.__class__ == 1"})
+
+
+# ============================================================================
+# SERVICE
+# ============================================================================
+
+class TestRuleEvaluation:
+    """Tests for ConstructabilityRuleService evaluation on the shared rule set."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_rule_set(self):
+        """Start and end every test with an empty rule set cache."""
+        get_rule_set_cache().invalidate()
+        yield
+        get_rule_set_cache().invalidate()
+
+    @pytest.fixture
+    def service(self, fake_db, monkeypatch) -> ConstructabilityRuleService:
+        """Provide a ConstructabilityRuleService over constructability_rules, embeddings stubbed."""
+        rows = [dict(row) for row in ROWS]
+
+        def update_rule(params):
+            row = next(row for row in rows if str(row["id"]) == params[-1])
+            row["condition_expression"] = params[0]
+            return [row]
+
+        fake_db.on("FROM constructability_rules", lambda params: [row for row in rows if row["is_enabled"]])
+        fake_db.on("UPDATE constructability_rules", update_rule)
+        monkeypatch.setattr(ConstructabilityRuleService, "_create_rule_embedding", lambda service, rule: None)
+        return ConstructabilityRuleService()
+
+    def test_evaluate_rules_loads_once_and_reloads_after_update(self, service, fake_db):
+        """Test that evaluations share one rule load until a rule is updated."""
+        request = RuleEvaluationRequest(
+            input_data={"rebar_spacing": 60, "cover": 20},
+            discipline=RuleDiscipline.STRUCTURAL,
+            workflow_type="beam_design",
+        )
+
+        first = service.evaluate_rules(request, "engineer")
+        second = service.evaluate_rules(request, "engineer")
+
+        assert fake_db.count("FROM constructability_rules") == 1
+        assert [r.rule_code for r in first.results] == ["COVER_MIN", "REBAR_SPACING_MIN"]
+        assert first.has_blockers and first.critical_count == 1 and first.high_count == 1
+        assert first.total_rules_evaluated == second.total_rules_evaluated == 5
+        assert fake_db.audits[0]["details"] == {"rules_evaluated": 5, "rules_triggered": 2, "has_blockers": True}
+
+        cover_rule = next(row for row in ROWS if row["rule_code"] == "COVER_MIN")
+        service.update_rule(cover_rule["id"], RuleUpdate(condition_expression="$input.cover < 15"), "engineer")
+        third = service.evaluate_rules(request, "engineer")
+
+        assert fake_db.count("FROM constructability_rules") == 2
+        assert [r.rule_code for r in third.results] == ["REBAR_SPACING_MIN"]
+
+    def test_batch_evaluation_writes_evaluations_in_one_transaction(self, service, fake_db):
+        """Test that a batch loads rules once and inserts triggered evaluations in one transaction."""
+        response = service.evaluate_rules_batch(RuleBatchEvaluationRequest(
+            input_records=[
+                {"rebar_spacing": 60},
+                {"rebar_spacing": 120, "cover": 40},
+                {"load": 900, "depth": 1.5, "cover": 20},
+            ],
+            workflow_type="beam_design",
+            execution_id=uuid4(),
+        ), "engineer")
+
+        assert fake_db.count("FROM constructability_rules") == 1
+        assert [[r.rule_code for r in e.results] for e in response.evaluations] == [
+            ["REBAR_SPACING_MIN"], [], ["COVER_MIN", "DEEP_FOUNDATION"]
+        ]
+        assert response.total_records == 3
+        assert response.records_with_triggers == 2
+        assert response.has_blockers
+
+        inserts = [sql for sql in fake_db.conn.statements if "INSERT INTO rule_evaluations" in sql]
+        assert len(inserts) == 1
+        assert inserts[0].count("'engineer')") == 3
+        assert fake_db.conn.commits == 1
+        assert len(fake_db.audits) == 1 and fake_db.audits[0]["action"] == "evaluate_rules_batch"
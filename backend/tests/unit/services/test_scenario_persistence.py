@@ -0,0 +1,139 @@
+"""
+Unit Tests for Scenario Persistence
+
+Tests cover:
+- Scenario row and BOQ items written in one transaction with one commit
+- Scenario UUID taken from RETURNING id (no follow-up SELECT)
+- BOQ items sent as paged multi-row INSERTs
+- Storage failures logged without failing scenario creation
+"""
+
+from contextlib import contextmanager
+
+from app.services.scenario import scenario_service as scenario_module
+from app.services.scenario.scenario_service import ScenarioService
+
+SCENARIO_UUID = "7f1d5a2e-0000-4000-8000-000000000001"
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.connection = conn  # execute_values reads connection.encoding
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        if isinstance(sql, bytes):
+            sql = sql.decode()
+        if self.conn.fail_on and self.conn.fail_on in sql:
+            raise RuntimeError("relation does not exist")
+        self.conn.statements.append(sql)
+
+    def mogrify(self, template, args):
+        return ("(" + ",".join(repr(arg) for arg in args) + ")").encode()
+
+    def fetchone(self):
+        return (SCENARIO_UUID,)
+
+
+class FakeConnection:
+    encoding = "UTF8"
+
+    def __init__(self, fail_on=None):
+        self.statements = []
+        self.commits = 0
+        self.fail_on = fail_on
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+
+class FakeDB:
+    def __init__(self, conn):
+        self.conn = conn
+        self.checkouts = 0
+
+    @contextmanager
+    def connection(self):
+        self.checkouts += 1
+        yield self.conn
+
+
+def make_service(conn):
+    service = ScenarioService.__new__(ScenarioService)
+    service.db = FakeDB(conn)
+    return service
+
+
+def make_scenario():
+    return {
+        "scenario_id": "SCN-TEST0001",
+        "scenario_name": "Scenario A",
+        "scenario_type": "beam",
+        "design_variables": {"concrete_grade": "M30"},
+        "design_output": {},
+        "material_quantities": {},
+        "cost_estimation": {},
+        "created_by": "estimator",
+    }
+
+
+def make_boq_items(count):
+    return [
+        {
+            "boq_id": f"BOQ-{i:08d}",
+            "item_number": i + 1,
+            "item_code": "CON-M30",
+            "item_description": "RCC in beam",
+            "category": "concrete",
+            "quantity": 1.5,
+            "unit": "cum",
+            "base_rate": 7000.0,
+            "adjusted_rate": 7000.0,
+            "amount": 10500.0,
+        }
+        for i in range(count)
+    ]
+
+
+def test_scenario_and_boq_items_stored_in_one_transaction():
+    conn = FakeConnection()
+    service = make_service(conn)
+
+    scenario_uuid = service._store_scenario(make_scenario(), make_boq_items(120))
+
+    assert scenario_uuid == SCENARIO_UUID
+    assert service.db.checkouts == 1
+    assert conn.commits == 1
+    assert len(conn.statements) == 2
+    assert "RETURNING id" in conn.statements[0]
+    assert conn.statements[1].count("BOQ-") == 120
+    assert SCENARIO_UUID in conn.statements[1]
+    assert not any("SELECT id" in sql for sql in conn.statements)
+
+
+def test_large_boq_is_paged(monkeypatch):
+    monkeypatch.setattr(scenario_module, "BOQ_INSERT_PAGE_SIZE", 100)
+    conn = FakeConnection()
+
+    make_service(conn)._store_scenario(make_scenario(), make_boq_items(250))
+
+    assert [sql.count("BOQ-") for sql in conn.statements[1:]] == [100, 100, 50]
+    assert conn.commits == 1
+
+
+def test_failed_boq_insert_is_not_committed():
+    conn = FakeConnection(fail_on="INSERT INTO boq_items")
+
+    scenario_uuid = make_service(conn)._store_scenario(make_scenario(), make_boq_items(5))
+
+    assert scenario_uuid is None
+    assert conn.commits == 0
@@ -0,0 +1,237 @@
+"""
+Unit Tests for the Deliverable Schema Cache
+
+Tests cover:
+- TTL expiry and LRU eviction
+- Invalidation of schemas and derived variant tables
+- Puts of data read before an invalidation ignored (generation counter)
+- SchemaService read-through caching and write invalidation
+- In-process weighted variant selection
+"""
+
+import random
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.services.schema_cache import SchemaCache, get_schema_cache, select_weighted_variant
+from app.services.schema_service import SchemaService
+from app.services.versioning.version_control import VersionControlService
+
+
+# ============================================================================
+# ROWS
+# ============================================================================
+
+def schema_row(deliverable_type="foundation_design", version=1, schema_id=None):
+    now = datetime.utcnow()
+    return {
+        "id": schema_id or uuid4(),
+        "deliverable_type": deliverable_type,
+        "display_name": "Foundation Design",
+        "description": None,
+        "discipline": "civil",
+        "workflow_steps": [{
+            "step_number": 1,
+            "step_name": "design",
+            "function_to_call": "civil_foundation_designer_v1.design_isolated_footing",
+            "input_mapping": {"load": "$input.load"},
+            "output_variable": "design",
+        }],
+        "input_schema": {"type": "object", "required": ["load"]},
+        "output_schema": None,
+        "validation_rules": [],
+        "risk_config": {},
+        "status": "active",
+        "tags": [],
+        "version": version,
+        "created_at": now,
+        "updated_at": now,
+        "created_by": "tester",
+        "updated_by": "tester",
+    }
+
+
+def variant_row(schema_id, key, allocation):
+    now = datetime.utcnow()
+    return {
+        "id": uuid4(),
+        "schema_id": schema_id,
+        "base_version": 1,
+        "variant_key": key,
+        "variant_name": key,
+        "config_overrides": {},
+        "status": "active",
+        "traffic_allocation": allocation,
+        "created_at": now,
+        "updated_at": now,
+        "created_by": "tester",
+        "updated_by": "tester",
+    }
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+class TestSchemaCache:
+    """Tests for SchemaCache expiry, eviction and invalidation."""
+
+    def test_entries_expire_after_ttl(self):
+        """Test that entries are dropped once their TTL has passed."""
+        cache = SchemaCache(ttl_seconds=0.05)
+        schema = SimpleNamespace(id=uuid4(), deliverable_type="foundation_design")
+        cache.put_schema(schema)
+
+        assert cache.get_schema("foundation_design") is schema
+        time.sleep(0.08)
+        assert cache.get_schema("foundation_design") is None
+        assert cache.get_stats()["misses"] == 1
+
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = SchemaCache(ttl_seconds=60, max_entries=2)
+        for name in ("a", "b"):
+            cache.put_schema(SimpleNamespace(id=uuid4(), deliverable_type=name))
+        cache.get_schema("a")  # "b" becomes least recently used
+        cache.put_schema(SimpleNamespace(id=uuid4(), deliverable_type="c"))
+
+        assert cache.get_schema("b") is None
+        assert cache.get_schema("a") is not None
+        assert cache.get_stats()["evictions"] == 1
+
+
+    def test_invalidate_schema_drops_variant_tables(self):
+        """Test that invalidating a schema also drops its variant tables."""
+        cache = SchemaCache()
+        schema = SimpleNamespace(id=uuid4(), deliverable_type="foundation_design")
+        cache.put_schema(schema)
+        cache.put_variants(schema.id, 1, ["variant"])
+
+        cache.apply_invalidation({"kind": "schema", "key": "foundation_design"})
+
+        assert cache.get_schema("foundation_design") is None
+        assert cache.get_variants(schema.id, 1) is None
+
+
+    def test_put_read_before_invalidation_is_ignored(self):
+        """Test that a reader cannot re-cache a row it loaded before an invalidation."""
+        cache = SchemaCache()
+        schema = SimpleNamespace(id=uuid4(), deliverable_type="foundation_design")
+        generation = cache.generation
+        cache.invalidate_schema("foundation_design")  # a write lands during the read
+
+        cache.put_schema(schema, generation)
+        cache.put_variants(schema.id, 1, ["variant"], generation)
+
+        assert cache.get_schema("foundation_design") is None
+        assert cache.get_variants(schema.id, 1) is None
+        assert cache.get_stats()["stale_puts"] == 2
+
+        cache.put_schema(schema, cache.generation)
+        assert cache.get_schema("foundation_design") is schema
+
+
+    def test_zero_ttl_disables_cache(self):
+        """Test that a zero TTL disables caching."""
+        cache = SchemaCache(ttl_seconds=0)
+        cache.put_schema(SimpleNamespace(id=uuid4(), deliverable_type="x"))
+        assert cache.get_schema("x") is None
+
+
+# ============================================================================
+# SERVICES
+# ============================================================================
+
+class TestServiceCaching:
+    """Tests for SchemaService and VersionControlService on the shared schema cache."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        """Start and end every test with an empty process-wide schema cache."""
+        get_schema_cache().clear()
+        yield
+        get_schema_cache().clear()
+
+    @pytest.fixture
+    def schema_service(self, fake_db) -> SchemaService:
+        """Provide a SchemaService whose database holds one foundation schema."""
+        fake_db.on("deliverable_schemas", [schema_row()])
+        return SchemaService()
+
+    def test_get_schema_reads_through_cache(self, schema_service, fake_db):
+        """Test that repeated reads hit the cache unless use_cache=False."""
+        first = schema_service.get_schema("foundation_design")
+        second = schema_service.get_schema("foundation_design")
+
+        assert first is second
+        assert len(fake_db.queries) == 1
+
+        schema_service.get_schema("foundation_design", use_cache=False)
+        assert len(fake_db.queries) == 2
+
+    def test_delete_schema_invalidates_cache(self, schema_service):
+        """Test that deleting a schema drops its cache entry."""
+        schema_service.get_schema("foundation_design")
+
+        schema_service.delete_schema("foundation_design", "tester")
+
+        assert schema_service.cache.get_schema("foundation_design") is None
+
+    def test_read_racing_a_write_is_not_cached(self, fake_db):
+        """Test that a schema read while another request invalidates it is not cached."""
+        def read_during_update(params):
+            get_schema_cache().invalidate_schema("foundation_design")
+            return [schema_row(version=1)]
+
+        fake_db.on("deliverable_schemas", read_during_update)
+        service = SchemaService()
+
+        assert service.get_schema("foundation_design").version == 1
+        assert service.cache.get_schema("foundation_design") is None
+
+    def test_variant_selection_uses_cached_allocation_table(self, fake_db):
+        """Test that variant selection and lookups reuse one allocation table load."""
+        schema_id = uuid4()
+        rows = [variant_row(schema_id, "a", 30), variant_row(schema_id, "b", 70)]
+        fake_db.on("schema_variants", rows)
+        service = VersionControlService()
+
+        keys = {
+            service.select_variant_for_execution(schema_id, schema_version=1).variant_key
+            for _ in range(200)
+        }
+
+        assert keys == {"a", "b"}
+        assert len(fake_db.queries) == 1
+
+        # Active variants are resolved without another query
+        variant = service.get_variant(rows[0]["id"])
+        assert variant.variant_key == "a"
+        assert len(fake_db.queries) == 1
+
+        service.update_traffic_allocation(schema_id, 1, {"a": 50, "b": 50}, "tester")
+        assert service.cache.get_variants(schema_id, 1) is None
+
+
+class TestWeightedSelection:
+    """Tests for in-process weighted variant selection."""
+
+    def test_weighted_selection_matches_allocation(self):
+        """Test that picks follow the traffic allocation, the rest going to the base schema."""
+        variants = [
+            SimpleNamespace(variant_key="b", traffic_allocation=25),
+            SimpleNamespace(variant_key="a", traffic_allocation=25),
+        ]
+        rng = random.Random(42)
+        picks = [select_weighted_variant(variants, rng) for _ in range(4000)]
+
+        base_share = sum(p is None for p in picks) / len(picks)
+        a_share = sum(p is not None and p.variant_key == "a" for p in picks) / len(picks)
+
+        assert base_share == pytest.approx(0.5, abs=0.05)
+        assert a_share == pytest.approx(0.25, abs=0.05)
@@ -0,0 +1,191 @@
+"""
+Unit Tests for the Workflow Runner
+
+Tests cover:
+- Executing workflows off the event loop
+- Backpressure when the pool and queue are full
+- Slots released when scheduling fails (runner shut down)
+- Submit-and-return mode with job status tracking
+- Streaming of failures raised before execution starts
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.execution import get_streaming_manager, StreamEventType
+from app.services.workflow_runner import WorkflowRunner, ExecutionCapacityError
+
+
+# ============================================================================
+# FAKES
+# ============================================================================
+
+class FakeOrchestrator:
+    def __init__(self, delay=0.0, gate=None, error=None):
+        self.delay = delay
+        self.gate = gate
+        self.error = error
+
+    def execute_workflow(self, deliverable_type, input_data, user_id,
+                         project_id=None, experiment_id=None, execution_id=None):
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return SimpleNamespace(
+            id=execution_id,
+            deliverable_type=deliverable_type,
+            execution_status="completed",
+            error_message=None,
+        )
+
+
+def make_runner(max_workers=2, max_queue=0, **kwargs):
+    return WorkflowRunner(
+        max_workers=max_workers,
+        max_queue=max_queue,
+        orchestrator_factory=lambda: FakeOrchestrator(**kwargs),
+    )
+
+
+# ============================================================================
+# TESTS
+# ============================================================================
+
+def test_run_does_not_block_event_loop():
+    runner = make_runner(delay=0.2)
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        result = await runner.run("foundation_design", {}, "user")
+        task.cancel()
+        return result, ticks
+
+    result, ticks = asyncio.run(scenario())
+    runner.shutdown()
+
+    assert result.execution_status == "completed"
+    assert ticks >= 5
+
+
+def test_run_executes_concurrently():
+    runner = make_runner(max_workers=4, delay=0.2)
+
+    async def scenario():
+        start = time.perf_counter()
+        await asyncio.gather(*[
+            runner.run("foundation_design", {}, "user") for _ in range(4)
+        ])
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(scenario())
+    runner.shutdown()
+
+    assert elapsed < 0.6
+
+
+def test_capacity_exhausted_rejects():
+    gate = threading.Event()
+    runner = make_runner(max_workers=1, max_queue=1, gate=gate)
+
+    async def scenario():
+        runner.submit("foundation_design", {}, "user")
+        runner.submit("foundation_design", {}, "user")
+        with pytest.raises(ExecutionCapacityError):
+            runner.submit("foundation_design", {}, "user")
+        gate.set()
+
+    asyncio.run(scenario())
+    runner.shutdown()
+
+    assert runner.get_stats()["rejected"] == 1
+
+
+def test_failed_scheduling_releases_slot():
+    runner = make_runner(max_workers=1, max_queue=0)
+    runner.shutdown()
+
+    async def scenario():
+        for _ in range(3):
+            with pytest.raises(RuntimeError, match="shutdown"):
+                runner.submit("foundation_design", {}, "user")
+        with pytest.raises(RuntimeError, match="shutdown"):
+            await runner.run("foundation_design", {}, "user")
+
+    asyncio.run(scenario())
+
+    stats = runner.get_stats()
+    assert stats["rejected"] == 0
+    assert stats["submitted"] == 0
+    assert runner.jobs == {}
+
+
+def test_submit_returns_immediately_and_tracks_job():
+    gate = threading.Event()
+    runner = make_runner(gate=gate)
+
+    async def scenario():
+        execution_id = runner.submit("foundation_design", {}, "user")
+        assert runner.get_job(str(execution_id))["status"] in ("queued", "running")
+        gate.set()
+        while runner.get_job(str(execution_id))["completed_at"] is None:
+            await asyncio.sleep(0.01)
+        return execution_id
+
+    execution_id = asyncio.run(scenario())
+    runner.shutdown()
+
+    job = runner.get_job(str(execution_id))
+    assert job["status"] == "completed"
+
+
+def test_submit_failure_is_streamed():
+    runner = make_runner(error=ValueError("Schema 'missing' not found"))
+
+    async def scenario():
+        execution_id = runner.submit("missing", {}, "user")
+        while runner.get_job(str(execution_id))["completed_at"] is None:
+            await asyncio.sleep(0.01)
+        return str(execution_id)
+
+    execution_id = asyncio.run(scenario())
+    runner.shutdown()
+
+    assert runner.get_job(execution_id)["status"] == "failed"
+    history = get_streaming_manager().get_event_history(execution_id)
+    assert history[-1].event_type == StreamEventType.EXECUTION_FAILED
+
+
+def test_async_subscriber_receives_events_from_worker_thread():
+    manager = get_streaming_manager()
+    received = []
+
+    async def scenario():
+        done = asyncio.Event()
+
+        async def callback(event):
+            received.append(event)
+            done.set()
+
+        manager.subscribe("exec-thread-test", callback)
+        await asyncio.get_running_loop().run_in_executor(
+            None, WorkflowRunner._emit_failure, "exec-thread-test", "boom"
+        )
+        await asyncio.wait_for(done.wait(), timeout=2)
+        manager.unsubscribe("exec-thread-test", callback)
+
+    asyncio.run(scenario())
+    assert received and received[0].data["error_message"] == "boom"